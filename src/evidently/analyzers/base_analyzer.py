@@ -28,6 +28,9 @@ class BaseAnalyzerResult:
 
 
 class Analyzer:
+    # analyzers that use only rows without NaN and infinite values, pipeline stages get the data without such rows
+    removes_nans_and_infinities: bool = False
+
     @abc.abstractmethod
     def calculate(self,
                   reference_data: pd.DataFrame,
@@ -15,16 +15,14 @@ from evidently.analyzers.base_analyzer import BaseAnalyzerResult
 from evidently.analyzers.stattests.registry import get_stattest, StatTest
 from evidently.analyzers.utils import process_columns
 from evidently.options import DataDriftOptions, QualityMetricsOptions
+from evidently.options import ReferenceCacheOptions
+from evidently.utils.reference_cache import get_or_calculate
+from evidently.utils.reference_cache import resolve_reference_cache
 
 
 def _remove_nans_and_infinities(dataframe):
-    #   document somewhere, that all analyzers are mutators, i.e. they will change
-    #   the dataframe, like here: replace inf and nan values. That means if far down the pipeline
-    #   somebody wants to compute number of nans, the results will be 0.
-    #   Consider return copies of dataframes, even though it will drain memory for large datasets
-    dataframe.replace([np.inf, -np.inf], np.nan, inplace=True)
-    dataframe.dropna(axis=0, how="any", inplace=True)
-    return dataframe
+    # return a copy: the input data can be shared with other analyzers or be read-only in a worker process
+    return dataframe.replace([np.inf, -np.inf], np.nan).dropna(axis=0, how="any")
 
 
 def _compute_statistic(
@@ -67,6 +65,8 @@ class CatTargetDriftAnalyzer(Analyzer):
     For reference see https://evidentlyai.com/blog/evidently-014-target-and-prediction-drift
     """
 
+    removes_nans_and_infinities = True
+
     @staticmethod
     def get_results(analyzer_results) -> CatTargetDriftAnalyzerResults:
         return analyzer_results[CatTargetDriftAnalyzer]
@@ -83,7 +83,7 @@ class CatTargetDriftAnalyzer(Analyzer):
         Otherwise, uses a z-test.
 
         Notes:
-            Be aware that any nan or infinity values will be dropped from the dataframes in place.
+            Rows with any nan or infinity values are not used in the calculation.
 
             You can also provide a custom function that computes a statistic by adding special
             `DataDriftOptions` object to the `option_provider` of the class.::
@@ -140,9 +140,15 @@ class CatTargetDriftAnalyzer(Analyzer):
             columns=columns, reference_data_count=reference_data.shape[0], current_data_count=current_data.shape[0]
         )
 
-        # consider replacing only values in target and prediction column, see comment above
-        #   _remove_nans_and_infinities
-        reference_data = _remove_nans_and_infinities(reference_data)
+        # consider replacing only values in target and prediction column
+        used_columns = [column for column in (target_column, prediction_column) if column is not None]
+        reference_data = get_or_calculate(
+            resolve_reference_cache(self.options_provider.get(ReferenceCacheOptions).cache),
+            "cat_target_drift_reference",
+            reference_data,
+            lambda: _remove_nans_and_infinities(reference_data)[used_columns],
+            used_columns,
+        )
         current_data = _remove_nans_and_infinities(current_data)
         feature_type = "cat"
         if target_column is not None:
@@ -9,13 +9,14 @@ from typing import Union
 
 import pandas as pd
 import numpy as np
-from sklearn import metrics
 
 from evidently import ColumnMapping
 from evidently.analyzers.base_analyzer import Analyzer
 from evidently.analyzers.base_analyzer import BaseAnalyzerResult
 from evidently.analyzers.utils import process_columns
 from evidently.analyzers.utils import calculate_confusion_by_classes
+from evidently.utils.confusion_matrix import get_confusion_matrix
+from evidently.utils.confusion_matrix import get_confusion_matrix_metrics
 
 
 @dataclass
@@ -46,25 +47,18 @@ class ClassificationPerformanceAnalyzerResults(BaseAnalyzerResult):
 def classification_performance_metrics(
         target: pd.Series, prediction: pd.Series, target_names: Optional[List[str]]
 ) -> ClassificationPerformanceMetrics:
-    # calculate metrics matrix
-    metrics_matrix = metrics.classification_report(target, prediction, output_dict=True)
-    # get quality metrics from the metrics matrix, do not calculate them again
-    accuracy_score = metrics_matrix["accuracy"]
-    avg_precision = metrics_matrix["macro avg"]["precision"]
-    avg_recall = metrics_matrix["macro avg"]["recall"]
-    avg_f1 = metrics_matrix["macro avg"]["f1-score"]
-
-    # calculate confusion matrix
-    confusion_matrix = metrics.confusion_matrix(target, prediction)
+    # calculate confusion matrix, all quality metrics are derived from it
+    confusion_matrix, matrix_labels = get_confusion_matrix(target, prediction)
+    quality_metrics = get_confusion_matrix_metrics(confusion_matrix, matrix_labels)
     # get labels from data mapping or get all values kinds from target and prediction columns
-    labels = target_names if target_names else sorted(set(target) | set(prediction))
+    labels = target_names if target_names else matrix_labels
     confusion_by_classes = calculate_confusion_by_classes(confusion_matrix, labels)
     return ClassificationPerformanceMetrics(
-        accuracy=accuracy_score,
-        precision=avg_precision,
-        recall=avg_recall,
-        f1=avg_f1,
-        metrics_matrix=metrics_matrix,
+        accuracy=quality_metrics.accuracy,
+        precision=quality_metrics.precision,
+        recall=quality_metrics.recall,
+        f1=quality_metrics.f1,
+        metrics_matrix=quality_metrics.metrics_matrix,
         confusion_matrix=ConfusionMatrix(labels=labels, values=confusion_matrix.tolist()),
         confusion_by_classes=confusion_by_classes,
     )
@@ -78,12 +72,13 @@ def _calculate_performance_metrics(
     target_names: Optional[List[str]],
 ) -> ClassificationPerformanceMetrics:
     # remove all rows with infinite and NaN values from the dataset
-    data.replace([np.inf, -np.inf], np.nan, inplace=True)
-    data.dropna(axis=0, how="any", inplace=True)
+    data = data.replace([np.inf, -np.inf], np.nan).dropna(axis=0, how="any")
     return classification_performance_metrics(data[target_column], data[prediction_column], target_names)
 
 
 class ClassificationPerformanceAnalyzer(Analyzer):
+    removes_nans_and_infinities = True
+
     @staticmethod
     def get_results(analyzer_results) -> ClassificationPerformanceAnalyzerResults:
         return analyzer_results[ClassificationPerformanceAnalyzer]
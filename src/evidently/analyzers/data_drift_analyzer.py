@@ -1,7 +1,9 @@
 #!/usr/bin/env python
 # coding: utf-8
 import collections
-from typing import Dict, Optional, Tuple
+import contextlib
+import copy
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from dataclasses import dataclass
 
 import pandas as pd
@@ -10,9 +12,27 @@ import numpy as np
 from evidently import ColumnMapping
 from evidently.analyzers.base_analyzer import Analyzer
 from evidently.analyzers.base_analyzer import BaseAnalyzerResult
+from evidently.analyzers.stattests import StatTest
 from evidently.analyzers.stattests import get_stattest
+from evidently.analyzers.stattests.batch import NumericalSamples
+from evidently.analyzers.stattests.batch import split_batches
+from evidently.analyzers.stattests.batch import stack_sorted_values
+from evidently.analyzers.stattests.registry import get_default_stattest_by_counts
 from evidently.options import DataDriftOptions
+from evidently.options import ReferenceCacheOptions
 from evidently.analyzers.utils import process_columns, recognize_task
+from evidently.utils.dataset_view import get_column_view
+from evidently.utils.dataset_view import register_dataset_views
+from evidently.utils.histograms import get_histogram
+from evidently.utils.histograms import get_sorted_values
+from evidently.utils.parallel import PROCESS_BACKEND
+from evidently.utils.parallel import create_executor
+from evidently.utils.reference_cache import ReferenceCache
+from evidently.utils.reference_cache import get_or_calculate
+from evidently.utils.reference_cache import resolve_reference_cache
+from evidently.utils.shared_data import SharedDataFrame
+from evidently.utils.shared_data import is_shared_memory_available
+from evidently.utils.shared_data import share_dataframes
 
 
 def dataset_drift_evaluation(p_values, drift_share=0.5) -> Tuple[int, float, bool]:
@@ -23,6 +43,39 @@ def dataset_drift_evaluation(p_values, drift_share=0.5) -> Tuple[int, float, boo
 
 
 PValueWithDrift = collections.namedtuple("PValueWithDrift", ["p_value", "drifted"])
+NumFeatureDrift = collections.namedtuple(
+    "NumFeatureDrift", ["drift_result", "stattest_name", "current_small_hist", "ref_small_hist"]
+)
+
+
+def _get_num_feature(feature: pd.Series, nbinsx: int) -> Tuple[pd.Series, list]:
+    """Get finite values of a numerical feature and their small histogram"""
+    view = get_column_view(feature)
+    small_hist = [t.tolist() for t in get_histogram(view, nbinsx, density=True)]
+    return view.finite(), small_hist
+
+
+def _is_batchable(feature: pd.Series) -> bool:
+    return pd.api.types.is_numeric_dtype(feature.dtype) and not pd.api.types.is_complex_dtype(feature.dtype)
+
+
+def _get_num_features(
+        data: pd.DataFrame, feature_names: List[str], nbinsx: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray, List[list]]:
+    """Get sorted finite values of numerical features, their numbers and small histograms"""
+    views = [get_column_view(data[feature_name]) for feature_name in feature_names]
+    sorted_values, counts = stack_sorted_values([get_sorted_values(view) for view in views])
+    small_hists = [
+        [t.tolist() for t in get_histogram(view, int(feature_nbinsx), density=True)]
+        for view, feature_nbinsx in zip(views, nbinsx)
+    ]
+    return sorted_values, counts, small_hists
+
+
+def _get_cat_feature(feature: pd.Series) -> Tuple[pd.Series, pd.Series]:
+    """Get not null values of a categorical feature and their counts"""
+    not_null_view = get_column_view(feature).not_null_view()
+    return not_null_view.column, not_null_view.value_counts()
 
 
 @dataclass
@@ -63,6 +116,7 @@ class DataDriftAnalyzer(Analyzer):
             raise ValueError("current_data should be present")
 
         data_drift_options = self.options_provider.get(DataDriftOptions)
+        reference_cache = resolve_reference_cache(self.options_provider.get(ReferenceCacheOptions).cache)
         columns = process_columns(reference_data, column_mapping)
         num_feature_names = columns.num_feature_names
         cat_feature_names = columns.cat_feature_names
@@ -96,62 +150,213 @@ class DataDriftAnalyzer(Analyzer):
                     cat_feature_names += [prediction_column]
 
         # calculate result
-        features_metrics = {}
-        p_values = {}
-
-        for feature_name in num_feature_names:
-            threshold = data_drift_options.get_threshold(feature_name)
-            feature_type = "num"
-            ref_feature = reference_data[feature_name].replace([-np.inf, np.inf], np.nan).dropna()
-            curr_feature = current_data[feature_name].replace([-np.inf, np.inf], np.nan).dropna()
-            test = get_stattest(ref_feature,
-                                curr_feature,
-                                feature_type,
-                                data_drift_options.get_feature_stattest_func(feature_name, feature_type))
-            drift_result = test(
-                ref_feature,
-                curr_feature,
-                feature_type,
-                threshold
+        features_metrics = self._calculate_features_drift(
+            reference_data, current_data, num_feature_names, cat_feature_names, data_drift_options, reference_cache
+        )
+        p_values = {
+            feature_name: PValueWithDrift(feature_metrics.p_value, feature_metrics.drift_detected)
+            for feature_name, feature_metrics in features_metrics.items()
+        }
+
+        n_drifted_features, share_drifted_features, dataset_drift = dataset_drift_evaluation(p_values, drift_share)
+        result_metrics = DataDriftAnalyzerMetrics(
+            n_features=len(num_feature_names) + len(cat_feature_names),
+            n_drifted_features=n_drifted_features,
+            share_drifted_features=share_drifted_features,
+            dataset_drift=dataset_drift,
+            features=features_metrics,
+        )
+        result = DataDriftAnalyzerResults(
+            columns=columns,
+            options=data_drift_options,
+            metrics=result_metrics,
+        )
+        return result
+
+    @staticmethod
+    def _calculate_features_drift(
+            reference_data: pd.DataFrame,
+            current_data: pd.DataFrame,
+            num_feature_names: List[str],
+            cat_feature_names: List[str],
+            options: DataDriftOptions,
+            reference_cache: Optional[ReferenceCache],
+    ) -> Dict[str, DataDriftAnalyzerFeatureMetrics]:
+        """Calculate drift of features, concurrently by chunks of features if `options.n_jobs` is more than 1.
+
+        Results are in the order of the features: numerical features first, then categorical ones.
+        """
+        features = [(feature_name, "num") for feature_name in num_feature_names] + [
+            (feature_name, "cat") for feature_name in cat_feature_names
+        ]
+        chunk_size = options.chunk_size or max(1, -(-len(features) // options.n_jobs))
+        chunks = [features[start: start + chunk_size] for start in range(0, len(features), chunk_size)]
+
+        if options.n_jobs == 1 or len(chunks) < 2:
+            return _calculate_features_drift(
+                reference_data, current_data, num_feature_names, cat_feature_names, options, reference_cache
+            )
+
+        task: Callable = _calculate_features_drift
+        task_data: Tuple[Any, Any] = (reference_data, current_data)
+
+        with contextlib.ExitStack() as stack:
+            if options.backend == PROCESS_BACKEND:
+                # workers get only the columns of the features
+                columns = list(dict.fromkeys(num_feature_names + cat_feature_names))
+                task_data = (reference_data[columns], current_data[columns])
+
+                if is_shared_memory_available():
+                    task = _calculate_features_drift_with_shared_data
+                    task_data = stack.enter_context(share_dataframes(*task_data))
+
+            executor = stack.enter_context(create_executor(options.n_jobs, options.backend))
+            futures = [
+                executor.submit(
+                    task,
+                    *task_data,
+                    [feature_name for feature_name, feature_type in chunk if feature_type == "num"],
+                    [feature_name for feature_name, feature_type in chunk if feature_type == "cat"],
+                    options,
+                    reference_cache,
+                )
+                for chunk in chunks
+            ]
+            features_metrics: Dict[str, DataDriftAnalyzerFeatureMetrics] = {}
+
+            for future in futures:
+                features_metrics.update(future.result())
+
+        return features_metrics
+
+    @staticmethod
+    def _calculate_num_drift(
+            reference_data: pd.DataFrame,
+            current_data: pd.DataFrame,
+            feature_names: List[str],
+            options: DataDriftOptions,
+            reference_cache: Optional[ReferenceCache],
+    ) -> Dict[str, NumFeatureDrift]:
+        """Calculate drift of numerical features.
+
+        Features with numeric types are calculated in batches: stattests that support it are calculated
+        for all features of a batch at once, see `evidently.analyzers.stattests.batch`.
+        """
+        results: Dict[str, NumFeatureDrift] = {}
+        batched_features = [
+            feature_name
+            for feature_name in feature_names
+            if _is_batchable(reference_data[feature_name]) and _is_batchable(current_data[feature_name])
+        ]
+
+        for features in split_batches(batched_features, reference_data.shape[0] + current_data.shape[0]):
+            nbinsx = np.array([options.get_nbinsx(feature_name) for feature_name in features])
+            reference_sorted, reference_counts, reference_small_hists = get_or_calculate(
+                reference_cache,
+                "data_drift_num_features",
+                [reference_data[feature_name] for feature_name in features],
+                lambda: _get_num_features(reference_data, features, nbinsx),
+                nbinsx.tolist(),
+            )
+            current_sorted, current_counts, current_small_hists = _get_num_features(current_data, features, nbinsx)
+            samples = NumericalSamples(reference_sorted, reference_counts, current_sorted, current_counts)
+            unique_counts = samples.get_unique_counts()
+            batches: Dict[int, Tuple[StatTest, List[int]]] = {}
+
+            for position, feature_name in enumerate(features):
+                stattest_func = options.get_feature_stattest_func(feature_name, "num")
+                has_values = reference_counts[position] > 0 and current_counts[position] > 0
+
+                if stattest_func is None and has_values:
+                    test = get_default_stattest_by_counts(
+                        int(reference_counts[position]), int(unique_counts[position]), "num"
+                    )
+
+                else:
+                    test = get_stattest(
+                        get_column_view(reference_data[feature_name]).finite(),
+                        get_column_view(current_data[feature_name]).finite(),
+                        "num",
+                        stattest_func,
+                    )
+
+                if test.batch_func is not None and has_values:
+                    batches.setdefault(id(test), (test, []))[1].append(position)
+
+                else:
+                    # features without finite values are calculated one by one, like custom stattests
+                    drift_result = test(
+                        get_column_view(reference_data[feature_name]).finite(),
+                        get_column_view(current_data[feature_name]).finite(),
+                        "num",
+                        options.get_threshold(feature_name),
+                    )
+                    results[feature_name] = NumFeatureDrift(
+                        drift_result, test.display_name, current_small_hists[position], reference_small_hists[position]
+                    )
+
+            for test, positions in batches.values():
+                drift_results = test.batch(
+                    samples.select(positions), [options.get_threshold(features[position]) for position in positions]
+                )
+
+                for position, drift_result in zip(positions, drift_results):
+                    results[features[position]] = NumFeatureDrift(
+                        drift_result, test.display_name, current_small_hists[position], reference_small_hists[position]
+                    )
+
+        for feature_name in feature_names:
+            if feature_name in results:
+                continue
+
+            current_nbinsx = options.get_nbinsx(feature_name)
+            ref_feature, ref_small_hist = get_or_calculate(
+                reference_cache,
+                "data_drift_num_feature",
+                reference_data[feature_name],
+                lambda: _get_num_feature(reference_data[feature_name], current_nbinsx),
+                current_nbinsx,
             )
-            p_value = drift_result.drift_score
-            drifted = drift_result.drifted
-            threshold = drift_result.actual_threshold
-            p_values[feature_name] = PValueWithDrift(p_value, drifted)
-            current_nbinsx = data_drift_options.get_nbinsx(feature_name)
-            features_metrics[feature_name] = DataDriftAnalyzerFeatureMetrics(
-                current_small_hist=[t.tolist() for t in
-                                    np.histogram(current_data[feature_name][np.isfinite(current_data[feature_name])],
-                                                 bins=current_nbinsx, density=True)],
-                ref_small_hist=[t.tolist() for t in
-                                np.histogram(reference_data[feature_name][np.isfinite(reference_data[feature_name])],
-                                             bins=current_nbinsx, density=True)],
-                feature_type='num',
-                stattest_name=test.display_name,
-                p_value=p_value,
-                drift_detected=drifted,
-                threshold=threshold,
+            curr_feature, current_small_hist = _get_num_feature(current_data[feature_name], current_nbinsx)
+            test = get_stattest(
+                ref_feature, curr_feature, "num", options.get_feature_stattest_func(feature_name, "num")
             )
+            drift_result = test(ref_feature, curr_feature, "num", options.get_threshold(feature_name))
+            results[feature_name] = NumFeatureDrift(drift_result, test.display_name, current_small_hist, ref_small_hist)
+
+        return {feature_name: results[feature_name] for feature_name in feature_names}
 
-        for feature_name in cat_feature_names:
-            threshold = data_drift_options.get_threshold(feature_name)
-            feature_ref_data = reference_data[feature_name].dropna()
-            feature_cur_data = current_data[feature_name].dropna()
+    @staticmethod
+    def _calculate_cat_drift(
+            reference_data: pd.DataFrame,
+            current_data: pd.DataFrame,
+            feature_names: List[str],
+            options: DataDriftOptions,
+            reference_cache: Optional[ReferenceCache],
+    ) -> Dict[str, DataDriftAnalyzerFeatureMetrics]:
+        """Calculate drift of categorical features"""
+        results: Dict[str, DataDriftAnalyzerFeatureMetrics] = {}
+
+        for feature_name in feature_names:
+            threshold = options.get_threshold(feature_name)
+            feature_ref_data, ref_counts = get_or_calculate(
+                reference_cache,
+                "data_drift_cat_feature",
+                reference_data[feature_name],
+                lambda: _get_cat_feature(reference_data[feature_name]),
+            )
+            feature_cur_data, cur_counts = _get_cat_feature(current_data[feature_name])
+            # counts are shared, they are completed with zeros for values that are only in the other data
+            ref_counts = ref_counts.copy()
+            cur_counts = cur_counts.copy()
 
             feature_type = "cat"
             stat_test = get_stattest(feature_ref_data,
                                      feature_cur_data,
                                      feature_type,
-                                     data_drift_options.get_feature_stattest_func(feature_name, feature_type))
+                                     options.get_feature_stattest_func(feature_name, feature_type))
             drift_result = stat_test(feature_ref_data, feature_cur_data, feature_type, threshold)
-            p_value = drift_result.drift_score
-            drifted = drift_result.drifted
-            threshold = drift_result.actual_threshold
 
-            p_values[feature_name] = PValueWithDrift(p_value, drifted)
-
-            ref_counts = feature_ref_data.value_counts(sort=False)
-            cur_counts = feature_cur_data.value_counts(sort=False)
             keys = set(ref_counts.keys()).union(set(cur_counts.keys()))
             for key in keys:
                 if key not in ref_counts:
@@ -160,30 +365,17 @@ class DataDriftAnalyzer(Analyzer):
                     cur_counts[key] = 0
             ref_small_hist = list(reversed(list(map(list, zip(*sorted(ref_counts.items(), key=lambda x: x[0]))))))
             cur_small_hist = list(reversed(list(map(list, zip(*sorted(cur_counts.items(), key=lambda x: x[0]))))))
-            features_metrics[feature_name] = DataDriftAnalyzerFeatureMetrics(
+            results[feature_name] = DataDriftAnalyzerFeatureMetrics(
                 ref_small_hist=ref_small_hist,
                 current_small_hist=cur_small_hist,
-                feature_type='cat',
+                feature_type=feature_type,
                 stattest_name=stat_test.display_name,
-                p_value=p_value,
-                drift_detected=drifted,
-                threshold=threshold,
+                p_value=drift_result.drift_score,
+                drift_detected=drift_result.drifted,
+                threshold=drift_result.actual_threshold,
             )
 
-        n_drifted_features, share_drifted_features, dataset_drift = dataset_drift_evaluation(p_values, drift_share)
-        result_metrics = DataDriftAnalyzerMetrics(
-            n_features=len(num_feature_names) + len(cat_feature_names),
-            n_drifted_features=n_drifted_features,
-            share_drifted_features=share_drifted_features,
-            dataset_drift=dataset_drift,
-            features=features_metrics,
-        )
-        result = DataDriftAnalyzerResults(
-            columns=columns,
-            options=data_drift_options,
-            metrics=result_metrics,
-        )
-        return result
+        return results
 
     @staticmethod
     def _get_pred_labels_from_prob(data: pd.DataFrame, prediction_column: list):
@@ -191,3 +383,53 @@ class DataDriftAnalyzer(Analyzer):
         prediction_ids = np.argmax(array_prediction, axis=-1)
         prediction_labels = [prediction_column[x] for x in prediction_ids]
         return prediction_labels
+
+
+def _calculate_features_drift(
+        reference_data: pd.DataFrame,
+        current_data: pd.DataFrame,
+        num_feature_names: List[str],
+        cat_feature_names: List[str],
+        options: DataDriftOptions,
+        reference_cache: Optional[ReferenceCache],
+) -> Dict[str, DataDriftAnalyzerFeatureMetrics]:
+    features_metrics = {}
+    num_drift = DataDriftAnalyzer._calculate_num_drift(
+        reference_data, current_data, num_feature_names, options, reference_cache
+    )
+
+    for feature_name, (drift_result, test_name, current_small_hist, ref_small_hist) in num_drift.items():
+        features_metrics[feature_name] = DataDriftAnalyzerFeatureMetrics(
+            current_small_hist=current_small_hist,
+            ref_small_hist=copy.deepcopy(ref_small_hist),
+            feature_type='num',
+            stattest_name=test_name,
+            p_value=drift_result.drift_score,
+            drift_detected=drift_result.drifted,
+            threshold=drift_result.actual_threshold,
+        )
+
+    features_metrics.update(
+        DataDriftAnalyzer._calculate_cat_drift(
+            reference_data, current_data, cat_feature_names, options, reference_cache
+        )
+    )
+    return features_metrics
+
+
+def _calculate_features_drift_with_shared_data(
+        reference_data: SharedDataFrame,
+        current_data: SharedDataFrame,
+        num_feature_names: List[str],
+        cat_feature_names: List[str],
+        options: DataDriftOptions,
+        reference_cache: Optional[ReferenceCache],
+) -> Dict[str, DataDriftAnalyzerFeatureMetrics]:
+    attached_reference_data = reference_data.attach()
+    attached_current_data = current_data.attach()
+
+    with register_dataset_views(attached_reference_data, attached_current_data):
+        return _calculate_features_drift(
+            attached_reference_data, attached_current_data, num_feature_names, cat_feature_names, options,
+            reference_cache,
+        )
@@ -1,21 +1,49 @@
 #!/usr/bin/env python
 # coding: utf-8
+import copy
+from typing import Any
 from typing import Dict
 from typing import Callable
+from typing import List
 from typing import Optional
+from typing import Tuple
 from typing import Union
 
 from dataclasses import dataclass, fields
 import numpy as np
 import pandas as pd
-from scipy.stats import chi2_contingency
+from pandas.api.types import is_scalar
 
 from evidently import ColumnMapping
 from evidently.analyzers.base_analyzer import Analyzer
 from evidently.analyzers.base_analyzer import BaseAnalyzerResult
+from evidently.analyzers.stattests.batch import split_batches
 from evidently.analyzers.utils import DatasetColumns
 from evidently.analyzers.utils import process_columns
 from evidently.analyzers.utils import recognize_task
+from evidently.options import QualityMetricsOptions
+from evidently.options import ReferenceCacheOptions
+from evidently.utils.correlations import factorize_column
+from evidently.utils.correlations import get_cramer_v
+from evidently.utils.correlations import get_cramer_v_matrix
+from evidently.utils.dataset_view import get_column_view
+from evidently.utils.reference_cache import ReferenceCache
+from evidently.utils.reference_cache import get_active_reference_cache
+from evidently.utils.reference_cache import get_or_calculate
+from evidently.utils.reference_cache import resolve_reference_cache
+from evidently.utils.sketches import DEFAULT_CHUNK_SIZE
+from evidently.utils.sketches import HyperLogLogSketch
+from evidently.utils.sketches import SpaceSavingSketch
+
+# fields of stats of categorical features that are estimated with sketches in the approximate mode
+APPROXIMATE_UNIQUE_FIELDS = ["unique_count", "unique_percentage"]
+APPROXIMATE_MOST_COMMON_FIELDS = [
+    "most_common_value",
+    "most_common_value_percentage",
+    "most_common_not_null_value",
+    "most_common_not_null_value_percentage",
+]
+APPROXIMATE_NEW_VALUES_FIELDS = ["new_in_current_values_count", "unused_in_current_values_count"]
 
 
 @dataclass
@@ -54,6 +82,8 @@ class FeatureQualityStats:
             Defined for reference dataset only.
         - new_in_current_values_count - quantity of values in the reference dataset that not presented in the current
             Defined for reference dataset only.
+
+    approximate_fields - names of the fields that are estimated with sketches, None if all the stats are exact.
     """
 
     # feature type - cat for category, num for numeric, datetime for datetime features
@@ -79,6 +109,7 @@ class FeatureQualityStats:
     most_common_not_null_value_percentage: Optional[float] = None
     new_in_current_values_count: Optional[int] = None
     unused_in_current_values_count: Optional[int] = None
+    approximate_fields: Optional[List[str]] = None
 
     def is_datetime(self):
         """Checks that the object store stats for a datetime feature"""
@@ -100,8 +131,9 @@ class FeatureQualityStats:
             other_field_value = getattr(other, field.name)
             self_field_value = getattr(self, field.name)
 
-            if pd.isnull(other_field_value) and pd.isnull(self_field_value):
-                continue
+            if is_scalar(other_field_value) and is_scalar(self_field_value):
+                if pd.isnull(other_field_value) and pd.isnull(self_field_value):
+                    continue
 
             if not other_field_value == self_field_value:
                 return False
@@ -154,6 +186,292 @@ class DataQualityAnalyzerResults(BaseAnalyzerResult):
     reference_correlations: Dict[str, pd.DataFrame]
     current_features_stats: Optional[DataQualityStats] = None
     current_correlations: Optional[Dict[str, pd.DataFrame]] = None
+    # numbers of rows correlation matrices are calculated with, less than the data size for sampled kinds
+    reference_correlations_sample_sizes: Optional[Dict[str, int]] = None
+    current_correlations_sample_sizes: Optional[Dict[str, int]] = None
+
+
+def set_value_counts_stats(
+    result: FeatureQualityStats,
+    all_values_count: int,
+    missing_count: int,
+    unique_count: int,
+    most_common_not_null: Optional[Tuple[Any, int]],
+    null_value: Any,
+    is_null_first: Callable[[], bool],
+) -> None:
+    """Set counts and the most common values of a feature, the same way as with `Series.value_counts(dropna=False)`.
+
+    Args:
+        most_common_not_null: the most common not null value with its count, None if there are no such values.
+        null_value: the first missing value of the feature, it is the most common value if missing values prevail.
+        is_null_first: whether the first missing value goes before the most common not null value in the feature,
+            it resolves a tie of the counts in the same way as `value_counts`.
+    """
+    def get_percentage_from_all_values(value: int) -> float:
+        return np.round(100 * value / all_values_count, 2)
+
+    result.missing_count = missing_count
+    result.count = all_values_count - missing_count
+    result.missing_percentage = get_percentage_from_all_values(missing_count)
+    result.unique_count = unique_count
+    result.unique_percentage = get_percentage_from_all_values(unique_count)
+
+    if most_common_not_null is None:
+        result.most_common_value = null_value
+        result.most_common_value_percentage = get_percentage_from_all_values(missing_count)
+        return
+
+    value, count = most_common_not_null
+
+    if missing_count > count or (missing_count == count and is_null_first()):
+        result.most_common_value = null_value
+        result.most_common_value_percentage = get_percentage_from_all_values(missing_count)
+        result.most_common_not_null_value = value
+        result.most_common_not_null_value_percentage = get_percentage_from_all_values(count)
+
+    else:
+        result.most_common_value = value
+        result.most_common_value_percentage = get_percentage_from_all_values(count)
+
+
+@dataclass
+class CatFeatureSketches:
+    """Counts of values of a categorical feature and sketches of its not missing values"""
+
+    all_values_count: int
+    missing_count: int
+    # the first missing value of the feature
+    null_value: Any
+    unique_values: HyperLogLogSketch
+    most_common_values: SpaceSavingSketch
+
+
+def _get_cat_feature_sketches(feature: pd.Series, hll_precision: int, capacity: int) -> CatFeatureSketches:
+    """Sketches of a feature calculated by chunks, memory does not depend on the number of unique values"""
+    result = CatFeatureSketches(
+        all_values_count=feature.shape[0],
+        missing_count=0,
+        null_value=None,
+        unique_values=HyperLogLogSketch(hll_precision),
+        most_common_values=SpaceSavingSketch(capacity),
+    )
+
+    for start in range(0, feature.shape[0], DEFAULT_CHUNK_SIZE):
+        chunk = feature.iloc[start: start + DEFAULT_CHUNK_SIZE]
+        # the chunk is factorized once: unique values are hashed and counted only
+        codes, uniques = pd.factorize(chunk)
+        null_mask = codes < 0
+
+        if result.missing_count == 0 and null_mask.any():
+            result.null_value = chunk.iloc[int(np.argmax(null_mask))]
+
+        result.missing_count += int(null_mask.sum())
+        result.unique_values.update(uniques, categorize=False)
+        result.most_common_values.update_counts(uniques, np.bincount(codes[~null_mask], minlength=len(uniques)))
+
+    return result
+
+
+def _get_approximate_cat_stats(sketches: CatFeatureSketches) -> FeatureQualityStats:
+    """Stats of a categorical feature with estimated unique count and the most common values"""
+    result = FeatureQualityStats(feature_type="cat")
+
+    if not sketches.all_values_count > 0:
+        return result
+
+    most_common_values = sketches.most_common_values
+    # the sketch keeps real values: there are at least as many unique values and not more than all values
+    unique_count = min(
+        max(sketches.unique_values.count(), most_common_values.values.shape[0]),
+        sketches.all_values_count - sketches.missing_count,
+    )
+    set_value_counts_stats(
+        result,
+        sketches.all_values_count,
+        sketches.missing_count,
+        unique_count,
+        most_common_values.get_most_common(),
+        sketches.null_value,
+        # positions of values are not kept, a tie goes to the not missing value
+        lambda: False,
+    )
+    result.approximate_fields = list(APPROXIMATE_UNIQUE_FIELDS)
+
+    if not most_common_values.is_exact:
+        result.approximate_fields += APPROXIMATE_MOST_COMMON_FIELDS
+
+    return result
+
+
+def _set_approximate_new_values_counts(
+    result: FeatureQualityStats,
+    reference_stats: Optional[FeatureQualityStats],
+    current_sketch: HyperLogLogSketch,
+    reference_sketch: Optional[HyperLogLogSketch],
+) -> None:
+    """Estimate numbers of new and unused values of the current feature by the sketch of the union of the features.
+
+    Errors of the estimates are relative to the number of unique values in both features, not to the estimates.
+    """
+    if reference_sketch is None:
+        reference_sketch = HyperLogLogSketch(current_sketch.precision)
+
+    union_sketch = copy.deepcopy(reference_sketch)
+    union_sketch.merge(current_sketch)
+    union_count = union_sketch.count()
+    # missing values are counted as a value that is the same in both features
+    current_has_nulls = bool(result.missing_count)
+    reference_has_nulls = reference_stats is not None and bool(reference_stats.missing_count)
+    result.new_in_current_values_count = max(union_count - reference_sketch.count(), 0) + int(
+        current_has_nulls and not reference_has_nulls
+    )
+    result.unused_in_current_values_count = max(union_count - current_sketch.count(), 0) + int(
+        reference_has_nulls and not current_has_nulls
+    )
+    result.approximate_fields = (result.approximate_fields or []) + APPROXIMATE_NEW_VALUES_FIELDS
+
+
+def _is_fused_dtype(dtype) -> bool:
+    """Check that stats of features of the type can be calculated at once with `_get_num_values_stats`"""
+    return isinstance(dtype, np.dtype) and dtype in (np.float64, np.int64)
+
+
+def _get_sorted_percentiles(sorted_values: np.ndarray, counts: np.ndarray, quantile: float) -> np.ndarray:
+    """Percentiles of columns of sorted values with missing values in the end, the same as `np.percentile`"""
+    last_indexes = np.maximum(counts - 1, 0)
+    virtual_indexes = last_indexes * quantile
+    previous_indexes = np.floor(virtual_indexes).astype(np.intp)
+    next_indexes = np.minimum(previous_indexes + 1, last_indexes)
+    gamma = virtual_indexes - previous_indexes
+    columns = np.arange(sorted_values.shape[1])
+    previous_values = sorted_values[previous_indexes, columns].astype(np.float64)
+    next_values = sorted_values[next_indexes, columns].astype(np.float64)
+
+    with np.errstate(invalid="ignore"):
+        # linear interpolation of `np.percentile`
+        diff = next_values - previous_values
+        result = np.where(gamma >= 0.5, next_values - diff * (1 - gamma), previous_values + diff * gamma)
+
+    return np.where(counts > 0, result, np.nan)
+
+
+def _get_num_values_stats(values: np.ndarray) -> List[FeatureQualityStats]:
+    """Stats of numerical features given by columns of a not empty 2-D array, calculated at once for all columns.
+
+    The results are the same as of `DataQualityAnalyzer._get_features_stats` for every column.
+    """
+    all_values_count = values.shape[0]
+
+    if values.dtype.kind == "f":
+        null_mask = np.isnan(values)
+        missing_counts = null_mask.sum(axis=0)
+        infinite_counts = np.isinf(values).sum(axis=0)
+        filled_values = np.where(null_mask, 0.0, values)
+
+    else:
+        null_mask = None
+        missing_counts = np.zeros(values.shape[1], dtype=np.intp)
+        infinite_counts = missing_counts
+        filled_values = values.astype(np.float64)
+
+    counts = all_values_count - missing_counts
+    sorted_values = np.sort(values, axis=0)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        # mean and std are calculated the same way as in `Series.describe`
+        means = filled_values.sum(axis=0) / counts
+        np.subtract(means, filled_values, out=filled_values)
+        np.square(filled_values, out=filled_values)
+
+        if null_mask is not None:
+            filled_values[null_mask] = 0.0
+
+        stds = np.where(counts > 1, np.sqrt(filled_values.sum(axis=0) / (counts - 1)), np.nan)
+
+    percentiles = [_get_sorted_percentiles(sorted_values, counts, quantile) for quantile in (0.25, 0.5, 0.75)]
+    results = []
+
+    for position in range(values.shape[1]):
+        column_values = values[:, position]
+        count = int(counts[position])
+        result = FeatureQualityStats(feature_type="num")
+        most_common_not_null: Optional[Tuple[Any, int]] = None
+        unique_count = 0
+
+        if count > 0:
+            not_null_values = sorted_values[:count, position]
+            run_starts = np.flatnonzero(np.concatenate([[True], not_null_values[1:] != not_null_values[:-1]]))
+            run_counts = np.diff(np.append(run_starts, count))
+            unique_count = run_starts.shape[0]
+            max_count = int(run_counts.max())
+            candidates = not_null_values[run_starts[run_counts == max_count]]
+            # value_counts puts the first found value first among values with the same count
+            value_position = int(np.argmax(np.isin(column_values, candidates)))
+            most_common_not_null = (column_values[value_position], max_count)
+
+        null_position = int(np.argmax(null_mask[:, position])) if null_mask is not None else 0
+        set_value_counts_stats(
+            result,
+            all_values_count,
+            int(missing_counts[position]),
+            unique_count,
+            most_common_not_null,
+            column_values[null_position],
+            lambda: null_position < value_position,
+        )
+        # round most common feature value for numeric features to 1e-5
+        result.most_common_value = np.round(result.most_common_value, 5)
+        result.infinite_count = int(infinite_counts[position])
+        result.infinite_percentage = np.round(100 * result.infinite_count / all_values_count, 2)
+
+        if count > 0:
+            result.max = np.round(sorted_values[count - 1, position], 2)
+            result.min = np.round(sorted_values[0, position], 2)
+
+        else:
+            result.max = result.min = np.nan
+
+        result.std = np.round(stds[position], 2)
+        result.mean = np.round(means[position], 2)
+        result.percentile_25 = np.round(percentiles[0][position], 2)
+        result.percentile_50 = np.round(percentiles[1][position], 2)
+        result.percentile_75 = np.round(percentiles[2][position], 2)
+        results.append(result)
+
+    return results
+
+
+def _get_num_features_stats(dataset: pd.DataFrame, feature_names: List[str]) -> Dict[str, FeatureQualityStats]:
+    """Stats of numerical features.
+
+    Features with the same numeric type are calculated at once by batches, see `_get_num_values_stats`,
+    other features are calculated one by one.
+    """
+    results: Dict[str, FeatureQualityStats] = {}
+    fused_features: Dict[np.dtype, List[str]] = {}
+
+    for feature_name in dict.fromkeys(feature_names):
+        dtype = dataset[feature_name].dtype
+
+        if dataset.shape[0] > 0 and _is_fused_dtype(dtype):
+            fused_features.setdefault(dtype, []).append(feature_name)
+
+        else:
+            results[feature_name] = DataQualityAnalyzer._get_features_stats(dataset[feature_name], feature_type="num")
+
+    for dtype, dtype_feature_names in fused_features.items():
+        for batch in split_batches(dtype_feature_names, dataset.shape[0]):
+            # columns are contiguous to sum them up in the same order as pandas does
+            values = np.empty((dataset.shape[0], len(batch)), dtype=dtype, order="F")
+
+            for position, feature_name in enumerate(batch):
+                values[:, position] = dataset[feature_name].to_numpy()
+
+            results.update(zip(batch, _get_num_values_stats(values)))
+
+    return {feature_name: results[feature_name] for feature_name in feature_names}
+
 
 
 class DataQualityAnalyzer(Analyzer):
@@ -165,16 +483,95 @@ class DataQualityAnalyzer(Analyzer):
     def get_results(analyzer_results) -> DataQualityAnalyzerResults:
         return analyzer_results[DataQualityAnalyzer]
 
-    def _calculate_stats(self, dataset: pd.DataFrame, columns: DatasetColumns, task: Optional[str]) -> DataQualityStats:
+    def _get_reference_cache(self) -> Optional[ReferenceCache]:
+        # the analyzer can be used without options, unlike other analyzers
+        options_provider = getattr(self, "options_provider", None)
+
+        if options_provider is None:
+            return get_active_reference_cache()
+
+        return resolve_reference_cache(options_provider.get(ReferenceCacheOptions).cache)
+
+    def _get_options(self) -> QualityMetricsOptions:
+        options_provider = getattr(self, "options_provider", None)
+
+        if options_provider is None:
+            return QualityMetricsOptions()
+
+        return options_provider.get(QualityMetricsOptions)
+
+    def _calculate_stats(
+        self,
+        dataset: pd.DataFrame,
+        columns: DatasetColumns,
+        task: Optional[str],
+        reference_cache: Optional[ReferenceCache] = None,
+        unique_values_sketches: Optional[Dict[str, HyperLogLogSketch]] = None,
+    ) -> DataQualityStats:
+        """Stats of all features of the dataset.
+
+        Sketches of unique values of categorical features are added to `unique_values_sketches`
+        if stats are approximate.
+        """
+        options = self._get_options()
+        target_name = columns.utility_columns.target
+        prediction_name = columns.utility_columns.prediction
+        num_feature_names = list(columns.num_feature_names)
+
+        if task != "classification":
+            num_feature_names += [
+                name for name in (target_name, prediction_name) if isinstance(name, str) and name in dataset
+            ]
+
+        num_features_stats = get_or_calculate(
+            reference_cache,
+            "data_quality_num_features_stats",
+            [dataset[feature_name] for feature_name in num_feature_names],
+            lambda: _get_num_features_stats(dataset, num_feature_names),
+        )
+
+        def get_features_stats(feature_name: str, feature_type: str) -> FeatureQualityStats:
+            if feature_type == "num":
+                stats = num_features_stats[feature_name]
+
+            elif feature_type == "cat" and options.approximate_cat_stats:
+                sketches = get_or_calculate(
+                    reference_cache,
+                    "data_quality_cat_sketches",
+                    dataset[feature_name],
+                    lambda: _get_cat_feature_sketches(
+                        dataset[feature_name], options.hll_precision, options.heavy_hitters_capacity
+                    ),
+                    options.hll_precision,
+                    options.heavy_hitters_capacity,
+                )
+
+                if unique_values_sketches is not None:
+                    unique_values_sketches[feature_name] = sketches.unique_values
+
+                # the stats are not cached: they are cheap to get from the sketches
+                return _get_approximate_cat_stats(sketches)
+
+            else:
+                stats = get_or_calculate(
+                    reference_cache,
+                    "data_quality_feature_stats",
+                    dataset[feature_name],
+                    lambda: self._get_features_stats(dataset[feature_name], feature_type=feature_type),
+                    feature_type,
+                )
+            # cached stats are shared, the result can be changed later
+            return copy.copy(stats) if reference_cache is not None else stats
+
         result = DataQualityStats()
 
         result.num_features_stats = {
-            feature_name: self._get_features_stats(dataset[feature_name], feature_type="num")
+            feature_name: get_features_stats(feature_name, feature_type="num")
             for feature_name in columns.num_feature_names
         }
 
         result.cat_features_stats = {
-            feature_name: self._get_features_stats(dataset[feature_name], feature_type="cat")
+            feature_name: get_features_stats(feature_name, feature_type="cat")
             for feature_name in columns.cat_feature_names
         }
 
@@ -185,35 +582,27 @@ class DataQualityAnalyzer(Analyzer):
             date_list = columns.datetime_feature_names
 
         result.datetime_features_stats = {
-            feature_name: self._get_features_stats(dataset[feature_name], feature_type="datetime")
+            feature_name: get_features_stats(feature_name, feature_type="datetime")
             for feature_name in date_list
         }
 
-        target_name = columns.utility_columns.target
-
         if target_name is not None and target_name in dataset:
             result.target_stats = {}
 
             if task == "classification":
-                result.target_stats[target_name] = self._get_features_stats(dataset[target_name], feature_type="cat")
+                result.target_stats[target_name] = get_features_stats(target_name, feature_type="cat")
 
             else:
-                result.target_stats[target_name] = self._get_features_stats(dataset[target_name], feature_type="num")
-
-        prediction_name = columns.utility_columns.prediction
+                result.target_stats[target_name] = get_features_stats(target_name, feature_type="num")
 
         if isinstance(prediction_name, str) and prediction_name in dataset:
             result.prediction_stats = {}
 
             if task == "classification":
-                result.prediction_stats[prediction_name] = self._get_features_stats(
-                    dataset[prediction_name], feature_type="cat"
-                )
+                result.prediction_stats[prediction_name] = get_features_stats(prediction_name, feature_type="cat")
 
             else:
-                result.prediction_stats[prediction_name] = self._get_features_stats(
-                    dataset[prediction_name], feature_type="num"
-                )
+                result.prediction_stats[prediction_name] = get_features_stats(prediction_name, feature_type="num")
 
         return result
 
@@ -241,6 +630,7 @@ class DataQualityAnalyzer(Analyzer):
 
         columns = process_columns(reference_data, column_mapping)
         target_name = columns.utility_columns.target
+        reference_cache = self._get_reference_cache()
         task: Optional[str]
 
         if column_mapping.task is not None:
@@ -252,12 +642,16 @@ class DataQualityAnalyzer(Analyzer):
         else:
             task = None
 
-        reference_features_stats = self._calculate_stats(reference_data, columns, task)
+        reference_sketches: Dict[str, HyperLogLogSketch] = {}
+        reference_features_stats = self._calculate_stats(
+            reference_data, columns, task, reference_cache, reference_sketches
+        )
 
         current_features_stats: Optional[DataQualityStats]
 
         if current_data is not None:
-            current_features_stats = self._calculate_stats(current_data, columns, task)
+            current_sketches: Dict[str, HyperLogLogSketch] = {}
+            current_features_stats = self._calculate_stats(current_data, columns, task, None, current_sketches)
 
             all_cat_features = {}
 
@@ -270,10 +664,26 @@ class DataQualityAnalyzer(Analyzer):
             if current_features_stats.cat_features_stats is not None:
                 # calculate additional stats of representation reference dataset values in the current dataset
                 for feature_name, cat_feature_stats in all_cat_features.items():
-                    current_values_set = set(current_data[feature_name].unique())
+                    if feature_name in current_sketches:
+                        _set_approximate_new_values_counts(
+                            cat_feature_stats,
+                            reference_features_stats.get_all_features().get(feature_name),
+                            current_sketches[feature_name],
+                            reference_sketches.get(feature_name),
+                        )
+                        continue
+
+                    current_values_set = set(get_column_view(current_data[feature_name]).unique())
 
                     if feature_name in reference_data:
-                        reference_values_set = set(reference_data[feature_name].unique())
+                        reference_values_set = set(
+                            get_or_calculate(
+                                reference_cache,
+                                "data_quality_unique_values",
+                                reference_data[feature_name],
+                                get_column_view(reference_data[feature_name]).unique,
+                            )
+                        )
 
                     else:
                         reference_values_set = set()
@@ -297,26 +707,22 @@ class DataQualityAnalyzer(Analyzer):
             current_features_stats = None
 
         # calculate correlations
-
+        options = self._get_options()
         num_for_corr, cat_for_corr = self._select_features_for_corr(reference_features_stats, target_name)
-        reference_correlations = {}
-        current_correlations = {}
-        for kind in ["pearson", "spearman", "kendall", "cramer_v"]:
-            reference_correlations[kind] = self._calculate_correlations(
-                reference_data, num_for_corr, cat_for_corr, kind
-            )
-            if current_data is not None:
-                current_correlations[kind] = self._calculate_correlations(
-                    current_data, num_for_corr, cat_for_corr, kind
-                )
+        reference_correlations, reference_sample_sizes = self._calculate_correlations_by_kinds(
+            reference_data, num_for_corr, cat_for_corr, options, reference_cache
+        )
         results = DataQualityAnalyzerResults(
             columns=columns,
             reference_features_stats=reference_features_stats,
             reference_correlations=reference_correlations,
+            reference_correlations_sample_sizes=reference_sample_sizes,
         )
-        if current_features_stats is not None:
+        if current_data is not None and current_features_stats is not None:
             results.current_features_stats = current_features_stats
-            results.current_correlations = current_correlations
+            results.current_correlations, results.current_correlations_sample_sizes = (
+                self._calculate_correlations_by_kinds(current_data, num_for_corr, cat_for_corr, options)
+            )
 
         return results
 
@@ -332,20 +738,27 @@ class DataQualityAnalyzer(Analyzer):
             # we have no data, return default stats for en empty dataset
             return result
 
-        result.missing_count = int(feature.isnull().sum())
-        result.count = int(feature.count())
-        all_values_count = feature.shape[0]
-        value_counts = feature.value_counts(dropna=False)
-        result.missing_percentage = np.round(100 * result.missing_count / all_values_count, 2)
-        unique_count: int = feature.nunique()
-        result.unique_count = unique_count
-        result.unique_percentage = get_percentage_from_all_values(unique_count)
-        result.most_common_value = value_counts.index[0]
-        result.most_common_value_percentage = get_percentage_from_all_values(value_counts.iloc[0])
-
-        if result.count > 0 and pd.isnull(result.most_common_value):
-            result.most_common_not_null_value = value_counts.index[1]
-            result.most_common_not_null_value_percentage = get_percentage_from_all_values(value_counts.iloc[1])
+        # all value counts are calculated from one factorization, codes of values are in order of appearance
+        codes, uniques = pd.factorize(feature)
+        null_mask = codes < 0
+        value_counts = np.bincount(codes[~null_mask], minlength=len(uniques))
+        most_common_not_null: Optional[Tuple[Any, int]] = None
+        null_position = int(np.argmax(null_mask))
+
+        if len(uniques) > 0:
+            # the first found value goes first among values with the same count
+            most_common_code = int(np.argmax(value_counts))
+            most_common_not_null = (uniques[most_common_code], int(value_counts[most_common_code]))
+
+        set_value_counts_stats(
+            result,
+            all_values_count,
+            int(null_mask.sum()),
+            len(uniques),
+            most_common_not_null,
+            feature.iloc[null_position],
+            lambda: null_position < int(np.argmax(codes == most_common_code)),
+        )
 
         if feature_type == "num":
             # round most common feature value for numeric features to 1e-5
@@ -420,16 +833,7 @@ class DataQualityAnalyzer(Analyzer):
         Returns:
             Value of the Cramér's V
         """
-        arr = pd.crosstab(x, y).values
-        chi2_stat = chi2_contingency(arr, correction=False)
-        phi2 = chi2_stat[0] / arr.sum()
-        n_rows, n_cols = arr.shape
-        if min(n_cols - 1, n_rows - 1) == 0:
-            value = np.nan
-        else:
-            value = np.sqrt(phi2 / min(n_cols - 1, n_rows - 1))
-
-        return value
+        return get_cramer_v(*factorize_column(x), *factorize_column(y))
 
     def _corr_matrix(self, df: pd.Series, func: Callable[[pd.Series, pd.Series], float]) -> pd.DataFrame:
         """Compute pairwise correlation of columns
@@ -455,7 +859,83 @@ class DataQualityAnalyzer(Analyzer):
                     corr_array[j, i] = c
             return pd.DataFrame(data=corr_array, columns=columns, index=columns)
 
-    def _calculate_correlations(self, df, num_for_corr, cat_for_corr, kind):
+    def _calculate_correlations_by_kinds(
+        self,
+        df: pd.DataFrame,
+        num_for_corr: List[str],
+        cat_for_corr: List[str],
+        options: QualityMetricsOptions,
+        reference_cache: Optional[ReferenceCache] = None,
+    ) -> Tuple[Dict[str, pd.DataFrame], Dict[str, int]]:
+        """Calculate correlation matrices of the kinds selected in the options.
+
+        Spearman and Kendall correlations share one rank transform of the numerical features.
+        Matrices of the reference data are taken from the cache if it is set.
+
+        Returns:
+            Correlation matrices and numbers of rows they are calculated with.
+        """
+        samples: Dict[Optional[int], pd.DataFrame] = {}
+        ranks: Dict[Optional[int], Optional[pd.DataFrame]] = {}
+
+        def get_sample(sample_size: Optional[int]) -> pd.DataFrame:
+            if sample_size not in samples:
+                data = df[num_for_corr + cat_for_corr]
+                samples[sample_size] = (
+                    data if sample_size is None
+                    else data.sample(n=sample_size, random_state=options.correlation_random_state)
+                )
+
+            return samples[sample_size]
+
+        def get_ranks(sample_size: Optional[int]) -> Optional[pd.DataFrame]:
+            if sample_size not in ranks:
+                num_data = get_sample(sample_size)[num_for_corr]
+                # pandas ranks values of every pair of features separately if some values are missing
+                ranks[sample_size] = None if num_data.isnull().values.any() else num_data.rank()
+
+            return ranks[sample_size]
+
+        def calculate(kind: str, sample_size: Optional[int]) -> pd.DataFrame:
+            feature_ranks = get_ranks(sample_size) if kind in ("spearman", "kendall") else None
+            return self._calculate_correlations(
+                get_sample(sample_size), num_for_corr, cat_for_corr, kind, feature_ranks, options
+            )
+
+        correlations = {}
+        sample_sizes = {}
+
+        for kind in options.correlation_kinds:
+            sample_size = options.get_correlation_sample_size(kind, df.shape[0])
+            sample_sizes[kind] = df.shape[0] if sample_size is None else sample_size
+
+            if reference_cache is None:
+                correlations[kind] = calculate(kind, sample_size)
+                continue
+
+            features = cat_for_corr if kind == "cramer_v" else num_for_corr
+            correlations[kind] = reference_cache.get_or_calculate(
+                "data_quality_correlations",
+                df[features],
+                lambda: calculate(kind, sample_size),
+                kind,
+                sample_size,
+                options.correlation_random_state if sample_size is not None else None,
+                # Cramér's V of features with more categories is NaN
+                options.cramer_v_max_categories if kind == "cramer_v" else None,
+            ).copy()
+
+        return correlations, sample_sizes
+
+    def _calculate_correlations(
+        self,
+        df,
+        num_for_corr,
+        cat_for_corr,
+        kind,
+        ranks: Optional[pd.DataFrame] = None,
+        options: Optional[QualityMetricsOptions] = None,
+    ):
         """Calculate correlation matrix depending on the kind parameter
         Args:
             df: initial data frame.
@@ -466,14 +946,24 @@ class DataQualityAnalyzer(Analyzer):
                 - kendall - Kendall Tau correlation coefficient
                 - spearman - Spearman rank correlation
                 - cramer_v - Cramer’s V measure of association
+            ranks: average ranks of the numerical features without missing values, if they are calculated already.
+            options: options of Cramér's V calculation.
         Returns:
             Correlation matrix.
         """
         if kind == "pearson":
             return df[num_for_corr].corr("pearson")
         elif kind == "spearman":
-            return df[num_for_corr].corr("spearman")
+            # Spearman correlation is Pearson correlation of ranks
+            return df[num_for_corr].corr("spearman") if ranks is None else ranks.corr("pearson")
         elif kind == "kendall":
-            return df[num_for_corr].corr("kendall")
+            # Kendall correlation does not change with ranking
+            return df[num_for_corr].corr("kendall") if ranks is None else ranks.corr("kendall")
         elif kind == "cramer_v":
-            return self._corr_matrix(df[cat_for_corr], self._cramer_v)
+            options = options or QualityMetricsOptions()
+            return get_cramer_v_matrix(
+                df[cat_for_corr],
+                n_jobs=options.cramer_v_n_jobs,
+                backend=options.cramer_v_backend,
+                max_categories=options.cramer_v_max_categories,
+            )
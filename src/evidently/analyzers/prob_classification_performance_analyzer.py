@@ -3,6 +3,7 @@
 from typing import Dict
 from typing import List
 from typing import Optional
+from typing import Tuple
 from typing import Union
 
 import numpy as np
@@ -16,6 +17,14 @@ from evidently.analyzers.base_analyzer import BaseAnalyzerResult
 from evidently.options import QualityMetricsOptions
 from evidently.analyzers.utils import process_columns
 from evidently.analyzers.utils import calculate_confusion_by_classes
+from evidently.utils.confusion_matrix import BinaryThresholdSweep
+from evidently.utils.confusion_matrix import get_confusion_matrix
+from evidently.utils.confusion_matrix import get_confusion_matrix_metrics
+from evidently.utils.curves import get_pr_curve
+from evidently.utils.curves import get_pr_table
+from evidently.utils.curves import get_roc_curve
+from evidently.utils.multiclass import SparseConfusionMatrix
+from evidently.utils.multiclass import get_multiclass_metrics
 
 
 @dataclass
@@ -40,6 +49,8 @@ class ProbClassificationPerformanceMetrics:
     roc_curve: Optional[dict] = None
     pr_curve: Optional[dict] = None
     pr_table: Optional[Union[dict, list]] = None
+    # in the multiclass mode for many classes, detailed data is for the top classes only
+    sparse_confusion_matrix: Optional[SparseConfusionMatrix] = None
 
 
 @dataclass
@@ -49,7 +60,128 @@ class ProbClassificationPerformanceAnalyzerResults(BaseAnalyzerResult):
     current_metrics: Optional[ProbClassificationPerformanceMetrics] = None
 
 
+def _calculate_curves(
+    data: pd.DataFrame,
+    binaraized_target: np.ndarray,
+    label: str,
+    label_position: int,
+    max_curve_points: Optional[int],
+) -> Tuple[dict, dict, list]:
+    """ROC curve, PR curve and PR table of the label, probabilities of the label are sorted once"""
+    sweep = BinaryThresholdSweep(binaraized_target[:, label_position].astype(bool), data[label].to_numpy())
+    return get_roc_curve(sweep, max_curve_points), get_pr_curve(sweep, max_curve_points), get_pr_table(sweep)
+
+
+def _calculate_top_classes_metrics(
+    data: pd.DataFrame,
+    target_column: str,
+    prediction_column: List[str],
+    quality_metrics_options: QualityMetricsOptions,
+) -> ProbClassificationPerformanceMetrics:
+    """Metrics of data with many classes, curves and metrics of classes are calculated for the top classes only"""
+    prediction_ids = np.argmax(data[prediction_column].to_numpy(), axis=-1)
+    multiclass_metrics = get_multiclass_metrics(
+        data[target_column],
+        np.array(prediction_column)[prediction_ids],
+        data[prediction_column],
+        quality_metrics_options.top_classes,
+        quality_metrics_options.top_classes_by,
+        quality_metrics_options.max_curve_points,
+    )
+    return ProbClassificationPerformanceMetrics(
+        accuracy=multiclass_metrics.quality_metrics.accuracy,
+        precision=multiclass_metrics.quality_metrics.precision,
+        recall=multiclass_metrics.quality_metrics.recall,
+        f1=multiclass_metrics.quality_metrics.f1,
+        roc_auc=multiclass_metrics.roc_auc,
+        log_loss=multiclass_metrics.log_loss,
+        metrics_matrix=multiclass_metrics.quality_metrics.metrics_matrix,
+        confusion_matrix=ConfusionMatrix(
+            labels=multiclass_metrics.top_labels, values=multiclass_metrics.confusion_matrix
+        ),
+        confusion_by_classes=multiclass_metrics.confusion_by_classes,
+        roc_aucs=multiclass_metrics.roc_aucs,
+        roc_curve=multiclass_metrics.roc_curve,
+        pr_curve=multiclass_metrics.pr_curve,
+        pr_table=multiclass_metrics.pr_table,
+        sparse_confusion_matrix=multiclass_metrics.sparse_confusion_matrix,
+    )
+
+
+def _calculate_performance_metrics(
+    data: pd.DataFrame,
+    target_column: str,
+    prediction_column: List[str],
+    labels: list,
+    quality_metrics_options: QualityMetricsOptions,
+) -> ProbClassificationPerformanceMetrics:
+    """Metrics of data without missing and infinite values"""
+    if quality_metrics_options.use_top_classes(len(prediction_column)):
+        return _calculate_top_classes_metrics(data, target_column, prediction_column, quality_metrics_options)
+
+    binaraized_target = (data[target_column].values.reshape(-1, 1) == prediction_column).astype(int)
+    array_prediction = data[prediction_column].to_numpy()
+
+    if len(prediction_column) > 2:
+        prediction_ids = np.argmax(array_prediction, axis=-1)
+        prediction_labels = np.array(prediction_column)[prediction_ids]
+
+    else:
+        prediction_labels = np.where(
+            data[prediction_column[0]] >= quality_metrics_options.classification_threshold,
+            prediction_column[0],
+            prediction_column[1],
+        )
+
+    # calculate quality metrics
+    roc_auc = metrics.roc_auc_score(binaraized_target, array_prediction, average='macro')
+    log_loss = metrics.log_loss(binaraized_target, array_prediction)
+    # calculate confusion matrix, quality metrics of predicted labels and metrics matrix are derived from it
+    conf_matrix, matrix_labels = get_confusion_matrix(data[target_column], prediction_labels)
+    quality_metrics = get_confusion_matrix_metrics(conf_matrix, matrix_labels)
+    roc_aucs = None
+
+    if len(prediction_column) > 2:
+        roc_aucs = metrics.roc_auc_score(binaraized_target, array_prediction, average=None).tolist()
+
+    # get TP, FP, TN, FN metrics for each class
+    confusion_by_classes = calculate_confusion_by_classes(conf_matrix, labels)
+    result = ProbClassificationPerformanceMetrics(
+        accuracy=quality_metrics.accuracy,
+        precision=quality_metrics.precision,
+        recall=quality_metrics.recall,
+        f1=quality_metrics.f1,
+        roc_auc=roc_auc,
+        log_loss=log_loss,
+        metrics_matrix=quality_metrics.metrics_matrix,
+        confusion_matrix=ConfusionMatrix(labels=labels, values=conf_matrix.tolist()),
+        roc_aucs=roc_aucs,
+        confusion_by_classes=confusion_by_classes,
+    )
+
+    # calculate ROC and PR curves, PR table
+    if len(prediction_column) <= 2:
+        # curves of the first label only
+        result.roc_curve, result.pr_curve, result.pr_table = _calculate_curves(
+            data, binaraized_target, prediction_column[0], 0, quality_metrics_options.max_curve_points
+        )
+
+    else:
+        result.roc_curve = {}
+        result.pr_curve = {}
+        result.pr_table = {}
+
+        for label_position, label in enumerate(prediction_column):
+            result.roc_curve[label], result.pr_curve[label], result.pr_table[label] = _calculate_curves(
+                data, binaraized_target, label, label_position, quality_metrics_options.max_curve_points
+            )
+
+    return result
+
+
 class ProbClassificationPerformanceAnalyzer(Analyzer):
+    removes_nans_and_infinities = True
+
     @staticmethod
     def get_results(analyzer_results) -> ProbClassificationPerformanceAnalyzerResults:
         return analyzer_results[ProbClassificationPerformanceAnalyzer]
@@ -69,278 +201,19 @@ class ProbClassificationPerformanceAnalyzer(Analyzer):
             columns=columns,
             quality_metrics_options=quality_metrics_options,
         )
-        classification_threshold = quality_metrics_options.classification_threshold
 
         if target_column is not None and prediction_column is not None:
-            reference_data.replace([np.inf, -np.inf], np.nan, inplace=True)
-            reference_data.dropna(axis=0, how='any', inplace=True)
-            binaraized_target = (reference_data[target_column].values.reshape(-1, 1) == prediction_column).astype(int)
-            array_prediction = reference_data[prediction_column].to_numpy()
-
-            if len(prediction_column) > 2:
-                prediction_ids = np.argmax(array_prediction, axis=-1)
-                prediction_labels = [prediction_column[x] for x in prediction_ids]
-
-            else:
-                maper = {True: prediction_column[0], False: prediction_column[1]}
-                prediction_labels = (reference_data[prediction_column[0]] >= classification_threshold).map(maper)
-
+            reference_data = reference_data.replace([np.inf, -np.inf], np.nan).dropna(axis=0, how='any')
+            # labels of the reference data are used for both datasets
             labels = sorted(set(reference_data[target_column]))
-
-            # calculate quality metrics
-            roc_auc = metrics.roc_auc_score(binaraized_target, array_prediction, average='macro')
-            log_loss = metrics.log_loss(binaraized_target, array_prediction)
-            accuracy_score = metrics.accuracy_score(reference_data[target_column], prediction_labels)
-            avg_precision = metrics.precision_score(reference_data[target_column], prediction_labels, average='macro')
-            avg_recall = metrics.recall_score(reference_data[target_column], prediction_labels, average='macro')
-            avg_f1 = metrics.f1_score(reference_data[target_column], prediction_labels, average='macro')
-
-            # calculate class support and metrics matrix
-            metrics_matrix = metrics.classification_report(
-                reference_data[target_column], prediction_labels, output_dict=True
-            )
-
-            roc_aucs = None
-
-            if len(prediction_column) > 2:
-                roc_aucs = metrics.roc_auc_score(binaraized_target, array_prediction, average=None).tolist()
-
-            # calculate confusion matrix
-            conf_matrix = metrics.confusion_matrix(reference_data[target_column], prediction_labels)
-            confusion_by_classes = calculate_confusion_by_classes(conf_matrix, labels)
-
-            result.reference_metrics = ProbClassificationPerformanceMetrics(
-                accuracy=accuracy_score,
-                precision=avg_precision,
-                recall=avg_recall,
-                f1=avg_f1,
-                roc_auc=roc_auc,
-                log_loss=log_loss,
-                metrics_matrix=metrics_matrix,
-                confusion_matrix=ConfusionMatrix(labels=labels, values=conf_matrix.tolist()),
-                roc_aucs=roc_aucs,
-                confusion_by_classes=confusion_by_classes
+            result.reference_metrics = _calculate_performance_metrics(
+                reference_data, target_column, prediction_column, labels, quality_metrics_options
             )
 
-            # calculate ROC and PR curves, PR table
-            if len(prediction_column) <= 2:
-                binaraized_target = pd.DataFrame(binaraized_target[:, 0])
-                binaraized_target.columns = ['target']
-
-                fpr, tpr, thrs = metrics.roc_curve(binaraized_target, reference_data[prediction_column[0]])
-                result.reference_metrics.roc_curve = {
-                    'fpr': fpr.tolist(),
-                    'tpr': tpr.tolist(),
-                    'thrs': thrs.tolist()
-                }
-
-                pr, rcl, thrs = metrics.precision_recall_curve(binaraized_target, reference_data[prediction_column[0]])
-                result.reference_metrics.pr_curve = {
-                    'pr': pr.tolist(),
-                    'rcl': rcl.tolist(),
-                    'thrs': thrs.tolist()
-                }
-
-                pr_table = []
-                step_size = 0.05
-                binded = list(zip(binaraized_target['target'].tolist(),
-                                  reference_data[prediction_column[0]].tolist()))
-                binded.sort(key=lambda item: item[1], reverse=True)
-                data_size = len(binded)
-                target_class_size = sum([x[0] for x in binded])
-                offset = max(round(data_size * step_size), 1)
-
-                for step in np.arange(offset, data_size + offset, offset):
-                    count = min(step, data_size)
-                    prob = round(binded[min(step, data_size - 1)][1], 2)
-                    top = round(100.0 * min(step, data_size) / data_size, 1)
-                    tp = sum([x[0] for x in binded[:min(step, data_size)]])
-                    fp = count - tp
-                    precision = round(100.0 * tp / count, 1)
-                    recall = round(100.0 * tp / target_class_size, 1)
-                    pr_table.append([top, int(count), prob, int(tp), int(fp), precision, recall])
-
-                result.reference_metrics.pr_table = pr_table
-
-            else:
-                binaraized_target = pd.DataFrame(binaraized_target)
-                binaraized_target.columns = prediction_column
-
-                result.reference_metrics.roc_curve = {}
-                result.reference_metrics.pr_curve = {}
-                result.reference_metrics.pr_table = {}
-
-                for label in prediction_column:
-                    fpr, tpr, thrs = metrics.roc_curve(binaraized_target[label], reference_data[label])
-                    result.reference_metrics.roc_curve[label] = {
-                        'fpr': fpr.tolist(),
-                        'tpr': tpr.tolist(),
-                        'thrs': thrs.tolist()
-                    }
-
-                    pr, rcl, thrs = metrics.precision_recall_curve(binaraized_target[label], reference_data[label])
-                    result.reference_metrics.pr_curve[label] = {
-                        'pr': pr.tolist(),
-                        'rcl': rcl.tolist(),
-                        'thrs': thrs.tolist()
-                    }
-
-                    pr_table = []
-                    step_size = 0.05
-                    binded = list(zip(binaraized_target[label].tolist(),
-                                      reference_data[label].tolist()))
-                    binded.sort(key=lambda item: item[1], reverse=True)
-                    data_size = len(binded)
-                    target_class_size = sum([x[0] for x in binded])
-                    offset = max(round(data_size * step_size), 1)
-
-                    for step in np.arange(offset, data_size + offset, offset):
-                        count = min(step, data_size)
-                        prob = round(binded[min(step, data_size - 1)][1], 2)
-                        top = round(100.0 * min(step, data_size) / data_size, 1)
-                        tp = sum([x[0] for x in binded[:min(step, data_size)]])
-                        fp = count - tp
-                        precision = round(100.0 * tp / count, 1)
-                        recall = round(100.0 * tp / target_class_size, 1)
-                        pr_table.append([top, int(count), prob, int(tp), int(fp), precision, recall])
-                    result.reference_metrics.pr_table[label] = pr_table
-
             if current_data is not None:
-                current_data.replace([np.inf, -np.inf], np.nan, inplace=True)
-                current_data.dropna(axis=0, how='any', inplace=True)
-
-                binaraized_target = (current_data[target_column].values.reshape(-1, 1) == prediction_column).astype(int)
-
-                array_prediction = current_data[prediction_column].to_numpy()
-
-                if len(prediction_column) > 2:
-                    prediction_ids = np.argmax(array_prediction, axis=-1)
-                    prediction_labels = [prediction_column[x] for x in prediction_ids]
-
-                else:
-                    maper = {True: prediction_column[0], False: prediction_column[1]}
-                    prediction_labels = (current_data[prediction_column[0]] >= classification_threshold).map(maper)
-
-                # calculate quality metrics
-                roc_auc = metrics.roc_auc_score(binaraized_target, array_prediction, average='macro')
-                log_loss = metrics.log_loss(binaraized_target, array_prediction)
-                accuracy_score = metrics.accuracy_score(current_data[target_column], prediction_labels)
-                avg_precision = metrics.precision_score(current_data[target_column], prediction_labels, average='macro')
-                avg_recall = metrics.recall_score(current_data[target_column], prediction_labels, average='macro')
-                avg_f1 = metrics.f1_score(current_data[target_column], prediction_labels, average='macro')
-
-                # calculate class support and metrics matrix
-                metrics_matrix = metrics.classification_report(
-                    current_data[target_column], prediction_labels, output_dict=True
+                current_data = current_data.replace([np.inf, -np.inf], np.nan).dropna(axis=0, how='any')
+                result.current_metrics = _calculate_performance_metrics(
+                    current_data, target_column, prediction_column, labels, quality_metrics_options
                 )
 
-                roc_aucs = None
-
-                if len(prediction_column) > 2:
-                    roc_aucs = metrics.roc_auc_score(binaraized_target, array_prediction, average=None).tolist()
-
-                # calculate confusion matrix
-                conf_matrix = metrics.confusion_matrix(current_data[target_column], prediction_labels)
-                # get TP, FP, TN, FN metrics for each class
-                confusion_by_classes = calculate_confusion_by_classes(conf_matrix, labels)
-
-                result.current_metrics = ProbClassificationPerformanceMetrics(
-                    accuracy=accuracy_score,
-                    precision=avg_precision,
-                    recall=avg_recall,
-                    f1=avg_f1,
-                    roc_auc=roc_auc,
-                    log_loss=log_loss,
-                    metrics_matrix=metrics_matrix,
-                    confusion_matrix=ConfusionMatrix(labels=labels, values=conf_matrix.tolist()),
-                    roc_aucs=roc_aucs,
-                    confusion_by_classes=confusion_by_classes,
-                )
-
-                # calculate ROC and PR curves, PR table
-                if len(prediction_column) <= 2:
-                    binaraized_target = pd.DataFrame(binaraized_target[:, 0])
-                    binaraized_target.columns = ['target']
-
-                    fpr, tpr, thrs = metrics.roc_curve(binaraized_target, current_data[prediction_column[0]])
-                    result.current_metrics.roc_curve = {
-                        'fpr': fpr.tolist(),
-                        'tpr': tpr.tolist(),
-                        'thrs': thrs.tolist()
-                    }
-
-                    pr, rcl, thrs = metrics.precision_recall_curve(binaraized_target,
-                                                                   current_data[prediction_column[0]])
-                    result.current_metrics.pr_curve = {
-                        'pr': pr.tolist(),
-                        'rcl': rcl.tolist(),
-                        'thrs': thrs.tolist()
-                    }
-
-                    pr_table = []
-                    step_size = 0.05
-                    binded = list(zip(
-                        binaraized_target['target'].tolist(), current_data[prediction_column[0]].tolist()
-                    ))
-                    binded.sort(key=lambda item: item[1], reverse=True)
-                    data_size = len(binded)
-                    target_class_size = sum([x[0] for x in binded])
-                    offset = max(round(data_size * step_size), 1)
-
-                    for step in np.arange(offset, data_size + offset, offset):
-                        count = min(step, data_size)
-                        prob = round(binded[min(step, data_size - 1)][1], 2)
-                        top = round(100.0 * min(step, data_size) / data_size, 1)
-                        tp = sum([x[0] for x in binded[:min(step, data_size)]])
-                        fp = count - tp
-                        precision = round(100.0 * tp / count, 1)
-                        recall = round(100.0 * tp / target_class_size, 1)
-                        pr_table.append([top, int(count), prob, int(tp), int(fp), precision, recall])
-
-                    result.current_metrics.pr_table = pr_table
-
-                else:
-                    binaraized_target = pd.DataFrame(binaraized_target)
-                    binaraized_target.columns = prediction_column
-
-                    result.current_metrics.roc_curve = {}
-                    result.current_metrics.pr_curve = {}
-                    result.current_metrics.pr_table = {}
-
-                    for label in prediction_column:
-                        fpr, tpr, thrs = metrics.roc_curve(binaraized_target[label], current_data[label])
-                        result.current_metrics.roc_curve[label] = {
-                            'fpr': fpr.tolist(),
-                            'tpr': tpr.tolist(),
-                            'thrs': thrs.tolist()
-                        }
-
-                        pr, rcl, thrs = metrics.precision_recall_curve(binaraized_target[label], current_data[label])
-                        result.current_metrics.pr_curve[label] = {
-                            'pr': pr.tolist(),
-                            'rcl': rcl.tolist(),
-                            'thrs': thrs.tolist()
-                        }
-
-                        pr_table = []
-                        step_size = 0.05
-                        binded = list(zip(binaraized_target[label].tolist(),
-                                          current_data[label].tolist()))
-                        binded.sort(key=lambda item: item[1], reverse=True)
-                        data_size = len(binded)
-                        target_class_size = sum([x[0] for x in binded])
-                        offset = max(round(data_size * step_size), 1)
-
-                        for step in np.arange(offset, data_size + offset, offset):
-                            count = min(step, data_size)
-                            prob = round(binded[min(step, data_size - 1)][1], 2)
-                            top = round(100.0 * min(step, data_size) / data_size, 1)
-                            tp = sum([x[0] for x in binded[:min(step, data_size)]])
-                            fp = count - tp
-                            precision = round(100.0 * tp / count, 1)
-                            recall = round(100.0 * tp / target_class_size, 1)
-                            pr_table.append([top, int(count), prob, int(tp), int(fp), precision, recall])
-
-                        result.current_metrics.pr_table[label] = pr_table
-
         return result
@@ -58,6 +58,8 @@ class RegressionPerformanceAnalyzerResults(BaseAnalyzerResult):
 
 
 class RegressionPerformanceAnalyzer(Analyzer):
+    removes_nans_and_infinities = True
+
     @staticmethod
     def get_results(analyzer_results) -> RegressionPerformanceAnalyzerResults:
         return analyzer_results[RegressionPerformanceAnalyzer]
@@ -75,7 +77,7 @@ class RegressionPerformanceAnalyzer(Analyzer):
         cat_feature_names = columns.cat_feature_names
 
         if target_column is not None and prediction_column is not None:
-            _prepare_dataset(reference_data)
+            reference_data = _prepare_dataset(reference_data)
 
             # calculate quality metrics
             quality_metrics = _calculate_quality_metrics(reference_data, prediction_column, target_column)
@@ -98,7 +100,7 @@ class RegressionPerformanceAnalyzer(Analyzer):
             }
 
             if current_data is not None:
-                _prepare_dataset(current_data)
+                current_data = _prepare_dataset(current_data)
 
                 # calculate quality metrics
                 quality_metrics = _calculate_quality_metrics(current_data, prediction_column, target_column)
@@ -167,8 +169,7 @@ def _calculate_quality_metrics(dataset, prediction_column, target_column, conf_i
 
 
 def _prepare_dataset(dataset):
-    dataset.replace([np.inf, -np.inf], np.nan, inplace=True)
-    dataset.dropna(axis=0, how="any", inplace=True)
+    return dataset.replace([np.inf, -np.inf], np.nan).dropna(axis=0, how="any")
 
 
 def _calculate_underperformance(err_quantiles: ErrorWithQuantiles, conf_interval_n_sigmas: int = 1):
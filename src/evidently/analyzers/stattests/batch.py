@@ -0,0 +1,285 @@
+"""Drift scores of many numerical features calculated at once.
+
+Values of every feature are sorted once, reference and current values are merged into one sorted row per feature.
+KS statistics, Wasserstein distances, numbers of unique values and binned data for PSI, KL divergence and
+Jensen-Shannon distance are calculated from the sorted rows for all features with array operations.
+
+Missing values are NaN: infinite values are replaced with NaN, NaN values are sorted to the end of the rows
+and are masked out. Features can have different numbers of finite values.
+Results are the same as results of the stattests for finite values of every feature, up to floating point rounding.
+"""
+import copy
+from typing import Callable
+from typing import List
+from typing import Sequence
+from typing import Tuple
+
+import numpy as np
+from scipy import special
+from scipy.stats import distributions
+from scipy.stats import ks_2samp
+
+# scipy calculates exact p-values of KS test for samples up to this size (see `scipy.stats.ks_2samp`)
+KS_MAX_EXACT_SIZE = 10000
+# the same threshold of unique reference values as in `get_binned_data`
+BINNED_MIN_UNIQUE_VALUES = 20
+BINNED_ZERO_FILL_VALUE = 0.0001
+# merged values of all features in a batch: limits memory of the batch arrays (about 20 bytes per value)
+MAX_BATCH_VALUES = 2 ** 24
+# arrays of `NumericalSamples` with a row for every feature
+_SAMPLES_ARRAYS = (
+    "reference", "reference_counts", "current", "current_counts", "values", "is_reference", "valid", "_group_ends"
+)
+
+
+def sort_features_values(values: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Sort values of every feature.
+
+    Args:
+        values: two-dimensional float array with a column for every feature.
+
+    Returns:
+        sorted_values: array with a row of sorted finite values for every feature, padded with NaN.
+        counts: numbers of finite values of the features.
+    """
+    feature_values = np.array(values, dtype=float).T
+    feature_values[~np.isfinite(feature_values)] = np.nan
+    feature_values.sort(axis=1)
+    return feature_values, np.count_nonzero(~np.isnan(feature_values), axis=1)
+
+
+def stack_sorted_values(features_values: Sequence[np.ndarray]) -> Tuple[np.ndarray, np.ndarray]:
+    """Stack sorted finite values of features into rows padded with NaN"""
+    counts = np.array([len(feature_values) for feature_values in features_values], dtype=int)
+    stacked = np.full((len(features_values), counts.max(initial=0)), np.nan)
+
+    for position, feature_values in enumerate(features_values):
+        stacked[position, : len(feature_values)] = feature_values
+
+    return stacked, counts
+
+
+def split_batches(features: List[str], values_per_feature: int) -> List[List[str]]:
+    """Split features into batches with at most `MAX_BATCH_VALUES` values"""
+    batch_size = max(1, MAX_BATCH_VALUES // max(values_per_feature, 1))
+    return [features[start: start + batch_size] for start in range(0, len(features), batch_size)]
+
+
+def _get_valid_mask(counts: np.ndarray, width: int) -> np.ndarray:
+    return np.arange(width)[np.newaxis, :] < counts[:, np.newaxis]
+
+
+def _uniform_bin_indices(
+    values: np.ndarray, first_edges: np.ndarray, last_edges: np.ndarray, edges: np.ndarray, n_bins: np.ndarray
+) -> np.ndarray:
+    """Indices of equal bins of values in rows, calculated the same way as in `np.histogram`"""
+    with np.errstate(invalid="ignore"):
+        float_indices = (values - first_edges[:, np.newaxis]) / (last_edges - first_edges)[:, np.newaxis]
+        float_indices *= n_bins[:, np.newaxis]
+
+    indices = np.nan_to_num(float_indices, nan=0.0).astype(np.intp)
+    np.clip(indices, 0, (n_bins - 1)[:, np.newaxis], out=indices)
+    # the index calculation can be wrong within 1 ULP of the edges
+    indices -= values < np.take_along_axis(edges, indices, axis=1)
+    indices += (values >= np.take_along_axis(edges, indices + 1, axis=1)) & (indices != (n_bins - 1)[:, np.newaxis])
+    return indices
+
+
+def _uniform_edges(first_edges: np.ndarray, last_edges: np.ndarray, n_bins: np.ndarray) -> np.ndarray:
+    """Edges of equal bins in rows padded with infinity, the same as `np.linspace` for every row"""
+    positions = np.arange(n_bins.max(initial=1) + 1)[np.newaxis, :]
+    edges = positions * ((last_edges - first_edges) / n_bins)[:, np.newaxis] + first_edges[:, np.newaxis]
+    edges[positions > n_bins[:, np.newaxis]] = np.inf
+    edges[np.arange(len(n_bins)), n_bins] = last_edges
+    return edges
+
+
+def _count_in_rows(indices: np.ndarray, mask: np.ndarray, width: int) -> np.ndarray:
+    """Count indices where the mask is set in every row"""
+    rows = np.broadcast_to(np.arange(indices.shape[0])[:, np.newaxis], indices.shape)
+    flat_indices = rows[mask] * width + indices[mask]
+    return np.bincount(flat_indices, minlength=indices.shape[0] * width).reshape(indices.shape[0], width)
+
+
+def get_ks_asymptotic_p_values(statistics: np.ndarray, first_counts: np.ndarray, second_counts: np.ndarray):
+    """Asymptotic two-sided p-values of KS statistics, the same as `ks_2samp` with the "asymp" method"""
+    larger_counts = np.maximum(first_counts, second_counts).astype(float)
+    smaller_counts = np.minimum(first_counts, second_counts).astype(float)
+    effective_counts = np.round(larger_counts * smaller_counts / (larger_counts + smaller_counts))
+    return np.clip(distributions.kstwo.sf(statistics, effective_counts), 0, 1)
+
+
+class NumericalSamples:
+    """Sorted finite reference and current values of numerical features, a row for every feature.
+
+    Args:
+        reference: sorted reference values of the features padded with NaN, see `sort_features_values`.
+        reference_counts: numbers of reference values of the features.
+        current: sorted current values of the features padded with NaN.
+        current_counts: numbers of current values of the features.
+    """
+
+    reference: np.ndarray
+    reference_counts: np.ndarray
+    current: np.ndarray
+    current_counts: np.ndarray
+    # merged sorted values of both samples, NaN at the end
+    values: np.ndarray
+    is_reference: np.ndarray
+    valid: np.ndarray
+
+    def __init__(
+        self, reference: np.ndarray, reference_counts: np.ndarray, current: np.ndarray, current_counts: np.ndarray
+    ):
+        self.reference = reference
+        self.reference_counts = reference_counts
+        self.current = current
+        self.current_counts = current_counts
+        merged = np.concatenate([reference, current], axis=1)
+        # both parts are sorted, so a stable sort merges them
+        order = np.argsort(merged, axis=1, kind="stable")
+        self.values = np.take_along_axis(merged, order, axis=1)
+        self.is_reference = order < reference.shape[1]
+        self.valid = _get_valid_mask(reference_counts + current_counts, merged.shape[1])
+        # the last value of every group of equal values
+        self._group_ends = self.valid & np.concatenate(
+            [self.values[:, 1:] != self.values[:, :-1], np.ones((len(self), 1), dtype=bool)], axis=1
+        )
+
+    def __len__(self) -> int:
+        return self.reference.shape[0]
+
+    def select(self, features: Sequence[int]) -> "NumericalSamples":
+        """Samples of the features with the positions, without sorting them again"""
+        positions = np.asarray(features, dtype=int)
+        selected = copy.copy(self)
+
+        for name in _SAMPLES_ARRAYS:
+            setattr(selected, name, getattr(self, name)[positions])
+
+        return selected
+
+    def get_unique_counts(self) -> np.ndarray:
+        """Numbers of unique values in both samples"""
+        return np.count_nonzero(self._group_ends, axis=1)
+
+    def get_reference_unique_counts(self) -> np.ndarray:
+        reference_valid = _get_valid_mask(self.reference_counts, self.reference.shape[1])
+        different = np.concatenate(
+            [self.reference[:, 1:] != self.reference[:, :-1], np.ones((len(self), 1), dtype=bool)], axis=1
+        )
+        return np.count_nonzero(reference_valid & different, axis=1)
+
+    def _get_cdf_differences(self) -> np.ndarray:
+        """Differences of reference and current empirical distribution functions after every merged value"""
+        reference_cdf = np.cumsum(self.is_reference & self.valid, axis=1) / self.reference_counts[:, np.newaxis]
+        current_cdf = np.cumsum(~self.is_reference & self.valid, axis=1) / self.current_counts[:, np.newaxis]
+        return reference_cdf - current_cdf
+
+    def get_ks_statistics(self) -> np.ndarray:
+        """Two-sided two-sample Kolmogorov-Smirnov statistics"""
+        differences = np.where(self._group_ends, np.abs(self._get_cdf_differences()), 0.0)
+        return np.clip(differences.max(axis=1, initial=0.0), 0, 1)
+
+    def get_ks_p_values(self) -> np.ndarray:
+        """Two-sided p-values of the two-sample Kolmogorov-Smirnov test with the `ks_2samp` default method.
+
+        Exact p-values of small samples are calculated with `ks_2samp` feature by feature,
+        asymptotic p-values of large samples are calculated for all features at once.
+        """
+        p_values = get_ks_asymptotic_p_values(self.get_ks_statistics(), self.reference_counts, self.current_counts)
+        larger_counts = np.maximum(self.reference_counts, self.current_counts)
+
+        for feature in np.flatnonzero(larger_counts <= KS_MAX_EXACT_SIZE):
+            p_values[feature] = ks_2samp(
+                self.reference[feature, : self.reference_counts[feature]],
+                self.current[feature, : self.current_counts[feature]],
+            )[1]
+
+        return p_values
+
+    def get_wasserstein_distances(self) -> np.ndarray:
+        """First Wasserstein distances between the samples"""
+        deltas = np.diff(self.values, axis=1)
+        deltas[~self.valid[:, 1:]] = 0.0
+        return np.sum(np.abs(self._get_cdf_differences()[:, :-1]) * deltas, axis=1)
+
+    def get_reference_std(self) -> np.ndarray:
+        """Standard deviations of the reference values, the same as `np.std`"""
+        reference_valid = _get_valid_mask(self.reference_counts, self.reference.shape[1])
+        means = np.where(reference_valid, self.reference, 0.0).sum(axis=1) / self.reference_counts
+        squares = np.where(reference_valid, (self.reference - means[:, np.newaxis]) ** 2, 0.0)
+        return np.sqrt(squares.sum(axis=1) / self.reference_counts)
+
+    def get_binned_data(self, fill_zeroes: bool = True) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Shares of values in bins for every feature, the same as `get_binned_data` for numerical features.
+
+        Features with more than 20 unique reference values are binned by Sturges' rule over both samples,
+        other features are binned by unique values of both samples.
+
+        Returns:
+            reference_percents: shares of reference values in bins, a row for every feature.
+            current_percents: shares of current values in bins.
+            bins: mask of bins of the features, rows are padded to the same number of bins.
+        """
+        by_unique_values = self.get_reference_unique_counts() <= BINNED_MIN_UNIQUE_VALUES
+        # positions of values in groups of equal values
+        indices = np.cumsum(self._group_ends, axis=1) - self._group_ends
+        bins_counts = self.get_unique_counts()
+
+        if not by_unique_values.all():
+            counts = self.reference_counts + self.current_counts
+            first_edges = self.values[:, 0]
+            last_edges = self.values[np.arange(len(self)), np.maximum(counts - 1, 0)]
+
+            with np.errstate(divide="ignore", invalid="ignore"):
+                bin_widths = (last_edges - first_edges) / (np.log2(counts) + 1.0)
+                n_bins = np.ceil((last_edges - first_edges) / bin_widths)
+
+            n_bins = np.where(by_unique_values | ~(bin_widths > 0), 1, n_bins).astype(int)
+            edges = _uniform_edges(first_edges, last_edges, n_bins)
+            histogram_indices = _uniform_bin_indices(self.values, first_edges, last_edges, edges, n_bins)
+            indices = np.where(by_unique_values[:, np.newaxis], indices, histogram_indices)
+            bins_counts = np.where(by_unique_values, bins_counts, n_bins)
+
+        width = int(bins_counts.max(initial=0))
+        bins = np.arange(width)[np.newaxis, :] < bins_counts[:, np.newaxis]
+        reference_percents = _count_in_rows(indices, self.valid & self.is_reference, width)
+        reference_percents = reference_percents / self.reference_counts[:, np.newaxis]
+        current_percents = _count_in_rows(indices, self.valid & ~self.is_reference, width)
+        current_percents = current_percents / self.current_counts[:, np.newaxis]
+
+        if fill_zeroes:
+            reference_percents[bins & (reference_percents == 0)] = BINNED_ZERO_FILL_VALUE
+            current_percents[bins & (current_percents == 0)] = BINNED_ZERO_FILL_VALUE
+
+        return reference_percents, current_percents, bins
+
+
+def get_psi_values(samples: NumericalSamples) -> np.ndarray:
+    reference_percents, current_percents, bins = samples.get_binned_data()
+    with np.errstate(divide="ignore", invalid="ignore"):
+        values = (reference_percents - current_percents) * np.log(reference_percents / current_percents)
+    return np.where(bins, values, 0.0).sum(axis=1)
+
+
+def get_kl_div_values(samples: NumericalSamples) -> np.ndarray:
+    reference_percents, current_percents, _ = samples.get_binned_data()
+    reference_percents = reference_percents / reference_percents.sum(axis=1, keepdims=True)
+    current_percents = current_percents / current_percents.sum(axis=1, keepdims=True)
+    return special.rel_entr(reference_percents, current_percents).sum(axis=1)
+
+
+def get_jensenshannon_values(samples: NumericalSamples) -> np.ndarray:
+    reference_percents, current_percents, _ = samples.get_binned_data(fill_zeroes=False)
+    reference_percents = reference_percents / reference_percents.sum(axis=1, keepdims=True)
+    current_percents = current_percents / current_percents.sum(axis=1, keepdims=True)
+    middle = (reference_percents + current_percents) / 2.0
+    divergence = (
+        special.rel_entr(reference_percents, middle).sum(axis=1) + special.rel_entr(current_percents, middle).sum(axis=1)
+    )
+    return np.sqrt(divergence / 2.0)
+
+
+# batch_func(samples, thresholds) -> (drift scores, drift detected) for every feature of the samples
+BatchStatTestFuncType = Callable[[NumericalSamples, np.ndarray], Tuple[np.ndarray, np.ndarray]]
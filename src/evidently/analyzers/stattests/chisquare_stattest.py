@@ -8,6 +8,10 @@ import pandas as pd
 from scipy.stats import chisquare
 
 from evidently.analyzers.stattests.registry import StatTest, register_stattest
+from evidently.analyzers.stattests.summary import ReferenceSummary
+from evidently.analyzers.stattests.summary import fit_reference_summary
+from evidently.analyzers.stattests import summary
+from evidently.analyzers.stattests.utils import get_category_counts
 
 
 def _chi_stat_test(
@@ -15,16 +19,28 @@ def _chi_stat_test(
         current_data: pd.Series,
         feature_type: str,
         threshold: float) -> Tuple[float, bool]:
-    #  TODO: simplify ignoring NaN values here, in z_stat_test and data_drift_analyzer
-    keys = list((set(reference_data) | set(current_data)) - {np.nan})
+    reference_counts, current_counts, _ = get_category_counts(reference_data, current_data)
+    return _get_chi_stat_test_result(
+        reference_counts, current_counts, current_data.shape[0] / reference_data.shape[0], threshold
+    )
 
-    ref_feature_dict = {**dict.fromkeys(keys, 0), **dict(reference_data.value_counts())}
-    current_feature_dict = {**dict.fromkeys(keys, 0), **dict(current_data.value_counts())}
 
-    k_norm = current_data.shape[0] / reference_data.shape[0]
+def _chi_stat_test_score(
+        reference: ReferenceSummary,
+        current_data: pd.Series,
+        feature_type: str,
+        threshold: float) -> Tuple[float, bool]:
+    reference_counts, current_counts, _ = summary.get_category_counts(reference, current_data)
+    return _get_chi_stat_test_result(reference_counts, current_counts, current_data.shape[0] / reference.size, threshold)
 
-    f_exp = [ref_feature_dict[key] * k_norm for key in keys]
-    f_obs = [current_feature_dict[key] for key in keys]
+
+def _get_chi_stat_test_result(
+        reference_counts: np.ndarray,
+        current_counts: np.ndarray,
+        k_norm: float,
+        threshold: float) -> Tuple[float, bool]:
+    f_exp = reference_counts * k_norm
+    f_obs = current_counts
     p_value = chisquare(f_exp, f_obs)[1]
     return p_value, p_value < threshold
 
@@ -33,7 +49,9 @@ chi_stat_test = StatTest(
     name="chisquare",
     display_name="chi-square p_value",
     func=_chi_stat_test,
-    allowed_feature_types=["cat"]
+    allowed_feature_types=["cat"],
+    fit_func=fit_reference_summary,
+    score_func=_chi_stat_test_score,
 )
 
 register_stattest(chi_stat_test)
@@ -1,8 +1,14 @@
 from typing import Tuple
 
+import numpy as np
 import pandas as pd
 from scipy.spatial import distance
 
+from evidently.analyzers.stattests.batch import NumericalSamples
+from evidently.analyzers.stattests.batch import get_jensenshannon_values
+from evidently.analyzers.stattests.summary import ReferenceSummary
+from evidently.analyzers.stattests.summary import fit_reference_summary
+from evidently.analyzers.stattests import summary
 from evidently.analyzers.stattests.utils import get_binned_data
 from evidently.analyzers.stattests.registry import StatTest, register_stattest
 
@@ -29,12 +35,30 @@ def _jensenshannon(
     return jensenshannon_value, jensenshannon_value >= threshold
 
 
+def _jensenshannon_batch(samples: NumericalSamples, threshold: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    jensenshannon_values = get_jensenshannon_values(samples)
+    return jensenshannon_values, jensenshannon_values >= threshold
+
+
+def _jensenshannon_score(
+        reference: ReferenceSummary,
+        current_data: pd.Series,
+        feature_type: str,
+        threshold: float) -> Tuple[float, bool]:
+    reference_percents, current_percents = summary.get_binned_data(reference, current_data, feature_type, False)
+    jensenshannon_value = distance.jensenshannon(reference_percents, current_percents)
+    return jensenshannon_value, jensenshannon_value >= threshold
+
+
 jensenshannon_stat_test = StatTest(
     name="jensenshannon",
     display_name="Jensen-Shannon distance",
     func=_jensenshannon,
     allowed_feature_types=["cat", "num"],
     default_threshold=0.1,
+    batch_func=_jensenshannon_batch,
+    fit_func=fit_reference_summary,
+    score_func=_jensenshannon_score,
 )
 
 register_stattest(jensenshannon_stat_test)
@@ -1,9 +1,15 @@
 from typing import Tuple
 
+import numpy as np
 import pandas as pd
 from scipy import stats
 
+from evidently.analyzers.stattests.batch import NumericalSamples
+from evidently.analyzers.stattests.batch import get_kl_div_values
 from evidently.analyzers.stattests.registry import StatTest, register_stattest
+from evidently.analyzers.stattests.summary import ReferenceSummary
+from evidently.analyzers.stattests.summary import fit_reference_summary
+from evidently.analyzers.stattests import summary
 from evidently.analyzers.stattests.utils import get_binned_data
 
 
@@ -29,12 +35,30 @@ def kl_div(
     return kl_div_value, kl_div_value >= threshold
 
 
+def kl_div_batch(samples: NumericalSamples, threshold: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    kl_div_values = get_kl_div_values(samples)
+    return kl_div_values, kl_div_values >= threshold
+
+
+def kl_div_score(
+        reference: ReferenceSummary,
+        current_data: pd.Series,
+        feature_type: str,
+        threshold: float) -> Tuple[float, bool]:
+    reference_percents, current_percents = summary.get_binned_data(reference, current_data, feature_type)
+    kl_div_value = stats.entropy(reference_percents, current_percents)
+    return kl_div_value, kl_div_value >= threshold
+
+
 kl_div_stat_test = StatTest(
     name="kl_div",
     display_name="Kullback-Leibler divergence",
     func=kl_div,
     allowed_feature_types=["cat", "num"],
     default_threshold=0.1,
+    batch_func=kl_div_batch,
+    fit_func=fit_reference_summary,
+    score_func=kl_div_score,
 )
 
 register_stattest(kl_div_stat_test)
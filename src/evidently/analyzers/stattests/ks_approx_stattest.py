@@ -0,0 +1,74 @@
+"""Approximate two-sample Kolmogorov-Smirnov test with KLL sketches of both samples.
+
+Sketches keep `O(k)` values for any size of data, see `evidently.utils.sketches.KLLSketch`.
+The KS statistic differs from the exact one by at most the sum of rank errors of the sketches,
+about 2.7% with 99% confidence for the default k=200. The statistic is reduced by this error before
+the test: otherwise the critical statistic of large samples is less than the error of sketches and the test
+detects drift of samples of the same distribution. P-values are asymptotic.
+
+A reference sketch can be built chunk by chunk and merged, then scored against current data:
+
+    summary = StatTestSummary("ks_approx", "num", ReferenceSummary.from_sketch(sketch))
+    ks_approx_stat_test.score(summary, current_data)
+"""
+from typing import Tuple
+
+import numpy as np
+import pandas as pd
+
+from evidently.analyzers.stattests.batch import get_ks_asymptotic_p_values
+from evidently.analyzers.stattests.registry import StatTest, register_stattest
+from evidently.analyzers.stattests.summary import ReferenceSummary
+from evidently.analyzers.stattests.summary import fit_sketch_summary
+from evidently.analyzers.stattests.summary import get_ks_statistic
+from evidently.utils.sketches import KLLSketch
+
+
+def _ks_approx_stat_test(
+        reference_data: pd.Series,
+        current_data: pd.Series,
+        feature_type: str,
+        threshold: float) -> Tuple[float, bool]:
+    """Run the approximate two-sample Kolmogorov-Smirnov test of two samples. Alternative: two-sided
+    Args:
+        reference_data: reference data
+        current_data: current data
+        feature_type: feature type
+        threshold: level of significance
+    Returns:
+        p_value: two-tailed p-value
+        test_result: whether the drift is detected
+    """
+    return _ks_approx_stat_test_score(fit_sketch_summary(reference_data, feature_type), current_data, feature_type, threshold)
+
+
+def _ks_approx_stat_test_score(
+        reference: ReferenceSummary,
+        current_data: pd.Series,
+        feature_type: str,
+        threshold: float) -> Tuple[float, bool]:
+    current_sketch = KLLSketch.from_values(current_data.to_numpy(dtype=float))
+    current_values, current_counts = current_sketch.get_weighted_values()
+    reference_size = reference.counts.sum()
+    current_size = current_counts.sum()
+
+    if reference_size == 0 or current_size == 0:
+        raise ValueError("Data passed to ks_approx must not be empty")
+
+    statistic = get_ks_statistic(reference.values, reference.counts, current_values, current_counts)
+    # the difference of the statistic that can be explained by errors of the sketches is not a drift
+    statistic = max(statistic - reference.rank_error - current_sketch.cdf_error, 0.0)
+    p_value = float(get_ks_asymptotic_p_values(np.array([statistic]), reference_size, current_size)[0])
+    return p_value, p_value <= threshold
+
+
+ks_approx_stat_test = StatTest(
+    name="ks_approx",
+    display_name="K-S p_value (approximate)",
+    func=_ks_approx_stat_test,
+    allowed_feature_types=["num"],
+    fit_func=fit_sketch_summary,
+    score_func=_ks_approx_stat_test_score,
+)
+
+register_stattest(ks_approx_stat_test)
@@ -2,10 +2,15 @@
 # coding: utf-8
 from typing import Tuple
 
+import numpy as np
 import pandas as pd
 from scipy.stats import ks_2samp
 
+from evidently.analyzers.stattests.batch import NumericalSamples
 from evidently.analyzers.stattests.registry import StatTest, register_stattest
+from evidently.analyzers.stattests.summary import ReferenceSummary
+from evidently.analyzers.stattests.summary import fit_reference_summary
+from evidently.analyzers.stattests.summary import get_ks_p_value
 
 
 def _ks_stat_test(
@@ -27,11 +32,28 @@ def _ks_stat_test(
     return p_value, p_value <= threshold
 
 
+def _ks_stat_test_batch(samples: NumericalSamples, threshold: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    p_values = samples.get_ks_p_values()
+    return p_values, p_values <= threshold
+
+
+def _ks_stat_test_score(
+        reference: ReferenceSummary,
+        current_data: pd.Series,
+        feature_type: str,
+        threshold: float) -> Tuple[float, bool]:
+    p_value = get_ks_p_value(reference, current_data)
+    return p_value, p_value <= threshold
+
+
 ks_stat_test = StatTest(
     name="ks",
     display_name="K-S p_value",
     func=_ks_stat_test,
     allowed_feature_types=["num"],
+    batch_func=_ks_stat_test_batch,
+    fit_func=fit_reference_summary,
+    score_func=_ks_stat_test_score,
 )
 
 register_stattest(ks_stat_test)
@@ -3,7 +3,12 @@ from typing import Tuple
 import pandas as pd
 import numpy as np
 
+from evidently.analyzers.stattests.batch import NumericalSamples
+from evidently.analyzers.stattests.batch import get_psi_values
 from evidently.analyzers.stattests.registry import StatTest, register_stattest
+from evidently.analyzers.stattests.summary import ReferenceSummary
+from evidently.analyzers.stattests.summary import fit_reference_summary
+from evidently.analyzers.stattests import summary
 from evidently.analyzers.stattests.utils import get_binned_data
 
 
@@ -25,7 +30,11 @@ def psi(
         test_result: whether the drift is detected
     """
     reference_percents, current_percents = get_binned_data(reference_data, current_data, feature_type, n_bins)
+    psi_value = _get_psi_value(reference_percents, current_percents)
+    return psi_value, psi_value >= threshold
+
 
+def _get_psi_value(reference_percents: np.ndarray, current_percents: np.ndarray) -> float:
     def sub_psi(ref_perc, curr_perc):
         """Calculate the actual PSI value from comparing the values.
             Update the actual value to a very small number if equal to zero
@@ -37,15 +46,33 @@ def psi(
     for i, _ in enumerate(reference_percents):
         psi_value += sub_psi(reference_percents[i], current_percents[i])
 
+    return psi_value
+
+
+def psi_score(
+        reference: ReferenceSummary,
+        current_data: pd.Series,
+        feature_type: str,
+        threshold: float) -> Tuple[float, bool]:
+    reference_percents, current_percents = summary.get_binned_data(reference, current_data, feature_type)
+    psi_value = _get_psi_value(reference_percents, current_percents)
     return psi_value, psi_value >= threshold
 
 
+def psi_batch(samples: NumericalSamples, threshold: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    psi_values = get_psi_values(samples)
+    return psi_values, psi_values >= threshold
+
+
 psi_stat_test = StatTest(
     name="psi",
     display_name="PSI",
     func=psi,
     allowed_feature_types=["cat", "num"],
     default_threshold=0.1,
+    batch_func=psi_batch,
+    fit_func=fit_reference_summary,
+    score_func=psi_score,
 )
 
 register_stattest(psi_stat_test)
@@ -2,11 +2,18 @@ from typing import List, Union, Callable, Tuple, Dict, Optional
 
 import dataclasses
 
+import numpy as np
 import pandas as pd
 
 from evidently.analyzers import stattests
+from evidently.analyzers.stattests.batch import BatchStatTestFuncType
+from evidently.analyzers.stattests.batch import NumericalSamples
+from evidently.analyzers.stattests.summary import ReferenceSummary
+from evidently.utils.dataset_view import get_column_view
 
 StatTestFuncType = Callable[[pd.Series, pd.Series, str, float], Tuple[float, bool]]
+StatTestFitFuncType = Callable[[pd.Series, str], ReferenceSummary]
+StatTestScoreFuncType = Callable[[ReferenceSummary, pd.Series, str, float], Tuple[float, bool]]
 
 
 @dataclasses.dataclass
@@ -16,6 +23,29 @@ class StatTestResult:
     actual_threshold: float
 
 
+@dataclasses.dataclass
+class StatTestSummary:
+    """Reference data of a stattest fitted with `StatTest.fit`, to be scored with `StatTest.score`"""
+    stattest_name: str
+    feature_type: str
+    reference: ReferenceSummary
+
+    def to_dict(self) -> dict:
+        return {
+            "stattest_name": self.stattest_name,
+            "feature_type": self.feature_type,
+            "reference": self.reference.to_dict(),
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "StatTestSummary":
+        return cls(
+            stattest_name=data["stattest_name"],
+            feature_type=data["feature_type"],
+            reference=ReferenceSummary.from_dict(data["reference"]),
+        )
+
+
 @dataclasses.dataclass
 class StatTest:
     name: str
@@ -23,6 +53,11 @@ class StatTest:
     func: StatTestFuncType
     allowed_feature_types: List[str]
     default_threshold: float = 0.05
+    # calculates the test for many numerical features at once, see `evidently.analyzers.stattests.batch`
+    batch_func: Optional[BatchStatTestFuncType] = None
+    # calculate the test in two steps: fit a summary of reference data once, then score current data with it
+    fit_func: Optional[StatTestFitFuncType] = None
+    score_func: Optional[StatTestScoreFuncType] = None
 
     def __call__(self,
                  reference_data: pd.Series,
@@ -33,6 +68,48 @@ class StatTest:
         drift_score, drifted = self.func(reference_data, current_data, feature_type, actual_threshold)
         return StatTestResult(drift_score=drift_score, drifted=drifted, actual_threshold=actual_threshold)
 
+    def fit(self, reference_data: pd.Series, feature_type: str) -> StatTestSummary:
+        """Summarize reference data for `score`, the test should have `fit_func` and `score_func`"""
+        if self.fit_func is None or self.score_func is None:
+            raise ValueError(f"Stattest {self.name} cannot be fitted to reference data")
+
+        return StatTestSummary(
+            stattest_name=self.name,
+            feature_type=feature_type,
+            reference=self.fit_func(reference_data, feature_type),
+        )
+
+    def score(self,
+              summary: StatTestSummary,
+              current_data: pd.Series,
+              threshold: Optional[float] = None) -> StatTestResult:
+        """Run the test for current data against the reference summary, the same as calling the test"""
+        if self.score_func is None:
+            raise ValueError(f"Stattest {self.name} cannot be scored against a reference summary")
+
+        if summary.stattest_name != self.name:
+            raise ValueError(f"Summary of stattest {summary.stattest_name} cannot be scored by stattest {self.name}")
+
+        actual_threshold = self.default_threshold if threshold is None else threshold
+        drift_score, drifted = self.score_func(summary.reference, current_data, summary.feature_type, actual_threshold)
+        return StatTestResult(drift_score=drift_score, drifted=drifted, actual_threshold=actual_threshold)
+
+    def batch(self, samples: NumericalSamples, thresholds: List[Optional[float]]) -> List[StatTestResult]:
+        """Run the test for all numerical features of the samples, the test should have `batch_func`"""
+        if self.batch_func is None:
+            raise ValueError(f"Stattest {self.name} cannot be calculated for many features at once")
+
+        actual_thresholds = np.array(
+            [self.default_threshold if threshold is None else threshold for threshold in thresholds], dtype=float
+        )
+        drift_scores, drifted = self.batch_func(samples, actual_thresholds)
+        return [
+            StatTestResult(drift_score=drift_score, drifted=bool(is_drifted), actual_threshold=actual_threshold)
+            for drift_score, is_drifted, actual_threshold in zip(
+                drift_scores.tolist(), drifted.tolist(), actual_thresholds.tolist()
+            )
+        ]
+
 
 PossibleStatTestType = Union[str, StatTestFuncType, StatTest]
 
@@ -45,9 +122,25 @@ def register_stattest(stat_test: StatTest):
     _registered_stat_test_funcs[stat_test.func] = stat_test.name
 
 
+def _count_unique_values(reference_data: pd.Series, current_data: pd.Series) -> int:
+    """Number of unique not null values in both series, the same as `nunique` of the concatenated series"""
+    values = pd.unique(
+        np.concatenate(
+            [np.asarray(get_column_view(reference_data).unique()), np.asarray(get_column_view(current_data).unique())]
+        )
+    )
+    return int(pd.notnull(values).sum())
+
+
 def _get_default_stattest(reference_data: pd.Series, current_data: pd.Series, feature_type: str) -> StatTest:
-    n_values = pd.concat([reference_data, current_data]).nunique()
-    if reference_data.shape[0] <= 1000:
+    return get_default_stattest_by_counts(
+        reference_data.shape[0], _count_unique_values(reference_data, current_data), feature_type
+    )
+
+
+def get_default_stattest_by_counts(reference_size: int, n_values: int, feature_type: str) -> StatTest:
+    """Choose the default stattest by the size of reference data and the number of unique values in both datasets"""
+    if reference_size <= 1000:
         if feature_type == "num":
             if n_values <= 5:
                 return stattests.chi_stat_test if n_values > 2 else stattests.z_stat_test
@@ -55,9 +148,8 @@ def _get_default_stattest(reference_data: pd.Series, current_data: pd.Series, fe
                 return stattests.ks_stat_test
         elif feature_type == "cat":
             return stattests.chi_stat_test if n_values > 2 else stattests.z_stat_test
-    elif reference_data.shape[0] > 1000:
+    elif reference_size > 1000:
         if feature_type == "num":
-            n_values = pd.concat([reference_data, current_data]).nunique()
             if n_values <= 5:
                 return stattests.jensenshannon_stat_test
             elif n_values > 5:
@@ -0,0 +1,151 @@
+"""Summaries of reference data for scoring stattests against many current datasets.
+
+A summary keeps unique reference values with their counts instead of the raw values: this is enough
+to calculate all built-in stattests with the same results as for the raw reference data.
+Summaries can be converted to dicts of lists and back, to be stored or sent without the reference data.
+"""
+import dataclasses
+from typing import Optional
+from typing import Tuple
+
+import numpy as np
+import pandas as pd
+from scipy.stats import ks_2samp
+
+from evidently.analyzers.stattests.batch import BINNED_MIN_UNIQUE_VALUES
+from evidently.analyzers.stattests.batch import BINNED_ZERO_FILL_VALUE
+from evidently.analyzers.stattests.batch import KS_MAX_EXACT_SIZE
+from evidently.analyzers.stattests.batch import get_ks_asymptotic_p_values
+from evidently.utils.histograms import calculate_bin_edges
+from evidently.utils.sketches import KLLSketch
+
+
+@dataclasses.dataclass
+class ReferenceSummary:
+    """Unique reference values with their counts.
+
+    Attributes:
+        size: number of reference values, missing values included.
+        values: unique not missing values, sorted for numerical features.
+        counts: number of reference values equal to every unique value.
+        std: standard deviation of the reference values of a numerical feature, the same as `np.std`.
+        rank_error: bound of the error of CDF values of an approximate summary, 0 for exact summaries.
+    """
+
+    size: int
+    values: np.ndarray
+    counts: np.ndarray
+    std: Optional[float] = None
+    rank_error: float = 0.0
+
+    def to_dict(self) -> dict:
+        return {
+            "size": self.size,
+            "values": self.values.tolist(),
+            "counts": self.counts.tolist(),
+            "std": self.std,
+            "rank_error": self.rank_error,
+        }
+
+    @classmethod
+    def from_sketch(cls, sketch: KLLSketch) -> "ReferenceSummary":
+        """Approximate summary of numerical values: values of the sketch with numbers of values they stand for"""
+        values, counts = sketch.get_weighted_values()
+        return cls(size=sketch.count, values=values, counts=counts, std=sketch.std, rank_error=sketch.cdf_error)
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "ReferenceSummary":
+        return cls(
+            size=data["size"],
+            values=np.array(data["values"]),
+            counts=np.array(data["counts"], dtype=np.int64),
+            std=data["std"],
+            rank_error=data.get("rank_error", 0.0),
+        )
+
+
+def fit_reference_summary(reference_data: pd.Series, feature_type: str) -> ReferenceSummary:
+    counts = reference_data.value_counts(sort=False)
+
+    if feature_type == "num":
+        counts = counts.sort_index()
+
+    return ReferenceSummary(
+        size=reference_data.shape[0],
+        values=counts.index.to_numpy(),
+        counts=counts.to_numpy(dtype=np.int64),
+        std=float(np.std(reference_data)) if feature_type == "num" else None,
+    )
+
+
+def get_category_counts(summary: ReferenceSummary, current_data: pd.Series) -> Tuple[np.ndarray, np.ndarray, pd.Index]:
+    """Count current values by the reference categories, the same as `utils.get_category_counts`"""
+    categories = pd.Index(summary.values)
+    codes = categories.get_indexer(current_data)
+    known = codes >= 0
+    current_counts = np.bincount(codes[known], minlength=len(categories))
+    # categories that are only in the current data
+    new_counts = current_data[~known].value_counts()
+    return (
+        np.concatenate([summary.counts, np.zeros(len(new_counts), dtype=np.int64)]),
+        np.concatenate([current_counts, new_counts.to_numpy(dtype=np.int64)]),
+        categories.append(new_counts.index),
+    )
+
+
+def get_binned_data(
+    summary: ReferenceSummary, current_data: pd.Series, feature_type: str, fill_zeroes: bool = True
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Shares of reference and current values in buckets, the same as `utils.get_binned_data`"""
+    if feature_type == "num" and len(summary.values) > BINNED_MIN_UNIQUE_VALUES:
+        current = current_data.to_numpy(dtype=float)
+        bins = calculate_bin_edges(
+            min(summary.values[0], current.min(initial=np.inf)),
+            max(summary.values[-1], current.max(initial=-np.inf)),
+            summary.counts.sum() + current.shape[0],
+            "sturges",
+        )
+        reference_percents = np.histogram(summary.values, bins, weights=summary.counts)[0] / summary.size
+        current_percents = np.histogram(current, bins)[0] / current.shape[0]
+
+    else:
+        reference_counts, current_counts, _ = get_category_counts(summary, current_data)
+        reference_percents = reference_counts / summary.size
+        current_percents = current_counts / current_data.shape[0]
+
+    if fill_zeroes:
+        np.place(reference_percents, reference_percents == 0, BINNED_ZERO_FILL_VALUE)
+        np.place(current_percents, current_percents == 0, BINNED_ZERO_FILL_VALUE)
+
+    return reference_percents, current_percents
+
+
+def get_ks_p_value(summary: ReferenceSummary, current_data: pd.Series) -> float:
+    """Two-sided p-value of the two-sample KS test with the `ks_2samp` default method"""
+    reference_size = int(summary.counts.sum())
+    current = np.sort(current_data.to_numpy(dtype=float))
+
+    if max(reference_size, current.shape[0]) <= KS_MAX_EXACT_SIZE:
+        return ks_2samp(np.repeat(summary.values, summary.counts), current)[1]
+
+    statistic = get_ks_statistic(summary.values, summary.counts, current, np.ones(current.shape[0], dtype=np.int64))
+    return float(get_ks_asymptotic_p_values(np.array([statistic]), reference_size, current.shape[0])[0])
+
+
+def get_ks_statistic(
+    first_values: np.ndarray, first_counts: np.ndarray, second_values: np.ndarray, second_counts: np.ndarray
+) -> float:
+    """Two-sided KS statistic of two samples given by sorted values and their counts"""
+    points = np.concatenate([first_values, second_values])
+    first_cdf = np.concatenate([[0], np.cumsum(first_counts)])[
+        np.searchsorted(first_values, points, side="right")
+    ] / first_counts.sum()
+    second_cdf = np.concatenate([[0], np.cumsum(second_counts)])[
+        np.searchsorted(second_values, points, side="right")
+    ] / second_counts.sum()
+    return float(np.clip(np.max(np.abs(first_cdf - second_cdf), initial=0.0), 0, 1))
+
+
+def fit_sketch_summary(reference_data: pd.Series, feature_type: str) -> ReferenceSummary:
+    """Approximate summary of numerical reference data with a KLL sketch, see `ReferenceSummary.from_sketch`"""
+    return ReferenceSummary.from_sketch(KLLSketch.from_values(reference_data.to_numpy(dtype=float)))
@@ -1,6 +1,39 @@
+from typing import Tuple
+
 import pandas as pd
 import numpy as np
 
+from evidently.utils.dataset_view import get_column_view
+from evidently.utils.histograms import get_bin_edges
+from evidently.utils.histograms import get_histogram
+
+
+def get_category_counts(reference: pd.Series, current: pd.Series) -> Tuple[np.ndarray, np.ndarray, pd.Index]:
+    """Count values of reference and current data by common categories.
+
+    Values of both series are encoded to the same integer codes once and counted with `np.bincount`.
+    Missing values are not counted, categories without values in both series are dropped.
+    Returns:
+        reference_counts: number of reference values for every category
+        current_counts: number of current values for every category
+        categories: categories in the same order as the counts
+    """
+    if isinstance(reference.dtype, pd.CategoricalDtype) and reference.dtype == current.dtype:
+        # the codes are already common
+        reference_codes = reference.cat.codes.to_numpy()
+        current_codes = current.cat.codes.to_numpy()
+        categories = reference.dtype.categories
+
+    else:
+        codes, categories = pd.factorize(pd.concat([reference, current], ignore_index=True))
+        reference_codes = codes[:len(reference)]
+        current_codes = codes[len(reference):]
+
+    reference_counts = np.bincount(reference_codes[reference_codes >= 0], minlength=len(categories))
+    current_counts = np.bincount(current_codes[current_codes >= 0], minlength=len(categories))
+    present = (reference_counts + current_counts) > 0
+    return reference_counts[present], current_counts[present], pd.Index(categories)[present]
+
 
 def get_binned_data(reference: pd.Series, current: pd.Series, feature_type: str, n: int, feel_zeroes: bool = True):
     """Split variable into n buckets based on reference quantiles
@@ -16,19 +49,18 @@ def get_binned_data(reference: pd.Series, current: pd.Series, feature_type: str,
     n_vals = reference.nunique()
     if feature_type == 'num' and n_vals > 20:
 
-        bins = np.histogram_bin_edges(list(reference) + list(current), bins='sturges')
+        reference_view = get_column_view(reference)
+        current_view = get_column_view(current)
+        bins = get_bin_edges([reference_view, current_view], 'sturges')
 
-        reference_percents = np.histogram(reference, bins)[0] / len(reference)
-        current_percents = np.histogram(current, bins)[0] / len(current)
+        reference_percents = get_histogram(reference_view, bins)[0] / len(reference)
+        current_percents = get_histogram(current_view, bins)[0] / len(current)
 
     else:
-        keys = list((set(reference.unique()) | set(current.unique())) - {np.nan})
-
-        ref_feature_dict = {**dict.fromkeys(keys, 0), **dict(reference.value_counts())}
-        current_feature_dict = {**dict.fromkeys(keys, 0), **dict(current.value_counts())}
+        reference_counts, current_counts, _ = get_category_counts(reference, current)
+        reference_percents = reference_counts / len(reference)
+        current_percents = current_counts / len(current)
 
-        reference_percents = np.array([ref_feature_dict[key] / len(reference) for key in keys])
-        current_percents = np.array([current_feature_dict[key] / len(current) for key in keys])
     if feel_zeroes:
         np.place(reference_percents, reference_percents == 0, 0.0001)
         np.place(current_percents, current_percents == 0, 0.0001)
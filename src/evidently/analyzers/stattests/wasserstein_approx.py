@@ -0,0 +1,58 @@
+"""Approximate normed Wasserstein distance with KLL sketches of both samples.
+
+Sketches keep `O(k)` values for any size of data, see `evidently.utils.sketches.KLLSketch`.
+The distance differs from the exact one by at most the sum of rank errors of the sketches
+(about 2.7% with 99% confidence for the default k=200) times the range of values divided by the reference std.
+The reference std is exact.
+"""
+from typing import Tuple
+
+import pandas as pd
+from scipy import stats
+
+from evidently.analyzers.stattests.registry import StatTest, register_stattest
+from evidently.analyzers.stattests.summary import ReferenceSummary
+from evidently.analyzers.stattests.summary import fit_sketch_summary
+from evidently.utils.sketches import KLLSketch
+
+
+def _wasserstein_approx(
+        reference_data: pd.Series,
+        current_data: pd.Series,
+        feature_type: str,
+        threshold: float) -> Tuple[float, bool]:
+    """Compute the approximate first Wasserstein distance between two arrays normed by std of reference data
+    Args:
+        reference_data: reference data
+        current_data: current data
+        feature_type: feature type
+        threshold: all values above this threshold means data drift
+    Returns:
+        wasserstein_distance_norm: normed Wasserstein distance
+        test_result: whether the drift is detected
+    """
+    return _wasserstein_approx_score(fit_sketch_summary(reference_data, feature_type), current_data, feature_type, threshold)
+
+
+def _wasserstein_approx_score(
+        reference: ReferenceSummary,
+        current_data: pd.Series,
+        feature_type: str,
+        threshold: float) -> Tuple[float, bool]:
+    current_values, current_counts = KLLSketch.from_values(current_data.to_numpy(dtype=float)).get_weighted_values()
+    norm = max(reference.std, 0.001)
+    wd_norm_value = stats.wasserstein_distance(reference.values, current_values, reference.counts, current_counts) / norm
+    return wd_norm_value, wd_norm_value >= threshold
+
+
+wasserstein_approx_stat_test = StatTest(
+    name="wasserstein_approx",
+    display_name="Wasserstein distance (normed, approximate)",
+    func=_wasserstein_approx,
+    allowed_feature_types=["num"],
+    default_threshold=0.1,
+    fit_func=fit_sketch_summary,
+    score_func=_wasserstein_approx_score,
+)
+
+register_stattest(wasserstein_approx_stat_test)
@@ -4,7 +4,10 @@ import pandas as pd
 import numpy as np
 from scipy import stats
 
+from evidently.analyzers.stattests.batch import NumericalSamples
 from evidently.analyzers.stattests.registry import StatTest, register_stattest
+from evidently.analyzers.stattests.summary import ReferenceSummary
+from evidently.analyzers.stattests.summary import fit_reference_summary
 
 
 def _wasserstein_distance_norm(
@@ -27,12 +30,33 @@ def _wasserstein_distance_norm(
     return wd_norm_value, wd_norm_value >= threshold
 
 
+def _wasserstein_distance_norm_batch(
+        samples: NumericalSamples,
+        threshold: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    norm = np.maximum(samples.get_reference_std(), 0.001)
+    wd_norm_values = samples.get_wasserstein_distances() / norm
+    return wd_norm_values, wd_norm_values >= threshold
+
+
+def _wasserstein_distance_norm_score(
+        reference: ReferenceSummary,
+        current_data: pd.Series,
+        feature_type: str,
+        threshold: float) -> Tuple[float, bool]:
+    norm = max(reference.std, 0.001)
+    wd_norm_value = stats.wasserstein_distance(reference.values, current_data, u_weights=reference.counts) / norm
+    return wd_norm_value, wd_norm_value >= threshold
+
+
 wasserstein_stat_test = StatTest(
     name="wasserstein",
     display_name="Wasserstein distance (normed)",
     func=_wasserstein_distance_norm,
     allowed_feature_types=["num"],
     default_threshold=0.1,
+    batch_func=_wasserstein_distance_norm_batch,
+    fit_func=fit_reference_summary,
+    score_func=_wasserstein_distance_norm_score,
 )
 
 register_stattest(wasserstein_stat_test)
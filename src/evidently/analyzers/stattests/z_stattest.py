@@ -8,15 +8,21 @@ import pandas as pd
 from scipy.stats import norm
 
 from evidently.analyzers.stattests.registry import StatTest, register_stattest
+from evidently.analyzers.stattests.summary import ReferenceSummary
+from evidently.analyzers.stattests.summary import fit_reference_summary
+from evidently.analyzers.stattests import summary
+from evidently.analyzers.stattests.utils import get_category_counts
 
 
 def proportions_diff_z_stat_ind(ref: pd.DataFrame, curr: pd.DataFrame):
     # pylint: disable=invalid-name
-    n1 = len(ref)
-    n2 = len(curr)
+    return proportions_diff_z_stat_counts(float(sum(ref)), len(ref), float(sum(curr)), len(curr))
 
-    p1 = float(sum(ref)) / n1
-    p2 = float(sum(curr)) / n2
+
+def proportions_diff_z_stat_counts(count1: float, n1: int, count2: float, n2: int):
+    # pylint: disable=invalid-name
+    p1 = count1 / n1
+    p2 = count2 / n2
     P = float(p1 * n1 + p2 * n2) / (n1 + n2)
 
     return (p1 - p2) / np.sqrt(P * (1 - P) * (1. / n1 + 1. / n2))
@@ -41,18 +47,38 @@ def _z_stat_test(
         current_data: pd.Series,
         feature_type: str,
         threshold: float) -> Tuple[float, bool]:
-    #  TODO: simplify ignoring NaN values here, in chi_stat_test and data_drift_analyzer
-    if (reference_data.nunique() == 1
-            and current_data.nunique() == 1
-            and reference_data.unique()[0] == current_data.unique()[0]):
+    reference_counts, current_counts, categories = get_category_counts(reference_data, current_data)
+    return _get_z_stat_test_result(
+        reference_counts, current_counts, categories, reference_data.shape[0], current_data.shape[0], threshold
+    )
+
+
+def _z_stat_test_score(
+        reference: ReferenceSummary,
+        current_data: pd.Series,
+        feature_type: str,
+        threshold: float) -> Tuple[float, bool]:
+    reference_counts, current_counts, categories = summary.get_category_counts(reference, current_data)
+    return _get_z_stat_test_result(
+        reference_counts, current_counts, categories, reference.size, current_data.shape[0], threshold
+    )
+
+
+def _get_z_stat_test_result(
+        reference_counts: np.ndarray,
+        current_counts: np.ndarray,
+        categories: pd.Index,
+        n1: int,
+        n2: int,
+        threshold: float) -> Tuple[float, bool]:
+    if len(categories) == 1 and reference_counts[0] > 0 and current_counts[0] > 0:
         p_value = 1
     else:
-        keys = set(list(reference_data.unique()) + list(current_data.unique())) - {np.nan}
-        ordered_keys = sorted(list(keys))
+        # proportions of values that are not the first of the ordered categories, missing values included
+        first = list(categories).index(sorted(categories)[0])
         p_value = proportions_diff_z_test(
-            proportions_diff_z_stat_ind(
-                reference_data.apply(lambda x, key=ordered_keys[0]: 0 if x == key else 1),
-                current_data.apply(lambda x, key=ordered_keys[0]: 0 if x == key else 1)
+            proportions_diff_z_stat_counts(
+                float(n1 - reference_counts[first]), n1, float(n2 - current_counts[first]), n2
             )
         )
     return p_value, p_value < threshold
@@ -63,6 +89,8 @@ z_stat_test = StatTest(
     display_name="Z-test p_value",
     func=_z_stat_test,
     allowed_feature_types=["cat"],
+    fit_func=fit_reference_summary,
+    score_func=_z_stat_test_score,
 )
 
 register_stattest(z_stat_test)
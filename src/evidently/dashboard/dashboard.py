@@ -166,8 +166,10 @@ class Dashboard(Pipeline):
     name: str
     stages: Sequence[Tab]
 
-    def __init__(self, tabs: Sequence[Tab], options: Optional[List[object]] = None):
-        super().__init__(tabs, options if options is not None else [])
+    def __init__(
+        self, tabs: Sequence[Tab], options: Optional[List[object]] = None, n_jobs: int = 1, backend: str = "thread"
+    ):
+        super().__init__(tabs, options if options is not None else [], n_jobs=n_jobs, backend=backend)
 
     def calculate(self,
                   reference_data: pandas.DataFrame,
@@ -9,6 +9,8 @@ from evidently.model.widget import BaseWidgetInfo
 from evidently.pipeline.column_mapping import ColumnMapping
 from evidently.pipeline.stage import PipelineStage
 from evidently.dashboard.widgets.widget import Widget
+from evidently.utils.run_stats import CallKind
+from evidently.utils.run_stats import measure
 
 
 VerboseLevel = int
@@ -60,10 +62,11 @@ class Tab(PipelineStage):
         self._widget_results.clear()
         for widget in self._widgets:
             widget.options_provider = self.options_provider
-            self._widget_results.append(widget.calculate(reference_data,
-                                                         current_data,
-                                                         column_mapping,
-                                                         analyzers_results))
+            with measure(CallKind.WIDGET, type(widget).__name__):
+                self._widget_results.append(widget.calculate(reference_data,
+                                                             current_data,
+                                                             column_mapping,
+                                                             analyzers_results))
 
     def info(self) -> List[Optional[BaseWidgetInfo]]:
         return self._widget_results
@@ -15,6 +15,9 @@ from evidently.dashboard.widgets.utils import CutQuantileTransformer, fig_to_jso
 from evidently.options import ColorOptions
 from evidently.options import DataDriftOptions
 from evidently.options import QualityMetricsOptions
+from evidently.utils.dataset_view import get_column_view
+from evidently.utils.histograms import get_bin_edges
+from evidently.utils.histograms import get_histogram
 
 
 def _generate_feature_params(name: str, data: DataDriftAnalyzerFeatureMetrics) -> dict:
@@ -39,6 +42,30 @@ def _generate_feature_params(name: str, data: DataDriftAnalyzerFeatureMetrics) -
     }
 
 
+def _add_histogram_bars(
+    fig: go.Figure, reference_data: pd.Series, current_data: pd.Series, nbinsx: int, color_options: ColorOptions
+) -> None:
+    reference_view = get_column_view(reference_data)
+    current_view = get_column_view(current_data)
+    bins = get_bin_edges([reference_view, current_view], nbinsx)
+    bin_centers = (bins[:-1] + bins[1:]) / 2
+
+    for view, color, name in (
+        (reference_view, color_options.get_reference_data_color(), "Reference"),
+        (current_view, color_options.get_current_data_color(), "Current"),
+    ):
+        counts = get_histogram(view, bins)[0]
+        fig.add_trace(
+            go.Bar(
+                x=bin_centers,
+                y=counts / max(counts.sum(), 1),
+                marker_color=color,
+                opacity=0.6,
+                name=name,
+            )
+        )
+
+
 def _generate_additional_graph_num_feature(
     name: str,
     reference_data: pd.DataFrame,
@@ -51,12 +78,7 @@ def _generate_additional_graph_num_feature(
     # plot distributions
     conf_interval_n_sigmas = quality_metrics_options.conf_interval_n_sigmas
     fig = go.Figure()
-    if data_drift_options.xbins and data_drift_options.xbins.get(name):
-        current_xbins = data_drift_options.xbins.get(name)
-        current_nbinsx = None
-    else:
-        current_xbins = None
-        current_nbinsx = data_drift_options.get_nbinsx(name)
+    current_xbins = data_drift_options.xbins.get(name) if data_drift_options.xbins else None
     quantiles = quality_metrics_options.get_cut_quantile(name)
     if quantiles:
         side, q = quantiles
@@ -67,29 +89,34 @@ def _generate_additional_graph_num_feature(
     else:
         reference_data_to_plot = reference_data[name]
         current_data_to_plot = current_data[name]
-    fig.add_trace(
-        go.Histogram(
-            x=reference_data_to_plot,
-            marker_color=color_options.get_reference_data_color(),
-            opacity=0.6,
-            xbins=current_xbins,
-            nbinsx=current_nbinsx,
-            name="Reference",
-            histnorm="probability",
+    if not current_xbins:
+        # bins are calculated once for both datasets, only the shares of values in bins are passed to the plot
+        _add_histogram_bars(
+            fig, reference_data_to_plot, current_data_to_plot, data_drift_options.get_nbinsx(name), color_options
         )
-    )
 
-    fig.add_trace(
-        go.Histogram(
-            x=current_data_to_plot,
-            marker_color=color_options.get_current_data_color(),
-            opacity=0.6,
-            xbins=current_xbins,
-            nbinsx=current_nbinsx,
-            name="Current",
-            histnorm="probability",
+    else:
+        fig.add_trace(
+            go.Histogram(
+                x=reference_data_to_plot,
+                marker_color=color_options.get_reference_data_color(),
+                opacity=0.6,
+                xbins=current_xbins,
+                name="Reference",
+                histnorm="probability",
+            )
+        )
+
+        fig.add_trace(
+            go.Histogram(
+                x=current_data_to_plot,
+                marker_color=color_options.get_current_data_color(),
+                opacity=0.6,
+                xbins=current_xbins,
+                name="Current",
+                histnorm="probability",
+            )
         )
-    )
     fig.update_layout(
         legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1),
         xaxis_title=name,
@@ -11,6 +11,7 @@ from plotly.subplots import make_subplots
 from evidently import ColumnMapping
 from evidently.analyzers.data_quality_analyzer import DataQualityAnalyzer
 from evidently.model.widget import BaseWidgetInfo, AdditionalGraphInfo
+from evidently.options.quality_metrics import CORRELATION_KINDS
 from evidently.dashboard.widgets.widget import Widget
 
 
@@ -38,8 +39,9 @@ class DataQualityCorrelationsWidget(Widget):
 
         additional_graphs = []
         parts = []
-        for kind in ['pearson', 'spearman', 'kendall', 'cramer_v']:
-            if reference_correlations[kind].shape[0] > 1:
+        for kind in CORRELATION_KINDS:
+            # only the kinds selected in QualityMetricsOptions are calculated
+            if kind in reference_correlations and reference_correlations[kind].shape[0] > 1:
                 correlation_figure = self._plot_correlation_figure(kind, reference_correlations, current_correlations)
                 additional_graphs.append(
                     AdditionalGraphInfo(
@@ -153,15 +155,15 @@ class DataQualityCorrelationsWidget(Widget):
 
     def _make_metrics(self, reference_correlations: dict, current_correlations: Optional[dict]):
         metrics = []
+        ref_spearman = reference_correlations.get('spearman', pd.DataFrame())
+        ref_cramer_v = reference_correlations.get('cramer_v', pd.DataFrame())
         if current_correlations is not None:
-            if reference_correlations['spearman'].shape[0] > 1:
-                com_num_corr = self._get_rel_diff_corr_features_sorted(reference_correlations['spearman'],
-                                                                       current_correlations['spearman'])
+            if ref_spearman.shape[0] > 1:
+                com_num_corr = self._get_rel_diff_corr_features_sorted(ref_spearman, current_correlations['spearman'])
             else:
                 com_num_corr = pd.DataFrame()
-            if reference_correlations['cramer_v'].shape[0] > 1:
-                com_cat_corr = self._get_rel_diff_corr_features_sorted(reference_correlations['cramer_v'],
-                                                                       current_correlations['cramer_v'])
+            if ref_cramer_v.shape[0] > 1:
+                com_cat_corr = self._get_rel_diff_corr_features_sorted(ref_cramer_v, current_correlations['cramer_v'])
             else:
                 com_cat_corr = pd.DataFrame()
             for i in range(5):
@@ -180,12 +182,12 @@ class DataQualityCorrelationsWidget(Widget):
                     {"label": "", "values": values},
                 )
         else:
-            if reference_correlations['spearman'].shape[0] > 0:
-                ref_num_corr = self._get_df_corr_features_sorted(reference_correlations['spearman'])
+            if ref_spearman.shape[0] > 0:
+                ref_num_corr = self._get_df_corr_features_sorted(ref_spearman)
             else:
                 ref_num_corr = pd.DataFrame()
-            if reference_correlations['cramer_v'].shape[0] > 0:
-                ref_cat_corr = self._get_df_corr_features_sorted(reference_correlations['cramer_v'])
+            if ref_cramer_v.shape[0] > 0:
+                ref_cat_corr = self._get_df_corr_features_sorted(ref_cramer_v)
             else:
                 ref_cat_corr = pd.DataFrame()
             for i in range(5):
@@ -63,8 +63,9 @@ class ProbClassMetricsMatrixWidget(Widget):
         y = ['precision', 'recall', 'f1-score']
 
         if len(utility_columns.prediction) > 2:
-            roc_aucs = metrics.roc_aucs
-            z = np.append(z, [roc_aucs], axis=0)
+            # ROC AUC of classes are in the order of probability columns, classes may be the top ones only
+            roc_aucs = dict(zip(map(str, utility_columns.prediction), metrics.roc_aucs))
+            z = np.append(z, [[roc_aucs.get(str(label), np.nan) for label in x]], axis=0)
             y.append('roc-auc')
 
         # change each element of z to type string for annotations
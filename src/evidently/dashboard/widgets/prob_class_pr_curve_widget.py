@@ -100,6 +100,10 @@ class ProbClassPRCurveWidget(Widget):
             graphs = []
 
             for label in utility_columns.prediction:
+                if label not in metrics.pr_curve:
+                    # curves are calculated for the top classes only if there are many classes
+                    continue
+
                 pr_curve = metrics.pr_curve[label]
                 fig = go.Figure()
                 fig.add_trace(go.Scatter(
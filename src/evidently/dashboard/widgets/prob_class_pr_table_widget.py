@@ -132,6 +132,10 @@ class ProbClassPRTableWidget(Widget):
                 if not isinstance(metrics.pr_table, dict):
                     raise ValueError(f"Widget [{self.title}] got incorrect type of pr_table value")
 
+                if label not in metrics.pr_table:
+                    # PR tables are calculated for the top classes only if there are many classes
+                    continue
+
                 pr_table_data_list = metrics.pr_table[label]
 
                 for line in pr_table_data_list:
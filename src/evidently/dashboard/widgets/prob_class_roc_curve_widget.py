@@ -106,6 +106,10 @@ class ProbClassRocCurveWidget(Widget):
                 if not isinstance(metrics.roc_curve, dict):
                     raise ValueError(f"Widget [{self.title}] got incorrect type for roc_curve value")
 
+                if label not in metrics.roc_curve:
+                    # curves are calculated for the top classes only if there are many classes
+                    continue
+
                 roc_curve = metrics.roc_curve[label]
                 fig = go.Figure()
 
@@ -1,6 +1,12 @@
 import abc
+import dataclasses
+import enum
+import re
 from dataclasses import dataclass
+from typing import Any
 from typing import Generic
+from typing import Hashable
+from typing import List
 from typing import Tuple
 from typing import TypeVar
 from typing import Optional
@@ -8,15 +14,83 @@ from typing import Optional
 import pandas as pd
 
 from evidently.pipeline.column_mapping import ColumnMapping
+from evidently.utils.dataset_view import DatasetView
+from evidently.utils.dataset_view import get_dataset_view
+from evidently.utils.reference_cache import ReferenceCache
 
 TResult = TypeVar("TResult")
 
+_PATTERN_TYPE = type(re.compile(""))
+
 
 @dataclass
 class InputData:
     reference_data: Optional[pd.DataFrame]
     current_data: pd.DataFrame
     column_mapping: ColumnMapping
+    # if False, metrics skip data that is only used to draw plots and keep None instead of it
+    calculate_plot_data: bool = True
+
+    @property
+    def reference_view(self) -> Optional[DatasetView]:
+        """Shared per-column primitives of the reference data"""
+        return None if self.reference_data is None else get_dataset_view(self.reference_data)
+
+    @property
+    def current_view(self) -> DatasetView:
+        """Shared per-column primitives of the current data"""
+        return get_dataset_view(self.current_data)
+
+
+def _freeze_parameter(value: Any) -> Hashable:
+    """Convert a metric parameter to a hashable value that is equal for equal parameters.
+
+    Values that cannot be compared by content (data frames, arrays, other third-party objects)
+    are identified by the object itself, so metrics that hold them are never treated as equivalent.
+    """
+    if value is None or isinstance(value, (str, bytes, bool, int, float, complex, enum.Enum, type)):
+        return value
+
+    if isinstance(value, Metric):
+        return value.get_fingerprint()
+
+    if isinstance(value, (list, tuple)):
+        return type(value), tuple(_freeze_parameter(item) for item in value)
+
+    if isinstance(value, (set, frozenset)):
+        return type(value), frozenset(_freeze_parameter(item) for item in value)
+
+    if isinstance(value, dict):
+        return dict, tuple(
+            sorted(
+                ((_freeze_parameter(key), _freeze_parameter(item)) for key, item in value.items()),
+                key=repr,
+            )
+        )
+
+    if isinstance(value, _PATTERN_TYPE):
+        return _PATTERN_TYPE, value.pattern, value.flags
+
+    if dataclasses.is_dataclass(value):
+        return type(value), tuple(
+            (field.name, _freeze_parameter(getattr(value, field.name))) for field in dataclasses.fields(value)
+        )
+
+    if callable(value) or isinstance(value, ReferenceCache):
+        # a cache is shared state, metrics are equivalent only with the same cache
+        return value
+
+    if hasattr(value, "__dict__") and type(value).__module__.startswith("evidently."):
+        # evidently objects like analyzers and options providers are compared by their fields
+        return type(value), _freeze_parameter(vars(value))
+
+    try:
+        hash(value)
+
+    except TypeError:
+        return type(value), id(value)
+
+    return value
 
 
 class Metric(Generic[TResult]):
@@ -29,6 +103,29 @@ class Metric(Generic[TResult]):
     def set_context(self, context):
         self.context = context
 
+    def get_dependencies(self) -> List["Metric"]:
+        """Metrics whose results are required by the metric.
+
+        All fields of the metric with a type that is subclass of Metric are used as dependencies,
+        their results are passed to `calculate` in the `metrics` dict.
+        """
+        return [field for name, field in vars(self).items() if name != "context" and isinstance(field, Metric)]
+
+    def __getstate__(self):
+        # a context is bound to a suite, do not transfer it with the metric (e.g. to a worker process)
+        state = self.__dict__.copy()
+        state.pop("context", None)
+        return state
+
+    def get_fingerprint(self) -> Tuple[type, Hashable]:
+        """Identify the metric by its type and parameters.
+
+        Metrics with equal fingerprints calculate the same result for the same data,
+        so a suite can calculate only one of them and share the result.
+        """
+        parameters = {name: value for name, value in vars(self).items() if name != "context"}
+        return type(self), _freeze_parameter(parameters)
+
     def get_result(self) -> TResult:
         if self.context is None:
             raise ValueError("No context is set")
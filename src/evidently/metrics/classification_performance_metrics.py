@@ -17,6 +17,16 @@ from evidently.analyzers.classification_performance_analyzer import ConfusionMat
 from evidently.analyzers.utils import calculate_confusion_by_classes
 from evidently.metrics.base_metric import InputData
 from evidently.metrics.base_metric import Metric
+from evidently.options import QualityMetricsOptions
+from evidently.utils.confusion_matrix import BinaryThresholdSweep
+from evidently.utils.confusion_matrix import get_confusion_matrix
+from evidently.utils.confusion_matrix import get_confusion_matrix_metrics
+from evidently.utils.curves import get_pr_curve
+from evidently.utils.curves import get_pr_table
+from evidently.utils.curves import get_roc_curve
+from evidently.utils.multiclass import SparseConfusionMatrix
+from evidently.utils.multiclass import get_log_loss
+from evidently.utils.multiclass import get_multiclass_metrics
 
 
 @dataclasses.dataclass
@@ -36,6 +46,8 @@ class DatasetClassificationPerformanceMetrics:
     roc_curve: Optional[dict] = None
     pr_curve: Optional[dict] = None
     pr_table: Optional[Union[dict, list]] = None
+    # in the multiclass mode for many classes, detailed data is for the top classes only
+    sparse_confusion_matrix: Optional[SparseConfusionMatrix] = None
 
 
 @dataclasses.dataclass
@@ -57,6 +69,7 @@ class ClassificationPerformanceMetricsResults:
     reference_metrics: Optional[DatasetClassificationPerformanceMetrics] = None
     reference_by_k_metrics: Optional[Dict[Union[int, float], DatasetClassificationPerformanceMetrics]] = None
     reference_by_threshold_metrics: Optional[Dict[Union[int, float], DatasetClassificationPerformanceMetrics]] = None
+    # None if plot data is not calculated
     data_for_plots: Optional[DataForPlots] = None
 
 
@@ -79,34 +92,113 @@ def threshold_probability_labels(
 
 
 def _calculate_k_variants(
-    target_data: pd.Series, prediction_probas: pd.DataFrame, labels: List[str], k_variants: List[Union[int, float]]
+    target_data: pd.Series,
+    prediction_probas: pd.DataFrame,
+    labels: List[str],
+    k_variants: List[Union[int, float]],
+    probas_metrics: DatasetClassificationPerformanceMetrics,
 ):
-    by_k_results = {}
-    for k in k_variants:
-        # calculate metrics matrix
-        if prediction_probas is None or len(labels) > 2:
-            raise ValueError("Top K parameter can be used only with binary classification with probas")
-
-        pos_label, neg_label = prediction_probas.columns
-        prediction_labels = threshold_probability_labels(
-            prediction_probas, pos_label, neg_label, k_probability_threshold(prediction_probas, k)
-        )
-        by_k_results[k] = classification_performance_metrics(
-            target_data, prediction_labels, prediction_probas, pos_label
-        )
-    return by_k_results
+    if not k_variants:
+        return {}
+
+    if prediction_probas is None or len(labels) > 2:
+        raise ValueError("Top K parameter can be used only with binary classification with probas")
+
+    pos_label = prediction_probas.columns[0]
+    sweep = BinaryThresholdSweep((target_data == pos_label).to_numpy(), prediction_probas[pos_label].to_numpy())
+    by_k_metrics = _calculate_by_thresholds(
+        target_data, prediction_probas, [sweep.get_k_threshold(k) for k in k_variants], probas_metrics, sweep
+    )
+    return dict(zip(k_variants, by_k_metrics))
+
+
+def _calculate_thresholds(
+    target_data: pd.Series,
+    prediction_probas: pd.DataFrame,
+    thresholds: List[float],
+    probas_metrics: DatasetClassificationPerformanceMetrics,
+):
+    if not thresholds:
+        return {}
 
+    return dict(zip(thresholds, _calculate_by_thresholds(target_data, prediction_probas, thresholds, probas_metrics)))
 
-def _calculate_thresholds(target_data: pd.Series, prediction_probas: pd.DataFrame, thresholds: List[float]):
-    by_threshold_results = {}
 
-    for threshold in thresholds:
-        pos_label, neg_label = prediction_probas.columns
-        prediction_labels = threshold_probability_labels(prediction_probas, pos_label, neg_label, threshold)
-        by_threshold_results[threshold] = classification_performance_metrics(
-            target_data, prediction_labels, prediction_probas, pos_label
+def _calculate_by_thresholds(
+    target_data: pd.Series,
+    prediction_probas: pd.DataFrame,
+    thresholds: List[float],
+    probas_metrics: DatasetClassificationPerformanceMetrics,
+    sweep: Optional[BinaryThresholdSweep] = None,
+) -> List[DatasetClassificationPerformanceMetrics]:
+    """Metrics of binary classification with labels predicted by thresholds of the positive label probability.
+
+    Confusion matrices of all thresholds are counted from probabilities that are sorted once, metrics that
+    do not depend on the threshold (ROC AUC, log loss, curves and PR tables) are taken from `probas_metrics`.
+    """
+    pos_label, neg_label = prediction_probas.columns
+    target_labels = sorted(set(target_data.unique()))
+
+    if not set(target_labels) <= {pos_label, neg_label}:
+        # the target has labels without probabilities, metrics of predicted labels are calculated the usual way
+        return [
+            dataclasses.replace(
+                classification_performance_metrics(
+                    target_data,
+                    threshold_probability_labels(prediction_probas, pos_label, neg_label, threshold),
+                    None,
+                    pos_label,
+                ),
+                roc_auc=probas_metrics.roc_auc,
+                log_loss=probas_metrics.log_loss,
+                roc_aucs=probas_metrics.roc_aucs,
+                roc_curve=probas_metrics.roc_curve,
+                pr_curve=probas_metrics.pr_curve,
+                pr_table=probas_metrics.pr_table,
+            )
+            for threshold in thresholds
+        ]
+
+    if sweep is None:
+        sweep = BinaryThresholdSweep((target_data == pos_label).to_numpy(), prediction_probas[pos_label].to_numpy())
+
+    results = []
+
+    for true_positives, false_positives, false_negatives, true_negatives in zip(
+        *sweep.get_confusion_counts(thresholds)
+    ):
+        counts = {
+            (pos_label, pos_label): true_positives,
+            (neg_label, pos_label): false_positives,
+            (pos_label, neg_label): false_negatives,
+            (neg_label, neg_label): true_negatives,
+        }
+        # the same labels as `sklearn.metrics.unique_labels` of the target and the predicted labels
+        predicted_labels = {label for (_, label), count in counts.items() if count > 0}
+        matrix_labels = sorted(set(target_labels) | predicted_labels)
+        conf_matrix = np.array(
+            [[counts[(true_label, label)] for label in matrix_labels] for true_label in matrix_labels]
+        )
+        quality_metrics = get_confusion_matrix_metrics(conf_matrix, matrix_labels, "binary", pos_label)
+        results.append(
+            DatasetClassificationPerformanceMetrics(
+                accuracy=quality_metrics.accuracy,
+                precision=quality_metrics.precision,
+                recall=quality_metrics.recall,
+                f1=quality_metrics.f1,
+                roc_auc=probas_metrics.roc_auc,
+                log_loss=probas_metrics.log_loss,
+                metrics_matrix=quality_metrics.metrics_matrix,
+                confusion_matrix=ConfusionMatrix(labels=target_labels, values=conf_matrix.tolist()),
+                roc_aucs=probas_metrics.roc_aucs,
+                roc_curve=probas_metrics.roc_curve,
+                pr_curve=probas_metrics.pr_curve,
+                pr_table=probas_metrics.pr_table,
+                confusion_by_classes=calculate_confusion_by_classes(conf_matrix, target_labels),
+            )
         )
-    return by_threshold_results
+
+    return results
 
 
 def classification_performance_metrics(
@@ -114,29 +206,56 @@ def classification_performance_metrics(
     prediction: pd.Series,
     prediction_probas: Optional[pd.DataFrame],
     pos_label: Optional[Union[str, int]],
+    options: Optional[QualityMetricsOptions] = None,
 ) -> DatasetClassificationPerformanceMetrics:
+    """Quality metrics of predicted labels and, if `prediction_probas` is set, of probabilities of labels.
 
-    class_num = target.nunique()
-    prediction_labels = prediction
+    ROC and precision-recall curves are reduced to `options.max_curve_points` points if it is set.
+    Classification with more than `options.top_classes` classes is evaluated in the multiclass mode
+    for many classes, see `evidently.utils.multiclass`.
+    """
+    if options is None:
+        options = QualityMetricsOptions()
 
-    if class_num > 2:
-        accuracy_score = sklearn.metrics.accuracy_score(target, prediction_labels)
-        avg_precision = sklearn.metrics.precision_score(target, prediction_labels, average="macro")
-        avg_recall = sklearn.metrics.recall_score(target, prediction_labels, average="macro")
-        avg_f1 = sklearn.metrics.f1_score(target, prediction_labels, average="macro")
+    classes_count = target.nunique() if prediction_probas is None else prediction_probas.shape[1]
 
-    else:
-        accuracy_score = sklearn.metrics.accuracy_score(target, prediction_labels)
-        avg_precision = sklearn.metrics.precision_score(
-            target, prediction_labels, average="binary", pos_label=pos_label
+    if options.use_top_classes(classes_count):
+        multiclass_metrics = get_multiclass_metrics(
+            target, prediction, prediction_probas, options.top_classes, options.top_classes_by, options.max_curve_points
         )
-        avg_recall = sklearn.metrics.recall_score(target, prediction_labels, average="binary", pos_label=pos_label)
-        avg_f1 = sklearn.metrics.f1_score(target, prediction_labels, average="binary", pos_label=pos_label)
+        return DatasetClassificationPerformanceMetrics(
+            accuracy=multiclass_metrics.quality_metrics.accuracy,
+            precision=multiclass_metrics.quality_metrics.precision,
+            recall=multiclass_metrics.quality_metrics.recall,
+            f1=multiclass_metrics.quality_metrics.f1,
+            roc_auc=multiclass_metrics.roc_auc,
+            log_loss=multiclass_metrics.log_loss,
+            metrics_matrix=multiclass_metrics.quality_metrics.metrics_matrix,
+            confusion_matrix=ConfusionMatrix(
+                labels=multiclass_metrics.top_labels, values=multiclass_metrics.confusion_matrix
+            ),
+            roc_aucs=multiclass_metrics.roc_aucs,
+            roc_curve=multiclass_metrics.roc_curve,
+            pr_curve=multiclass_metrics.pr_curve,
+            pr_table=multiclass_metrics.pr_table,
+            confusion_by_classes=multiclass_metrics.confusion_by_classes,
+            sparse_confusion_matrix=multiclass_metrics.sparse_confusion_matrix,
+        )
+
+    # all quality metrics of predicted labels are derived from the confusion matrix
+    conf_matrix, matrix_labels = get_confusion_matrix(target, prediction)
+    support = conf_matrix.sum(axis=1)
+    labels = [label for label, label_support in zip(matrix_labels, support) if label_support > 0]
+    quality_metrics = get_confusion_matrix_metrics(
+        conf_matrix, matrix_labels, "macro" if len(labels) > 2 else "binary", pos_label
+    )
 
     roc_auc: Optional[float] = None
     roc_aucs: Optional[list] = None
     log_loss: Optional[float] = None
     roc_curve: Optional[dict] = None
+    pr_curve: Optional[dict] = None
+    pr_table: Optional[dict] = None
 
     if prediction_probas is not None:
         binaraized_target = (
@@ -146,34 +265,32 @@ def classification_performance_metrics(
         roc_auc = sklearn.metrics.roc_auc_score(binaraized_target, array_prediction, average="macro")
         log_loss = sklearn.metrics.log_loss(binaraized_target, array_prediction)
         roc_aucs = sklearn.metrics.roc_auc_score(binaraized_target, array_prediction, average=None).tolist()  # noqa
-        # roc curve
+        # curves of every label from its probabilities sorted once
         roc_curve = {}
-        binaraized_target = pd.DataFrame(binaraized_target)
-        binaraized_target.columns = list(prediction_probas.columns)
-        for label in binaraized_target.columns:
-            fpr, tpr, thrs = sklearn.metrics.roc_curve(binaraized_target[label], prediction_probas[label])
-            roc_curve[label] = {"fpr": fpr.tolist(), "tpr": tpr.tolist(), "thrs": thrs.tolist()}
-
-    # calculate class support and metrics matrix
-    metrics_matrix = sklearn.metrics.classification_report(target, prediction_labels, output_dict=True)
-
-    # calculate confusion matrix
-    # labels = target_names if target_names else sorted(set(target.unique()) | set(prediction.unique()))
-    labels = sorted(set(target.unique()))
-    conf_matrix = sklearn.metrics.confusion_matrix(target, prediction_labels)
+        pr_curve = {}
+        pr_table = {}
+        for position, label in enumerate(prediction_probas.columns):
+            sweep = BinaryThresholdSweep(binaraized_target[:, position].astype(bool), array_prediction[:, position])
+            roc_curve[label] = get_roc_curve(sweep, options.max_curve_points)
+            pr_curve[label] = get_pr_curve(sweep, options.max_curve_points)
+            pr_table[label] = get_pr_table(sweep)
+
+    # labels of the target only
     confusion_by_classes = calculate_confusion_by_classes(conf_matrix, labels)
 
     return DatasetClassificationPerformanceMetrics(
-        accuracy=accuracy_score,
-        precision=avg_precision,
-        recall=avg_recall,
-        f1=avg_f1,
+        accuracy=quality_metrics.accuracy,
+        precision=quality_metrics.precision,
+        recall=quality_metrics.recall,
+        f1=quality_metrics.f1,
         roc_auc=roc_auc,
         log_loss=log_loss,
-        metrics_matrix=metrics_matrix,
+        metrics_matrix=quality_metrics.metrics_matrix,
         confusion_matrix=ConfusionMatrix(labels=labels, values=conf_matrix.tolist()),
         roc_aucs=roc_aucs,
         roc_curve=roc_curve,
+        pr_curve=pr_curve,
+        pr_table=pr_table,
         confusion_by_classes=confusion_by_classes,
     )
 
@@ -182,9 +299,10 @@ class ClassificationPerformanceMetrics(Metric[ClassificationPerformanceMetricsRe
     k_variants: List[Union[int, float]]
     thresholds: List[float]
 
-    def __init__(self):
+    def __init__(self, options: Optional[QualityMetricsOptions] = None):
         self.k_variants = []
         self.thresholds = []
+        self.options = options if options is not None else QualityMetricsOptions()
 
     def with_k(self, k: Union[int, float]) -> "ClassificationPerformanceMetrics":
         self.k_variants.append(k)
@@ -206,12 +324,20 @@ class ClassificationPerformanceMetrics(Metric[ClassificationPerformanceMetricsRe
 
         labels = sorted(set(target_data.unique()))
         current_metrics = classification_performance_metrics(
-            target_data, prediction_data, prediction_probas, data.column_mapping.pos_label
+            target_data,
+            prediction_data,
+            prediction_probas,
+            data.column_mapping.pos_label,
+            self.options,
         )
 
-        current_by_k_metrics = _calculate_k_variants(target_data, prediction_probas, labels, self.k_variants)
+        current_by_k_metrics = _calculate_k_variants(
+            target_data, prediction_probas, labels, self.k_variants, current_metrics
+        )
 
-        current_by_thresholds_metrics = _calculate_thresholds(target_data, prediction_probas, self.thresholds)
+        current_by_thresholds_metrics = _calculate_thresholds(
+            target_data, prediction_probas, self.thresholds, current_metrics
+        )
 
         reference_metrics = None
         reference_by_k = None
@@ -229,20 +355,27 @@ class ClassificationPerformanceMetrics(Metric[ClassificationPerformanceMetricsRe
                 ref_prediction_data,
                 ref_probas,
                 data.column_mapping.pos_label,
+                self.options,
             )
-            reference_by_k = _calculate_k_variants(ref_target, ref_probas, labels, self.k_variants)
-            reference_by_threshold = _calculate_thresholds(ref_target, ref_probas, self.thresholds)
+            reference_by_k = _calculate_k_variants(ref_target, ref_probas, labels, self.k_variants, reference_metrics)
+            reference_by_threshold = _calculate_thresholds(ref_target, ref_probas, self.thresholds, reference_metrics)
 
         # dummy
         labels_ratio = target_data.value_counts(normalize=True)
         np.random.seed(0)
         dummy_preds = np.random.choice(labels_ratio.index, len(target_data), p=labels_ratio)
         dummy_metrics = classification_performance_metrics(
-            target_data, dummy_preds, None, data.column_mapping.pos_label
+            target_data, dummy_preds, None, data.column_mapping.pos_label, self.options
         )
 
         # dummy log_loss
-        if prediction_probas is not None:
+        if prediction_probas is not None and self.options.use_top_classes(prediction_probas.shape[1]):
+            dummy_prediction = pd.DataFrame(
+                np.full(prediction_probas.shape, 1 / prediction_probas.shape[1]), columns=prediction_probas.columns
+            )
+            dummy_metrics.log_loss = get_log_loss(target_data, dummy_prediction)
+
+        elif prediction_probas is not None:
             binaraized_target = (
                 target_data.astype(str).values.reshape(-1, 1) == list(prediction_probas.columns.astype(str))
             ).astype(int)
@@ -263,12 +396,15 @@ class ClassificationPerformanceMetrics(Metric[ClassificationPerformanceMetricsRe
         dummy_metrics.roc_auc = 0.5
 
         # data for plots
-        curr_for_plots = None
-        ref_for_plots = None
-        if prediction_probas is not None:
-            curr_for_plots = _collect_plot_data(prediction_probas)
-        if data.reference_data is not None and ref_probas is not None:
-            ref_for_plots = _collect_plot_data(ref_probas)
+        data_for_plots = None
+        if data.calculate_plot_data:
+            curr_for_plots = None
+            ref_for_plots = None
+            if prediction_probas is not None:
+                curr_for_plots = _collect_plot_data(prediction_probas)
+            if data.reference_data is not None and ref_probas is not None:
+                ref_for_plots = _collect_plot_data(ref_probas)
+            data_for_plots = DataForPlots(current=curr_for_plots, reference=ref_for_plots)
 
         return ClassificationPerformanceMetricsResults(
             current_metrics=current_metrics,
@@ -280,7 +416,7 @@ class ClassificationPerformanceMetrics(Metric[ClassificationPerformanceMetricsRe
             dummy_metrics=dummy_metrics,
             dummy_by_k_metrics=k_dummy_results,
             dummy_by_threshold_metrics=threshold_dummy_results,
-            data_for_plots=DataForPlots(current=curr_for_plots, reference=ref_for_plots),
+            data_for_plots=data_for_plots,
         )
 
 
@@ -292,17 +428,27 @@ def _dummy_threshold_metrics(
     else:
         mult_precision = min(1.0, 0.5 / (1 - threshold))
     mult_recall = min(1.0, (1 - threshold) / 0.5)
+    f1_denominator = dummy_results.precision * mult_precision + dummy_results.recall * mult_recall
+
+    if f1_denominator == 0:
+        # F1 is NaN if precision and recall are 0, like with division of numpy floats
+        f1 = np.nan
+
+    else:
+        f1 = (
+            2
+            * dummy_results.precision
+            * mult_precision
+            * dummy_results.recall
+            * mult_recall
+            / f1_denominator
+        )
 
     return DatasetClassificationPerformanceMetrics(
         accuracy=dummy_results.accuracy,
         precision=dummy_results.precision * mult_precision,
         recall=dummy_results.recall * mult_recall,
-        f1=2
-        * dummy_results.precision
-        * mult_precision
-        * dummy_results.recall
-        * mult_recall
-        / (dummy_results.precision * mult_precision + dummy_results.recall * mult_recall),
+        f1=f1,
         roc_auc=None,
         log_loss=dummy_results.log_loss,
         metrics_matrix=dummy_results.metrics_matrix,
@@ -8,9 +8,14 @@ from evidently.analyzers.data_drift_analyzer import DataDriftAnalyzer
 from evidently.analyzers.data_drift_analyzer import DataDriftAnalyzerResults
 from evidently.options import DataDriftOptions
 from evidently.options import OptionsProvider
+from evidently.options import ReferenceCacheOptions
+from evidently.utils.reference_cache import ReferenceCache
+from evidently.utils.reference_cache import resolve_reference_cache
 
 from evidently.metrics.base_metric import InputData
 from evidently.metrics.base_metric import Metric
+from evidently.utils.run_stats import CallKind
+from evidently.utils.run_stats import measure
 from evidently.metrics.utils import make_hist_for_num_plot
 from evidently.metrics.utils import make_hist_for_cat_plot
 
@@ -18,25 +23,37 @@ from evidently.metrics.utils import make_hist_for_cat_plot
 @dataclass
 class DataDriftMetricsResults:
     analyzer_result: DataDriftAnalyzerResults
-    distr_for_plots: Dict[str, Dict[str, pd.DataFrame]]
+    # data for plots, None if plot data is not calculated
+    distr_for_plots: Optional[Dict[str, Dict[str, pd.DataFrame]]]
 
 
 class DataDriftMetrics(Metric[DataDriftMetricsResults]):
-    def __init__(self, options: Optional[DataDriftOptions] = None):
+    def __init__(self, options: Optional[DataDriftOptions] = None, reference_cache: Optional[ReferenceCache] = None):
         self.analyzer = DataDriftAnalyzer()
         self.analyzer.options_provider = OptionsProvider()
 
         if options is not None:
             self.analyzer.options_provider.add(options)
 
+        if reference_cache is not None:
+            self.analyzer.options_provider.add(ReferenceCacheOptions(cache=reference_cache))
+
     def calculate(self, data: InputData, metrics: dict) -> DataDriftMetricsResults:
         if data.reference_data is None:
             raise ValueError("Reference dataset should be present")
 
-        analyzer_result = self.analyzer.calculate(data.reference_data, data.current_data, data.column_mapping)
+        with measure(CallKind.ANALYZER, type(self.analyzer).__name__):
+            analyzer_result = self.analyzer.calculate(data.reference_data, data.current_data, data.column_mapping)
+
+        if not data.calculate_plot_data:
+            return DataDriftMetricsResults(analyzer_result=analyzer_result, distr_for_plots=None)
+
+        reference_cache = resolve_reference_cache(self.analyzer.options_provider.get(ReferenceCacheOptions).cache)
         distr_for_plots = {}
         for feature in analyzer_result.columns.num_feature_names:
-            distr_for_plots[feature] = make_hist_for_num_plot(data.current_data[feature], data.reference_data[feature])
+            distr_for_plots[feature] = make_hist_for_num_plot(
+                data.current_data[feature], data.reference_data[feature], reference_cache
+            )
         for feature in analyzer_result.columns.cat_feature_names:
             distr_for_plots[feature] = make_hist_for_cat_plot(data.current_data[feature], data.reference_data[feature])
 
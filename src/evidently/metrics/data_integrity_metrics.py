@@ -11,6 +11,7 @@ from typing import Union
 
 from evidently.metrics.base_metric import InputData
 from evidently.metrics.base_metric import Metric
+from evidently.utils.dataset_view import DatasetView
 
 
 @dataclass
@@ -29,7 +30,10 @@ class DataIntegrityMetricsValues:
     columns_type: dict
     nans_by_columns: dict
     number_uniques_by_columns: dict
-    counts_of_values: dict
+    # data for plots, None if plot data is not calculated
+    counts_of_values: Optional[dict]
+    # names of the fields that are estimated with sketches, None if all the values are exact
+    approximate_fields: Optional[List[str]] = None
 
 
 @dataclass
@@ -40,27 +44,58 @@ class DataIntegrityMetricsResults:
 
 class DataIntegrityMetrics(Metric[DataIntegrityMetricsResults]):
     @staticmethod
-    def _get_integrity_metrics_values(dataset: pd.DataFrame, columns: tuple) -> DataIntegrityMetricsValues:
-        counts_of_values = {}
-        for col in dataset.columns:
-            feature = dataset[col]
-            df_counts = feature.value_counts(dropna=False).reset_index()
-            df_counts.columns = ["x", "count"]
-            counts_of_values[col] = df_counts
+    def _get_number_of_duplicated_columns(dataset_view: DatasetView, columns: np.ndarray) -> int:
+        """Number of pairs of equal columns, only columns with equal hashes are compared"""
+        groups: Dict[Optional[bytes], List] = {}
+
+        for col in columns:
+            try:
+                key: Optional[bytes] = dataset_view.column(col).content_hash()
+
+            except TypeError:
+                # columns that pandas cannot hash are compared with each other
+                key = None
+
+            groups.setdefault(key, []).append(col)
+
+        dataset = dataset_view.data
+        return sum(
+            1
+            for group in groups.values()
+            for i, j in combinations(group, 2)
+            if dataset[i].equals(dataset[j])
+        )
+
+    @staticmethod
+    def _get_integrity_metrics_values(
+        dataset_view: DatasetView, columns: np.ndarray, calculate_plot_data: bool = True
+    ) -> DataIntegrityMetricsValues:
+        rows_count = dataset_view.data.shape[0]
+        column_views = [dataset_view.column(col) for col in columns]
+        counts_of_values: Optional[dict] = None
+        if calculate_plot_data:
+            counts_of_values = {}
+            for col, column_view in zip(columns, column_views):
+                df_counts = column_view.value_counts(dropna=False).reset_index()
+                df_counts.columns = ["x", "count"]
+                counts_of_values[col] = df_counts
+        null_mask = dataset_view.null_mask(columns)
+        nans_by_columns = null_mask.sum(axis=0)
+        number_uniques_by_columns = {col: column_view.nunique() for col, column_view in zip(columns, column_views)}
         return DataIntegrityMetricsValues(
             number_of_columns=len(columns),
-            number_of_rows=dataset.shape[0],
-            number_of_nans=dataset.isna().sum().sum(),
-            number_of_columns_with_nans=dataset.isna().any().sum(),
-            number_of_rows_with_nans=dataset.isna().any(axis=1).sum(),
-            number_of_constant_columns=len(dataset.columns[dataset.nunique() <= 1]),  # type: ignore
-            number_of_empty_rows=dataset.isna().all(1).sum(),
-            number_of_empty_columns=dataset.isna().all().sum(),
-            number_of_duplicated_rows=dataset.duplicated().sum(),
-            number_of_duplicated_columns=sum([1 for i, j in combinations(dataset, 2) if dataset[i].equals(dataset[j])]),
-            columns_type=dict(dataset.dtypes.to_dict()),
-            nans_by_columns=dataset.isna().sum().to_dict(),
-            number_uniques_by_columns=dict(dataset.nunique().to_dict()),
+            number_of_rows=rows_count,
+            number_of_nans=int(nans_by_columns.sum()),
+            number_of_columns_with_nans=int((nans_by_columns > 0).sum()),
+            number_of_rows_with_nans=int(null_mask.any(axis=1).sum()),
+            number_of_constant_columns=sum(1 for count in number_uniques_by_columns.values() if count <= 1),
+            number_of_empty_rows=int(null_mask.all(axis=1).sum()),
+            number_of_empty_columns=int((nans_by_columns == rows_count).sum()),
+            number_of_duplicated_rows=int(dataset_view.duplicated(columns).sum()),
+            number_of_duplicated_columns=DataIntegrityMetrics._get_number_of_duplicated_columns(dataset_view, columns),
+            columns_type={col: column_view.column.dtype for col, column_view in zip(columns, column_views)},
+            nans_by_columns={col: int(count) for col, count in zip(columns, nans_by_columns)},
+            number_uniques_by_columns=number_uniques_by_columns,
             counts_of_values=counts_of_values
         )
 
@@ -95,14 +130,16 @@ class DataIntegrityMetrics(Metric[DataIntegrityMetricsResults]):
 
         current_columns = np.intersect1d(columns, data.current_data.columns)
 
-        curr_data = data.current_data[current_columns]
-        current_stats = self._get_integrity_metrics_values(curr_data, current_columns)
+        current_stats = self._get_integrity_metrics_values(
+            data.current_view, current_columns, data.calculate_plot_data
+        )
 
-        if data.reference_data is not None:
+        reference_view = data.reference_view
+
+        if data.reference_data is not None and reference_view is not None:
             reference_columns = np.intersect1d(columns, data.reference_data.columns)
-            ref_data = data.reference_data[reference_columns]
             reference_stats: Optional[DataIntegrityMetricsValues] = self._get_integrity_metrics_values(
-                ref_data, reference_columns
+                reference_view, reference_columns, data.calculate_plot_data
             )
 
         else:
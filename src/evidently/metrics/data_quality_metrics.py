@@ -14,8 +14,13 @@ from evidently.analyzers.data_quality_analyzer import DataQualityAnalyzer
 from evidently.analyzers.utils import recognize_task
 from evidently.options.quality_metrics import QualityMetricsOptions
 from evidently.options import OptionsProvider
+from evidently.options import ReferenceCacheOptions
+from evidently.utils.reference_cache import ReferenceCache
+from evidently.utils.reference_cache import resolve_reference_cache
 from evidently.metrics.base_metric import InputData
 from evidently.metrics.base_metric import Metric
+from evidently.utils.run_stats import CallKind
+from evidently.utils.run_stats import measure
 from evidently.metrics.utils import make_hist_for_num_plot
 from evidently.metrics.utils import make_hist_for_cat_plot
 
@@ -23,36 +28,49 @@ from evidently.metrics.utils import make_hist_for_cat_plot
 @dataclass
 class DataQualityMetricsResults:
     features_stats: DataQualityStats
-    distr_for_plots: Dict[str, Dict[str, pd.DataFrame]]
-    counts_of_values: Dict[str, Dict[str, pd.DataFrame]]
+    # data for plots, None if plot data is not calculated
+    distr_for_plots: Optional[Dict[str, Dict[str, pd.DataFrame]]]
+    counts_of_values: Optional[Dict[str, Dict[str, pd.DataFrame]]]
     correlations: Optional[Dict[str, pd.DataFrame]] = None
     reference_features_stats: Optional[DataQualityStats] = None
+    # numbers of rows correlation matrices are calculated with
+    correlations_sample_sizes: Optional[Dict[str, int]] = None
 
 
 class DataQualityMetrics(Metric[DataQualityMetricsResults]):
-    def __init__(self, options: QualityMetricsOptions = None) -> None:
+    def __init__(
+        self, options: QualityMetricsOptions = None, reference_cache: Optional[ReferenceCache] = None
+    ) -> None:
         self.analyzer = DataQualityAnalyzer()
         self.analyzer.options_provider = OptionsProvider()
 
         if options is not None:
             self.analyzer.options_provider.add(options)
 
+        if reference_cache is not None:
+            self.analyzer.options_provider.add(ReferenceCacheOptions(cache=reference_cache))
+
     def calculate(self, data: InputData, metrics: dict) -> DataQualityMetricsResults:
         if data.current_data is None:
             raise ValueError("Current dataset should be present")
 
         if data.reference_data is None:
-            analyzer_results = self.analyzer.calculate(
-                reference_data=data.current_data, current_data=None, column_mapping=data.column_mapping
-            )
+            with measure(CallKind.ANALYZER, type(self.analyzer).__name__):
+                analyzer_results = self.analyzer.calculate(
+                    reference_data=data.current_data, current_data=None, column_mapping=data.column_mapping
+                )
             features_stats = analyzer_results.reference_features_stats
             correlations = analyzer_results.reference_correlations
+            correlations_sample_sizes = analyzer_results.reference_correlations_sample_sizes
             reference_features_stats = None
 
         else:
-            analyzer_results = self.analyzer.calculate(
-                reference_data=data.reference_data, current_data=data.current_data, column_mapping=data.column_mapping
-            )
+            with measure(CallKind.ANALYZER, type(self.analyzer).__name__):
+                analyzer_results = self.analyzer.calculate(
+                    reference_data=data.reference_data,
+                    current_data=data.current_data,
+                    column_mapping=data.column_mapping,
+                )
             if analyzer_results.current_features_stats is None:
                 raise ValueError("No results from analyzer")
 
@@ -62,9 +80,22 @@ class DataQualityMetrics(Metric[DataQualityMetricsResults]):
                 raise ValueError("No results from analyzer")
 
             correlations = analyzer_results.current_correlations
+            correlations_sample_sizes = analyzer_results.current_correlations_sample_sizes
             reference_features_stats = analyzer_results.reference_features_stats
 
+        if not data.calculate_plot_data:
+            return DataQualityMetricsResults(
+                features_stats=features_stats,
+                distr_for_plots=None,
+                counts_of_values=None,
+                correlations=correlations,
+                correlations_sample_sizes=correlations_sample_sizes,
+                reference_features_stats=reference_features_stats,
+            )
+
         # data for visualisation
+        reference_view = data.reference_view
+
         if data.reference_data is not None:
             reference_data = data.reference_data
 
@@ -106,24 +137,26 @@ class DataQualityMetrics(Metric[DataQualityMetricsResults]):
         if task == TaskType.CLASSIFICATION_TASK:
             cat_columns.extend(target_prediction_columns)
 
+        reference_cache = resolve_reference_cache(self.analyzer.options_provider.get(ReferenceCacheOptions).cache)
+
         for feature in num_columns:
             counts_of_value_feature = {}
             curr_feature = data.current_data[feature]
-            current_counts = data.current_data[feature].value_counts(dropna=False).reset_index()
+            current_counts = data.current_view.column(feature).value_counts(dropna=False).reset_index()
             current_counts.columns = ["x", "count"]
             counts_of_value_feature["current"] = current_counts
 
             ref_feature = None
 
-            if reference_data is not None:
+            if reference_data is not None and reference_view is not None:
                 ref_feature = reference_data[feature]
 
-                reference_counts = ref_feature.value_counts(dropna=False).reset_index()
+                reference_counts = reference_view.column(feature).value_counts(dropna=False).reset_index()
                 reference_counts.columns = ["x", "count"]
                 counts_of_value_feature["reference"] = reference_counts
 
             counts_of_values[feature] = counts_of_value_feature
-            distr_for_plots[feature] = make_hist_for_num_plot(curr_feature, ref_feature)
+            distr_for_plots[feature] = make_hist_for_num_plot(curr_feature, ref_feature, reference_cache)
 
         for feature in cat_columns:
             curr_feature = data.current_data[feature]
@@ -138,6 +171,7 @@ class DataQualityMetrics(Metric[DataQualityMetricsResults]):
             distr_for_plots=distr_for_plots,
             counts_of_values=counts_of_values,
             correlations=correlations,
+            correlations_sample_sizes=correlations_sample_sizes,
             reference_features_stats=reference_features_stats,
         )
 
@@ -156,17 +190,19 @@ class DataQualityStabilityMetrics(Metric[DataQualityStabilityMetricsResults]):
         target_name = data.column_mapping.target
         prediction_name = data.column_mapping.prediction
         columns = [column for column in data.current_data.columns if column not in (target_name, prediction_name)]
-        duplicates = data.current_data[data.current_data.duplicated(subset=columns, keep=False)]
+        # hashes of the columns are calculated once and shared with other metrics by the dataset view
+        current_view = data.current_view
+        duplicates = current_view.duplicated(columns, keep=False)
 
         if target_name in data.current_data:
-            result.number_not_stable_target = duplicates.drop(
-                data.current_data[data.current_data.duplicated(subset=columns + [target_name], keep=False)].index
-            ).shape[0]
+            result.number_not_stable_target = int(
+                np.sum(duplicates & ~current_view.duplicated(columns + [target_name], keep=False))
+            )
 
         if prediction_name in data.current_data:
-            result.number_not_stable_prediction = duplicates.drop(
-                data.current_data[data.current_data.duplicated(subset=columns + [prediction_name], keep=False)].index
-            ).shape[0]
+            result.number_not_stable_prediction = int(
+                np.sum(duplicates & ~current_view.duplicated(columns + [prediction_name], keep=False))
+            )
 
         return result
 
@@ -192,21 +228,23 @@ class DataQualityValueListMetrics(Metric[DataQualityValueListMetricsResults]):
         self.column = column
 
     def calculate(self, data: InputData, metrics: dict) -> DataQualityValueListMetricsResults:
+        reference_view = data.reference_view
+
         if self.values is None:
-            if data.reference_data is None:
+            if reference_view is None:
                 raise ValueError("Reference or values list should be present")
-            self.values = data.reference_data[self.column].unique()
+            self.values = reference_view.column(self.column).unique()
 
         rows_count = data.current_data.shape[0]
         values_in_list = data.current_data[self.column].isin(self.values).sum()
         number_not_in_list = rows_count - values_in_list
         counts_of_value = {}
-        current_counts = data.current_data[self.column].value_counts(dropna=False).reset_index()
+        current_counts = data.current_view.column(self.column).value_counts(dropna=False).reset_index()
         current_counts.columns = ["x", "count"]
         counts_of_value["current"] = current_counts
 
-        if data.reference_data is not None and self.values is not None:
-            reference_counts = data.reference_data[self.column].value_counts(dropna=False).reset_index()
+        if reference_view is not None and self.values is not None:
+            reference_counts = reference_view.column(self.column).value_counts(dropna=False).reset_index()
             reference_counts.columns = ["x", "count"]
             counts_of_value["reference"] = reference_counts
 
@@ -0,0 +1,654 @@
+"""Mergeable partial states of feature and data integrity statistics.
+
+A state is calculated for a part of the data with `from_data`, states of consecutive parts are combined with `merge`
+and `finalize` returns the same result as for the whole data: `FeatureQualityStats` or `DataIntegrityMetricsValues`.
+It allows to calculate statistics of data that does not fit in memory chunk by chunk, or of parts of data
+in parallel workers.
+
+States of parts should be merged in the order of the parts: the most common values with the same counts
+are resolved by the first appearance, like in `Series.value_counts`.
+
+States keep exact counts of values by default, so their memory grows with the number of unique values
+and distinct rows. States calculated with `SketchOptions` keep sketches of a fixed size instead, fields estimated
+with the sketches are listed in `approximate_fields` of the results.
+"""
+from dataclasses import dataclass
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Tuple
+from typing import Union
+
+import numpy as np
+import pandas as pd
+
+from evidently.analyzers.data_quality_analyzer import APPROXIMATE_MOST_COMMON_FIELDS
+from evidently.analyzers.data_quality_analyzer import APPROXIMATE_UNIQUE_FIELDS
+from evidently.analyzers.data_quality_analyzer import FeatureQualityStats
+from evidently.analyzers.data_quality_analyzer import set_value_counts_stats
+from evidently.metrics.data_integrity_metrics import DataIntegrityMetricsValues
+from evidently.utils.dataset_view import DatasetView
+from evidently.utils.sketches import DEFAULT_HLL_PRECISION
+from evidently.utils.sketches import DEFAULT_KLL_K
+from evidently.utils.sketches import DEFAULT_SPACE_SAVING_CAPACITY
+from evidently.utils.sketches import HyperLogLogSketch
+from evidently.utils.sketches import KLLSketch
+from evidently.utils.sketches import SpaceSavingSketch
+from evidently.utils.sketches import merge_moments
+
+# fields of feature stats that are estimated with the quantile sketch, when it has compacted values
+APPROXIMATE_PERCENTILE_FIELDS = ["percentile_25", "percentile_50", "percentile_75"]
+# fields of data integrity metrics that are estimated with sketches
+APPROXIMATE_INTEGRITY_FIELDS = [
+    "number_of_constant_columns",
+    "number_of_duplicated_rows",
+    "number_uniques_by_columns",
+]
+
+
+@dataclass
+class SketchOptions:
+    """Sizes of sketches of states with memory that does not depend on the number of unique values.
+
+    Attributes:
+        hll_precision: precision of HyperLogLog sketches of unique values and distinct rows,
+            they keep 2 ** precision bytes.
+        heavy_hitters_capacity: number of the most common values of a column kept by Space-Saving sketches.
+        kll_k: accuracy parameter of KLL sketches of percentiles of numerical features.
+    """
+    hll_precision: int = DEFAULT_HLL_PRECISION
+    heavy_hitters_capacity: int = DEFAULT_SPACE_SAVING_CAPACITY
+    kll_k: int = DEFAULT_KLL_K
+
+
+class ValueCountsState:
+    """Exact counts of not missing values of a column in order of their first appearance.
+
+    Also keeps the number of missing values and the first of them, so counts are the same as
+    `Series.value_counts(dropna=False)`.
+    """
+
+    rows_count: int
+    values: pd.Index
+    counts: np.ndarray
+    # positions of the first appearance of the values in the column, increasing
+    first_positions: np.ndarray
+    missing_count: int
+    first_null_position: Optional[int]
+    null_value: Any
+
+    def __init__(self):
+        self.rows_count = 0
+        self.values = pd.Index([])
+        self.counts = np.empty(0, dtype=np.int64)
+        self.first_positions = np.empty(0, dtype=np.int64)
+        self.missing_count = 0
+        self.first_null_position = None
+        self.null_value = None
+
+    @classmethod
+    def from_data(cls, column: pd.Series) -> "ValueCountsState":
+        return cls.from_codes(column, *pd.factorize(column))
+
+    @classmethod
+    def from_codes(cls, column: pd.Series, codes: np.ndarray, uniques: Any) -> "ValueCountsState":
+        """The state of a column factorized with `pd.factorize`"""
+        state = cls()
+        null_mask = codes < 0
+        state.rows_count = column.shape[0]
+        state.values = pd.Index(uniques)
+        state.counts = np.bincount(codes[~null_mask], minlength=len(uniques)).astype(np.int64)
+        # codes are in order of appearance: a value appears first where the codes exceed all previous codes
+        previous_max_codes = np.concatenate([[-1], np.maximum.accumulate(codes)[:-1]])
+        state.first_positions = np.flatnonzero(codes > previous_max_codes).astype(np.int64)
+        state.missing_count = int(null_mask.sum())
+
+        if state.missing_count > 0:
+            state.first_null_position = int(np.argmax(null_mask))
+            state.null_value = column.iloc[state.first_null_position]
+
+        return state
+
+    def merge(self, other: "ValueCountsState") -> np.ndarray:
+        """Add counts of the next part of the column.
+
+        Returns:
+            positions of the values of `other` in the merged values.
+        """
+        offset = self.rows_count
+        codes, uniques = pd.factorize(self.values.append(other.values))
+        counts = np.zeros(len(uniques), dtype=np.int64)
+        np.add.at(counts, codes, np.concatenate([self.counts, other.counts]))
+        other_codes = codes[len(self.values):]
+        # values of the part go after the known values, in order of their appearance in the part
+        new_values = other_codes >= len(self.values)
+        self.first_positions = np.concatenate([self.first_positions, other.first_positions[new_values] + offset])
+        self.values = pd.Index(uniques)
+        self.counts = counts
+        self.rows_count += other.rows_count
+
+        if self.first_null_position is None and other.first_null_position is not None:
+            self.first_null_position = other.first_null_position + offset
+            self.null_value = other.null_value
+
+        self.missing_count += other.missing_count
+        return other_codes
+
+    @property
+    def unique_count(self) -> int:
+        """Number of unique not missing values"""
+        return len(self.values)
+
+    def get_most_common(self) -> Optional[Tuple[Any, int, int]]:
+        """The most common not missing value, its count and the position of its first appearance"""
+        if len(self.values) == 0:
+            return None
+
+        # the first found value goes first among values with the same count
+        code = int(np.argmax(self.counts))
+        return self.values[code], int(self.counts[code]), int(self.first_positions[code])
+
+    def get_value_counts(self) -> pd.DataFrame:
+        """Counts of values with missing values in columns "x" and "count", sorted by count in descending order"""
+        values = self.values
+        counts = self.counts
+        positions = self.first_positions
+
+        if self.missing_count > 0:
+            values = values.append(pd.Index([self.null_value]))
+            counts = np.append(counts, self.missing_count)
+            positions = np.append(positions, self.first_null_position)
+
+        order = np.lexsort((positions, -counts))
+        return pd.DataFrame({"x": values.take(order), "count": counts[order]})
+
+
+class ValueSketchesState:
+    """Sketches of not missing values of a column with exact numbers of rows and missing values.
+
+    Unique values are counted with `HyperLogLogSketch`, the most common values with `SpaceSavingSketch`,
+    so memory does not depend on the number of unique values. Positions of values are not kept:
+    a tie of counts of the most common value and missing values goes to the not missing value,
+    ties of not missing values can be resolved differently than in `Series.value_counts`.
+    """
+
+    rows_count: int
+    missing_count: int
+    # the first missing value of the column
+    null_value: Any
+    unique_values: HyperLogLogSketch
+    most_common_values: SpaceSavingSketch
+
+    def __init__(self, options: SketchOptions):
+        self.rows_count = 0
+        self.missing_count = 0
+        self.null_value = None
+        self.unique_values = HyperLogLogSketch(options.hll_precision)
+        self.most_common_values = SpaceSavingSketch(options.heavy_hitters_capacity)
+
+    @classmethod
+    def from_data(cls, column: pd.Series, options: SketchOptions) -> "ValueSketchesState":
+        state = cls(options)
+        # the column is factorized once: unique values are hashed and counted only
+        codes, uniques = pd.factorize(column)
+        null_mask = codes < 0
+        state.rows_count = column.shape[0]
+        state.missing_count = int(null_mask.sum())
+
+        if state.missing_count > 0:
+            state.null_value = column.iloc[int(np.argmax(null_mask))]
+
+        state.unique_values.update(uniques, categorize=False)
+        state.most_common_values.update_counts(uniques, np.bincount(codes[~null_mask], minlength=len(uniques)))
+        return state
+
+    def merge(self, other: "ValueSketchesState") -> None:
+        """Add sketches of the next part of the column"""
+        if self.missing_count == 0:
+            self.null_value = other.null_value
+
+        self.rows_count += other.rows_count
+        self.missing_count += other.missing_count
+        self.unique_values.merge(other.unique_values)
+        self.most_common_values.merge(other.most_common_values)
+
+    @property
+    def unique_count(self) -> int:
+        """Estimated number of unique not missing values"""
+        # the sketch keeps real values: there are at least as many unique values and not more than all values
+        return min(
+            max(self.unique_values.count(), self.most_common_values.values.shape[0]),
+            self.rows_count - self.missing_count,
+        )
+
+    def get_value_counts(self) -> pd.DataFrame:
+        """The most common values with upper bounds of their counts and missing values with their exact count,
+        in columns "x" and "count", sorted by count in descending order
+        """
+        values = self.most_common_values.values
+        counts = self.most_common_values.counts
+
+        if self.missing_count > 0:
+            values = values.append(pd.Index([self.null_value]))
+            counts = np.append(counts, self.missing_count)
+
+        order = np.argsort(-counts, kind="stable")
+        return pd.DataFrame({"x": values.take(order), "count": counts[order]})
+
+
+def _get_weighted_percentiles(values: np.ndarray, counts: np.ndarray, quantiles: Tuple[float, ...]) -> List[float]:
+    """Percentiles of values repeated by their counts with linear interpolation, the same as `np.percentile`"""
+    count = int(counts.sum())
+
+    if count == 0:
+        return [np.nan] * len(quantiles)
+
+    order = np.argsort(values, kind="stable")
+    sorted_values = values[order]
+    cumulative_counts = np.cumsum(counts[order])
+    result = []
+
+    for quantile in quantiles:
+        virtual_index = (count - 1) * quantile
+        previous_index = int(np.floor(virtual_index))
+        gamma = virtual_index - previous_index
+        previous_value, next_value = sorted_values[
+            np.searchsorted(cumulative_counts, [previous_index, min(previous_index + 1, count - 1)], side="right")
+        ]
+
+        with np.errstate(invalid="ignore"):
+            diff = next_value - previous_value
+            result.append(next_value - diff * (1 - gamma) if gamma >= 0.5 else previous_value + diff * gamma)
+
+    return result
+
+
+class FeatureStatsState:
+    """Mergeable partial state of `FeatureQualityStats` of a feature.
+
+    Numerical features also keep numbers of infinite values, minimum, maximum and moments of finite values.
+    Percentiles are calculated from the exact value counts, or from a KLL sketch of finite values
+    for states calculated with `SketchOptions`.
+    """
+
+    feature_type: str
+    # None for exact stats
+    sketches: Optional[SketchOptions]
+    value_counts: Union[ValueCountsState, ValueSketchesState]
+    # sketch of finite values of numerical features for stats calculated with sketches
+    quantiles: Optional[KLLSketch]
+    positive_infinite_count: int
+    negative_infinite_count: int
+    min: Any
+    max: Any
+    # number, mean and sum of squared differences from the mean of finite values
+    moments: Tuple[int, float, float]
+
+    def __init__(self, feature_type: str, sketches: Optional[SketchOptions] = None):
+        self.feature_type = feature_type
+        self.sketches = sketches
+        self.value_counts = ValueCountsState() if sketches is None else ValueSketchesState(sketches)
+        self.quantiles = KLLSketch(sketches.kll_k) if sketches is not None and feature_type == "num" else None
+        self.positive_infinite_count = 0
+        self.negative_infinite_count = 0
+        self.min = None
+        self.max = None
+        self.moments = (0, 0.0, 0.0)
+
+    @classmethod
+    def from_data(
+        cls, feature: pd.Series, feature_type: str, sketches: Optional[SketchOptions] = None
+    ) -> "FeatureStatsState":
+        """The state of a part of the feature, estimated with sketches of the given sizes if `sketches` is set"""
+        state = cls(feature_type, sketches)
+        if sketches is None:
+            state.value_counts = ValueCountsState.from_data(feature)
+
+        else:
+            state.value_counts = ValueSketchesState.from_data(feature, sketches)
+
+        if feature_type == "num" and not np.issubdtype(feature, np.number):
+            feature = feature.astype(float)
+
+        if state.value_counts.missing_count < feature.shape[0] and feature_type in ("num", "datetime"):
+            state.min = feature.min()
+            state.max = feature.max()
+
+        if feature_type == "num":
+            values = feature.to_numpy(dtype=np.float64)
+            state.positive_infinite_count = int(np.count_nonzero(values == np.inf))
+            state.negative_infinite_count = int(np.count_nonzero(values == -np.inf))
+            values = values[np.isfinite(values)]
+
+            if state.quantiles is not None:
+                state.quantiles.update(values)
+
+            if values.shape[0] > 0:
+                mean = values.mean()
+                state.moments = (values.shape[0], float(mean), float(np.sum((values - mean) ** 2)))
+
+        return state
+
+    def merge(self, other: "FeatureStatsState") -> None:
+        """Add the state of the next part of the feature"""
+        if other.feature_type != self.feature_type:
+            raise ValueError(f"Cannot merge stats of {self.feature_type} and {other.feature_type} features")
+
+        if (other.sketches is None) != (self.sketches is None):
+            raise ValueError("Cannot merge exact stats with stats estimated with sketches")
+
+        self.value_counts.merge(other.value_counts)  # type: ignore
+
+        if self.quantiles is not None and other.quantiles is not None:
+            self.quantiles.merge(other.quantiles)
+
+        self.positive_infinite_count += other.positive_infinite_count
+        self.negative_infinite_count += other.negative_infinite_count
+        self.moments = merge_moments(*self.moments, *other.moments)
+
+        if other.min is not None:
+            self.min = other.min if self.min is None else min(self.min, other.min)
+            self.max = other.max if self.max is None else max(self.max, other.max)
+
+    def finalize(self) -> FeatureQualityStats:
+        """Stats of the feature, the same as `DataQualityAnalyzer._get_features_stats` for the whole feature"""
+        result = FeatureQualityStats(feature_type=self.feature_type)
+        value_counts = self.value_counts
+        all_values_count = value_counts.rows_count
+
+        if not all_values_count > 0:
+            # we have no data, return default stats for en empty dataset
+            return result
+
+        if isinstance(value_counts, ValueSketchesState):
+            most_common_values = value_counts.most_common_values
+            most_common_not_null = most_common_values.get_most_common()
+            # positions of values are not kept, a tie goes to the not missing value
+            is_null_first = False
+            result.approximate_fields = list(APPROXIMATE_UNIQUE_FIELDS)
+
+            if not most_common_values.is_exact:
+                result.approximate_fields += APPROXIMATE_MOST_COMMON_FIELDS
+
+        else:
+            most_common = value_counts.get_most_common()
+            most_common_not_null = None if most_common is None else most_common[:2]
+            is_null_first = (
+                most_common is not None
+                and value_counts.first_null_position is not None
+                and value_counts.first_null_position < most_common[2]
+            )
+
+        set_value_counts_stats(
+            result,
+            all_values_count,
+            value_counts.missing_count,
+            value_counts.unique_count,
+            most_common_not_null,
+            value_counts.null_value,
+            lambda: is_null_first,
+        )
+
+        if self.feature_type == "num":
+            count, mean, m2 = self.moments
+            infinite_count = self.positive_infinite_count + self.negative_infinite_count
+            # round most common feature value for numeric features to 1e-5
+            result.most_common_value = np.round(result.most_common_value, 5)
+            result.infinite_count = infinite_count
+            result.infinite_percentage = np.round(100 * infinite_count / all_values_count, 2)
+            result.max = np.nan if self.max is None else np.round(self.max, 2)
+            result.min = np.nan if self.min is None else np.round(self.min, 2)
+
+            if infinite_count > 0:
+                # infinite values make the mean infinite or undefined and the std undefined, like in pandas
+                if self.positive_infinite_count > 0 and self.negative_infinite_count > 0:
+                    result.mean = np.nan
+
+                else:
+                    result.mean = np.inf if self.positive_infinite_count > 0 else -np.inf
+
+                result.std = np.nan
+
+            else:
+                result.mean = np.round(mean, 2) if count > 0 else np.nan
+                result.std = np.round(np.sqrt(m2 / (count - 1)), 2) if count > 1 else np.nan
+
+            percentiles = self._get_percentiles((0.25, 0.5, 0.75))
+
+            if self.quantiles is not None and self.quantiles.cdf_error > 0:
+                result.approximate_fields = (result.approximate_fields or []) + APPROXIMATE_PERCENTILE_FIELDS
+
+            result.percentile_25 = np.round(percentiles[0], 2)
+            result.percentile_50 = np.round(percentiles[1], 2)
+            result.percentile_75 = np.round(percentiles[2], 2)
+
+        if self.feature_type == "datetime":
+            # cast datetime value to str for datetime features
+            result.most_common_value = str(result.most_common_value)
+            result.max = str(pd.NaT if self.max is None else self.max)
+            result.min = str(pd.NaT if self.min is None else self.min)
+
+        return result
+
+    def _get_percentiles(self, quantiles: Tuple[float, ...]) -> List[float]:
+        """Percentiles of not missing values with linear interpolation, the same as `np.percentile`.
+
+        Percentiles estimated with the quantile sketch are exact while it has no compacted values.
+        """
+        if self.quantiles is None:
+            value_counts = self.value_counts
+            return _get_weighted_percentiles(
+                value_counts.values.to_numpy(dtype=np.float64), value_counts.counts, quantiles  # type: ignore
+            )
+
+        values, weights = self.quantiles.get_weighted_values()
+        # infinite values are not kept by the sketch, they are the smallest and the largest values
+        return _get_weighted_percentiles(
+            np.concatenate([[-np.inf], values, [np.inf]]),
+            np.concatenate([[self.negative_infinite_count], weights, [self.positive_infinite_count]]),
+            quantiles,
+        )
+
+
+def _count_rows(rows: np.ndarray, counts: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Distinct rows of a matrix of value codes with sums of their counts"""
+    row_codes = np.zeros(rows.shape[0], dtype=np.int64)
+
+    # codes of rows are combined with codes of columns one by one, they are less than the number of rows
+    for column_codes in rows.T:
+        row_codes, _ = pd.factorize(row_codes * (int(column_codes.max(initial=-1)) + 2) + column_codes + 1)
+
+    _, first_positions = np.unique(row_codes, return_index=True)
+    row_counts = np.zeros(first_positions.shape[0], dtype=np.int64)
+    np.add.at(row_counts, row_codes, counts)
+    return rows[first_positions], row_counts
+
+
+def _get_row_hashes(dataset_view: DatasetView) -> np.ndarray:
+    """64-bit hashes of rows of all columns"""
+    try:
+        return dataset_view.row_hashes(list(dataset_view.data.columns))
+
+    except TypeError:
+        # values that pandas cannot hash are hashed as strings
+        return pd.util.hash_pandas_object(dataset_view.data.astype(str), index=False).to_numpy()
+
+
+def _get_column_classes(dataset_view: DatasetView) -> List[int]:
+    """Position of the first equal column for every column, like `Series.equals`.
+
+    Only columns with equal hashes are compared.
+    """
+    dataset = dataset_view.data
+    groups: Dict[Optional[bytes], List[int]] = {}
+    classes: List[int] = []
+
+    for position, column in enumerate(dataset.columns):
+        try:
+            key: Optional[bytes] = dataset_view.column(column).content_hash()
+
+        except TypeError:
+            # columns that pandas cannot hash are compared with each other
+            key = None
+
+        group = groups.setdefault(key, [])
+        equal_position = next(
+            (other for other in group if dataset.iloc[:, other].equals(dataset.iloc[:, position])), None
+        )
+
+        if equal_position is None:
+            group.append(position)
+            equal_position = position
+
+        classes.append(equal_position)
+
+    return classes
+
+
+class DataIntegrityState:
+    """Mergeable partial state of `DataIntegrityMetricsValues` of a dataset.
+
+    Rows are kept as codes of their values in the value counts of columns, so duplicated rows are counted
+    exactly, like in `DataFrame.duplicated`. Columns are equal if they are equal in every part.
+
+    States calculated with `SketchOptions` keep sketches of values of columns and a HyperLogLog sketch
+    of hashes of rows instead: unique values, the most common values and distinct rows are estimated.
+    """
+
+    columns_type: Dict[str, Any]
+    number_of_rows: int
+    number_of_rows_with_nans: int
+    number_of_empty_rows: int
+    value_counts: Dict[str, Union[ValueCountsState, ValueSketchesState]]
+    # distinct rows of codes of values in `value_counts`, -1 for missing values, and numbers of these rows,
+    # None for states calculated with sketches
+    distinct_rows: Optional[np.ndarray]
+    distinct_row_counts: Optional[np.ndarray]
+    # sketch of distinct rows for states calculated with sketches
+    row_hashes: Optional[HyperLogLogSketch]
+    # position of the first equal column for every column
+    column_classes: List[int]
+
+    @classmethod
+    def from_data(cls, dataset: pd.DataFrame, sketches: Optional[SketchOptions] = None) -> "DataIntegrityState":
+        """The state of a part of the dataset, estimated with sketches of the given sizes if `sketches` is set"""
+        state = cls()
+        dataset_view = DatasetView(dataset)
+        null_mask = dataset.isnull().to_numpy()
+        state.columns_type = dict(dataset.dtypes.to_dict())
+        state.number_of_rows = dataset.shape[0]
+        state.number_of_rows_with_nans = int(null_mask.any(axis=1).sum())
+        state.number_of_empty_rows = int(null_mask.all(axis=1).sum())
+        state.value_counts = {}
+        state.distinct_rows = None
+        state.distinct_row_counts = None
+        state.row_hashes = None
+
+        if sketches is not None:
+            for column in dataset.columns:
+                state.value_counts[column] = ValueSketchesState.from_data(dataset[column], sketches)
+
+            state.row_hashes = HyperLogLogSketch(sketches.hll_precision)
+            state.row_hashes.update_hashes(_get_row_hashes(dataset_view))
+
+        else:
+            rows = np.empty((dataset.shape[0], dataset.shape[1]), dtype=np.int64)
+
+            for position, column in enumerate(dataset.columns):
+                codes, uniques = pd.factorize(dataset[column])
+                state.value_counts[column] = ValueCountsState.from_codes(dataset[column], codes, uniques)
+                rows[:, position] = codes
+
+            state.distinct_rows, state.distinct_row_counts = _count_rows(
+                rows, np.ones(dataset.shape[0], dtype=np.int64)
+            )
+
+        state.column_classes = _get_column_classes(dataset_view)
+        return state
+
+    def merge(self, other: "DataIntegrityState") -> None:
+        """Add the state of the next part of the dataset with the same columns"""
+        if list(other.value_counts) != list(self.value_counts):
+            raise ValueError("Cannot merge data integrity states of datasets with different columns")
+
+        if (other.row_hashes is None) != (self.row_hashes is None):
+            raise ValueError("Cannot merge exact data integrity states with states estimated with sketches")
+
+        self.number_of_rows += other.number_of_rows
+        self.number_of_rows_with_nans += other.number_of_rows_with_nans
+        self.number_of_empty_rows += other.number_of_empty_rows
+
+        if self.row_hashes is not None and other.row_hashes is not None:
+            for column, value_counts in self.value_counts.items():
+                value_counts.merge(other.value_counts[column])  # type: ignore
+
+            self.row_hashes.merge(other.row_hashes)
+
+        else:
+            self._merge_distinct_rows(other)
+
+        # columns stay equal if they are equal in the part too
+        first_positions: Dict[Tuple[int, int], int] = {}
+        self.column_classes = [
+            first_positions.setdefault(classes, position)
+            for position, classes in enumerate(zip(self.column_classes, other.column_classes))
+        ]
+
+    def _merge_distinct_rows(self, other: "DataIntegrityState") -> None:
+        """Add value counts and distinct rows of exact states"""
+        other_rows = other.distinct_rows.copy()
+
+        for position, (column, value_counts) in enumerate(self.value_counts.items()):
+            # codes of the part are replaced with codes of the merged values, -1 stays for missing values
+            codes = np.append(value_counts.merge(other.value_counts[column]), -1)
+            other_rows[:, position] = codes[other.distinct_rows[:, position]]
+
+        self.distinct_rows, self.distinct_row_counts = _count_rows(
+            np.concatenate([self.distinct_rows, other_rows]),
+            np.concatenate([self.distinct_row_counts, other.distinct_row_counts]),
+        )
+
+    def finalize(self) -> DataIntegrityMetricsValues:
+        """Values of data integrity metrics, the same as for the whole dataset.
+
+        Values estimated with sketches are listed in `approximate_fields` of the result.
+        """
+        nans_by_columns = {column: state.missing_count for column, state in self.value_counts.items()}
+        number_uniques_by_columns = {column: state.unique_count for column, state in self.value_counts.items()}
+        columns_counts = np.bincount(self.column_classes, minlength=len(self.column_classes))
+        approximate_fields = None
+
+        if self.row_hashes is not None:
+            # the sketch cannot find more distinct rows than rows
+            distinct_rows_count = min(self.row_hashes.count(), self.number_of_rows)
+            approximate_fields = list(APPROXIMATE_INTEGRITY_FIELDS)
+
+            if any(
+                isinstance(state, ValueSketchesState) and not state.most_common_values.is_exact
+                for state in self.value_counts.values()
+            ):
+                approximate_fields.append("counts_of_values")
+
+        else:
+            distinct_rows_count = self.distinct_rows.shape[0]
+
+        return DataIntegrityMetricsValues(
+            number_of_columns=len(self.value_counts),
+            number_of_rows=self.number_of_rows,
+            number_of_nans=sum(nans_by_columns.values()),
+            number_of_columns_with_nans=sum(1 for count in nans_by_columns.values() if count > 0),
+            number_of_rows_with_nans=self.number_of_rows_with_nans,
+            number_of_constant_columns=sum(1 for count in number_uniques_by_columns.values() if count <= 1),
+            number_of_empty_rows=self.number_of_empty_rows,
+            number_of_empty_columns=sum(1 for count in nans_by_columns.values() if count == self.number_of_rows),
+            # pandas does not find duplicated rows without columns
+            number_of_duplicated_rows=self.number_of_rows - distinct_rows_count if self.value_counts else 0,
+            # every pair of equal columns is a duplicate
+            number_of_duplicated_columns=int(sum(count * (count - 1) // 2 for count in columns_counts.tolist())),
+            columns_type=self.columns_type,
+            nans_by_columns=nans_by_columns,
+            number_uniques_by_columns=number_uniques_by_columns,
+            counts_of_values={column: state.get_value_counts() for column, state in self.value_counts.items()},
+            approximate_fields=approximate_fields,
+        )
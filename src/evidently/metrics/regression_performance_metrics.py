@@ -14,12 +14,21 @@ from evidently.analyzers.regression_performance_analyzer import RegressionPerfor
 
 from evidently.metrics.base_metric import InputData
 from evidently.metrics.base_metric import Metric
+from evidently.utils.run_stats import CallKind
+from evidently.utils.run_stats import measure
 from evidently.metrics.utils import make_target_bins_for_reg_plots
 from evidently.metrics.utils import make_hist_for_cat_plot
 from evidently.metrics.utils import apply_func_to_binned_data
 from evidently.metrics.utils import make_hist_for_num_plot
 
 
+def _remove_nans_and_infinities(dataset: Optional[pd.DataFrame]) -> Optional[pd.DataFrame]:
+    if dataset is None:
+        return None
+
+    return dataset.replace([np.inf, -np.inf], np.nan).dropna(axis=0, how="any")
+
+
 @dataclass
 class RegressionPerformanceMetricsResults:
     r2_score: float
@@ -27,7 +36,8 @@ class RegressionPerformanceMetricsResults:
     rmse_default: float
     mean_error: float
     me_default_sigma: float
-    me_hist_for_plot: Dict[str, pd.Series]
+    # data for plots, None if plot data is not calculated
+    me_hist_for_plot: Optional[Dict[str, pd.Series]]
     mean_abs_error: float
     mean_abs_error_default: float
     mean_abs_perc_error: float
@@ -39,8 +49,9 @@ class RegressionPerformanceMetricsResults:
     abs_perc_error_std: float
     error_normality: dict
     underperformance: dict
-    hist_for_plot: Dict[str, pd.Series]
-    vals_for_plots: Dict[str, Dict[str, pd.Series]]
+    # data for plots, None if plot data is not calculated
+    hist_for_plot: Optional[Dict[str, pd.Series]]
+    vals_for_plots: Optional[Dict[str, Dict[str, pd.Series]]]
     error_bias: Optional[dict] = None
     mean_abs_error_ref: Optional[float] = None
     mean_abs_perc_error_ref: Optional[float] = None
@@ -57,16 +68,28 @@ class RegressionPerformanceMetrics(Metric[RegressionPerformanceMetricsResults]):
         if data.current_data is None:
             raise ValueError("current dataset should be present")
 
+        # the analyzer and the metrics below use only rows without infinite and NaN values
+        data = InputData(
+            reference_data=_remove_nans_and_infinities(data.reference_data),
+            current_data=_remove_nans_and_infinities(data.current_data),
+            column_mapping=data.column_mapping,
+            calculate_plot_data=data.calculate_plot_data,
+        )
+
         if data.reference_data is None:
-            analyzer_results = self.analyzer.calculate(
-                reference_data=data.current_data, current_data=None, column_mapping=data.column_mapping
-            )
+            with measure(CallKind.ANALYZER, type(self.analyzer).__name__):
+                analyzer_results = self.analyzer.calculate(
+                    reference_data=data.current_data, current_data=None, column_mapping=data.column_mapping
+                )
             current_metrics = analyzer_results.reference_metrics
             reference_metrics = None
         else:
-            analyzer_results = self.analyzer.calculate(
-                reference_data=data.reference_data, current_data=data.current_data, column_mapping=data.column_mapping
-            )
+            with measure(CallKind.ANALYZER, type(self.analyzer).__name__):
+                analyzer_results = self.analyzer.calculate(
+                    reference_data=data.reference_data,
+                    current_data=data.current_data,
+                    column_mapping=data.column_mapping,
+                )
             current_metrics = analyzer_results.current_metrics
             reference_metrics = analyzer_results.reference_metrics
 
@@ -129,41 +152,45 @@ class RegressionPerformanceMetrics(Metric[RegressionPerformanceMetricsResults]):
         me_default_sigma = (y_pred - y_true).std()
 
         # visualisation
+        hist_for_plot = None
+        vals_for_plots = None
+        me_hist_for_plot = None
 
-        df_target_binned = make_target_bins_for_reg_plots(
-            data.current_data, data.column_mapping.target, data.column_mapping.prediction, data.reference_data
-        )
-        curr_target_bins = df_target_binned.loc[df_target_binned.data == "curr", "target_binned"]
-        ref_target_bins = None
-        if data.reference_data is not None:
-            ref_target_bins = df_target_binned.loc[df_target_binned.data == "ref", "target_binned"]
-        hist_for_plot = make_hist_for_cat_plot(curr_target_bins, ref_target_bins)
-
-        vals_for_plots = {}
-
-        if data.reference_data is not None:
-            is_ref_data = True
-
-        else:
-            is_ref_data = False
-
-        for name, func in zip(
-            ["r2_score", "rmse", "mean_abs_error", "mean_abs_perc_error"],
-            [r2_score, mean_squared_error, mean_absolute_error, mean_absolute_percentage_error],
-        ):
-            vals_for_plots[name] = apply_func_to_binned_data(
-                df_target_binned, func, data.column_mapping.target, data.column_mapping.prediction, is_ref_data
-            )
-
-        # me plot
-        err_curr = data.current_data[data.column_mapping.prediction] - data.current_data[data.column_mapping.target]
-        err_ref = None
-
-        if is_ref_data:
-            err_ref = (
-                data.reference_data[data.column_mapping.prediction] - data.reference_data[data.column_mapping.target]
+        if data.calculate_plot_data:
+            df_target_binned = make_target_bins_for_reg_plots(
+                data.current_data, data.column_mapping.target, data.column_mapping.prediction, data.reference_data
             )
-        me_hist_for_plot = make_hist_for_num_plot(err_curr, err_ref)
+            curr_target_bins = df_target_binned.loc[df_target_binned.data == "curr", "target_binned"]
+            ref_target_bins = None
+            if data.reference_data is not None:
+                ref_target_bins = df_target_binned.loc[df_target_binned.data == "ref", "target_binned"]
+            hist_for_plot = make_hist_for_cat_plot(curr_target_bins, ref_target_bins)
+
+            vals_for_plots = {}
+
+            if data.reference_data is not None:
+                is_ref_data = True
+
+            else:
+                is_ref_data = False
+
+            for name, func in zip(
+                ["r2_score", "rmse", "mean_abs_error", "mean_abs_perc_error"],
+                [r2_score, mean_squared_error, mean_absolute_error, mean_absolute_percentage_error],
+            ):
+                vals_for_plots[name] = apply_func_to_binned_data(
+                    df_target_binned, func, data.column_mapping.target, data.column_mapping.prediction, is_ref_data
+                )
+
+            # me plot
+            err_curr = data.current_data[data.column_mapping.prediction] - data.current_data[data.column_mapping.target]
+            err_ref = None
+
+            if is_ref_data:
+                err_ref = (
+                    data.reference_data[data.column_mapping.prediction] - data.reference_data[data.column_mapping.target]
+                )
+            me_hist_for_plot = make_hist_for_num_plot(err_curr, err_ref)
 
         if r2_score_ref is not None:
             r2_score_ref = float(r2_score_ref)
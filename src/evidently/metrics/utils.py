@@ -1,7 +1,14 @@
+from typing import Optional
 from typing import Tuple
 import numpy as np
 import pandas as pd
 
+from evidently.utils.dataset_view import get_column_view
+from evidently.utils.histograms import get_bin_edges
+from evidently.utils.histograms import get_histogram
+from evidently.utils.histograms import get_sorted_values
+from evidently.utils.reference_cache import ReferenceCache
+
 
 def make_hist_df(hist: Tuple[np.array, np.array]) -> pd.DataFrame:
     hist_df = pd.DataFrame(
@@ -14,7 +21,28 @@ def make_hist_df(hist: Tuple[np.array, np.array]) -> pd.DataFrame:
     return hist_df
 
 
-def make_hist_for_num_plot(curr: pd.Series, ref: pd.Series = None):
+def _is_numeric(feature: pd.Series) -> bool:
+    return pd.api.types.is_numeric_dtype(feature.dtype) and not pd.api.types.is_complex_dtype(feature.dtype)
+
+
+def make_hist_for_num_plot(curr: pd.Series, ref: pd.Series = None, reference_cache: Optional[ReferenceCache] = None):
+    if _is_numeric(curr) and (ref is None or _is_numeric(ref)):
+        # bins and counts are calculated from sorted finite values shared with other histograms of the columns
+        views = [get_column_view(curr)]
+
+        if ref is not None:
+            ref_view = get_column_view(ref)
+            get_sorted_values(ref_view, reference_cache)
+            views.append(ref_view)
+
+        bins = get_bin_edges(views, "doane")
+        result = {"current": make_hist_df(get_histogram(views[0], bins))}
+
+        if ref is not None:
+            result["reference"] = make_hist_df(get_histogram(views[1], bins))
+
+        return result
+
     result = {}
     if ref is not None:
         ref = ref.dropna()
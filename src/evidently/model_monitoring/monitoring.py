@@ -53,11 +53,17 @@ class ModelMonitor(PipelineStage):
 
 
 class ModelMonitoring(Pipeline):
-    def __init__(self, monitors: Sequence[ModelMonitor], options: Optional[list] = None):
+    def __init__(
+        self,
+        monitors: Sequence[ModelMonitor],
+        options: Optional[list] = None,
+        n_jobs: int = 1,
+        backend: str = "thread",
+    ):
         if options is None:
             options = []
 
-        super().__init__(monitors, options)
+        super().__init__(monitors, options, n_jobs=n_jobs, backend=backend)
         self.monitors = list(monitors)
 
     def get_analyzers(self):
@@ -29,6 +29,8 @@ class DataQualityMonitor(ModelMonitor):
         for feature_name, feature_stats in data_stats.get_all_features().items():
             feature_stats_dict = feature_stats.as_dict()
             feature_type = feature_stats_dict.pop("feature_type")
+            # names of approximate stats are not a metric
+            feature_stats_dict.pop("approximate_fields")
             for stat_name, stat_value in feature_stats_dict.items():
                 if stat_value is not None:
                     if pd.isnull(stat_value):
@@ -90,19 +90,20 @@ class ProbClassificationPerformanceMonitor(ModelMonitor):
         # process confusion metrics
         for idx, class_x_name in enumerate(metrics.confusion_matrix.labels):
             class_x_name = str(class_x_name)
+            tp_value = metrics.confusion_by_classes[class_x_name]["tp"]
+            fp_value = metrics.confusion_by_classes[class_x_name]["fp"]
+            tn_value = metrics.confusion_by_classes[class_x_name]["tn"]
+            fn_value = metrics.confusion_by_classes[class_x_name]["fn"]
+            # the confusion matrix may have cells of the top classes only, the representation is of all rows
             yield ProbClassificationPerformanceMonitorMetricsMonitor.class_representation.create(
-                sum(metrics.confusion_matrix.values[idx]),
+                tp_value + fn_value,
                 dict(dataset=dataset, class_name=class_x_name, type="target"),
             )
             yield ProbClassificationPerformanceMonitorMetricsMonitor.class_representation.create(
-                sum([i[idx] for i in metrics.confusion_matrix.values]),
+                tp_value + fp_value,
                 dict(dataset=dataset, class_name=class_x_name, type="prediction"),
             )
 
-            tp_value = metrics.confusion_by_classes[class_x_name]["tp"]
-            fp_value = metrics.confusion_by_classes[class_x_name]["fp"]
-            tn_value = metrics.confusion_by_classes[class_x_name]["tn"]
-            fn_value = metrics.confusion_by_classes[class_x_name]["fn"]
             yield ProbClassificationPerformanceMonitorMetricsMonitor.class_confusion.create(
                 tp_value, dict(dataset=dataset, class_name=class_x_name, metric="TP")
             )
@@ -1,12 +1,17 @@
+import copy
+import dataclasses
 import json
 from datetime import datetime
 from typing import Any
 from typing import Dict
+from typing import Hashable
 from typing import List
 from typing import Optional
 from typing import Type
 from typing import Sequence
+from typing import Union
 
+import numpy as np
 import pandas
 
 from evidently.analyzers.base_analyzer import Analyzer
@@ -14,16 +19,73 @@ from evidently.pipeline.pipeline import Pipeline
 from evidently.pipeline.column_mapping import ColumnMapping
 from evidently.model_profile.sections.base_profile_section import ProfileSection
 from evidently.utils import NumpyEncoder
+from evidently.utils.reference_cache import ReferenceCache
+from evidently.utils.run_stats import RunStats
+from evidently.utils.segments import calculate_segments
+from evidently.utils.segments import get_segment_column_mapping
+from evidently.utils.segments import get_segment_columns
+from evidently.utils.segments import make_segments_summary
+from evidently.utils.segments import split_segments
+
+
+def _calculate_segment(
+    template: "Profile",
+    reference_data: pandas.DataFrame,
+    current_data: pandas.DataFrame,
+    column_mapping: ColumnMapping,
+) -> "Profile":
+    profile = copy.deepcopy(template)
+    profile._execute(reference_data, current_data.copy(), column_mapping)
+    return profile
+
+
+def _get_summary_metrics(profile_object: Dict[str, Any]) -> Dict[str, Any]:
+    """Scalar metrics of all sections as `<section id>.<metric name>`"""
+    summary_metrics = {}
+
+    for part_id, part_result in profile_object.items():
+        data = part_result.get("data") if isinstance(part_result, dict) else None
+        metrics = data.get("metrics") if isinstance(data, dict) else None
+
+        if not isinstance(metrics, dict):
+            continue
+
+        for metric_name, value in metrics.items():
+            if isinstance(value, (str, bool, int, float, np.generic)):
+                summary_metrics[f"{part_id}.{metric_name}"] = value
+
+    return summary_metrics
+
+
+@dataclasses.dataclass
+class SegmentedProfile:
+    """Results of `Profile.calculate_segmented`.
+
+    Attributes:
+        segment_by: columns that the current data was grouped by.
+        segments: a profile with results for every segment by the segment key.
+        summary: number of rows and scalar metrics of sections for every segment, indexed by the segment keys.
+    """
+
+    segment_by: List[str]
+    segments: Dict[Hashable, "Profile"]
+    summary: pandas.DataFrame
 
 
 class Profile(Pipeline):
     result: Dict[str, Any]
     stages: Sequence[ProfileSection]
 
-    def __init__(self, sections: Sequence[ProfileSection], options: Optional[list] = None) -> None:
+    def __init__(
+        self,
+        sections: Sequence[ProfileSection],
+        options: Optional[list] = None,
+        n_jobs: int = 1,
+        backend: str = "thread",
+    ) -> None:
         if options is None:
             options = []
-        super().__init__(sections, options if options is not None else [])
+        super().__init__(sections, options if options is not None else [], n_jobs=n_jobs, backend=backend)
 
     def calculate(
         self,
@@ -33,13 +95,69 @@ class Profile(Pipeline):
     ) -> None:
         self.execute(reference_data, current_data, column_mapping)
 
+    def calculate_segmented(
+        self,
+        reference_data: pandas.DataFrame,
+        current_data: pandas.DataFrame,
+        segment_by: Union[str, Sequence[str]],
+        column_mapping: Optional[ColumnMapping] = None,
+        reference_cache: Optional[ReferenceCache] = None,
+    ) -> SegmentedProfile:
+        """Calculate the profile for every segment of the current data against the same reference data.
+
+        The current data is grouped by `segment_by` columns once. Segments are calculated concurrently
+        with `n_jobs` and `backend` of the profile, analyzers of one segment are calculated sequentially.
+        Reference-side work is shared by the segments, see `evidently.utils.segments`.
+        Results of the profile itself are not changed.
+
+        Args:
+            reference_data: reference data for all segments.
+            current_data: current data with the segment columns.
+            segment_by: a column or a list of columns to group the current data by.
+            column_mapping: column mapping for all segments, segment columns are not used as features.
+            reference_cache: a cache for reference-only intermediates, a new in-memory cache is used by default.
+        """
+        if column_mapping is None:
+            column_mapping = ColumnMapping()
+
+        segment_columns = get_segment_columns(segment_by, current_data)
+        template = copy.deepcopy(self)
+        template.n_jobs = 1
+        template.analyzers_results = {}
+        template.run_stats = RunStats(trace_memory=self.run_stats.trace_memory)
+        segment_frames = split_segments(current_data, segment_columns)
+        # the reference data is copied once for all segments, like in `execute`
+        segments = calculate_segments(
+            _calculate_segment,
+            template,
+            reference_data.copy(),
+            segment_frames,
+            get_segment_column_mapping(current_data, column_mapping, segment_columns),
+            self.n_jobs,
+            self.backend,
+            reference_cache,
+        )
+        summary_rows = [
+            (key, {"rows": segment.shape[0], **_get_summary_metrics(profile.object())})
+            for (key, profile), (_, segment) in zip(segments, segment_frames)
+        ]
+        return SegmentedProfile(
+            segment_by=segment_columns,
+            segments=dict(segments),
+            summary=make_segments_summary(segment_columns, summary_rows),
+        )
+
     def get_analyzers(self) -> List[Type[Analyzer]]:
         return list({analyzer for tab in self.stages for analyzer in tab.analyzers()})
 
-    def json(self) -> str:
-        return json.dumps(self.object(), cls=NumpyEncoder)
+    def json(self, include_run_stats: bool = False) -> str:
+        return json.dumps(self.object(include_run_stats=include_run_stats), cls=NumpyEncoder)
 
-    def object(self) -> Dict[str, Any]:
+    def object(self, include_run_stats: bool = False) -> Dict[str, Any]:
         result: Dict[str, Any] = {part.part_id(): part.get_results() for part in self.stages}
         result["timestamp"] = str(datetime.now())
+
+        if include_run_stats:
+            result["run_stats"] = self.run_stats.as_dict()
+
         return result
@@ -65,6 +65,16 @@ class DataQualityProfileSection(ProfileSection):
         if result.current_correlations:
             result_json["correlations"]["current"] = self._get_corr_matrices_as_dict(result.current_correlations)
 
+        sample_sizes = {
+            "reference": (result.reference_correlations_sample_sizes, reference_data),
+            "current": (result.current_correlations_sample_sizes, current_data),
+        }
+
+        for dataset_name, (dataset_sample_sizes, dataset) in sample_sizes.items():
+            # sizes are reported only for correlations calculated with a sample of rows
+            if dataset_sample_sizes and any(size < dataset.shape[0] for size in dataset_sample_sizes.values()):
+                result_json.setdefault("correlations_sample_sizes", {})[dataset_name] = dataset_sample_sizes
+
         self._result = {"name": self.part_id(), "datetime": str(datetime.now()), "data": result_json}
 
     def get_results(self):
@@ -39,6 +39,14 @@ class ProbClassificationPerformanceProfileSection(ProfileSection):
         if metrics.roc_aucs is not None:
             result['roc_aucs'] = metrics.roc_aucs
 
+        if metrics.sparse_confusion_matrix is not None:
+            result['sparse_confusion_matrix'] = {
+                'labels': metrics.sparse_confusion_matrix.labels,
+                'true_positions': metrics.sparse_confusion_matrix.true_positions,
+                'predicted_positions': metrics.sparse_confusion_matrix.predicted_positions,
+                'counts': metrics.sparse_confusion_matrix.counts,
+            }
+
         return result
 
     def calculate(self, reference_data, current_data, column_mapping, analyzers_results):
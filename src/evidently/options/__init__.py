@@ -9,6 +9,7 @@ from .color_scheme import (
 )
 from .data_drift import DataDriftOptions
 from .quality_metrics import QualityMetricsOptions
+from .reference_cache import ReferenceCacheOptions
 
 TypeParam = TypeVar("TypeParam")
 
@@ -3,6 +3,8 @@ from typing import Optional, Dict, Union
 import warnings
 
 from evidently.analyzers.stattests import StatTest, PossibleStatTestType
+from evidently.utils.parallel import THREAD_BACKEND
+from evidently.utils.parallel import check_execution_parameters
 
 DEFAULT_NBINSX = 10
 
@@ -35,6 +37,11 @@ class DataDriftOptions:
                               per feature.
         cat_target_stattest_func: Defines a custom statistical test to detect target drift in CatTargetDrift.
         num_target_stattest_func: Defines a custom statistical test to detect target drift in NumTargetDrift.
+        n_jobs: Number of workers to calculate drift of features concurrently, 1 (default) means sequential calculation.
+        backend: Pool type for concurrent calculation, "thread" or "process".
+                 With "process" custom statistical tests should be picklable (defined on a module level).
+        chunk_size: Number of features a worker calculates at once.
+                    By default features are split evenly between workers.
     """
     confidence: Optional[Union[float, Dict[str, float]]] = None
     threshold: Optional[Union[float, Dict[str, float]]] = None
@@ -55,6 +62,16 @@ class DataDriftOptions:
     cat_target_stattest_func: Optional[PossibleStatTestType] = None
     num_target_stattest_func: Optional[PossibleStatTestType] = None
 
+    n_jobs: int = 1
+    backend: str = THREAD_BACKEND
+    chunk_size: Optional[int] = None
+
+    def __post_init__(self):
+        check_execution_parameters(self.n_jobs, self.backend)
+
+        if self.chunk_size is not None and self.chunk_size < 1:
+            raise ValueError(f"chunk_size should be a positive number, got {self.chunk_size}")
+
     def as_dict(self):
         return {
             "confidence": self.confidence,
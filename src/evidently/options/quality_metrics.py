@@ -1,15 +1,90 @@
 from dataclasses import dataclass
-from typing import Optional, Dict, Tuple, Union
+from typing import Optional, Dict, Sequence, Tuple, Union
+
+from evidently.utils.parallel import THREAD_BACKEND
+from evidently.utils.parallel import check_execution_parameters
+from evidently.utils.sketches import DEFAULT_HLL_PRECISION
+from evidently.utils.sketches import DEFAULT_SPACE_SAVING_CAPACITY
+from evidently.utils.sketches import HLL_MAX_PRECISION
+from evidently.utils.sketches import HLL_MIN_PRECISION
+from evidently.utils.multiclass import TOP_CLASSES_BY
 
 DEFAULT_CONF_INTERVAL_SIZE = 1
 DEFAULT_CLASSIFICATION_THRESHOLD = 0.5
+CORRELATION_KINDS = ("pearson", "spearman", "kendall", "cramer_v")
+DEFAULT_SAMPLED_CORRELATION_KINDS = ("kendall",)
 
 
 @dataclass
 class QualityMetricsOptions:
+    """Configuration for quality metrics.
+
+    Attributes:
+        correlation_kinds: kinds of correlation matrices calculated by DataQualityAnalyzer,
+            all of "pearson", "spearman", "kendall" and "cramer_v" by default.
+        correlation_sample_size: if set, correlations of `sampled_correlation_kinds` are calculated
+            with a random sample of rows of this size for data with more rows.
+        sampled_correlation_kinds: kinds of correlations calculated with a sample of rows, Kendall by default.
+        correlation_random_state: seed of the sample of rows, the same data gets the same sample.
+        cramer_v_n_jobs: number of workers to calculate Cramér's V of pairs of features concurrently.
+        cramer_v_backend: pool type for concurrent calculation of Cramér's V, "thread" or "process".
+        cramer_v_max_categories: if set, Cramér's V of features with more categories is not calculated (NaN).
+        approximate_cat_stats: if True, unique counts and the most common values of categorical features
+            are estimated with sketches of a fixed size, see `FeatureQualityStats.approximate_fields`.
+        hll_precision: precision of HyperLogLog sketches of unique values, they keep 2 ** precision bytes.
+        heavy_hitters_capacity: number of the most common values kept by Space-Saving sketches.
+        max_curve_points: if set, ROC and precision-recall curves of probabilistic classification
+            are reduced to this number of points, keeping their convex hulls, see `evidently.utils.curves`.
+        top_classes: if set, probabilistic classification with more classes is evaluated in the multiclass mode
+            for many classes, see `evidently.utils.multiclass`: curves, PR tables, cells of the confusion matrix
+            and metrics of classes are calculated for this number of top classes only and the confusion matrix
+            of all classes is stored sparsely, averaged metrics are calculated over all classes.
+        top_classes_by: how the top classes are chosen, by "support" in the target or by "error",
+            the number of false negatives and false positives.
+    """
     conf_interval_n_sigmas: int = DEFAULT_CONF_INTERVAL_SIZE
     classification_threshold: float = DEFAULT_CLASSIFICATION_THRESHOLD
     cut_quantile: Union[None, Tuple[str, float], Dict[str, Tuple[str, float]]] = None
+    correlation_kinds: Sequence[str] = CORRELATION_KINDS
+    correlation_sample_size: Optional[int] = None
+    sampled_correlation_kinds: Sequence[str] = DEFAULT_SAMPLED_CORRELATION_KINDS
+    correlation_random_state: int = 0
+    cramer_v_n_jobs: int = 1
+    cramer_v_backend: str = THREAD_BACKEND
+    cramer_v_max_categories: Optional[int] = None
+    approximate_cat_stats: bool = False
+    hll_precision: int = DEFAULT_HLL_PRECISION
+    heavy_hitters_capacity: int = DEFAULT_SPACE_SAVING_CAPACITY
+    max_curve_points: Optional[int] = None
+    top_classes: Optional[int] = None
+    top_classes_by: str = "support"
+
+    def __post_init__(self):
+        check_execution_parameters(self.cramer_v_n_jobs, self.cramer_v_backend)
+
+        for kind in list(self.correlation_kinds) + list(self.sampled_correlation_kinds):
+            if kind not in CORRELATION_KINDS:
+                raise ValueError(f"Unexpected correlation kind {kind}. Expected [{','.join(CORRELATION_KINDS)}]")
+
+        if self.correlation_sample_size is not None and self.correlation_sample_size < 1:
+            raise ValueError(f"correlation_sample_size should be a positive number, got {self.correlation_sample_size}")
+
+        if not HLL_MIN_PRECISION <= self.hll_precision <= HLL_MAX_PRECISION:
+            raise ValueError(
+                f"hll_precision should be from {HLL_MIN_PRECISION} to {HLL_MAX_PRECISION}, got {self.hll_precision}"
+            )
+
+        if self.heavy_hitters_capacity < 1:
+            raise ValueError(f"heavy_hitters_capacity should be a positive number, got {self.heavy_hitters_capacity}")
+
+        if self.max_curve_points is not None and self.max_curve_points < 2:
+            raise ValueError(f"max_curve_points should be at least 2, got {self.max_curve_points}")
+
+        if self.top_classes is not None and self.top_classes < 1:
+            raise ValueError(f"top_classes should be a positive number, got {self.top_classes}")
+
+        if self.top_classes_by not in TOP_CLASSES_BY:
+            raise ValueError(f"Unexpected top_classes_by {self.top_classes_by}. Expected [{','.join(TOP_CLASSES_BY)}]")
 
     def as_dict(self):
         return {
@@ -27,3 +102,17 @@ class QualityMetricsOptions:
             return self.cut_quantile.get(feature_name, None)
         raise ValueError(f"""QualityMetricsOptions.remove_outliers
                                 is incorrect type {type(self.cut_quantile)}""")
+
+    def get_correlation_sample_size(self, kind: str, rows_count: int) -> Optional[int]:
+        """Size of the sample of rows to calculate a correlation of the kind with, None to use all rows"""
+        if self.correlation_sample_size is None or kind not in self.sampled_correlation_kinds:
+            return None
+
+        if rows_count <= self.correlation_sample_size:
+            return None
+
+        return self.correlation_sample_size
+
+    def use_top_classes(self, classes_count: int) -> bool:
+        """Whether classification with the number of classes is evaluated in the multiclass mode for many classes"""
+        return self.top_classes is not None and classes_count > max(self.top_classes, 2)
@@ -0,0 +1,16 @@
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+from typing import Optional
+
+if TYPE_CHECKING:
+    from evidently.utils.reference_cache import ReferenceCache
+
+
+@dataclass
+class ReferenceCacheOptions:
+    """Cache of reference-only intermediates for analyzers and metrics.
+
+    Attributes:
+        cache: a cache shared by runs with the same reference data. If None, nothing is cached.
+    """
+    cache: Optional["ReferenceCache"] = None
@@ -1,21 +1,88 @@
 import itertools
-from typing import List, Dict, Type, Sequence, Optional
+from typing import Callable, List, Dict, Type, Sequence, Optional
 
+import numpy as np
 import pandas
 
 from evidently.analyzers.base_analyzer import Analyzer
 from evidently.options import OptionsProvider
 from evidently.pipeline.column_mapping import ColumnMapping
 from evidently.pipeline.stage import PipelineStage
+from evidently.utils.dataset_view import register_dataset_views
+from evidently.utils.parallel import PROCESS_BACKEND
+from evidently.utils.parallel import THREAD_BACKEND
+from evidently.utils.parallel import check_execution_parameters
+from evidently.utils.parallel import create_executor
+from evidently.utils.run_stats import CallKind
+from evidently.utils.run_stats import RunStats
+from evidently.utils.run_stats import collect_run_stats
+from evidently.utils.run_stats import measure
+from evidently.utils.shared_data import SharedDataFrame
+from evidently.utils.shared_data import is_shared_memory_available
+from evidently.utils.shared_data import share_dataframes
+
+
+def _remove_nans_and_infinities(dataset: pandas.DataFrame) -> pandas.DataFrame:
+    return dataset.replace([np.inf, -np.inf], np.nan).dropna(axis=0, how="any")
+
+
+def _calculate_analyzer(
+    analyzer: Type[Analyzer],
+    options_provider: OptionsProvider,
+    reference_data: pandas.DataFrame,
+    current_data: Optional[pandas.DataFrame],
+    column_mapping: ColumnMapping,
+):
+    instance = analyzer()
+    instance.options_provider = options_provider
+
+    with measure(CallKind.ANALYZER, analyzer.__name__):
+        return instance.calculate(reference_data, current_data, column_mapping)
+
+
+def _calculate_analyzer_with_shared_data(
+    analyzer: Type[Analyzer],
+    options_provider: OptionsProvider,
+    reference_data: SharedDataFrame,
+    current_data: Optional[SharedDataFrame],
+    column_mapping: ColumnMapping,
+):
+    attached_reference_data = reference_data.attach()
+    attached_current_data = None if current_data is None else current_data.attach()
+
+    with register_dataset_views(attached_reference_data, attached_current_data):
+        return _calculate_analyzer(
+            analyzer, options_provider, attached_reference_data, attached_current_data, column_mapping
+        )
 
 
 class Pipeline:
+    """Calculates analyzers and then all stages with the analyzers results.
+
+    Args:
+        n_jobs: number of workers to calculate analyzers concurrently, 1 (default) means sequential calculation.
+        backend: pool type for concurrent calculation, "thread" or "process".
+            With "process" the data is published once to shared memory and workers read it without copying,
+            analyzers options should be picklable.
+
+    Time and memory of analyzers, stages and widgets calls of the last execution are recorded to `run_stats`.
+    """
+
     _analyzers: List[Type[Analyzer]]
     stages: Sequence[PipelineStage]
     analyzers_results: Dict[Type[Analyzer], object]
     options_provider: OptionsProvider
+    n_jobs: int
+    backend: str
+    run_stats: RunStats
 
-    def __init__(self, stages: Sequence[PipelineStage], options: list):
+    def __init__(
+        self, stages: Sequence[PipelineStage], options: list, n_jobs: int = 1, backend: str = THREAD_BACKEND
+    ):
+        check_execution_parameters(n_jobs, backend)
+        self.n_jobs = n_jobs
+        self.backend = backend
+        self.run_stats = RunStats()
         self.stages = stages
         self.analyzers_results = {}
         self.options_provider = OptionsProvider()
@@ -40,12 +107,70 @@ class Pipeline:
         #  - this copy WILL KEEP all values' changes in existing rows and columns.
         rdata = reference_data.copy()
         cdata = None if current_data is None else current_data.copy()
-        for analyzer in self.get_analyzers():
-            instance = analyzer()
-            instance.options_provider = self.options_provider
-            self.analyzers_results[analyzer] = instance.calculate(rdata, cdata, column_mapping)
-        for stage in self.stages:
-            stage.options_provider = self.options_provider
-            stage.calculate(
-                rdata.copy(), None if cdata is None else cdata.copy(), column_mapping, self.analyzers_results
-            )
+        self._execute(rdata, cdata, column_mapping)
+
+    def _execute(
+        self,
+        rdata: pandas.DataFrame,
+        cdata: Optional[pandas.DataFrame],
+        column_mapping: ColumnMapping,
+    ) -> None:
+        self.run_stats.clear()
+
+        with self.run_stats.activate():
+            with register_dataset_views(rdata, cdata):
+                self._calculate_analyzers(rdata, cdata, column_mapping)
+
+            if any(analyzer.removes_nans_and_infinities for analyzer in self.get_analyzers()):
+                # stages show the same rows that such analyzers used
+                rdata = _remove_nans_and_infinities(rdata)
+                cdata = None if cdata is None else _remove_nans_and_infinities(cdata)
+
+            for stage in self.stages:
+                stage.options_provider = self.options_provider
+                with measure(CallKind.STAGE, type(stage).__name__):
+                    stage.calculate(
+                        rdata.copy(), None if cdata is None else cdata.copy(), column_mapping, self.analyzers_results
+                    )
+
+    def _calculate_analyzers(
+        self,
+        reference_data: pandas.DataFrame,
+        current_data: Optional[pandas.DataFrame],
+        column_mapping: ColumnMapping,
+    ) -> None:
+        analyzers = self.get_analyzers()
+
+        if self.n_jobs == 1 or len(analyzers) < 2:
+            for analyzer in analyzers:
+                self.analyzers_results[analyzer] = _calculate_analyzer(
+                    analyzer, self.options_provider, reference_data, current_data, column_mapping
+                )
+            return
+
+        if self.backend == PROCESS_BACKEND and is_shared_memory_available():
+            with share_dataframes(reference_data, current_data) as (shared_reference_data, shared_current_data):
+                self._calculate_analyzers_concurrently(
+                    analyzers,
+                    _calculate_analyzer_with_shared_data,
+                    (shared_reference_data, shared_current_data, column_mapping),
+                )
+            return
+
+        self._calculate_analyzers_concurrently(
+            analyzers, _calculate_analyzer, (reference_data, current_data, column_mapping)
+        )
+
+    def _calculate_analyzers_concurrently(self, analyzers: List[Type[Analyzer]], task: Callable, task_args: tuple):
+        with create_executor(self.n_jobs, self.backend) as executor:
+            futures = {
+                analyzer: executor.submit(
+                    collect_run_stats, self.run_stats.trace_memory, task, analyzer, self.options_provider, *task_args
+                )
+                for analyzer in analyzers
+            }
+            for analyzer, future in futures.items():
+                self.analyzers_results[analyzer], calls = future.result()
+
+                for call in calls:
+                    self.run_stats.record(call)
@@ -1,10 +1,30 @@
 import dataclasses
+from concurrent.futures import Executor
+from concurrent.futures import FIRST_COMPLETED
+from concurrent.futures import Future
+from concurrent.futures import wait
+from typing import Callable
+from typing import Dict
+from typing import Hashable
 from typing import Optional
 
 from evidently.metrics.base_metric import Metric, InputData
+from evidently.pipeline.column_mapping import ColumnMapping
 from evidently.renderers.base_renderer import TestRenderer, RenderersDefinitions, DEFAULT_RENDERERS
-from evidently.suite.execution_graph import ExecutionGraph, SimpleExecutionGraph
+from evidently.suite.execution_graph import ExecutionGraph, DependencyExecutionGraph
 from evidently.tests.base_test import Test, TestResult, GroupingTypes
+from evidently.utils.dataset_view import register_dataset_views
+from evidently.utils.parallel import PROCESS_BACKEND
+from evidently.utils.parallel import THREAD_BACKEND
+from evidently.utils.parallel import check_execution_parameters
+from evidently.utils.parallel import create_executor
+from evidently.utils.run_stats import CallKind
+from evidently.utils.run_stats import RunStats
+from evidently.utils.run_stats import collect_run_stats
+from evidently.utils.run_stats import measure
+from evidently.utils.shared_data import SharedDataFrame
+from evidently.utils.shared_data import is_shared_memory_available
+from evidently.utils.shared_data import share_dataframes
 
 
 @dataclasses.dataclass
@@ -45,10 +65,55 @@ class ExecutionError(Exception):
     pass
 
 
+def _calculate_metric(metric: Metric, metrics: dict, data: InputData):
+    with measure(CallKind.METRIC, type(metric).__name__):
+        return metric.calculate(data, metrics)
+
+
+def _calculate_metric_with_shared_data(
+    metric: Metric,
+    metrics: dict,
+    reference_data: Optional[SharedDataFrame],
+    current_data: SharedDataFrame,
+    column_mapping: ColumnMapping,
+    calculate_plot_data: bool,
+):
+    data = InputData(
+        reference_data=None if reference_data is None else reference_data.attach(),
+        current_data=current_data.attach(),
+        column_mapping=column_mapping,
+        calculate_plot_data=calculate_plot_data,
+    )
+
+    with register_dataset_views(data.reference_data, data.current_data):
+        return _calculate_metric(metric, metrics, data)
+
+
 class Suite:
+    """Calculates metrics and runs tests over them.
+
+    Args:
+        n_jobs: number of workers to calculate independent metrics concurrently.
+            With 1 (default) metrics are calculated sequentially in the current thread.
+        backend: pool type for concurrent calculation, "thread" or "process".
+            With "process" the input data is published once to shared memory and workers read it without copying,
+            metrics are pickled to workers, so changes that metrics make to themselves during calculation are not kept.
+
+    Time and memory of metrics calculation and tests checks are recorded to `run_stats`.
+    """
+
     context: Context
+    n_jobs: int
+    backend: str
+    run_stats: RunStats
+    _metrics_by_fingerprint: Dict[Hashable, Metric]
 
-    def __init__(self):
+    def __init__(self, n_jobs: int = 1, backend: str = THREAD_BACKEND):
+        check_execution_parameters(n_jobs, backend)
+        self.n_jobs = n_jobs
+        self.backend = backend
+        self.run_stats = RunStats()
+        self._metrics_by_fingerprint = {}
         self.context = Context(
             execution_graph=None,
             metrics=[],
@@ -59,11 +124,39 @@ class Suite:
             renderers=DEFAULT_RENDERERS,
         )
 
-    def add_metrics(self, *metrics: Metric):
-        for metric in metrics:
+    def __setstate__(self, state):
+        # metrics do not keep their context when they are copied or pickled, bind them to the suite copy
+        self.__dict__.update(state)
+
+        for metric in self.context.metrics:
             metric.set_context(self.context)
-        self.context.metrics.extend(metrics)
+
+    def add_metric(self, metric: Metric) -> Metric:
+        """Add a metric to the suite and return the instance that will be calculated for it.
+
+        If an equivalent metric (same type and parameters) was already added, the earlier instance
+        is returned and the new one is not calculated - callers should use the returned instance.
+        Metric dependencies are added too.
+        """
+        for field_name, dependency in list(vars(metric).items()):
+            if field_name != "context" and isinstance(dependency, Metric):
+                setattr(metric, field_name, self.add_metric(dependency))
+
+        fingerprint = metric.get_fingerprint()
+        existing_metric = self._metrics_by_fingerprint.get(fingerprint)
+
+        if existing_metric is not None:
+            return existing_metric
+
+        metric.set_context(self.context)
+        self._metrics_by_fingerprint[fingerprint] = metric
+        self.context.metrics.append(metric)
         self.context.state = States.Init
+        return metric
+
+    def add_metrics(self, *metrics: Metric):
+        for metric in metrics:
+            self.add_metric(metric)
 
     def add_tests(self, *tests: Test):
         for test in tests:
@@ -72,7 +165,7 @@ class Suite:
         self.context.state = States.Init
 
     def verify(self):
-        self.context.execution_graph = SimpleExecutionGraph(self.context.metrics, self.context.tests)
+        self.context.execution_graph = DependencyExecutionGraph(self.context.metrics, self.context.tests)
         self.context.state = States.Verified
 
     def run_calculate(self, data: InputData):
@@ -83,15 +176,78 @@ class Suite:
             return
 
         results: dict = {}
+        self.context.metric_results = results
 
+        with self.run_stats.activate(), register_dataset_views(data.reference_data, data.current_data):
+            self._calculate_metrics(data, results)
+
+        self.context.state = States.Calculated
+
+    def _calculate_metrics(self, data: InputData, results: dict):
         if self.context.execution_graph is not None:
             execution_graph: ExecutionGraph = self.context.execution_graph
 
-            for metric in execution_graph.get_metric_execution_iterator():
-                results[metric] = metric.calculate(data, results)
+            if self.n_jobs > 1 and self.backend == PROCESS_BACKEND and is_shared_memory_available():
+                with share_dataframes(data.reference_data, data.current_data) as (reference_data, current_data):
+                    with create_executor(self.n_jobs, self.backend) as executor:
+                        self._calculate_concurrently(
+                            executor,
+                            execution_graph,
+                            results,
+                            _calculate_metric_with_shared_data,
+                            (reference_data, current_data, data.column_mapping, data.calculate_plot_data),
+                        )
 
-        self.context.metric_results = results
-        self.context.state = States.Calculated
+            elif self.n_jobs > 1:
+                with create_executor(self.n_jobs, self.backend) as executor:
+                    self._calculate_concurrently(executor, execution_graph, results, _calculate_metric, (data,))
+
+            else:
+                for metric in execution_graph.get_metric_execution_iterator():
+                    results[metric] = _calculate_metric(metric, results, data)
+
+    def _calculate_concurrently(
+        self, executor: Executor, execution_graph: ExecutionGraph, results: dict, task: Callable, task_args: tuple
+    ):
+        """Submit every metric as soon as all its dependencies are calculated, store results as they complete.
+
+        The task is called in a worker as `task(metric, dependencies_results, *task_args)`,
+        calls measured in the worker are recorded to the suite run stats when the task is done.
+        """
+        waiting = list(execution_graph.get_metric_execution_iterator())
+        running: Dict[Future, Metric] = {}
+
+        def submit_ready_metrics():
+            for metric in list(waiting):
+                dependencies = execution_graph.get_metric_dependencies(metric)
+
+                if all(dependency in results for dependency in dependencies):
+                    waiting.remove(metric)
+                    dependencies_results = {dependency: results[dependency] for dependency in dependencies}
+                    running[
+                        executor.submit(
+                            collect_run_stats,
+                            self.run_stats.trace_memory,
+                            task,
+                            metric,
+                            dependencies_results,
+                            *task_args,
+                        )
+                    ] = metric
+
+        submit_ready_metrics()
+
+        while running:
+            done, _ = wait(list(running), return_when=FIRST_COMPLETED)
+
+            for future in done:
+                result, calls = future.result()
+                results[running.pop(future)] = result
+
+                for call in calls:
+                    self.run_stats.record(call)
+
+            submit_ready_metrics()
 
     def run_checks(self):
         if self.context.state in [States.Init, States.Verified]:
@@ -99,17 +255,24 @@ class Suite:
 
         test_results = {}
 
-        for test in self.context.execution_graph.get_test_execution_iterator():
-            try:
-                test_results[test] = test.check()
-            except BaseException as ex:
-                test_results[test] = TestResult(name=test.name,
-                                                status=TestResult.ERROR,
-                                                description=f"Test failed with exceptions: {ex}")
-            test_results[test].groups.update({
-                GroupingTypes.TestGroup.id: test.group,
-                GroupingTypes.TestType.id: test.name,
-            })
+        with self.run_stats.activate():
+            for test in self.context.execution_graph.get_test_execution_iterator():
+                test_results[test] = self._check_test(test)
 
         self.context.test_results = test_results
         self.context.state = States.Tested
+
+    @staticmethod
+    def _check_test(test: Test) -> TestResult:
+        with measure(CallKind.TEST, type(test).__name__):
+            try:
+                test_result = test.check()
+            except BaseException as ex:
+                test_result = TestResult(name=test.name,
+                                         status=TestResult.ERROR,
+                                         description=f"Test failed with exceptions: {ex}")
+        test_result.groups.update({
+            GroupingTypes.TestGroup.id: test.group,
+            GroupingTypes.TestType.id: test.name,
+        })
+        return test_result
@@ -1,4 +1,5 @@
 import abc
+from typing import Dict
 from typing import List
 
 from evidently.metrics.base_metric import Metric
@@ -14,6 +15,10 @@ class ExecutionGraph:
     def get_test_execution_iterator(self) -> List[Test]:
         raise NotImplementedError()
 
+    def get_metric_dependencies(self, metric: Metric) -> List[Metric]:
+        """Metrics that should be calculated before the metric. By default, metrics have no dependencies"""
+        return []
+
 
 class SimpleExecutionGraph(ExecutionGraph):
     """
@@ -33,3 +38,51 @@ class SimpleExecutionGraph(ExecutionGraph):
 
     def get_test_execution_iterator(self) -> List[Test]:
         return self.tests
+
+
+class DependencyExecutionGraph(ExecutionGraph):
+    """
+    Execution graph that orders metrics by their dependencies (see `Metric.get_dependencies`).
+
+    Metrics are iterated in topological order: every metric comes after all its dependencies,
+     independent metrics keep the order in which they were added.
+    """
+
+    metrics: List[Metric]
+    tests: List[Test]
+    dependencies: Dict[Metric, List[Metric]]
+
+    def __init__(self, metrics: List[Metric], tests: List[Test]):
+        self.tests = tests
+        self.dependencies = {}
+        self.metrics = []
+        visiting: set = set()
+
+        def visit(metric: Metric):
+            if metric in self.dependencies:
+                return
+
+            if metric in visiting:
+                raise ValueError(f"Metric {type(metric).__name__} has a circular dependency")
+
+            visiting.add(metric)
+            dependencies = metric.get_dependencies()
+
+            for dependency in dependencies:
+                visit(dependency)
+
+            visiting.remove(metric)
+            self.dependencies[metric] = dependencies
+            self.metrics.append(metric)
+
+        for metric in metrics:
+            visit(metric)
+
+    def get_metric_execution_iterator(self) -> List[Metric]:
+        return self.metrics
+
+    def get_test_execution_iterator(self) -> List[Test]:
+        return self.tests
+
+    def get_metric_dependencies(self, metric: Metric) -> List[Metric]:
+        return self.dependencies.get(metric, [])
@@ -4,8 +4,11 @@ import json
 import uuid
 from datetime import datetime
 from collections import Counter
+from typing import Dict
+from typing import Hashable
 from typing import List
 from typing import Optional
+from typing import Sequence
 from typing import Union
 from typing import Iterator
 from typing import Tuple
@@ -24,6 +27,15 @@ from evidently.dashboard.dashboard import save_data_file
 from evidently.model.dashboard import DashboardInfo
 from evidently.model.widget import BaseWidgetInfo
 from evidently.utils import NumpyEncoder
+from evidently.utils.reference_cache import ReferenceCache
+from evidently.utils.run_stats import CallKind
+from evidently.utils.run_stats import RunStats
+from evidently.utils.run_stats import measure
+from evidently.utils.segments import calculate_segments
+from evidently.utils.segments import get_segment_column_mapping
+from evidently.utils.segments import get_segment_columns
+from evidently.utils.segments import make_segments_summary
+from evidently.utils.segments import split_segments
 from evidently.metrics.base_metric import InputData
 from evidently.metrics.base_metric import Metric
 from evidently.renderers.notebook_utils import determine_template
@@ -35,19 +47,55 @@ from evidently.tests.base_test import TestResult
 from evidently.tests.base_test import DEFAULT_GROUP
 
 
+# test statuses counted in the summary of segmented runs
+SEGMENT_SUMMARY_STATUSES = [TestResult.SUCCESS, TestResult.WARNING, TestResult.FAIL, TestResult.ERROR]
+
+
 def _discover_dependencies(test: Test) -> Iterator[Tuple[str, Union[Metric, Test]]]:
     for field_name, field in test.__dict__.items():
         if issubclass(type(field), (Metric, Test)):
             yield field_name, field
 
 
+def _run_segment(
+    template: "TestSuite",
+    reference_data: Optional[pd.DataFrame],
+    current_data: pd.DataFrame,
+    column_mapping: ColumnMapping,
+) -> "TestSuite":
+    test_suite = copy.deepcopy(template)
+    test_suite._run_tests(InputData(reference_data, current_data, column_mapping))
+    return test_suite
+
+
+@dataclasses.dataclass
+class SegmentedTestSuite:
+    """Results of `TestSuite.run_segmented`.
+
+    Attributes:
+        segment_by: columns that the current data was grouped by.
+        segments: a test suite with results for every segment by the segment key.
+        summary: numbers of rows and tests by status for every segment, indexed by the segment keys.
+    """
+
+    segment_by: List[str]
+    segments: Dict[Hashable, "TestSuite"]
+    summary: pd.DataFrame
+
+    def __bool__(self):
+        return all(self.segments.values())
+
+
 class TestSuite:
     _inner_suite: Suite
     _columns_info: DatasetColumns
+    _tests: List[Test]
     _test_presets: List[TestPreset]
+    _calculate_plot_data: bool = True
 
-    def __init__(self, tests: Optional[List[Union[Test, TestPreset]]]):
-        self._inner_suite = Suite()
+    def __init__(self, tests: Optional[List[Union[Test, TestPreset]]], n_jobs: int = 1, backend: str = "thread"):
+        self._inner_suite = Suite(n_jobs=n_jobs, backend=backend)
+        self._tests = []
         self._test_presets = []
 
         for original_test in tests or []:
@@ -55,6 +103,7 @@ class TestSuite:
                 self._test_presets.append(original_test)
 
             else:
+                self._tests.append(original_test)
                 self._add_test(original_test)
 
     def _add_test(self, test: Test):
@@ -62,7 +111,8 @@ class TestSuite:
 
         for field_name, dependency in _discover_dependencies(new_test):
             if isinstance(dependency, Metric):
-                self._inner_suite.add_metrics(dependency)
+                # equivalent metrics are calculated once, so the test should use the suite's instance
+                new_test.__setattr__(field_name, self._inner_suite.add_metric(dependency))
 
             if isinstance(dependency, Test):
                 dependency_copy = copy.copy(dependency)
@@ -71,6 +121,11 @@ class TestSuite:
 
         self._inner_suite.add_tests(new_test)
 
+    @property
+    def run_stats(self) -> RunStats:
+        """Time and memory of metrics, tests and renderers calls of the last run"""
+        return self._inner_suite.run_stats
+
     def __bool__(self):
         return all(test_result.is_passed() for _, test_result in self._inner_suite.context.test_results.items())
 
@@ -80,10 +135,22 @@ class TestSuite:
         reference_data: Optional[pd.DataFrame],
         current_data: pd.DataFrame,
         column_mapping: Optional[ColumnMapping] = None,
+        calculate_plot_data: bool = True,
     ) -> None:
+        """Calculate metrics and run the tests.
+
+        Args:
+            reference_data: reference data, optional for most of the tests.
+            current_data: current data.
+            column_mapping: column mapping of the data.
+            calculate_plot_data: if False, metrics do not calculate data that is only used to draw plots,
+                for runs that are only exported with `json` or `as_dict`. Such test suite cannot be shown.
+        """
         if column_mapping is None:
             column_mapping = ColumnMapping()
 
+        self.run_stats.clear()
+        self._calculate_plot_data = calculate_plot_data
         self._columns_info = process_columns(current_data, column_mapping)
 
         for preset in self._test_presets:
@@ -92,10 +159,88 @@ class TestSuite:
             for test in tests:
                 self._add_test(test)
 
+        self._run_tests(InputData(reference_data, current_data, column_mapping, calculate_plot_data))
+
+    def _run_tests(self, data: InputData) -> None:
         self._inner_suite.verify()
-        self._inner_suite.run_calculate(InputData(reference_data, current_data, column_mapping))
+        self._inner_suite.run_calculate(data)
         self._inner_suite.run_checks()
 
+    def run_segmented(
+        self,
+        *,
+        reference_data: Optional[pd.DataFrame],
+        current_data: pd.DataFrame,
+        segment_by: Union[str, Sequence[str]],
+        column_mapping: Optional[ColumnMapping] = None,
+        reference_cache: Optional[ReferenceCache] = None,
+    ) -> SegmentedTestSuite:
+        """Run the tests for every segment of the current data against the same reference data.
+
+        The current data is grouped by `segment_by` columns once, presets are expanded once with columns of all
+        the current data. Segments are run concurrently with `n_jobs` and `backend` of the test suite,
+        metrics of one segment are calculated sequentially. Reference-side work is shared by the segments,
+        see `evidently.utils.segments`. Results of the test suite itself are not changed.
+
+        Args:
+            reference_data: reference data for all segments.
+            current_data: current data with the segment columns.
+            segment_by: a column or a list of columns to group the current data by.
+            column_mapping: column mapping for all segments, segment columns are not used as features.
+            reference_cache: a cache for reference-only intermediates, a new in-memory cache is used by default.
+        """
+        if column_mapping is None:
+            column_mapping = ColumnMapping()
+
+        segment_columns = get_segment_columns(segment_by, current_data)
+        segment_column_mapping = get_segment_column_mapping(current_data, column_mapping, segment_columns)
+        columns_info = process_columns(current_data, segment_column_mapping)
+        tests = copy.deepcopy(self._tests)
+
+        for preset in self._test_presets:
+            tests.extend(
+                preset.generate_tests(
+                    InputData(reference_data, current_data, segment_column_mapping), columns_info
+                )
+            )
+
+        template = TestSuite(tests)
+        template._columns_info = columns_info
+        segment_frames = split_segments(current_data, segment_columns)
+        segments = calculate_segments(
+            _run_segment,
+            template,
+            reference_data,
+            segment_frames,
+            segment_column_mapping,
+            self._inner_suite.n_jobs,
+            self._inner_suite.backend,
+            reference_cache,
+        )
+        summary_rows = []
+
+        for (key, test_suite), (_, segment) in zip(segments, segment_frames):
+            counter = Counter(
+                test_result.status for test_result in test_suite._inner_suite.context.test_results.values()
+            )
+            summary_rows.append(
+                (
+                    key,
+                    {
+                        "rows": segment.shape[0],
+                        "all_passed": bool(test_suite),
+                        "total_tests": sum(counter.values()),
+                        **{status.lower(): counter[status] for status in SEGMENT_SUMMARY_STATUSES},
+                    },
+                )
+            )
+
+        return SegmentedTestSuite(
+            segment_by=segment_columns,
+            segments=dict(segments),
+            summary=make_segments_summary(segment_columns, summary_rows),
+        )
+
     def _repr_html_(self):
         dashboard_id, dashboard_info, graphs = self._build_dashboard_info()
         template_params = TemplateParams(
@@ -147,17 +292,20 @@ class TestSuite:
             with open(filename, "w", encoding="utf-8") as out_file:
                 out_file.write(self._render(determine_template("inline"), template_params))
 
-    def as_dict(self) -> dict:
+    def as_dict(self, include_run_stats: bool = False) -> dict:
         test_results = []
         counter = Counter(test_result.status for test_result in self._inner_suite.context.test_results.values())
 
-        for test in self._inner_suite.context.test_results:
-            renderer = find_test_renderer(type(test), self._inner_suite.context.renderers)
-            test_results.append(renderer.render_json(test))
+        with self.run_stats.activate():
+            for test in self._inner_suite.context.test_results:
+                renderer = find_test_renderer(type(test), self._inner_suite.context.renderers)
+
+                with measure(CallKind.RENDERER, type(renderer).__name__):
+                    test_results.append(renderer.render_json(test))
 
         total_tests = len(self._inner_suite.context.test_results)
 
-        return {
+        result = {
             "version": evidently.__version__,
             "datetime": datetime.now().isoformat(),
             "tests": test_results,
@@ -171,26 +319,37 @@ class TestSuite:
             "columns_info": dataclasses.asdict(self._columns_info),
         }
 
-    def json(self) -> str:
-        return json.dumps(self.as_dict(), cls=NumpyEncoder)
+        if include_run_stats:
+            result["run_stats"] = self.run_stats.as_dict()
 
-    def save_json(self, filename):
+        return result
+
+    def json(self, include_run_stats: bool = False) -> str:
+        return json.dumps(self.as_dict(include_run_stats=include_run_stats), cls=NumpyEncoder)
+
+    def save_json(self, filename, include_run_stats: bool = False):
         with open(filename, "w", encoding="utf-8") as out_file:
-            json.dump(self.as_dict(), out_file, cls=NumpyEncoder)
+            json.dump(self.as_dict(include_run_stats=include_run_stats), out_file, cls=NumpyEncoder)
 
     def _render(self, temple_func, template_params: TemplateParams):
         return temple_func(params=template_params)
 
     def _build_dashboard_info(self):
+        if not self._calculate_plot_data:
+            raise ValueError("Test suite was run with calculate_plot_data=False, only json and as_dict are available")
+
         test_results = []
         total_tests = len(self._inner_suite.context.test_results)
         by_status = {}
 
-        for test, test_result in self._inner_suite.context.test_results.items():
-            # renderer = find_test_renderer(type(test.obj), self._inner_suite.context.renderers)
-            renderer = find_test_renderer(type(test), self._inner_suite.context.renderers)
-            by_status[test_result.status] = by_status.get(test_result.status, 0) + 1
-            test_results.append(renderer.render_html(test))
+        with self.run_stats.activate():
+            for test, test_result in self._inner_suite.context.test_results.items():
+                # renderer = find_test_renderer(type(test.obj), self._inner_suite.context.renderers)
+                renderer = find_test_renderer(type(test), self._inner_suite.context.renderers)
+                by_status[test_result.status] = by_status.get(test_result.status, 0) + 1
+
+                with measure(CallKind.RENDERER, type(renderer).__name__):
+                    test_results.append(renderer.render_html(test))
 
         summary_widget = BaseWidgetInfo(
             title="",
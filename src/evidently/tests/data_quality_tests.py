@@ -886,7 +886,8 @@ class TestMostCommonValueShare(BaseFeatureDataQualityMetricsTest):
         return most_common_value_percentage / 100.0
 
     def get_description(self, value: Numeric) -> str:
-        most_common_value = self.metric.get_result().counts_of_values[self.column_name]["current"].iloc[0, 0]
+        # the share is calculated for this value, with or without plot data
+        most_common_value = self.metric.get_result().features_stats[self.column_name].most_common_value
         return (
             f"The most common value in the column **{self.column_name}** is {most_common_value}. "
             f"Its share is {value:.3g}. "
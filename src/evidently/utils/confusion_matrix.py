@@ -0,0 +1,283 @@
+"""Classification quality metrics derived from confusion matrices.
+
+Target and prediction are factorized once and the confusion matrix is counted with `np.bincount`
+or as a sparse matrix of non-zero cells for many labels, all quality metrics are derived from the matrix. Metrics are the same as `sklearn.metrics` ones
+with the default `zero_division`: scores with zero denominators are 0.
+Binary confusion matrices for many thresholds of the positive label probability are counted from scores
+that are sorted once, see `BinaryThresholdSweep`.
+"""
+import dataclasses
+from typing import Any
+from typing import List
+from typing import Optional
+from typing import Sequence
+from typing import Tuple
+from typing import Union
+
+import numpy as np
+import pandas as pd
+from scipy import sparse
+
+
+@dataclasses.dataclass
+class ConfusionMatrixMetrics:
+    """Quality metrics of a confusion matrix.
+
+    Attributes:
+        accuracy: share of correct predictions.
+        precision: precision of the positive label or macro averaged precision.
+        recall: recall of the positive label or macro averaged recall.
+        f1: F1 score of the positive label or macro averaged F1 score.
+        metrics_matrix: the same as `sklearn.metrics.classification_report` with `output_dict=True`.
+    """
+
+    accuracy: float
+    precision: float
+    recall: float
+    f1: float
+    metrics_matrix: dict
+
+
+def _is_continuous(labels: pd.Index) -> bool:
+    if not pd.api.types.is_float_dtype(labels.dtype):
+        return False
+
+    values = labels.to_numpy()
+    finite = values[np.isfinite(values)]
+    return bool(np.any(finite != finite.astype(np.int64)))
+
+
+def _get_label_positions(
+    target: Sequence[Any], prediction: Sequence[Any]
+) -> Tuple[np.ndarray, np.ndarray, List[Any]]:
+    """Positions of target and predicted labels of rows in sorted labels of the target and the prediction"""
+    target_codes, target_labels = pd.factorize(pd.Series(target))
+    prediction_codes, prediction_labels = pd.factorize(pd.Series(prediction))
+
+    if _is_continuous(target_labels) or _is_continuous(prediction_labels):
+        raise ValueError("Classification metrics can't handle continuous targets")
+
+    # equal labels of the target and the prediction are taken from the target, like in `unique_labels`
+    try:
+        labels = sorted(set(target_labels) | set(prediction_labels))
+
+    except TypeError:
+        raise ValueError("Mix of label input types (string and number)")
+
+    positions = {label: i for i, label in enumerate(labels)}
+    target_positions = np.array([positions[label] for label in target_labels], dtype=np.int64)
+    prediction_positions = np.array([positions[label] for label in prediction_labels], dtype=np.int64)
+    return target_positions[target_codes], prediction_positions[prediction_codes], labels
+
+
+def get_confusion_matrix(target: Sequence[Any], prediction: Sequence[Any]) -> Tuple[np.ndarray, List[Any]]:
+    """Confusion matrix of target and predicted labels, the same as `sklearn.metrics.confusion_matrix`.
+
+    Target and prediction should not have missing values.
+
+    Returns:
+        numbers of rows by true labels (rows) and predicted labels (columns) and sorted labels
+        that are present in the target or in the prediction.
+    """
+    target_positions, prediction_positions, labels = _get_label_positions(target, prediction)
+    size = len(labels)
+    combined_codes = target_positions * size + prediction_positions
+    return np.bincount(combined_codes, minlength=size * size).reshape(size, size), labels
+
+
+def get_sparse_confusion_matrix(
+    target: Sequence[Any], prediction: Sequence[Any]
+) -> Tuple[sparse.csr_matrix, List[Any]]:
+    """The same as `get_confusion_matrix` but the matrix is sparse, with non-zero cells only"""
+    target_positions, prediction_positions, labels = _get_label_positions(target, prediction)
+    size = len(labels)
+    # counts of repeated cells are summed up
+    matrix = sparse.coo_matrix(
+        (np.ones(len(target_positions), dtype=np.int64), (target_positions, prediction_positions)),
+        shape=(size, size),
+    )
+    return matrix.tocsr(), labels
+
+
+def _divide(numerator: np.ndarray, denominator: np.ndarray) -> np.ndarray:
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(denominator == 0, 0.0, numerator / np.where(denominator == 0, 1, denominator))
+
+
+def _get_scores(
+    true_positives: np.ndarray, predicted: np.ndarray, support: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Precision, recall and F1 score of labels, calculated the same way as in `precision_recall_fscore_support`"""
+    precision = _divide(true_positives, predicted)
+    recall = _divide(true_positives, support)
+    denominator = precision + recall
+    zero_f1 = np.isclose(denominator, 0) | np.isclose(predicted + support, 0)
+    f1 = np.where(zero_f1, 0.0, 2 * precision * recall / np.where(zero_f1, 1, denominator))
+    return precision, recall, f1
+
+
+def get_confusion_matrix_metrics(
+    matrix: Union[np.ndarray, sparse.spmatrix],
+    labels: Sequence[Any],
+    average: str = "macro",
+    pos_label: Any = 1,
+    report_labels: Optional[Sequence[Any]] = None,
+) -> ConfusionMatrixMetrics:
+    """Quality metrics of a confusion matrix.
+
+    Args:
+        matrix: numbers of rows by true labels (rows) and predicted labels (columns) in the order of `labels`,
+            a dense or a sparse matrix.
+        labels: sorted labels that are present in the target or in the prediction.
+        average: "macro" for precision, recall and F1 score averaged over labels,
+            "binary" for the ones of the positive label.
+        pos_label: label of binary classification.
+        report_labels: if set, only these labels get metrics of their own in `metrics_matrix`,
+            averaged metrics are still calculated over all labels.
+    """
+    if average not in ("macro", "binary"):
+        raise ValueError(f"Unexpected average {average}, should be 'macro' or 'binary'")
+
+    if average == "binary":
+        if len(labels) > 2:
+            raise ValueError(
+                "Target is multiclass but average='binary'. Please choose another average setting, "
+                "one of [None, 'micro', 'macro', 'weighted']."
+            )
+
+        if len(labels) == 2 and pos_label not in labels:
+            raise ValueError(f"pos_label={pos_label!r} is not a valid label. It should be one of {list(labels)}")
+
+    if sparse.issparse(matrix):
+        true_positives = matrix.diagonal().astype(np.int64)
+        predicted = np.asarray(matrix.sum(axis=0), dtype=np.int64).ravel()
+        support = np.asarray(matrix.sum(axis=1), dtype=np.int64).ravel()
+
+    else:
+        matrix = np.asarray(matrix, dtype=np.int64)
+        true_positives = np.diag(matrix)
+        predicted = matrix.sum(axis=0)
+        support = matrix.sum(axis=1)
+
+    total = support.sum()
+    precision, recall, f1 = _get_scores(true_positives, predicted, support)
+    accuracy = float(_divide(true_positives.sum(), total))
+    metrics_matrix: dict = {
+        "%s" % label: {
+            "precision": float(precision[i]),
+            "recall": float(recall[i]),
+            "f1-score": float(f1[i]),
+            "support": float(support[i]),
+        }
+        for i, label in enumerate(labels)
+        if report_labels is None or label in report_labels
+    }
+    metrics_matrix["accuracy"] = accuracy
+
+    for name, weights in (("macro avg", None), ("weighted avg", support)):
+        metrics_matrix[name] = {
+            "precision": float(np.average(precision, weights=weights)),
+            "recall": float(np.average(recall, weights=weights)),
+            "f1-score": float(np.average(f1, weights=weights)),
+            "support": float(total),
+        }
+
+    if average == "macro":
+        return ConfusionMatrixMetrics(
+            accuracy=accuracy,
+            precision=metrics_matrix["macro avg"]["precision"],
+            recall=metrics_matrix["macro avg"]["recall"],
+            f1=metrics_matrix["macro avg"]["f1-score"],
+            metrics_matrix=metrics_matrix,
+        )
+
+    positions = [i for i, label in enumerate(labels) if label == pos_label]
+
+    if positions:
+        position = positions[0]
+        pos_precision, pos_recall, pos_f1 = precision[position], recall[position], f1[position]
+
+    else:
+        # the positive label is neither in the target nor in the prediction
+        pos_precision, pos_recall, pos_f1 = 0.0, 0.0, 0.0
+
+    return ConfusionMatrixMetrics(
+        accuracy=accuracy,
+        precision=float(pos_precision),
+        recall=float(pos_recall),
+        f1=float(pos_f1),
+        metrics_matrix=metrics_matrix,
+    )
+
+
+class BinaryThresholdSweep:
+    """Confusion matrices of binary classification by thresholds of the positive label probability.
+
+    Rows with probability greater than or equal to a threshold are predicted as the positive label.
+    Probabilities are sorted once, numbers of true and false positives for any thresholds are found
+    with a binary search and cumulative sums of the sorted target.
+
+    Args:
+        is_positive: True for rows with the positive label in the target.
+        scores: probabilities of the positive label.
+    """
+
+    def __init__(self, is_positive: np.ndarray, scores: np.ndarray):
+        scores = np.asarray(scores, dtype=np.float64)
+        # descending order, missing values are the last ones and are never predicted as positive
+        order = np.argsort(-scores, kind="stable")
+
+        self.sorted_scores = scores[order]
+        self.size = len(scores)
+        self._true_positives = np.concatenate([[0], np.cumsum(np.asarray(is_positive, dtype=bool)[order])])
+        self.positives = int(self._true_positives[-1])
+
+    def get_predicted_positives(self, thresholds: Union[Sequence[float], np.ndarray]) -> np.ndarray:
+        """Numbers of rows with probabilities greater than or equal to every threshold"""
+        thresholds = np.asarray(thresholds, dtype=np.float64)
+        counts = np.searchsorted(-self.sorted_scores, -thresholds, side="right")
+        return np.where(np.isnan(thresholds), 0, counts)
+
+    def get_confusion_counts(
+        self, thresholds: Union[Sequence[float], np.ndarray]
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Numbers of true positives, false positives, false negatives and true negatives for every threshold"""
+        predicted_positives = self.get_predicted_positives(thresholds)
+        true_positives = self._true_positives[predicted_positives]
+        false_positives = predicted_positives - true_positives
+        false_negatives = self.positives - true_positives
+        true_negatives = self.size - self.positives - false_positives
+        return true_positives, false_positives, false_negatives, true_negatives
+
+    def get_k_threshold(self, k: Union[int, float]) -> float:
+        """Probability of the k-th row by probability, k is a share of rows if it is float"""
+        if isinstance(k, float):
+            if k < 0.0 or k > 1.0:
+                raise ValueError(f"K should be in range [0.0, 1.0] but was {k}")
+            return self.sorted_scores[max(int(np.ceil(k * self.size)) - 1, 0)]
+        if isinstance(k, int):
+            return self.sorted_scores[min(k, self.size - 1)]
+        raise ValueError(f"K has unexpected type {type(k)}")
+
+    def get_top_true_positives(self, counts: Union[Sequence[int], np.ndarray]) -> np.ndarray:
+        """Numbers of rows with the positive label among `counts` rows with the highest probabilities.
+
+        Rows with equal probabilities are in the order of the data.
+        """
+        return self._true_positives[np.asarray(counts, dtype=np.int64)]
+
+    def get_distinct_thresholds(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Numbers of false positives and true positives for every distinct probability, in descending order.
+
+        The same as `_binary_clf_curve` of `sklearn.metrics` that ROC and precision-recall curves are built from.
+
+        Returns:
+            numbers of false positives, numbers of true positives and the probabilities.
+        """
+        last_positions = np.r_[np.flatnonzero(np.diff(self.sorted_scores)), self.size - 1]
+
+        if self.size == 0:
+            last_positions = np.array([], dtype=np.int64)
+
+        true_positives = self._true_positives[last_positions + 1]
+        return last_positions + 1 - true_positives, true_positives, self.sorted_scores[last_positions]
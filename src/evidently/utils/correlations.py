@@ -0,0 +1,146 @@
+"""Correlation matrices of many categorical columns.
+
+Every column is factorized once, contingency tables of pairs of columns are counted with `np.bincount`
+over combined codes of the columns. Pairs can be calculated concurrently, see `evidently.utils.parallel`.
+"""
+from typing import List
+from typing import Optional
+from typing import Sequence
+from typing import Tuple
+
+import numpy as np
+import pandas as pd
+
+from evidently.utils.parallel import THREAD_BACKEND
+from evidently.utils.parallel import create_executor
+
+# contingency tables with more cells are counted only for the observed pairs of categories
+MAX_DENSE_TABLE_SIZE = 2 ** 22
+
+
+def factorize_column(column: pd.Series) -> Tuple[np.ndarray, int]:
+    """Codes of the column values, -1 for missing values, and the number of categories.
+
+    Categories are sorted if their values can be compared, like in `pd.crosstab`.
+    """
+    try:
+        codes, categories = pd.factorize(column, sort=True)
+
+    except TypeError:
+        codes, categories = pd.factorize(column)
+
+    return codes.astype(np.int64), len(categories)
+
+
+def get_contingency_table(
+    first_codes: np.ndarray, first_size: int, second_codes: np.ndarray, second_size: int
+) -> np.ndarray:
+    """Contingency table of two factorized columns without missing values and categories that are not observed"""
+    valid = (first_codes >= 0) & (second_codes >= 0)
+    combined_codes = first_codes[valid] * second_size + second_codes[valid]
+    table = np.bincount(combined_codes, minlength=first_size * second_size).reshape(first_size, second_size)
+    return table[table.sum(axis=1) > 0][:, table.sum(axis=0) > 0]
+
+
+def get_cramer_v(first_codes: np.ndarray, first_size: int, second_codes: np.ndarray, second_size: int) -> float:
+    """Cramér's V of two factorized columns, the same as with `pd.crosstab` and `chi2_contingency`.
+
+    Rows with missing values in any of the columns are skipped. Returns NaN if any of the columns
+    has less than two categories in the other rows.
+    """
+    if first_size * second_size > MAX_DENSE_TABLE_SIZE:
+        return _get_sparse_cramer_v(first_codes, first_size, second_codes, second_size)
+
+    table = get_contingency_table(first_codes, first_size, second_codes, second_size)
+    n_rows, n_cols = table.shape
+
+    if min(n_rows, n_cols) < 2:
+        return np.nan
+
+    observed_count = table.sum()
+    # Pearson's chi-squared statistic, calculated the same way as in `chi2_contingency`
+    expected = np.outer(table.sum(axis=1), table.sum(axis=0)) / observed_count
+    chi2_stat = ((table.astype(np.float64) - expected) ** 2 / expected).sum()
+    return np.sqrt(chi2_stat / observed_count / min(n_cols - 1, n_rows - 1))
+
+
+def _get_sparse_cramer_v(first_codes: np.ndarray, first_size: int, second_codes: np.ndarray, second_size: int) -> float:
+    """Cramér's V for columns with many categories, with counts of the observed pairs of categories only"""
+    valid = (first_codes >= 0) & (second_codes >= 0)
+    cells, counts = np.unique(first_codes[valid] * second_size + second_codes[valid], return_counts=True)
+    rows = cells // second_size
+    cols = cells % second_size
+    row_sums = np.bincount(rows, weights=counts, minlength=first_size)
+    col_sums = np.bincount(cols, weights=counts, minlength=second_size)
+    n_rows = np.count_nonzero(row_sums)
+    n_cols = np.count_nonzero(col_sums)
+
+    if min(n_rows, n_cols) < 2:
+        return np.nan
+
+    observed_count = counts.sum()
+    # chi2 = n * (sum of observed ** 2 / (row sum * col sum) - 1), unobserved cells add nothing to the sum
+    chi2_stat = observed_count * (np.sum(counts.astype(np.float64) ** 2 / (row_sums[rows] * col_sums[cols])) - 1)
+    return np.sqrt(max(chi2_stat, 0.0) / observed_count / min(n_cols - 1, n_rows - 1))
+
+
+def _get_cramer_v_values(
+    codes: List[np.ndarray], sizes: List[int], pairs: Sequence[Tuple[int, int]]
+) -> List[float]:
+    return [get_cramer_v(codes[first], sizes[first], codes[second], sizes[second]) for first, second in pairs]
+
+
+def get_cramer_v_matrix(
+    data: pd.DataFrame,
+    n_jobs: int = 1,
+    backend: str = THREAD_BACKEND,
+    max_categories: Optional[int] = None,
+) -> pd.DataFrame:
+    """Matrix of Cramér's V of all pairs of columns of the data, empty for less than two columns.
+
+    Args:
+        data: categorical columns.
+        n_jobs: number of workers to calculate pairs of columns concurrently.
+        backend: pool type for concurrent calculation, "thread" or "process".
+        max_categories: if set, Cramér's V of columns with more categories is not calculated and is NaN:
+            for ID-like columns it is close to 1 for any other column.
+    """
+    columns = data.columns
+    columns_count = data.shape[1]
+
+    if columns_count <= 1:
+        return pd.DataFrame()
+
+    factorized = [factorize_column(data[column]) for column in columns]
+    codes = [column_codes for column_codes, _ in factorized]
+    sizes = [size for _, size in factorized]
+    # Cramér's V is not defined for columns with less than two categories
+    pairs = [
+        (first, second)
+        for first in range(columns_count)
+        for second in range(first)
+        if min(sizes[first], sizes[second]) >= 2
+        and (max_categories is None or max(sizes[first], sizes[second]) <= max_categories)
+    ]
+
+    if n_jobs == 1 or len(pairs) < 2:
+        values = _get_cramer_v_values(codes, sizes, pairs)
+
+    else:
+        chunk_size = -(-len(pairs) // n_jobs)
+
+        with create_executor(n_jobs, backend) as executor:
+            futures = [
+                executor.submit(_get_cramer_v_values, codes, sizes, pairs[start: start + chunk_size])
+                for start in range(0, len(pairs), chunk_size)
+            ]
+            values = [value for future in futures for value in future.result()]
+
+    corr_array = np.full((columns_count, columns_count), np.nan)
+    np.fill_diagonal(corr_array, 1.0)
+
+    for (first, second), value in zip(pairs, values):
+        corr_array[first, second] = value
+        corr_array[second, first] = value
+
+    return pd.DataFrame(data=corr_array, columns=columns, index=columns)
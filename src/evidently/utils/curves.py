@@ -0,0 +1,171 @@
+"""ROC curves, precision-recall curves and PR tables of probabilities of a label.
+
+All of them are calculated from probabilities that are sorted once with cumulative numbers of rows
+with the label, see `evidently.utils.confusion_matrix.BinaryThresholdSweep`.
+Curves are the same as `sklearn.metrics.roc_curve` and `sklearn.metrics.precision_recall_curve` of scikit-learn 1.0
+with any installed version: the first threshold of ROC curves is the maximal probability + 1, not infinity,
+so curves stay valid in JSON, and precision-recall curves stop at the first threshold with full recall.
+Curves with more points than `max_points` are reduced, see `get_curve_points`.
+"""
+import heapq
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+import numpy as np
+from scipy.spatial import ConvexHull
+
+from evidently.utils.confusion_matrix import BinaryThresholdSweep
+
+# PR table rows are for every 5% of rows with the highest probabilities
+PR_TABLE_STEP_SIZE = 0.05
+
+
+def _get_farthest_point(x: np.ndarray, y: np.ndarray, start: int, end: int) -> Tuple[float, int]:
+    """Distance to the segment line and position of the farthest point between `start` and `end` points"""
+    if end - start < 2:
+        return 0.0, -1
+
+    segment_x = x[end] - x[start]
+    segment_y = y[end] - y[start]
+    points_x = x[start + 1:end] - x[start]
+    points_y = y[start + 1:end] - y[start]
+    length = np.hypot(segment_x, segment_y)
+
+    if length == 0:
+        distances = np.hypot(points_x, points_y)
+
+    else:
+        distances = np.abs(segment_x * points_y - segment_y * points_x) / length
+
+    position = int(np.argmax(distances))
+    return float(distances[position]), start + 1 + position
+
+
+def _add_farthest_points(x: np.ndarray, y: np.ndarray, kept: np.ndarray, max_points: int) -> np.ndarray:
+    """Add the farthest points from the curve of `kept` points until there are `max_points` of them"""
+    kept_positions = set(kept.tolist())
+    # max heap of segments between kept points by the distance to their farthest point
+    segments = []
+
+    for start, end in zip(kept[:-1].tolist(), kept[1:].tolist()):
+        distance, position = _get_farthest_point(x, y, start, end)
+        segments.append((-distance, start, end, position))
+
+    heapq.heapify(segments)
+
+    while len(kept_positions) < max_points and segments:
+        distance, start, end, position = heapq.heappop(segments)
+
+        if distance == 0:
+            # the rest of points are on the curve
+            break
+
+        kept_positions.add(position)
+
+        for new_start, new_end in ((start, position), (position, end)):
+            new_distance, new_position = _get_farthest_point(x, y, new_start, new_end)
+            heapq.heappush(segments, (-new_distance, new_start, new_end, new_position))
+
+    return np.array(sorted(kept_positions), dtype=np.int64)
+
+
+def get_curve_points(x: np.ndarray, y: np.ndarray, max_points: Optional[int]) -> np.ndarray:
+    """Positions of at most `max_points` points of a curve that approximate it, all of them if `max_points` is None.
+
+    The first and the last points and vertices of the convex hull of the curve are kept, so the reduced curve
+    has the same convex hull. The rest of points are added one by one, the farthest from the reduced curve first,
+    like in the Ramer-Douglas-Peucker algorithm: all dropped points are closer to the reduced curve than
+    any added point, so areas under the curves, such as AUC, differ by no more than that distance.
+    If the convex hull has more than `max_points` vertices, points are chosen among vertices of the hull.
+    """
+    size = len(x)
+
+    if max_points is None or size <= max_points:
+        return np.arange(size)
+
+    # rates are NaN if a label is absent, such coordinates do not affect the choice of points
+    x = np.nan_to_num(np.asarray(x, dtype=np.float64))
+    y = np.nan_to_num(np.asarray(y, dtype=np.float64))
+    # joggled input to get the hull of collinear points too
+    hull = np.unique(np.r_[0, ConvexHull(np.c_[x, y], qhull_options="QJ").vertices, size - 1])
+
+    if len(hull) > max_points:
+        return hull[_add_farthest_points(x[hull], y[hull], np.array([0, len(hull) - 1]), max_points)]
+
+    return _add_farthest_points(x, y, hull, max_points)
+
+
+def get_roc_curve(sweep: BinaryThresholdSweep, max_points: Optional[int] = None) -> dict:
+    """ROC curve with intermediate collinear points dropped, as `fpr`, `tpr` and `thrs` lists.
+
+    The curve is reduced to `max_points` points if it has more of them, see `get_curve_points`.
+    """
+    false_positives, true_positives, thresholds = sweep.get_distinct_thresholds()
+
+    if len(false_positives) > 2:
+        # the same points as with `drop_intermediate=True`: corners of the curve and its ends
+        optimal = np.r_[True, np.logical_or(np.diff(false_positives, 2), np.diff(true_positives, 2)), True]
+        false_positives = false_positives[optimal]
+        true_positives = true_positives[optimal]
+        thresholds = thresholds[optimal]
+
+    false_positives = np.r_[0, false_positives]
+    true_positives = np.r_[0, true_positives]
+    thresholds = np.r_[thresholds[:1] + 1, thresholds]
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        # rates are NaN if there are no negative or no positive rows, like in scikit-learn
+        fpr = false_positives / false_positives[-1]
+        tpr = true_positives / true_positives[-1]
+
+    points = get_curve_points(fpr, tpr, max_points)
+    return {"fpr": fpr[points].tolist(), "tpr": tpr[points].tolist(), "thrs": thresholds[points].tolist()}
+
+
+def get_pr_curve(sweep: BinaryThresholdSweep, max_points: Optional[int] = None) -> dict:
+    """Precision-recall curve up to full recall with recall in decreasing order, as `pr`, `rcl` and `thrs` lists.
+
+    The curve is reduced to `max_points` points if it has more of them, see `get_curve_points`.
+    """
+    false_positives, true_positives, thresholds = sweep.get_distinct_thresholds()
+    true_positives = true_positives.astype(np.float64)
+    precision = true_positives / (true_positives + false_positives)
+
+    if sweep.positives == 0:
+        # recall is 1 for all thresholds if there are no positive rows, like in scikit-learn
+        recall = np.ones_like(true_positives)
+
+    else:
+        recall = true_positives / sweep.positives
+
+    # lower thresholds do not change recall
+    full_recall = slice(np.searchsorted(true_positives, sweep.positives), None, -1)
+    precision = np.r_[precision[full_recall], 1]
+    recall = np.r_[recall[full_recall], 0]
+    thresholds = thresholds[full_recall]
+    points = get_curve_points(recall, precision, max_points)
+    # the last point of zero recall has no threshold and is always kept
+    return {"pr": precision[points].tolist(), "rcl": recall[points].tolist(), "thrs": thresholds[points[:-1]].tolist()}
+
+
+def get_pr_table(sweep: BinaryThresholdSweep, step_size: float = PR_TABLE_STEP_SIZE) -> List[list]:
+    """Precision and recall of labeling top rows by probability as the label, for every `step_size` share of rows.
+
+    Every row of the table is [top %, count, probability, TP, FP, precision %, recall %]: the probability
+    is the one of the next row after the top rows, precision and recall are rounded to 0.1%.
+    """
+    data_size = sweep.size
+    offset = max(round(data_size * step_size), 1)
+    counts = np.minimum(np.arange(offset, data_size + offset, offset), data_size)
+    true_positives = sweep.get_top_true_positives(counts)
+    pr_table = []
+
+    for step, count, tp in zip(range(offset, data_size + offset, offset), counts.tolist(), true_positives.tolist()):
+        prob = round(float(sweep.sorted_scores[min(step, data_size - 1)]), 2)
+        top = round(100.0 * count / data_size, 1)
+        precision = round(100.0 * tp / count, 1)
+        recall = round(100.0 * tp / sweep.positives, 1) if sweep.positives > 0 else 0.0
+        pr_table.append([top, count, prob, tp, count - tp, precision, recall])
+
+    return pr_table
@@ -0,0 +1,332 @@
+"""Per-column primitives shared by the consumers of a dataset in one run.
+
+Analyzers and metrics compute the same primitives for the same columns: null masks, values without NaN
+and infinities, value counts, numbers of unique values, hashes of values. A dataset view computes each primitive
+once per column on the first request and keeps it for the next consumers.
+
+Suite and Pipeline register views of the reference and current data for the duration of a run.
+`get_dataset_view` and `get_column_view` return a registered view for the data of the run,
+for other data they return a new view that is not shared.
+
+A column view is bound to the column object: if a column is replaced in the data frame, a new view is created for it.
+Primitives are shared between consumers and should not be changed.
+"""
+import contextlib
+import hashlib
+import threading
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Hashable
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Sequence
+from typing import Tuple
+from typing import Union
+
+import numpy as np
+import pandas as pd
+
+
+class ColumnView:
+    """Lazily calculated primitives of a column"""
+
+    column: pd.Series
+
+    def __init__(self, column: pd.Series, dataset: Optional["DatasetView"] = None):
+        self.column = column
+        self._dataset = dataset
+        self._primitives: Dict[Hashable, Any] = {}
+
+    def _get(self, key: Hashable, calculate: Callable[[], Any]) -> Any:
+        # concurrent consumers can calculate a primitive twice, but all of them get the same result
+        if key not in self._primitives:
+            self._primitives[key] = calculate()
+
+        return self._primitives[key]
+
+    def get_or_calculate(self, key: Hashable, calculate: Callable[[], Any]) -> Any:
+        """A primitive defined outside of the view, see `evidently.utils.histograms`"""
+        return self._get(key, calculate)
+
+    def _derive(self, column: pd.Series) -> "ColumnView":
+        if self._dataset is None:
+            return ColumnView(column)
+
+        return self._dataset.add_column_view(column)
+
+    def null_mask(self) -> np.ndarray:
+        """Boolean mask of NaN and None values"""
+        return self._get("null_mask", lambda: self.column.isnull().to_numpy())
+
+    def null_count(self) -> int:
+        return self._get("null_count", lambda: int(self.null_mask().sum()))
+
+    def not_null(self) -> pd.Series:
+        """The column without NaN values"""
+        return self._get("not_null", lambda: self.column[~self.null_mask()] if self.null_count() else self.column)
+
+    def not_null_view(self) -> "ColumnView":
+        return self._get("not_null_view", lambda: self._derive(self.not_null()))
+
+    def finite(self) -> pd.Series:
+        """The column without NaN and infinite values"""
+        return self._get("finite", lambda: self.column.replace([-np.inf, np.inf], np.nan).dropna())
+
+    def finite_view(self) -> "ColumnView":
+        return self._get("finite_view", lambda: self._derive(self.finite()))
+
+    def sorted_finite_values(self) -> np.ndarray:
+        return self._get("sorted_finite_values", lambda: np.sort(self.finite().to_numpy()))
+
+    def value_counts(self, dropna: bool = True) -> pd.Series:
+        """Counts of values sorted by count in descending order, the same as `Series.value_counts`"""
+        return self._get(("value_counts", dropna), lambda: self.column.value_counts(dropna=dropna))
+
+    def nunique(self) -> int:
+        """Number of unique values without NaN"""
+        return self._get("nunique", lambda: int(self.column.nunique()))
+
+    def unique(self) -> np.ndarray:
+        """Unique values in order of appearance including NaN, the same as `Series.unique`"""
+        return self._get("unique", self.column.unique)
+
+    def value_hashes(self) -> np.ndarray:
+        """64-bit hashes of the values, the same as `pd.util.hash_pandas_object(column, index=False)`
+        except that negative zeros have the hash of positive zeros: pandas treats them as equal values.
+
+        Raises TypeError for values that pandas cannot hash.
+        """
+        return self._get("value_hashes", self._calculate_value_hashes)
+
+    def _calculate_value_hashes(self) -> np.ndarray:
+        column = self.column
+
+        if column.dtype.kind == "f":
+            # adding zero turns negative zeros into positive ones
+            column = column + 0.0
+
+        return pd.util.hash_pandas_object(column, index=False).to_numpy()
+
+    def negative_zeros(self) -> np.ndarray:
+        """Positions of negative zeros in a float column, their hashes are equal to hashes of positive zeros"""
+        return self._get("negative_zeros", self._calculate_negative_zeros)
+
+    def _calculate_negative_zeros(self) -> np.ndarray:
+        if self.column.dtype.kind != "f":
+            return np.empty(0, dtype=np.int64)
+
+        values = self.column.to_numpy(dtype=np.float64, na_value=np.nan)
+        return np.flatnonzero((values == 0) & np.signbit(values)).astype(np.int64)
+
+    def content_hash(self) -> bytes:
+        """Digest of the column values without the index, equal for equal values.
+
+        Raises TypeError for values that pandas cannot hash.
+        """
+        return self._get("content_hash", self._calculate_content_hash)
+
+    def _calculate_content_hash(self) -> bytes:
+        return hashlib.blake2b(self.value_hashes().tobytes(), digest_size=20).digest()
+
+    def index_hash(self) -> bytes:
+        """Digest of the index of the column, raises TypeError for labels that pandas cannot hash"""
+        return self._get("index_hash", self._calculate_index_hash)
+
+    def _calculate_index_hash(self) -> bytes:
+        index = self.column.index
+        digest = hashlib.blake2b(repr((type(index).__name__, index.names, str(index.dtype))).encode(), digest_size=20)
+
+        if isinstance(index, pd.RangeIndex):
+            digest.update(repr((index.start, index.stop, index.step)).encode())
+
+        else:
+            digest.update(pd.util.hash_pandas_object(index).to_numpy().tobytes())
+
+        return digest.digest()
+
+
+class DatasetView:
+    """Column views of a data frame and of the columns derived from them"""
+
+    data: pd.DataFrame
+
+    def __init__(self, data: pd.DataFrame):
+        self.data = data
+        self._columns: Dict[Hashable, ColumnView] = {}
+        # views by id of their column, the views keep the columns alive, so the ids are not reused
+        self._views_by_id: Dict[int, ColumnView] = {}
+        self._row_hashes: Dict[Tuple[Hashable, ...], np.ndarray] = {}
+        self._lock = threading.Lock()
+
+    def column(self, name: Hashable) -> ColumnView:
+        column = self.data[name]
+
+        with self._lock:
+            view = self._columns.get(name)
+
+            if view is None or view.column is not column:
+                view = ColumnView(column, self)
+                self._columns[name] = view
+                self._views_by_id[id(column)] = view
+
+            return view
+
+    def add_column_view(self, column: pd.Series) -> ColumnView:
+        """Create a view of a column derived from the data, it can be found by `find_column_view` later"""
+        with self._lock:
+            view = ColumnView(column, self)
+            self._views_by_id[id(column)] = view
+            return view
+
+    def find_column_view(self, column: pd.Series) -> Optional[ColumnView]:
+        """Find a view of the column if it is a column of the data or a column derived from it"""
+        view = self._views_by_id.get(id(column))
+
+        if view is not None and view.column is column:
+            return view
+
+        try:
+            if self.data[column.name] is column:
+                return self.column(column.name)
+
+        except (KeyError, TypeError):
+            pass
+
+        return None
+
+    def null_mask(self, columns: Optional[Sequence[Hashable]] = None) -> np.ndarray:
+        """Two-dimensional null mask of the columns (all columns by default) built from the column views"""
+        if columns is None:
+            columns = list(self.data.columns)
+
+        if len(columns) == 0:
+            return np.zeros((self.data.shape[0], 0), dtype=bool)
+
+        return np.column_stack([self.column(name).null_mask() for name in columns])
+
+    def row_hashes(self, columns: Sequence[Hashable]) -> np.ndarray:
+        """64-bit hashes of rows of the columns, the same as `pd.util.hash_pandas_object(data[columns], index=False)`
+        except for negative zeros, see `ColumnView.value_hashes`.
+
+        Hashes are combined from the hashes of the column views. Raises TypeError for values that pandas cannot hash.
+        """
+        key = tuple(columns)
+
+        with self._lock:
+            hashes = self._row_hashes.get(key)
+
+        if hashes is None:
+            hashes = _combine_hashes([self.column(name).value_hashes() for name in columns], self.data.shape[0])
+
+            with self._lock:
+                self._row_hashes[key] = hashes
+
+        return hashes
+
+    def duplicated(self, columns: Sequence[Hashable], keep: Union[str, bool] = "first") -> np.ndarray:
+        """Mask of duplicated rows of the columns, the same as `DataFrame.duplicated`.
+
+        Only rows with equal hashes are compared, other rows cannot be duplicates.
+        """
+        if len(columns) == 0:
+            # pandas does not find duplicates without columns either
+            return np.zeros(self.data.shape[0], dtype=bool)
+
+        subset = self.data[list(columns)]
+
+        try:
+            hashes = self.row_hashes(columns)
+
+        except TypeError:
+            return subset.duplicated(keep=keep).to_numpy()
+
+        candidates = np.flatnonzero(pd.Index(hashes).duplicated(keep=False))
+        result = np.zeros(self.data.shape[0], dtype=bool)
+
+        if candidates.shape[0] > 0:
+            result[candidates] = subset.iloc[candidates].duplicated(keep=keep).to_numpy()
+
+        return result
+
+
+def _combine_hashes(hashes: List[np.ndarray], size: int) -> np.ndarray:
+    """Hashes of rows from hashes of columns, the same way as in `pd.util.hash_pandas_object` for data frames"""
+    multiplier = np.uint64(1000003)
+    result = np.full(size, 0x345678, dtype=np.uint64)
+
+    for i, column_hashes in enumerate(hashes):
+        inverse_i = len(hashes) - i
+        result ^= column_hashes
+        result *= multiplier
+        multiplier += np.uint64(82520 + inverse_i + inverse_i)
+
+    result += np.uint64(97531)
+    return result
+
+
+# views registered for running suites and pipelines: id of data frame -> (data frame, view, number of registrations)
+_registered_views: Dict[int, Tuple[pd.DataFrame, DatasetView, int]] = {}
+_registered_views_lock = threading.Lock()
+
+
+@contextlib.contextmanager
+def register_dataset_views(*frames: Optional[pd.DataFrame]) -> Iterator[Tuple[Optional[DatasetView], ...]]:
+    """Share views of the data frames with all consumers in the context, including other threads.
+
+    Yields views in the same order as the frames (None for None frames).
+    A frame that is already registered keeps its view, so nested runs over the same data share it too.
+    """
+    registered: List[int] = []
+    views: List[Optional[DatasetView]] = []
+
+    with _registered_views_lock:
+        for frame in frames:
+            if frame is None:
+                views.append(None)
+                continue
+
+            key = id(frame)
+            _, view, count = _registered_views.get(key, (frame, DatasetView(frame), 0))
+            _registered_views[key] = (frame, view, count + 1)
+            registered.append(key)
+            views.append(view)
+
+    try:
+        yield tuple(views)
+
+    finally:
+        with _registered_views_lock:
+            for key in registered:
+                frame, view, count = _registered_views[key]
+
+                if count > 1:
+                    _registered_views[key] = (frame, view, count - 1)
+
+                else:
+                    del _registered_views[key]
+
+
+def get_dataset_view(frame: pd.DataFrame) -> DatasetView:
+    """Get the registered view of the data frame or a new not shared view"""
+    registered = _registered_views.get(id(frame))
+
+    if registered is not None and registered[0] is frame:
+        return registered[1]
+
+    return DatasetView(frame)
+
+
+def get_column_view(column: pd.Series) -> ColumnView:
+    """Get the shared view of a column of registered data (or of a column derived from it) or a new not shared view"""
+    with _registered_views_lock:
+        views = [view for _, view, _ in _registered_views.values()]
+
+    for view in views:
+        column_view = view.find_column_view(column)
+
+        if column_view is not None:
+            return column_view
+
+    return ColumnView(column)
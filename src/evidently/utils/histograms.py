@@ -0,0 +1,121 @@
+"""Histograms of numerical columns shared by drift calculations, metrics and widgets.
+
+Histograms are calculated from sorted finite values of a column that its view keeps once
+(see `evidently.utils.dataset_view`): counts for any bins take a binary search per bin edge
+instead of a pass over the values. Bin edges of a group of columns (like reference and current values
+of a feature) and counts of a column are kept in the column views by the bin spec,
+so all consumers of the same histogram in a run share it.
+
+Results are the same as results of `np.histogram_bin_edges` and `np.histogram` for finite values of the columns.
+"""
+from typing import Optional
+from typing import Sequence
+from typing import Tuple
+from typing import Union
+
+import numpy as np
+
+from evidently.utils.dataset_view import ColumnView
+from evidently.utils.reference_cache import ReferenceCache
+from evidently.utils.reference_cache import get_or_calculate
+
+# number of equal-width bins or a name of a `np.histogram_bin_edges` rule
+BinSpec = Union[int, str]
+
+# rules of `np.histogram_bin_edges` that depend only on the range and the number of values:
+# the bin width is the range divided by the value of the function of the number of values
+_SIZE_RULES = {
+    "sqrt": np.sqrt,
+    "sturges": lambda size: np.log2(size) + 1.0,
+    "rice": lambda size: 2.0 * size ** (1.0 / 3),
+}
+
+
+def get_sorted_values(view: ColumnView, reference_cache: Optional[ReferenceCache] = None) -> np.ndarray:
+    """Sorted finite values of a numerical column as floats.
+
+    Sorted values of reference columns can be kept in a reference cache, to share them between runs.
+    """
+
+    def calculate() -> np.ndarray:
+        return np.asarray(view.sorted_finite_values(), dtype=float)
+
+    return view.get_or_calculate(
+        "sorted_float_values",
+        lambda: get_or_calculate(reference_cache, "histogram_sorted_values", view.column, calculate),
+    )
+
+
+def calculate_bin_edges(first_edge: float, last_edge: float, size: int, bins: BinSpec) -> np.ndarray:
+    """Bin edges of values with the range and the number of values.
+
+    The same as `np.histogram_bin_edges` for a number of bins and the "sqrt", "sturges" and "rice" rules.
+    """
+    if size == 0:
+        first_edge, last_edge = 0.0, 1.0
+
+    values_range = last_edge - first_edge
+
+    if first_edge == last_edge:
+        first_edge, last_edge = first_edge - 0.5, last_edge + 0.5
+
+    if isinstance(bins, str):
+        width = values_range / _SIZE_RULES[bins](size) if size else 0.0
+        n_bins = int(np.ceil((last_edge - first_edge) / width)) if width else 1
+
+    else:
+        n_bins = bins
+
+    return np.linspace(first_edge, last_edge, n_bins + 1, endpoint=True)
+
+
+def get_bin_edges(views: Sequence[ColumnView], bins: BinSpec) -> np.ndarray:
+    """Bin edges of finite values of all the columns, the same as `np.histogram_bin_edges` of the values"""
+    return views[0].get_or_calculate(("bin_edges", bins, tuple(views[1:])), lambda: _calculate_bin_edges(views, bins))
+
+
+def _calculate_bin_edges(views: Sequence[ColumnView], bins: BinSpec) -> np.ndarray:
+    values = [get_sorted_values(view) for view in views]
+
+    if not isinstance(bins, str) or bins in _SIZE_RULES:
+        not_empty = [view_values for view_values in values if view_values.shape[0] > 0]
+        return calculate_bin_edges(
+            min((view_values[0] for view_values in not_empty), default=0.0),
+            max((view_values[-1] for view_values in not_empty), default=0.0),
+            sum(view_values.shape[0] for view_values in values),
+            bins,
+        )
+
+    # other rules need all the values
+    return np.histogram_bin_edges(np.concatenate(values), bins=bins)
+
+
+def get_histogram(
+    view: ColumnView, bins: Union[BinSpec, np.ndarray], density: bool = False
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Histogram of finite values of a column, the same as `np.histogram`.
+
+    Args:
+        view: view of the column.
+        bins: bin edges, a number of equal-width bins or a rule for the values of the column.
+        density: return densities of the values in bins instead of the counts.
+    Returns:
+        counts or densities of values in bins and the bin edges.
+    """
+    bin_edges = bins if isinstance(bins, np.ndarray) else get_bin_edges([view], bins)
+    counts = view.get_or_calculate(
+        ("histogram", bin_edges.tobytes()), lambda: _count_sorted(get_sorted_values(view), bin_edges)
+    )
+
+    if density:
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return counts / np.diff(bin_edges).astype(float) / counts.sum(), bin_edges
+
+    return counts, bin_edges
+
+
+def _count_sorted(sorted_values: np.ndarray, bin_edges: np.ndarray) -> np.ndarray:
+    positions = np.searchsorted(sorted_values, bin_edges, side="left")
+    # the last bin includes its right edge
+    positions[-1] = np.searchsorted(sorted_values, bin_edges[-1], side="right")
+    return np.diff(positions)
@@ -0,0 +1,239 @@
+"""Quality metrics of probabilistic multiclass classification with many classes.
+
+Probabilities of all classes are sorted with a single `np.sort` call, one-vs-rest ROC AUC of every class
+is derived from its sorted probabilities without a binarized matrix of the target. The confusion matrix is counted
+as a sparse matrix. Detailed data (curves, PR tables, confusion matrix cells and metrics of classes) is calculated
+for the top classes by support or by errors only, aggregated metrics are calculated over all classes.
+"""
+import dataclasses
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Sequence
+
+import numpy as np
+import pandas as pd
+from scipy import sparse
+
+from evidently.utils.confusion_matrix import BinaryThresholdSweep
+from evidently.utils.confusion_matrix import ConfusionMatrixMetrics
+from evidently.utils.confusion_matrix import get_confusion_matrix_metrics
+from evidently.utils.confusion_matrix import get_sparse_confusion_matrix
+from evidently.utils.curves import get_pr_curve
+from evidently.utils.curves import get_pr_table
+from evidently.utils.curves import get_roc_curve
+
+TOP_CLASSES_BY = ("support", "error")
+
+
+@dataclasses.dataclass
+class SparseConfusionMatrix:
+    """Non-zero cells of a confusion matrix.
+
+    Attributes:
+        labels: sorted labels that are present in the target or in the prediction.
+        true_positions: positions of true labels of cells in `labels`.
+        predicted_positions: positions of predicted labels of cells in `labels`.
+        counts: numbers of rows in cells.
+    """
+
+    labels: list
+    true_positions: List[int]
+    predicted_positions: List[int]
+    counts: List[int]
+
+
+@dataclasses.dataclass
+class MulticlassMetrics:
+    """Quality metrics of all classes with detailed data of the top classes.
+
+    Attributes:
+        quality_metrics: metrics of predicted labels, `metrics_matrix` has metrics of the top classes only.
+        top_labels: the top classes in the order of labels.
+        confusion_matrix: cells of the confusion matrix between the top classes.
+        confusion_by_classes: TP, TN, FP and FN of the top classes.
+        sparse_confusion_matrix: non-zero cells of the confusion matrix of all classes.
+        roc_auc: macro averaged ROC AUC of classes that are present in the target and not in all rows.
+        log_loss: the same as `sklearn.metrics.log_loss` with the default `eps`.
+        roc_aucs: ROC AUC of every class, NaN if it cannot be calculated.
+        roc_curve: ROC curves of the top classes.
+        pr_curve: precision-recall curves of the top classes.
+        pr_table: PR tables of the top classes.
+
+    Metrics of probabilities are None if there are no probabilities.
+    """
+
+    quality_metrics: ConfusionMatrixMetrics
+    top_labels: list
+    confusion_matrix: list
+    confusion_by_classes: Dict[str, Dict[str, int]]
+    sparse_confusion_matrix: SparseConfusionMatrix
+    roc_auc: Optional[float] = None
+    log_loss: Optional[float] = None
+    roc_aucs: Optional[list] = None
+    roc_curve: Optional[dict] = None
+    pr_curve: Optional[dict] = None
+    pr_table: Optional[dict] = None
+
+
+def get_top_positions(matrix: sparse.spmatrix, top_classes: int, top_classes_by: str) -> np.ndarray:
+    """Sorted positions of the top classes of a confusion matrix.
+
+    Classes are chosen by support (rows of the class in the target) or by errors (false negatives
+    and false positives of the class), classes with the same value are chosen in the order of labels.
+    """
+    if top_classes_by not in TOP_CLASSES_BY:
+        raise ValueError(f"Unexpected top_classes_by {top_classes_by}. Expected [{','.join(TOP_CLASSES_BY)}]")
+
+    support = np.asarray(matrix.sum(axis=1)).ravel()
+
+    if top_classes_by == "support":
+        scores = support
+
+    else:
+        scores = support + np.asarray(matrix.sum(axis=0)).ravel() - 2 * matrix.diagonal()
+
+    return np.sort(np.argsort(-scores, kind="stable")[:top_classes])
+
+
+def _get_confusion_by_classes(
+    matrix: sparse.spmatrix, labels: Sequence[Any], positions: np.ndarray
+) -> Dict[str, Dict[str, int]]:
+    """The same as `calculate_confusion_by_classes` for classes at `positions` of a sparse matrix"""
+    true_positive = matrix.diagonal()
+    false_positive = np.asarray(matrix.sum(axis=0)).ravel() - true_positive
+    false_negative = np.asarray(matrix.sum(axis=1)).ravel() - true_positive
+    true_negative = matrix.sum() - (false_positive + false_negative + true_positive)
+    return {
+        str(labels[position]): {
+            "tp": true_positive[position],
+            "tn": true_negative[position],
+            "fp": false_positive[position],
+            "fn": false_negative[position],
+        }
+        for position in positions
+    }
+
+
+def _get_target_positions(target: pd.Series, probas: pd.DataFrame) -> np.ndarray:
+    """Positions of columns of probabilities of target labels matched as strings, -1 if there is no column"""
+    return pd.Index([str(column) for column in probas.columns]).get_indexer(target.astype(str))
+
+
+def _get_log_loss(target_positions: np.ndarray, probas: np.ndarray) -> float:
+    eps = np.finfo(probas.dtype).eps
+    clipped = np.clip(probas, eps, 1 - eps)
+    rows = np.flatnonzero(target_positions >= 0)
+    true_probas = clipped[rows, target_positions[rows]] / clipped[rows].sum(axis=1)
+    return float(-np.log(true_probas).sum() / len(target_positions))
+
+
+def get_roc_aucs(target_positions: np.ndarray, probas: np.ndarray) -> np.ndarray:
+    """One-vs-rest ROC AUC of every column of probabilities, the same as `sklearn.metrics.roc_auc_score`.
+
+    ROC AUC is the share of pairs of a row with the label and a row without it where the probability
+    of the former is greater, pairs with equal probabilities count as halves. It is NaN if there are no rows
+    with the label or all rows have it.
+
+    Args:
+        target_positions: positions of columns of target labels of rows, -1 if there is no column.
+        probas: probabilities of labels in columns.
+    """
+    size, columns_count = probas.shape
+    # a copy with probabilities of every label in a row to sort them fast
+    sorted_probas = np.array(probas.T, order="C")
+    sorted_probas.sort(axis=1)
+    rows_order = np.argsort(target_positions, kind="stable")
+    bounds = np.searchsorted(target_positions[rows_order], np.arange(columns_count + 1))
+    roc_aucs = np.full(columns_count, np.nan)
+
+    for position in range(columns_count):
+        positive_probas = probas[rows_order[bounds[position]:bounds[position + 1]], position]
+        positives = len(positive_probas)
+        negatives = size - positives
+
+        if positives == 0 or negatives == 0:
+            continue
+
+        # numbers of rows without the label with lower and with equal probabilities for every row with the label
+        sorted_positive_probas = np.sort(positive_probas)
+        lower = np.searchsorted(sorted_probas[position], positive_probas, side="left") - np.searchsorted(
+            sorted_positive_probas, positive_probas, side="left"
+        )
+        lower_or_equal = np.searchsorted(sorted_probas[position], positive_probas, side="right") - np.searchsorted(
+            sorted_positive_probas, positive_probas, side="right"
+        )
+        roc_aucs[position] = (lower.sum() + lower_or_equal.sum()) / (2 * positives * negatives)
+
+    return roc_aucs
+
+
+def get_log_loss(target: pd.Series, probas: pd.DataFrame) -> float:
+    """Log loss without a binarized matrix of the target, the same as `sklearn.metrics.log_loss` with the default `eps`.
+
+    Target labels are matched with columns of probabilities as strings, rows with labels without probabilities add 0.
+    """
+    return _get_log_loss(_get_target_positions(target, probas), probas.to_numpy(dtype=np.float64))
+
+
+def get_multiclass_metrics(
+    target: pd.Series,
+    prediction: Sequence[Any],
+    probas: Optional[pd.DataFrame],
+    top_classes: int,
+    top_classes_by: str = "support",
+    max_curve_points: Optional[int] = None,
+) -> MulticlassMetrics:
+    """Quality metrics of labels predicted as the most probable ones and of probabilities of labels.
+
+    Target labels are matched with columns of probabilities as strings.
+
+    Args:
+        target: true labels without missing values.
+        prediction: predicted labels.
+        probas: probabilities of labels in columns named by labels, if there are any.
+        top_classes: number of classes to calculate detailed data for.
+        top_classes_by: "support" or "error", how to choose the top classes.
+        max_curve_points: if set, curves are reduced to this number of points.
+    """
+    matrix, labels = get_sparse_confusion_matrix(target, prediction)
+    top_positions = get_top_positions(matrix, top_classes, top_classes_by)
+    top_labels = [labels[position] for position in top_positions]
+    quality_metrics = get_confusion_matrix_metrics(matrix, labels, "macro", report_labels=set(top_labels))
+    coo_matrix = matrix.tocoo()
+    result = MulticlassMetrics(
+        quality_metrics=quality_metrics,
+        top_labels=top_labels,
+        confusion_matrix=matrix[top_positions][:, top_positions].toarray().tolist(),
+        confusion_by_classes=_get_confusion_by_classes(matrix, labels, top_positions),
+        sparse_confusion_matrix=SparseConfusionMatrix(
+            labels=labels,
+            true_positions=coo_matrix.row.tolist(),
+            predicted_positions=coo_matrix.col.tolist(),
+            counts=coo_matrix.data.tolist(),
+        ),
+    )
+
+    if probas is None:
+        return result
+
+    target_positions = _get_target_positions(target, probas)
+    array_probas = probas.to_numpy(dtype=np.float64)
+    roc_aucs = get_roc_aucs(target_positions, array_probas)
+    result.roc_aucs = roc_aucs.tolist()
+    result.roc_auc = float(np.nanmean(roc_aucs)) if not np.isnan(roc_aucs).all() else np.nan
+    result.log_loss = _get_log_loss(target_positions, array_probas)
+    top_columns = {str(label) for label in top_labels}
+    result.roc_curve = {}
+    result.pr_curve = {}
+    result.pr_table = {}
+
+    for position, label in enumerate(probas.columns):
+        if str(label) in top_columns:
+            sweep = BinaryThresholdSweep(target_positions == position, array_probas[:, position])
+            result.roc_curve[label] = get_roc_curve(sweep, max_curve_points)
+            result.pr_curve[label] = get_pr_curve(sweep, max_curve_points)
+            result.pr_table[label] = get_pr_table(sweep)
+
+    return result
@@ -4,8 +4,6 @@ import json
 import numpy as np
 import pandas as pd
 
-from evidently.tests.utils import ApproxValue
-
 
 _TYPES_MAPPING = (
     (
@@ -18,8 +16,6 @@ _TYPES_MAPPING = (
     ((pd.Timedelta, ), str),
     ((np.void, type(pd.NaT)), lambda obj: None),  # should be before datetime as NaT is subclass of datetime.
     ((pd.Timestamp, datetime.datetime, datetime.date), lambda obj: obj.isoformat()),
-    # map ApproxValue to json value
-    ((ApproxValue, ), lambda obj: obj.as_dict()),
 )
 
 
@@ -32,8 +28,15 @@ class NumpyEncoder(json.JSONEncoder):
 
         If we cannot convert the object, leave the default `JSONEncoder` behaviour - raise a TypeError exception.
         """
+        # imported here: evidently.tests imports metrics that import evidently.utils modules
+        from evidently.tests.utils import ApproxValue
+
         for types_list, python_type in _TYPES_MAPPING:
             if isinstance(o, types_list):
                 return python_type(o)
 
+        # map ApproxValue to json value
+        if isinstance(o, ApproxValue):
+            return o.as_dict()
+
         return json.JSONEncoder.default(self, o)
@@ -0,0 +1,24 @@
+from concurrent.futures import Executor
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import ThreadPoolExecutor
+
+THREAD_BACKEND = "thread"
+PROCESS_BACKEND = "process"
+
+EXECUTION_BACKENDS = {
+    THREAD_BACKEND: ThreadPoolExecutor,
+    PROCESS_BACKEND: ProcessPoolExecutor,
+}
+
+
+def check_execution_parameters(n_jobs: int, backend: str) -> None:
+    if n_jobs < 1:
+        raise ValueError(f"n_jobs should be a positive number, got {n_jobs}")
+
+    if backend not in EXECUTION_BACKENDS:
+        raise ValueError(f"Unexpected backend {backend}. Expected [{','.join(EXECUTION_BACKENDS.keys())}]")
+
+
+def create_executor(n_jobs: int, backend: str) -> Executor:
+    check_execution_parameters(n_jobs, backend)
+    return EXECUTION_BACKENDS[backend](max_workers=n_jobs)
@@ -0,0 +1,297 @@
+"""Cache of intermediate results that depend on reference data only.
+
+A reference dataset is often the same for many runs while the current data changes.
+Analyzers and metrics keep reference-only intermediates (value counts, histograms, sorted values, feature statistics,
+correlation matrices) in a cache with a key built from a content hash of the reference columns with their index
+and the parameters of the calculation, so equal reference data is not processed again.
+
+Entries are kept in memory with LRU eviction. If a directory is set, entries are also saved to `.npz` files in it
+and are available for later runs and other processes. Values that are not plain numpy arrays are pickled
+into the files: use only trusted directories.
+
+A cache can be activated for a block of code with `activate_reference_cache`: analyzers and metrics without
+a cache in their options use the active one, for example in segmented runs over the same reference data.
+"""
+import contextlib
+import hashlib
+import os
+import pickle
+import tempfile
+import threading
+import zipfile
+from collections import OrderedDict
+from typing import Any
+from typing import Callable
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Sequence
+from typing import Tuple
+from typing import TypeVar
+from typing import Union
+
+import numpy as np
+import pandas as pd
+
+from evidently._version import __version__
+from evidently.utils.dataset_view import get_column_view
+
+# entries in memory that a cache keeps by default
+DEFAULT_MAX_SIZE = 256
+# change it when the format of files or cached values is changed
+CACHE_FORMAT_VERSION = 2
+
+TValue = TypeVar("TValue")
+# reference data of a cached value: a column, a data frame or a list of columns
+CacheData = Union[pd.Series, pd.DataFrame, Sequence[pd.Series]]
+
+
+class ReferenceCache:
+    """Cache of reference-only intermediates with in-memory LRU eviction and an optional on-disk backend.
+
+    Values are shared between the callers: they should not be changed after they are got from the cache.
+
+    Args:
+        directory: a directory for `.npz` files with cached values. If None, the values are kept in memory only.
+        max_size: maximum number of entries in memory.
+    """
+
+    directory: Optional[str]
+    max_size: int
+    hits: int
+    misses: int
+
+    def __init__(self, directory: Optional[str] = None, max_size: int = DEFAULT_MAX_SIZE):
+        if max_size < 1:
+            raise ValueError(f"max_size should be a positive number, got {max_size}")
+
+        self.directory = directory
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[str, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+
+    def __getstate__(self):
+        # a copy of the cache in a worker process starts with empty memory and uses the same directory
+        state = self.__dict__.copy()
+        state["_entries"] = OrderedDict()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def __deepcopy__(self, memo):
+        # the cache is shared state: copies of metrics and options should use the same cache
+        return self
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self) -> None:
+        """Remove all entries from memory. Files in the directory are kept"""
+        with self._lock:
+            self._entries.clear()
+
+    def get_or_calculate(self, name: str, data: CacheData, calculate: Callable[[], TValue], *parameters: Any) -> TValue:
+        """Get a cached value or calculate and cache it.
+
+        Args:
+            name: name of the intermediate, different calculations should use different names.
+            data: reference data that the value is calculated from.
+            calculate: a function without arguments that calculates the value.
+            parameters: other parameters of the calculation, their `repr` is a part of the key.
+        """
+        try:
+            key = make_key(name, data, *parameters)
+
+        except TypeError:
+            # values that pandas cannot hash, for example lists in cells
+            return calculate()
+
+        found, value = self._get(key)
+
+        if found:
+            return value
+
+        value = calculate()
+        self._set(key, value)
+        return value
+
+    def _get(self, key: str) -> Tuple[bool, Any]:
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return True, self._entries[key]
+
+        found, value = self._load(key)
+
+        with self._lock:
+            if found:
+                self.hits += 1
+                self._add_entry(key, value)
+
+            else:
+                self.misses += 1
+
+        return found, value
+
+    def _set(self, key: str, value: Any) -> None:
+        if isinstance(value, np.ndarray):
+            value.flags.writeable = False
+
+        with self._lock:
+            self._add_entry(key, value)
+
+        self._save(key, value)
+
+    def _add_entry(self, key: str, value: Any) -> None:
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def _get_path(self, key: str) -> Optional[str]:
+        if self.directory is None:
+            return None
+
+        return os.path.join(self.directory, f"{key}.npz")
+
+    def _load(self, key: str) -> Tuple[bool, Any]:
+        path = self._get_path(key)
+
+        if path is None or not os.path.exists(path):
+            return False, None
+
+        try:
+            with np.load(path, allow_pickle=False) as stored:
+                if "array" in stored:
+                    value = stored["array"]
+                    value.flags.writeable = False
+                    return True, value
+
+                return True, pickle.loads(stored["pickled"].tobytes())
+
+        except (OSError, ValueError, KeyError, EOFError, pickle.UnpicklingError, zipfile.BadZipFile):
+            # a broken or incompatible file is calculated again and overwritten
+            return False, None
+
+    def _save(self, key: str, value: Any) -> None:
+        path = self._get_path(key)
+
+        if path is None:
+            return
+
+        if isinstance(value, np.ndarray) and not value.dtype.hasobject:
+            arrays = {"array": value}
+
+        else:
+            arrays = {"pickled": np.frombuffer(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL), dtype=np.uint8)}
+
+        # write to a temporary file first: other processes should never read a partially written entry
+        handle, temp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+
+        try:
+            with os.fdopen(handle, "wb") as file:
+                np.savez(file, **arrays)
+
+            os.replace(temp_path, path)
+
+        except BaseException:
+            os.remove(temp_path)
+            raise
+
+
+def make_key(name: str, data: CacheData, *parameters: Any) -> str:
+    """Build a cache key from the name of an intermediate, the content of reference data and parameters.
+
+    The index of the data is a part of the key: cached values, such as data frames and columns without
+    missing values, keep the index of the data that they are calculated from.
+    Hashes of columns of registered data are calculated once per run (see `evidently.utils.dataset_view`).
+    """
+    if isinstance(data, pd.Series):
+        columns = [data]
+
+    elif not isinstance(data, pd.DataFrame):
+        columns = list(data)
+
+    elif data.columns.is_unique:
+        columns = [data[column_name] for column_name in data.columns]
+
+    else:
+        columns = [data.iloc[:, position] for position in range(data.shape[1])]
+
+    digest = hashlib.blake2b(digest_size=20)
+    digest.update(repr((CACHE_FORMAT_VERSION, __version__, name, parameters)).encode())
+    digest.update(
+        repr(
+            (
+                [column.name for column in columns],
+                [str(column.dtype) for column in columns],
+                (len(columns[0]) if columns else 0, len(columns)),
+            )
+        ).encode()
+    )
+
+    for column in columns:
+        view = get_column_view(column)
+        digest.update(view.content_hash())
+        # cached values keep the sign of zeros, for example minimums
+        digest.update(view.negative_zeros().tobytes())
+        digest.update(view.index_hash())
+
+    return digest.hexdigest()
+
+
+# caches activated for all threads: the last one is used
+_active_caches: List[ReferenceCache] = []
+_active_caches_lock = threading.Lock()
+
+
+@contextlib.contextmanager
+def activate_reference_cache(cache: Optional[ReferenceCache]) -> Iterator[Optional[ReferenceCache]]:
+    """Use the cache in the context (including other threads) where analyzers and metrics do not set a cache"""
+    if cache is None:
+        yield None
+        return
+
+    with _active_caches_lock:
+        _active_caches.append(cache)
+
+    try:
+        yield cache
+
+    finally:
+        with _active_caches_lock:
+            _active_caches.remove(cache)
+
+
+def get_active_reference_cache() -> Optional[ReferenceCache]:
+    active_caches = _active_caches
+    return active_caches[-1] if active_caches else None
+
+
+def resolve_reference_cache(cache: Optional[ReferenceCache]) -> Optional[ReferenceCache]:
+    """Get the cache set in options or the active cache if it is not set"""
+    return cache if cache is not None else get_active_reference_cache()
+
+
+def get_or_calculate(
+    cache: Optional[ReferenceCache],
+    name: str,
+    data: CacheData,
+    calculate: Callable[[], TValue],
+    *parameters: Any,
+) -> TValue:
+    """Use the cache if it is set, otherwise just calculate the value"""
+    if cache is None:
+        return calculate()
+
+    return cache.get_or_calculate(name, data, calculate, *parameters)
@@ -0,0 +1,211 @@
+"""Instrumentation of suite and pipeline runs.
+
+Time and memory of every metric, analyzer, widget, stage, test and renderer call are recorded
+to the run stats that is active in the current thread. Calls outside an active run stats are not measured.
+
+Memory is measured with `tracemalloc` and only if `RunStats.trace_memory` is enabled: tracing slows down allocations.
+With concurrent calculation in threads the peak memory of a call includes allocations of other threads.
+"""
+import contextlib
+import dataclasses
+import threading
+import time
+import tracemalloc
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+# time.thread_time is available since python 3.7, without it CPU time includes other threads of the process
+_thread_time = getattr(time, "thread_time", time.process_time)
+
+
+class CallKind:
+    METRIC = "metric"
+    ANALYZER = "analyzer"
+    WIDGET = "widget"
+    STAGE = "stage"
+    TEST = "test"
+    RENDERER = "renderer"
+
+
+@dataclasses.dataclass
+class CallStats:
+    kind: str
+    name: str
+    # seconds
+    wall_time: float
+    # seconds of CPU time of the thread that made the call (of the process with python 3.6)
+    cpu_time: float
+    # peak of allocated memory during the call in bytes, None if memory is not traced
+    peak_memory: Optional[int] = None
+
+
+RunStatsCallback = Callable[[CallStats], None]
+
+
+class RunStats:
+    """Collects stats of calls made during a run.
+
+    Callbacks are called with every recorded call, for example to forward them to an external tracer.
+    """
+
+    trace_memory: bool
+    calls: List[CallStats]
+    callbacks: List[RunStatsCallback]
+
+    def __init__(self, trace_memory: bool = False, callbacks: Optional[List[RunStatsCallback]] = None):
+        self.trace_memory = trace_memory
+        self.calls = []
+        self.callbacks = list(callbacks) if callbacks is not None else []
+        self._lock = threading.Lock()
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def add_callback(self, callback: RunStatsCallback) -> None:
+        self.callbacks.append(callback)
+
+    def clear(self) -> None:
+        self.calls = []
+
+    def record(self, call: CallStats) -> None:
+        with self._lock:
+            self.calls.append(call)
+
+        for callback in self.callbacks:
+            callback(call)
+
+    @contextlib.contextmanager
+    def activate(self) -> Iterator["RunStats"]:
+        """Record calls measured in the current thread to the run stats"""
+        start_tracing = self.trace_memory and not tracemalloc.is_tracing()
+
+        if start_tracing:
+            tracemalloc.start()
+
+        _get_active_stack().append(self)
+
+        try:
+            yield self
+
+        finally:
+            _get_active_stack().pop()
+
+            if start_tracing:
+                tracemalloc.stop()
+
+    def as_dict(self) -> dict:
+        totals: Dict[str, Dict[str, float]] = {}
+
+        for call in self.calls:
+            total = totals.setdefault(call.kind, {"count": 0, "wall_time": 0.0, "cpu_time": 0.0})
+            total["count"] += 1
+            total["wall_time"] += call.wall_time
+            total["cpu_time"] += call.cpu_time
+
+        return {
+            "calls": [dataclasses.asdict(call) for call in self.calls],
+            "totals": totals,
+        }
+
+
+_local = threading.local()
+
+
+def _get_active_stack() -> List[RunStats]:
+    if not hasattr(_local, "active"):
+        _local.active = []
+
+    return _local.active
+
+
+def _get_memory_frames() -> List[List[int]]:
+    if not hasattr(_local, "memory_frames"):
+        _local.memory_frames = []
+
+    return _local.memory_frames
+
+
+def get_active_run_stats() -> Optional[RunStats]:
+    stack = _get_active_stack()
+    return stack[-1] if stack else None
+
+
+@contextlib.contextmanager
+def measure(kind: str, name: str) -> Iterator[None]:
+    """Measure the code in the context and record it to the active run stats"""
+    run_stats = get_active_run_stats()
+
+    if run_stats is None:
+        yield
+        return
+
+    trace_memory = tracemalloc.is_tracing()
+    memory_frames = _get_memory_frames()
+    frame: List[int] = []
+
+    if trace_memory:
+        current, peak = tracemalloc.get_traced_memory()
+
+        if memory_frames:
+            # keep the peak of the outer call before the peak is reset for the inner one
+            memory_frames[-1][1] = max(memory_frames[-1][1], peak)
+
+        _reset_peak()
+        # [memory before the call, peak during the call]
+        frame = [current, current]
+        memory_frames.append(frame)
+
+    wall_start = time.perf_counter()
+    cpu_start = _thread_time()
+
+    try:
+        yield
+
+    finally:
+        wall_time = time.perf_counter() - wall_start
+        cpu_time = _thread_time() - cpu_start
+        peak_memory = None
+
+        if trace_memory and tracemalloc.is_tracing():
+            memory_frames.pop()
+            peak = max(frame[1], tracemalloc.get_traced_memory()[1])
+            peak_memory = peak - frame[0]
+
+            if memory_frames:
+                memory_frames[-1][1] = max(memory_frames[-1][1], peak)
+
+        run_stats.record(
+            CallStats(kind=kind, name=name, wall_time=wall_time, cpu_time=cpu_time, peak_memory=peak_memory)
+        )
+
+
+def _reset_peak() -> None:
+    # tracemalloc.reset_peak is available since python 3.9, without it peaks include earlier calls
+    reset_peak = getattr(tracemalloc, "reset_peak", None)
+
+    if reset_peak is not None:
+        reset_peak()
+
+
+def collect_run_stats(trace_memory: bool, func: Callable, *args) -> Tuple[Any, List[CallStats]]:
+    """Call the function with a new run stats activated and return its result with the recorded calls.
+
+    Used for calls in pool workers: the calls are recorded to the run stats of the caller afterwards.
+    """
+    run_stats = RunStats(trace_memory=trace_memory)
+
+    with run_stats.activate():
+        result = func(*args)
+
+    return result, run_stats.calls
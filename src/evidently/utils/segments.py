@@ -0,0 +1,182 @@
+"""Segmented runs: the same calculation for every segment of the current data against the same reference data.
+
+Current data is grouped by the segment columns once. Columns are processed once for all the current data,
+so every segment uses the same features even if some of them are empty or constant in a segment.
+Segment columns are not used as features: they are constant in every segment.
+
+Reference-side work is shared by all segments: views of the reference data (see `evidently.utils.dataset_view`)
+are registered once and reference-only intermediates are kept in a reference cache activated for the run.
+"""
+import dataclasses
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Hashable
+from typing import List
+from typing import Optional
+from typing import Sequence
+from typing import Tuple
+from typing import Union
+
+import pandas as pd
+
+from evidently.analyzers.utils import process_columns
+from evidently.pipeline.column_mapping import ColumnMapping
+from evidently.utils.dataset_view import register_dataset_views
+from evidently.utils.parallel import PROCESS_BACKEND
+from evidently.utils.parallel import create_executor
+from evidently.utils.reference_cache import DEFAULT_MAX_SIZE
+from evidently.utils.reference_cache import ReferenceCache
+from evidently.utils.reference_cache import activate_reference_cache
+from evidently.utils.shared_data import SharedDataFrame
+from evidently.utils.shared_data import is_shared_memory_available
+from evidently.utils.shared_data import share_dataframes
+
+# reference intermediates per column that a default cache of a segmented run keeps:
+# every segment needs all of them, a smaller cache evicts them before the next segment
+CACHED_INTERMEDIATES_PER_COLUMN = 8
+
+# task(template, reference_data, current_data, column_mapping) -> result of the segment
+SegmentTask = Callable[[Any, Optional[pd.DataFrame], pd.DataFrame, ColumnMapping], Any]
+
+
+def get_segment_columns(segment_by: Union[str, Sequence[str]], data: pd.DataFrame) -> List[str]:
+    segment_columns = [segment_by] if isinstance(segment_by, str) else list(segment_by)
+
+    if not segment_columns:
+        raise ValueError("segment_by should contain at least one column")
+
+    missing_columns = [column for column in segment_columns if column not in data]
+
+    if missing_columns:
+        raise ValueError(f"Segment columns {missing_columns} are not found in current data")
+
+    return segment_columns
+
+
+def get_segment_column_mapping(
+    data: pd.DataFrame, column_mapping: ColumnMapping, segment_columns: List[str]
+) -> ColumnMapping:
+    """Column mapping with features found in all the data, without the segment columns"""
+    columns = process_columns(data, column_mapping)
+
+    def without_segment_columns(features: List[str]) -> List[str]:
+        return [feature for feature in features if feature not in segment_columns]
+
+    return dataclasses.replace(
+        column_mapping,
+        numerical_features=without_segment_columns(columns.num_feature_names),
+        categorical_features=without_segment_columns(columns.cat_feature_names),
+        datetime_features=without_segment_columns(columns.datetime_feature_names),
+    )
+
+
+def split_segments(data: pd.DataFrame, segment_columns: List[str]) -> List[Tuple[Hashable, pd.DataFrame]]:
+    """Group the data by the segment columns once.
+
+    Segments are sorted by their keys: a value of the column for one segment column, a tuple of values for many.
+    Rows with missing values in segment columns form their own segments.
+    """
+    grouped = data.groupby(
+        segment_columns[0] if len(segment_columns) == 1 else segment_columns, sort=True, dropna=False
+    )
+    return [(key, segment) for key, segment in grouped]
+
+
+def create_segments_reference_cache(reference_data: Optional[pd.DataFrame]) -> ReferenceCache:
+    columns_count = 0 if reference_data is None else reference_data.shape[1]
+    return ReferenceCache(max_size=max(DEFAULT_MAX_SIZE, CACHED_INTERMEDIATES_PER_COLUMN * columns_count))
+
+
+def _calculate_segment(
+    task: SegmentTask,
+    template: Any,
+    reference_data: Union[None, pd.DataFrame, SharedDataFrame],
+    current_data: pd.DataFrame,
+    column_mapping: ColumnMapping,
+    reference_cache: ReferenceCache,
+):
+    if isinstance(reference_data, SharedDataFrame):
+        reference_data = reference_data.attach()
+
+    # in the parent process the reference data and the cache are already registered, so nothing changes for them
+    with activate_reference_cache(reference_cache), register_dataset_views(reference_data):
+        return task(template, reference_data, current_data, column_mapping)
+
+
+def calculate_segments(
+    task: SegmentTask,
+    template: Any,
+    reference_data: Optional[pd.DataFrame],
+    segments: List[Tuple[Hashable, pd.DataFrame]],
+    column_mapping: ColumnMapping,
+    n_jobs: int,
+    backend: str,
+    reference_cache: Optional[ReferenceCache] = None,
+) -> List[Tuple[Hashable, Any]]:
+    """Call the task for every segment with the same reference data, concurrently if n_jobs is more than 1.
+
+    With the "process" backend the reference data is published to shared memory once, segments are pickled
+    to workers. Workers get a copy of the reference cache without entries in memory: reference intermediates are
+    shared between processes only if the cache has a directory.
+
+    Returns results in the same order as the segments.
+    """
+    if reference_cache is None:
+        reference_cache = create_segments_reference_cache(reference_data)
+
+    with activate_reference_cache(reference_cache), register_dataset_views(reference_data):
+        if n_jobs == 1 or len(segments) < 2:
+            return [
+                (key, _calculate_segment(task, template, reference_data, segment, column_mapping, reference_cache))
+                for key, segment in segments
+            ]
+
+        if backend == PROCESS_BACKEND and is_shared_memory_available():
+            with share_dataframes(reference_data) as (shared_reference_data,):
+                return _calculate_segments_concurrently(
+                    task, template, shared_reference_data, segments, column_mapping, n_jobs, backend, reference_cache
+                )
+
+        return _calculate_segments_concurrently(
+            task, template, reference_data, segments, column_mapping, n_jobs, backend, reference_cache
+        )
+
+
+def _calculate_segments_concurrently(
+    task: SegmentTask,
+    template: Any,
+    reference_data: Union[None, pd.DataFrame, SharedDataFrame],
+    segments: List[Tuple[Hashable, pd.DataFrame]],
+    column_mapping: ColumnMapping,
+    n_jobs: int,
+    backend: str,
+    reference_cache: ReferenceCache,
+) -> List[Tuple[Hashable, Any]]:
+    with create_executor(n_jobs, backend) as executor:
+        futures = [
+            (
+                key,
+                executor.submit(
+                    _calculate_segment, task, template, reference_data, segment, column_mapping, reference_cache
+                ),
+            )
+            for key, segment in segments
+        ]
+        return [(key, future.result()) for key, future in futures]
+
+
+def make_segments_summary(segment_columns: List[str], rows: List[Tuple[Hashable, Dict[str, Any]]]) -> pd.DataFrame:
+    """A table with a row of values for every segment, indexed by the segment keys"""
+    keys = [key for key, _ in rows]
+
+    if len(segment_columns) == 1:
+        index = pd.Index(keys, name=segment_columns[0], tupleize_cols=False)
+
+    elif keys:
+        index = pd.MultiIndex.from_tuples(keys, names=segment_columns)
+
+    else:
+        index = pd.MultiIndex.from_arrays([[] for _ in segment_columns], names=segment_columns)
+
+    return pd.DataFrame([values for _, values in rows], index=index)
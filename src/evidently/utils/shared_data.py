@@ -0,0 +1,179 @@
+"""Publishing of data frames to shared memory for process pool workers.
+
+A data frame is published once: every column with a numpy numeric, boolean or datetime dtype is copied
+to its own shared memory block, other columns are pickled with the frame description.
+Workers attach to the blocks and get read-only data frames without copying the shared columns.
+"""
+import contextlib
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any
+from typing import Dict
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Tuple
+from typing import Union
+
+import numpy as np
+import pandas as pd
+
+try:
+    from multiprocessing import shared_memory
+
+except ImportError:  # pragma: no cover - python < 3.8
+    shared_memory = None  # type: ignore
+
+SHAREABLE_DTYPE_KINDS = "biufcmM"
+# number of published data frames that a worker keeps attached
+ATTACHED_FRAMES_CACHE_SIZE = 4
+
+
+def is_shared_memory_available() -> bool:
+    return shared_memory is not None
+
+
+@dataclass
+class SharedArray:
+    """Description of a one-dimensional numpy array in a shared memory block"""
+
+    memory_name: str
+    dtype: str
+    length: int
+
+    def attach(self) -> Tuple[np.ndarray, Any]:
+        memory = shared_memory.SharedMemory(name=self.memory_name)
+        array: np.ndarray = np.ndarray((self.length,), dtype=np.dtype(self.dtype), buffer=memory.buf)
+        array.flags.writeable = False
+        return array, memory
+
+
+@dataclass
+class SharedColumn:
+    name: Any
+    # shared values or the column itself if its dtype cannot be shared
+    values: Union[SharedArray, pd.Series]
+    # for categorical columns values are shared category codes
+    categories: Optional[pd.Index] = None
+    ordered: bool = False
+
+
+@dataclass
+class SharedDataFrame:
+    """Picklable description of a data frame published to shared memory"""
+
+    key: str
+    index: Union[SharedArray, pd.Index]
+    columns: List[SharedColumn]
+
+    def attach(self) -> pd.DataFrame:
+        """Get a read-only data frame over the shared memory. Attached frames are cached in the process.
+
+        Every call returns a new shallow copy of the cached frame, so adding columns to it does not change the cache.
+        """
+        cached = _attached_frames.get(self.key)
+
+        if cached is not None:
+            _attached_frames.move_to_end(self.key)
+            return cached[0].copy(deep=False)
+
+        memories: list = []
+
+        def get_values(values: Union[SharedArray, pd.Series, pd.Index]):
+            if isinstance(values, SharedArray):
+                array, memory = values.attach()
+                memories.append(memory)
+                return array
+
+            return values
+
+        index = get_values(self.index)
+        data: Dict[Any, Any] = {}
+
+        for column in self.columns:
+            values = get_values(column.values)
+
+            if column.categories is not None:
+                values = pd.Categorical.from_codes(values, categories=column.categories, ordered=column.ordered)
+
+            elif isinstance(values, pd.Series):
+                values = values.array
+
+            data[column.name] = values
+
+        frame = pd.DataFrame(data, index=index, columns=[column.name for column in self.columns], copy=False)
+        _attached_frames[self.key] = (frame, memories)
+
+        if len(_attached_frames) > ATTACHED_FRAMES_CACHE_SIZE:
+            _attached_frames.popitem(last=False)
+
+        return frame.copy(deep=False)
+
+
+_attached_frames: "OrderedDict[str, Tuple[pd.DataFrame, list]]" = OrderedDict()
+
+
+def _is_shareable(values: Union[pd.Series, pd.Index]) -> bool:
+    return isinstance(values.dtype, np.dtype) and values.dtype.kind in SHAREABLE_DTYPE_KINDS and len(values) > 0
+
+
+def _share_array(array: np.ndarray, memories: list) -> SharedArray:
+    array = np.ascontiguousarray(array)
+    memory = shared_memory.SharedMemory(create=True, size=array.nbytes)
+    memories.append(memory)
+    shared_array: np.ndarray = np.ndarray(array.shape, dtype=array.dtype, buffer=memory.buf)
+    shared_array[:] = array
+    return SharedArray(memory_name=memory.name, dtype=array.dtype.str, length=len(array))
+
+
+def _share_dataframe(frame: pd.DataFrame, memories: list) -> SharedDataFrame:
+    if _is_shareable(frame.index) and not isinstance(frame.index, pd.RangeIndex):
+        index: Union[SharedArray, pd.Index] = _share_array(frame.index.to_numpy(), memories)
+
+    else:
+        index = frame.index
+
+    columns = []
+
+    for position, name in enumerate(frame.columns):
+        column = frame.iloc[:, position]
+
+        if isinstance(column.dtype, pd.CategoricalDtype) and len(column) > 0:
+            columns.append(
+                SharedColumn(
+                    name=name,
+                    values=_share_array(column.cat.codes.to_numpy(), memories),
+                    categories=column.cat.categories,
+                    ordered=bool(column.cat.ordered),
+                )
+            )
+
+        elif _is_shareable(column):
+            columns.append(SharedColumn(name=name, values=_share_array(column.to_numpy(), memories)))
+
+        else:
+            columns.append(SharedColumn(name=name, values=column))
+
+    return SharedDataFrame(key=uuid.uuid4().hex, index=index, columns=columns)
+
+
+@contextlib.contextmanager
+def share_dataframes(*frames: Optional[pd.DataFrame]) -> Iterator[Tuple[Optional[SharedDataFrame], ...]]:
+    """Publish data frames to shared memory for the duration of the context.
+
+    Yields descriptions in the same order as the frames (None for None frames).
+    Shared memory blocks are released on exit, workers should not use attached frames after it.
+    """
+    if shared_memory is None:
+        raise RuntimeError("Shared memory is not available, it requires python 3.8 or newer")
+
+    memories: list = []
+
+    try:
+        yield tuple(None if frame is None else _share_dataframe(frame, memories) for frame in frames)
+
+    finally:
+        for memory in memories:
+            memory.close()
+            memory.unlink()
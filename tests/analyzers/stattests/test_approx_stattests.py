@@ -0,0 +1,78 @@
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from evidently.analyzers.stattests import StatTestSummary
+from evidently.analyzers.stattests import get_stattest
+from evidently.analyzers.stattests import ks_approx_stat_test
+from evidently.analyzers.stattests import ks_stat_test
+from evidently.analyzers.stattests import wasserstein_approx_stat_test
+from evidently.analyzers.stattests import wasserstein_stat_test
+from evidently.analyzers.stattests.summary import ReferenceSummary
+from evidently.utils.sketches import KLLSketch
+
+
+@pytest.mark.parametrize(
+    "exact, approximate", ((ks_stat_test, ks_approx_stat_test), (wasserstein_stat_test, wasserstein_approx_stat_test))
+)
+def test_approximate_stattests(exact, approximate) -> None:
+    rng = np.random.default_rng(0)
+    reference = pd.Series(rng.normal(size=20000))
+    assert get_stattest(reference, reference, "num", approximate.name) is approximate
+
+    for shift, drifted in ((0.0, False), (0.5, True)):
+        current = pd.Series(rng.normal(shift, size=10000))
+        result = approximate(reference, current, "num", None)
+        assert result.drifted == exact(reference, current, "num", None).drifted == drifted
+
+
+def test_ks_approx_statistic_error() -> None:
+    rng = np.random.default_rng(1)
+    reference = rng.normal(size=100000)
+    current = rng.normal(0.1, size=100000)
+    reference_sketch = KLLSketch.from_values(reference)
+    current_sketch = KLLSketch.from_values(current)
+    points = np.linspace(-4, 4, 1001)
+    exact_statistic = np.max(
+        np.abs(
+            np.searchsorted(np.sort(reference), points, side="right") / reference.shape[0]
+            - np.searchsorted(np.sort(current), points, side="right") / current.shape[0]
+        )
+    )
+    approximate_statistic = np.max(np.abs(reference_sketch.cdf(points) - current_sketch.cdf(points)))
+    assert approximate_statistic == pytest.approx(
+        exact_statistic, abs=reference_sketch.rank_error + current_sketch.rank_error
+    )
+
+
+def test_approximate_stattests_with_merged_sketch() -> None:
+    rng = np.random.default_rng(2)
+    chunks = [rng.normal(size=5000) for _ in range(4)]
+    sketch = KLLSketch()
+
+    for chunk in chunks:
+        chunk_sketch = KLLSketch()
+        chunk_sketch.update(chunk)
+        sketch.merge(chunk_sketch)
+
+    summary = StatTestSummary("ks_approx", "num", ReferenceSummary.from_sketch(sketch))
+    restored = StatTestSummary.from_dict(json.loads(json.dumps(summary.to_dict())))
+    current = pd.Series(rng.normal(size=3000))
+    assert ks_approx_stat_test.score(restored, current) == ks_approx_stat_test.score(summary, current)
+    assert not ks_approx_stat_test.score(summary, current).drifted
+
+
+def test_ks_approx_large_samples_without_drift() -> None:
+    # the critical statistic of samples this large is less than the error of sketches
+    rng = np.random.default_rng(3)
+    reference = pd.Series(rng.normal(size=2000000))
+    current = pd.Series(rng.normal(size=2000000))
+    summary = ks_approx_stat_test.fit(reference, "num")
+
+    assert summary.reference.rank_error == KLLSketch.from_values(reference.to_numpy()).rank_error
+    assert not ks_approx_stat_test(reference, current, "num", None).drifted
+    assert ks_approx_stat_test(reference, pd.Series(rng.normal(0.1, size=2000000)), "num", None).drifted
+    # sketches of small samples are exact
+    assert KLLSketch.from_values(reference.to_numpy()[:100]).cdf_error == 0.0
@@ -0,0 +1,66 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from evidently.analyzers.stattests import jensenshannon_stat_test
+from evidently.analyzers.stattests import kl_div_stat_test
+from evidently.analyzers.stattests import ks_stat_test
+from evidently.analyzers.stattests import psi_stat_test
+from evidently.analyzers.stattests import wasserstein_stat_test
+from evidently.analyzers.stattests.batch import NumericalSamples
+from evidently.analyzers.stattests.batch import sort_features_values
+from evidently.analyzers.stattests.batch import split_batches
+
+
+def _make_features(size: int, shift: float, seed: int) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    features = np.column_stack(
+        [
+            rng.normal(size=size) + shift,
+            rng.integers(0, 5, size).astype(float),
+            np.round(rng.normal(size=size), 1),
+            np.full(size, 3.0),
+        ]
+    )
+    features[rng.random(features.shape) < 0.1] = np.nan
+    features[rng.random(features.shape) < 0.02] = np.inf
+    return features
+
+
+def _finite(values: np.ndarray) -> pd.Series:
+    return pd.Series(values).replace([np.inf, -np.inf], np.nan).dropna()
+
+
+@pytest.mark.parametrize("reference_size, current_size", ((25, 40), (200, 150), (3000, 12000)))
+@pytest.mark.parametrize(
+    "stattest", (ks_stat_test, wasserstein_stat_test, psi_stat_test, kl_div_stat_test, jensenshannon_stat_test)
+)
+def test_batch_matches_stattest(reference_size: int, current_size: int, stattest) -> None:
+    reference = _make_features(reference_size, 0.0, 1)
+    current = _make_features(current_size, 0.1, 2)
+    samples = NumericalSamples(*sort_features_values(reference), *sort_features_values(current))
+    results = stattest.batch(samples, [None] * reference.shape[1])
+    expected = [
+        stattest(_finite(reference[:, i]), _finite(current[:, i]), "num", None) for i in range(reference.shape[1])
+    ]
+    assert [result.drift_score for result in results] == pytest.approx(
+        [result.drift_score for result in expected], rel=1e-9, nan_ok=True
+    )
+    assert [result.drifted for result in results] == [result.drifted for result in expected]
+
+
+def test_unique_counts_and_select() -> None:
+    reference = _make_features(100, 0.0, 3)
+    current = _make_features(50, 0.0, 4)
+    samples = NumericalSamples(*sort_features_values(reference), *sort_features_values(current))
+    expected = [_finite(np.concatenate([reference[:, i], current[:, i]])).nunique() for i in range(4)]
+    assert samples.get_unique_counts().tolist() == expected
+    assert samples.select([3, 1]).get_unique_counts().tolist() == [expected[3], expected[1]]
+
+
+def test_split_batches() -> None:
+    assert split_batches([], 10) == []
+    assert split_batches(["a", "b", "c"], 10) == [["a", "b", "c"]]
+    batches = split_batches([str(i) for i in range(10)], 2**23)
+    assert sum(batches, []) == [str(i) for i in range(10)]
+    assert all(len(batch) == 2 for batch in batches)
@@ -4,6 +4,8 @@ from pytest import approx
 
 from evidently.analyzers.stattests import z_stat_test
 from evidently.analyzers.stattests.chisquare_stattest import chi_stat_test
+from evidently.analyzers.stattests.utils import get_binned_data
+from evidently.analyzers.stattests.utils import get_category_counts
 
 
 def test_freq_obs_eq_freq_exp() -> None:
@@ -36,3 +38,39 @@ def test_freq_obs_not_eq_freq_exp() -> None:
     reference = pd.Series([1, 2, 3, 4, 5, 6]).repeat([x * 2 for x in [16, 18, 16, 14, 12, 12]])
     current = pd.Series([1, 2, 3, 4, 5, 6]).repeat([16, 16, 16, 16, 16, 8])
     assert chi_stat_test.func(reference, current, "cat", 0.5) == (approx(0.62338, abs=1e-5), False)
+
+
+def test_get_category_counts() -> None:
+    reference = pd.Series(["b", "a", np.nan, "b"])
+    current = pd.Series(["c", "b", "b"])
+    reference_counts, current_counts, categories = get_category_counts(reference, current)
+    assert list(categories) == ["b", "a", "c"]
+    assert reference_counts.tolist() == [2, 1, 0]
+    assert current_counts.tolist() == [2, 0, 1]
+
+
+def test_get_category_counts_categorical() -> None:
+    dtype = pd.CategoricalDtype(["x", "a", "b"])
+    reference = pd.Series(["b", "a", None, "b"], dtype=dtype)
+    current = pd.Series(["a", "a"], dtype=dtype)
+    reference_counts, current_counts, categories = get_category_counts(reference, current)
+    # categories without values are dropped
+    assert list(categories) == ["a", "b"]
+    assert reference_counts.tolist() == [1, 2]
+    assert current_counts.tolist() == [2, 0]
+
+
+def test_z_stat_test_categorical_feature() -> None:
+    reference = pd.Series(["a", "b"]).repeat([10, 30])
+    current = pd.Series(["a", "b"]).repeat([30, 10])
+    expected = z_stat_test.func(reference, current, "cat", 0.5)
+    assert expected == (approx(7.744e-06, rel=1e-3), True)
+    assert z_stat_test.func(reference.astype("category"), current.astype("category"), "cat", 0.5) == expected
+
+
+def test_get_binned_data_cat_feature() -> None:
+    reference = pd.Series(["a", "b", "b", "c"])
+    current = pd.Series(["b", "d"])
+    reference_percents, current_percents = get_binned_data(reference, current, "cat", 10)
+    assert reference_percents.tolist() == [0.25, 0.5, 0.25, 0.0001]
+    assert current_percents.tolist() == [0.0001, 0.5, 0.0001, 0.5]
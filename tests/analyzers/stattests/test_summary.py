@@ -0,0 +1,64 @@
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from evidently.analyzers.stattests import StatTest
+from evidently.analyzers.stattests import StatTestSummary
+from evidently.analyzers.stattests import chi_stat_test
+from evidently.analyzers.stattests import jensenshannon_stat_test
+from evidently.analyzers.stattests import kl_div_stat_test
+from evidently.analyzers.stattests import ks_stat_test
+from evidently.analyzers.stattests import psi_stat_test
+from evidently.analyzers.stattests import wasserstein_stat_test
+from evidently.analyzers.stattests import z_stat_test
+
+_rng = np.random.default_rng(0)
+
+
+@pytest.mark.parametrize(
+    "stattest, feature_type, reference_data, current_data",
+    (
+        (ks_stat_test, "num", pd.Series(_rng.normal(size=300)), pd.Series(_rng.normal(0.2, size=200))),
+        (ks_stat_test, "num", pd.Series(_rng.normal(size=12000)), pd.Series(_rng.normal(size=11000))),
+        (wasserstein_stat_test, "num", pd.Series(_rng.normal(size=300)), pd.Series(_rng.normal(0.2, size=200))),
+        (psi_stat_test, "num", pd.Series(_rng.normal(size=300)), pd.Series(_rng.normal(0.2, size=200))),
+        (psi_stat_test, "num", pd.Series(_rng.integers(0, 5, 300)), pd.Series(_rng.integers(0, 6, 200))),
+        (kl_div_stat_test, "num", pd.Series(_rng.normal(size=300)), pd.Series(_rng.normal(0.2, size=200))),
+        (kl_div_stat_test, "cat", pd.Series(_rng.choice(list("abc"), 300)), pd.Series(_rng.choice(list("abcd"), 200))),
+        (jensenshannon_stat_test, "num", pd.Series(_rng.normal(size=300)), pd.Series(_rng.normal(size=200))),
+        (jensenshannon_stat_test, "cat", pd.Series(_rng.choice(list("ab"), 300)), pd.Series(_rng.choice(list("bc"), 200))),
+        (chi_stat_test, "cat", pd.Series(_rng.choice(list("abc"), 300)), pd.Series(_rng.choice(list("abc"), 200))),
+        (z_stat_test, "cat", pd.Series(_rng.choice(list("ab"), 300)), pd.Series(_rng.choice(list("ab"), 200))),
+        (z_stat_test, "cat", pd.Series(["a"] * 10), pd.Series(["a"] * 20)),
+    ),
+)
+def test_score_matches_stattest(
+    stattest: StatTest, feature_type: str, reference_data: pd.Series, current_data: pd.Series
+) -> None:
+    expected = stattest(reference_data, current_data, feature_type, None)
+    summary = stattest.fit(reference_data, feature_type)
+
+    for restored in (summary, StatTestSummary.from_dict(json.loads(json.dumps(summary.to_dict())))):
+        result = stattest.score(restored, current_data)
+        assert result.drift_score == pytest.approx(expected.drift_score, rel=1e-9)
+        assert result.drifted == expected.drifted
+        assert result.actual_threshold == expected.actual_threshold
+
+
+def test_score_with_threshold() -> None:
+    summary = psi_stat_test.fit(pd.Series([1, 2, 3, 3]), "num")
+    assert psi_stat_test.score(summary, pd.Series([1, 1, 2, 3]), 0.9).actual_threshold == 0.9
+
+
+def test_score_errors() -> None:
+    summary = ks_stat_test.fit(pd.Series([1.0, 2.0]), "num")
+
+    with pytest.raises(ValueError):
+        wasserstein_stat_test.score(summary, pd.Series([1.0, 2.0]))
+
+    custom = StatTest(name="custom", display_name="custom", func=lambda *args: (0.5, False), allowed_feature_types=["num"])
+
+    with pytest.raises(ValueError):
+        custom.fit(pd.Series([1.0]), "num")
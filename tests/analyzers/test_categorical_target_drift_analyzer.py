@@ -6,6 +6,8 @@ from pytest import approx
 from evidently import ColumnMapping
 from evidently.analyzers.cat_target_drift_analyzer import CatTargetDriftAnalyzer
 from evidently.options import DataDriftOptions, OptionsProvider
+from evidently.options import ReferenceCacheOptions
+from evidently.utils.reference_cache import ReferenceCache
 
 
 @pytest.fixture
@@ -156,3 +158,18 @@ def test_computing_uses_a_custom_function(analyzer: CatTargetDriftAnalyzer) -> N
     assert result.target_metrics is not None
     assert result.target_metrics.drift_score == approx(np.pi, abs=1e-4)
     assert result.target_metrics.column_name == "some_column"
+
+
+def test_reference_cache(analyzer: CatTargetDriftAnalyzer) -> None:
+    df1 = DataFrame({"target": ["a", "b", "a", None] * 5, "prediction": ["a", "b", "b", "a"] * 5})
+    df2 = DataFrame({"target": ["a", "b", "b", "b"] * 5, "prediction": ["a", "a", "b", "a"] * 5})
+    expected = analyzer.calculate(df1, df2, ColumnMapping())
+    cache = ReferenceCache()
+    analyzer.options_provider.add(ReferenceCacheOptions(cache=cache))
+
+    for _ in range(2):
+        result = analyzer.calculate(df1, df2, ColumnMapping())
+        assert result.target_metrics == expected.target_metrics
+        assert result.prediction_metrics == expected.prediction_metrics
+
+    assert (cache.hits, cache.misses) == (1, 1)
@@ -4,6 +4,7 @@ import numpy as np
 import pandas as pd
 
 import pytest
+import sklearn.metrics
 from pytest import approx
 
 from evidently.pipeline import column_mapping
@@ -385,3 +386,23 @@ def test_incorrect_data_mapping_in_datasets(
     )
     assert result.reference_metrics is None
     assert result.current_metrics is None
+
+
+def test_classification_analyzer_metrics_match_sklearn(analyzer: ClassificationPerformanceAnalyzer) -> None:
+    rng = np.random.default_rng(0)
+    target = rng.choice(["a", "b", "c", "d"], 1000)
+    # the prediction has a label that is not in the target
+    prediction = np.where(rng.random(1000) < 0.6, target, rng.choice(["a", "b", "e"], 1000))
+    df = pd.DataFrame({"target": target, "prediction": prediction})
+    result = analyzer.calculate(reference_data=df, current_data=None, column_mapping=column_mapping.ColumnMapping())
+    metrics = result.reference_metrics
+    assert metrics is not None
+
+    expected_matrix = sklearn.metrics.classification_report(target, prediction, output_dict=True, zero_division=0)
+
+    assert metrics.metrics_matrix == expected_matrix
+    assert metrics.accuracy == sklearn.metrics.accuracy_score(target, prediction)
+    assert metrics.f1 == expected_matrix["macro avg"]["f1-score"]
+    assert metrics.confusion_matrix == ConfusionMatrix(
+        labels=["a", "b", "c", "d", "e"], values=sklearn.metrics.confusion_matrix(target, prediction).tolist()
+    )
@@ -1,9 +1,12 @@
+import numpy as np
 import pytest
 from pandas import DataFrame
 
 from evidently import ColumnMapping
 from evidently.analyzers.data_drift_analyzer import DataDriftAnalyzer
 from evidently.options import DataDriftOptions, OptionsProvider
+from evidently.options import ReferenceCacheOptions
+from evidently.utils.reference_cache import ReferenceCache
 
 
 @pytest.fixture
@@ -65,3 +68,72 @@ def test_data_drift_analyzer_as_dict_format(data_drift_analyzer: DataDriftAnalyz
     # check data drift results
     assert result.columns.target_names == ["drift_target"]
     assert result.metrics.dataset_drift is False
+
+
+def test_data_drift_analyzer_with_reference_cache() -> None:
+    reference_data = DataFrame(
+        {"num": [0.5, 0.0, 4.8, 2.1, float("inf"), None], "cat": ["a", "b", "a", None, "c", "a"], "target": [1] * 6}
+    )
+    current_data = DataFrame({"num": [1.5, 2.0, 0.8, 2.1], "cat": ["a", "d", "a", "b"], "target": [1, 0, 1, 0]})
+    column_mapping = ColumnMapping(numerical_features=["num"], categorical_features=["cat"])
+    cache = ReferenceCache()
+    options_provider = OptionsProvider()
+    options_provider.add(ReferenceCacheOptions(cache=cache))
+    analyzer = DataDriftAnalyzer()
+    analyzer.options_provider = options_provider
+    expected_analyzer = DataDriftAnalyzer()
+    expected_analyzer.options_provider = OptionsProvider()
+    expected = expected_analyzer.calculate(reference_data, current_data, column_mapping)
+
+    assert analyzer.calculate(reference_data, current_data, column_mapping).metrics == expected.metrics
+    assert cache.hits == 0
+    assert analyzer.calculate(reference_data.copy(), current_data, column_mapping).metrics == expected.metrics
+    assert cache.hits == cache.misses == 3
+
+
+def test_data_drift_analyzer_with_approximate_stattests() -> None:
+    reference_data = DataFrame({"num_1": [float(i % 50) for i in range(1000)], "num_2": [float(i) for i in range(1000)]})
+    current_data = DataFrame({"num_1": [float(i % 50) for i in range(800)], "num_2": [i + 500.0 for i in range(800)]})
+    options_provider = OptionsProvider()
+    options_provider.add(DataDriftOptions(per_feature_stattest={"num_1": "ks_approx", "num_2": "wasserstein_approx"}))
+    analyzer = DataDriftAnalyzer()
+    analyzer.options_provider = options_provider
+    result = analyzer.calculate(reference_data, current_data, ColumnMapping())
+    assert result.metrics.features["num_1"].stattest_name == "K-S p_value (approximate)"
+    assert not result.metrics.features["num_1"].drift_detected
+    assert result.metrics.features["num_2"].stattest_name == "Wasserstein distance (normed, approximate)"
+    assert result.metrics.features["num_2"].drift_detected
+
+
+@pytest.mark.parametrize("backend", ("thread", "process"))
+@pytest.mark.parametrize("chunk_size", (None, 1, 3))
+def test_data_drift_analyzer_concurrent(backend: str, chunk_size) -> None:
+    rng = np.random.default_rng(0)
+    reference_data = DataFrame({f"num_{i}": rng.normal(size=200) for i in range(5)})
+    current_data = DataFrame({f"num_{i}": rng.normal(i * 0.1, size=150) for i in range(5)})
+
+    for data in (reference_data, current_data):
+        data["cat_1"] = rng.choice(["a", "b", "c"], data.shape[0])
+        data["cat_2"] = rng.integers(0, 3, data.shape[0])
+        data["target"] = rng.normal(size=data.shape[0])
+
+    column_mapping = ColumnMapping(categorical_features=["cat_1", "cat_2"])
+    expected_analyzer = DataDriftAnalyzer()
+    expected_analyzer.options_provider = OptionsProvider()
+    expected = expected_analyzer.calculate(reference_data.copy(), current_data.copy(), column_mapping)
+    options_provider = OptionsProvider()
+    options_provider.add(DataDriftOptions(n_jobs=2, backend=backend, chunk_size=chunk_size))
+    analyzer = DataDriftAnalyzer()
+    analyzer.options_provider = options_provider
+    result = analyzer.calculate(reference_data.copy(), current_data.copy(), column_mapping)
+
+    assert result.metrics == expected.metrics
+    assert list(result.metrics.features) == list(expected.metrics.features)
+
+
+@pytest.mark.parametrize(
+    "kwargs", ({"n_jobs": 0}, {"backend": "unknown"}, {"chunk_size": 0}),
+)
+def test_data_drift_options_execution_parameters(kwargs) -> None:
+    with pytest.raises(ValueError):
+        DataDriftOptions(**kwargs)
@@ -6,7 +6,12 @@ import pandas as pd
 from evidently import ColumnMapping
 from evidently.analyzers.data_quality_analyzer import DataQualityAnalyzer
 from evidently.analyzers.data_quality_analyzer import FeatureQualityStats
+from evidently.analyzers.data_quality_analyzer import _get_num_features_stats
 from evidently.analyzers.utils import process_columns
+from evidently.options import OptionsProvider
+from evidently.options import QualityMetricsOptions
+from evidently.options import ReferenceCacheOptions
+from evidently.utils.reference_cache import ReferenceCache
 
 import pytest
 
@@ -371,10 +376,17 @@ def test_data_profile_analyzer_classification_with_target() -> None:
         ),
     ],
 )
+@pytest.mark.parametrize("approximate_cat_stats", (False, True))
 def test_data_profile_analyzer_new_and_unused_count_for_cat_features(
-    reference_dataset: pd.DataFrame, current_dataset: pd.DataFrame, expected_new: int, expected_unused: int
+    reference_dataset: pd.DataFrame,
+    current_dataset: pd.DataFrame,
+    expected_new: int,
+    expected_unused: int,
+    approximate_cat_stats: bool,
 ) -> None:
     data_profile_analyzer = DataQualityAnalyzer()
+    data_profile_analyzer.options_provider = OptionsProvider()
+    data_profile_analyzer.options_provider.add(QualityMetricsOptions(approximate_cat_stats=approximate_cat_stats))
     data_mapping = ColumnMapping(
         categorical_features=["category_feature"],
         numerical_features=[],
@@ -911,3 +923,178 @@ def test_calculate_correlations(kind: str, expected_corr_df: np.array) -> None:
     assert num_for_corr == ["num_feature_1", "num_feature_2", "num_feature_3", "num_feature_4", "target"]
     assert cat_for_corr == ["cat_feature_1", "cat_feature_2", "cat_feature_3", "cat_feature_4"]
     assert np.allclose(corr_df, expected_corr_df, equal_nan=True)
+
+
+def test_data_quality_analyzer_with_reference_cache() -> None:
+    reference_data = pd.DataFrame(
+        {
+            "num_1": [1.0, 2.0, np.nan, 4.0, 5.0],
+            "num_2": [3, 1, 2, 5, 4],
+            "cat_1": ["a", "b", "a", None, "c"],
+            "cat_2": ["x", "y", "y", "x", "x"],
+        }
+    )
+    current_data = pd.DataFrame(
+        {"num_1": [2.0, 1.0, 3.0], "num_2": [1, 1, 2], "cat_1": ["a", "d", "d"], "cat_2": ["y", "x", "y"]}
+    )
+    column_mapping = ColumnMapping(numerical_features=["num_1", "num_2"], categorical_features=["cat_1", "cat_2"])
+    cache = ReferenceCache()
+    analyzer = DataQualityAnalyzer()
+    analyzer.options_provider = OptionsProvider()
+    analyzer.options_provider.add(ReferenceCacheOptions(cache=cache))
+    expected = DataQualityAnalyzer().calculate(reference_data, current_data, column_mapping)
+
+    for _ in range(2):
+        result = analyzer.calculate(reference_data, current_data, column_mapping)
+        assert result.reference_features_stats == expected.reference_features_stats
+        assert result.current_features_stats == expected.current_features_stats
+
+        for kind, correlations in expected.reference_correlations.items():
+            pd.testing.assert_frame_equal(result.reference_correlations[kind], correlations)
+
+    # stats of numerical features, 2 categorical feature stats, 2 sets of unique values and 4 correlation matrices
+    assert cache.misses == cache.hits == 9
+
+
+def test_cramer_v_max_categories_with_reference_cache() -> None:
+    rng = np.random.default_rng(0)
+    reference_data = pd.DataFrame(
+        {"cat_1": rng.integers(0, 50, 500).astype(str), "cat_2": rng.integers(0, 3, 500).astype(str)}
+    )
+    reference_data["cat_3"] = reference_data["cat_2"]
+    column_mapping = ColumnMapping(numerical_features=[], categorical_features=["cat_1", "cat_2", "cat_3"])
+    cache = ReferenceCache()
+
+    for max_categories in (None, 10, None):
+        analyzer = DataQualityAnalyzer()
+        analyzer.options_provider = OptionsProvider()
+        analyzer.options_provider.add(ReferenceCacheOptions(cache=cache))
+        analyzer.options_provider.add(
+            QualityMetricsOptions(correlation_kinds=["cramer_v"], cramer_v_max_categories=max_categories)
+        )
+        correlations = analyzer.calculate(reference_data, None, column_mapping).reference_correlations["cramer_v"]
+
+        assert correlations.loc["cat_2", "cat_3"] == 1.0
+        # the feature with 50 categories has no Cramér's V with the limit of 10 categories
+        if max_categories is None:
+            assert correlations.loc["cat_1", "cat_2"] > 0
+
+        else:
+            assert np.isnan(correlations.loc["cat_1", "cat_2"])
+
+    assert cache.hits > 0
+
+
+def test_num_features_stats_match_feature_stats() -> None:
+    rng = np.random.default_rng(0)
+    size = 1000
+    with_missing = np.round(rng.normal(size=size), 1)
+    with_missing[rng.random(size) < 0.3] = np.nan
+    with_missing[rng.random(size) < 0.05] = np.inf
+    dataset = pd.DataFrame(
+        {
+            "float": rng.normal(size=size),
+            "with_missing": with_missing,
+            "int": rng.integers(-5, 5, size),
+            "float32": rng.normal(size=size).astype(np.float32),
+            "constant": np.full(size, 2.0),
+            "missing": np.full(size, np.nan),
+            # NaN and 1.0 are equally common, NaN goes first
+            "tie": [np.nan, 1.0, 1.0, np.nan, 2.0] * (size // 5),
+        }
+    )
+    result = _get_num_features_stats(dataset, list(dataset.columns))
+
+    assert list(result) == list(dataset.columns)
+
+    for feature_name in dataset.columns:
+        assert result[feature_name] == DataQualityAnalyzer._get_features_stats(dataset[feature_name], "num")
+
+    assert pd.isnull(result["tie"].most_common_value)
+    assert result["tie"].most_common_not_null_value == 1.0
+    assert result["tie"].unique_count == 2
+    assert result["with_missing"].infinite_count == int(np.isinf(with_missing).sum())
+
+
+def test_data_quality_analyzer_correlation_kinds() -> None:
+    rng = np.random.default_rng(0)
+    reference_data = pd.DataFrame(
+        {
+            "num_1": rng.normal(size=100),
+            "num_2": rng.normal(size=100),
+            "cat_1": rng.choice(["a", "b"], 100),
+            "cat_2": rng.choice(["x", "y", "z"], 100),
+        }
+    )
+    current_data = reference_data.iloc[:30]
+    column_mapping = ColumnMapping(numerical_features=["num_1", "num_2"], categorical_features=["cat_1", "cat_2"])
+    expected = DataQualityAnalyzer().calculate(reference_data, current_data, column_mapping)
+    analyzer = DataQualityAnalyzer()
+    analyzer.options_provider = OptionsProvider()
+    analyzer.options_provider.add(
+        QualityMetricsOptions(
+            correlation_kinds=["spearman", "kendall"],
+            correlation_sample_size=50,
+            sampled_correlation_kinds=["kendall"],
+        )
+    )
+    result = analyzer.calculate(reference_data, current_data, column_mapping)
+
+    assert list(result.reference_correlations) == ["spearman", "kendall"]
+    assert result.reference_correlations_sample_sizes == {"spearman": 100, "kendall": 50}
+    # current data is smaller than the sample
+    assert result.current_correlations_sample_sizes == {"spearman": 30, "kendall": 30}
+    pd.testing.assert_frame_equal(result.reference_correlations["spearman"], expected.reference_correlations["spearman"])
+    pd.testing.assert_frame_equal(result.current_correlations["kendall"], expected.current_correlations["kendall"])
+    expected_sample = reference_data.sample(n=50, random_state=0)
+    pd.testing.assert_frame_equal(
+        result.reference_correlations["kendall"], expected_sample[["num_1", "num_2"]].corr("kendall")
+    )
+    # the sample is the same for every run
+    pd.testing.assert_frame_equal(
+        analyzer.calculate(reference_data, current_data, column_mapping).reference_correlations["kendall"],
+        result.reference_correlations["kendall"],
+    )
+
+
+def test_data_quality_analyzer_approximate_cat_stats() -> None:
+    rng = np.random.default_rng(0)
+    size = 20000
+    # ID-like values with a few frequent ones
+    reference_data = pd.DataFrame(
+        {"id": pd.Series(rng.integers(0, 10 ** 6, size).astype(str)).mask(rng.random(size) < 0.05)}
+    )
+    reference_data.loc[: size // 10, "id"] = "frequent"
+    current_data = pd.DataFrame({"id": reference_data["id"].iloc[: size // 2].to_numpy()})
+    current_data.loc[size // 4:, "id"] = "new_" + current_data["id"].iloc[size // 4:]
+    column_mapping = ColumnMapping(numerical_features=[], categorical_features=["id"])
+    expected = DataQualityAnalyzer().calculate(reference_data, current_data, column_mapping)
+    analyzer = DataQualityAnalyzer()
+    analyzer.options_provider = OptionsProvider()
+    analyzer.options_provider.add(QualityMetricsOptions(approximate_cat_stats=True, heavy_hitters_capacity=100))
+    result = analyzer.calculate(reference_data, current_data, column_mapping)
+
+    for stats, expected_stats in (
+        (result.reference_features_stats["id"], expected.reference_features_stats["id"]),
+        (result.current_features_stats["id"], expected.current_features_stats["id"]),
+    ):
+        assert stats.count == expected_stats.count
+        assert stats.missing_count == expected_stats.missing_count
+        assert stats.unique_count == pytest.approx(expected_stats.unique_count, rel=0.05)
+        assert stats.most_common_value == expected_stats.most_common_value == "frequent"
+        assert stats.most_common_value_percentage == pytest.approx(expected_stats.most_common_value_percentage, abs=1)
+
+    current_stats = result.current_features_stats["id"]
+    expected_current_stats = expected.current_features_stats["id"]
+    # errors of differences of unique counts are relative to the number of unique values in both features
+    assert current_stats.new_in_current_values_count == pytest.approx(
+        expected_current_stats.new_in_current_values_count, abs=0.03 * size
+    )
+    assert current_stats.unused_in_current_values_count == pytest.approx(
+        expected_current_stats.unused_in_current_values_count, abs=0.03 * size
+    )
+    assert "unique_count" in current_stats.approximate_fields
+    assert "new_in_current_values_count" in current_stats.approximate_fields
+    assert "most_common_value" in current_stats.approximate_fields
+    assert "new_in_current_values_count" not in result.reference_features_stats["id"].approximate_fields
+    assert expected_current_stats.approximate_fields is None
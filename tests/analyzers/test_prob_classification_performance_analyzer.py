@@ -1,9 +1,11 @@
+import numpy as np
 import pandas as pd
 from pytest import approx
 
 from evidently import ColumnMapping
 from evidently.analyzers.prob_classification_performance_analyzer import ProbClassificationPerformanceAnalyzer
 from evidently.options import OptionsProvider
+from evidently.options import QualityMetricsOptions
 
 
 def test_single_dataset_with_two_classes() -> None:
@@ -390,6 +392,67 @@ def test_two_dataset_with_two_classes_when_dataset_is_different() -> None:
     assert metrics_matrix["weighted avg"] == {"f1-score": 0.5, "precision": 0.5, "recall": 0.5, "support": 4}
 
 
+def test_max_curve_points() -> None:
+    rng = np.random.default_rng(0)
+    probas = rng.random((1000, 3))
+    probas = probas / probas.sum(axis=1, keepdims=True)
+    reference_data = pd.DataFrame(probas, columns=["label_a", "label_b", "label_c"])
+    reference_data["target"] = rng.choice(["label_a", "label_b", "label_c"], 1000)
+    df_column_mapping = ColumnMapping(target="target", prediction=["label_a", "label_b", "label_c"])
+    analyzer = ProbClassificationPerformanceAnalyzer()
+    analyzer.options_provider = OptionsProvider()
+    full_result = analyzer.calculate(reference_data, None, df_column_mapping)
+    analyzer.options_provider.add(QualityMetricsOptions(max_curve_points=20))
+    result = analyzer.calculate(reference_data, None, df_column_mapping)
+
+    for label in ("label_a", "label_b", "label_c"):
+        assert len(full_result.reference_metrics.roc_curve[label]["fpr"]) > 20
+        assert len(result.reference_metrics.roc_curve[label]["fpr"]) == 20
+        assert len(result.reference_metrics.roc_curve[label]["thrs"]) == 20
+        assert len(result.reference_metrics.pr_curve[label]["rcl"]) == 20
+        assert len(result.reference_metrics.pr_curve[label]["thrs"]) == 19
+
+    assert result.reference_metrics.roc_auc == full_result.reference_metrics.roc_auc
+    assert result.reference_metrics.pr_table == full_result.reference_metrics.pr_table
+
+
+def test_top_classes() -> None:
+    rng = np.random.default_rng(1)
+    labels = [f"label_{i}" for i in range(10)]
+    probas = rng.random((2000, 10))
+    probas = probas / probas.sum(axis=1, keepdims=True)
+    reference_data = pd.DataFrame(probas, columns=labels)
+    reference_data["target"] = rng.choice(labels, 2000, p=np.arange(1, 11) / 55)
+    df_column_mapping = ColumnMapping(target="target", prediction=labels)
+    analyzer = ProbClassificationPerformanceAnalyzer()
+    analyzer.options_provider = OptionsProvider()
+    full_metrics = analyzer.calculate(reference_data, None, df_column_mapping).reference_metrics
+    analyzer.options_provider.add(QualityMetricsOptions(top_classes=3))
+    metrics = analyzer.calculate(reference_data, None, df_column_mapping).reference_metrics
+    top_labels = ["label_7", "label_8", "label_9"]
+
+    # aggregated metrics are of all classes
+    assert metrics.accuracy == full_metrics.accuracy
+    assert metrics.precision == full_metrics.precision
+    assert metrics.recall == full_metrics.recall
+    assert metrics.f1 == full_metrics.f1
+    assert metrics.roc_auc == approx(full_metrics.roc_auc)
+    assert metrics.log_loss == approx(full_metrics.log_loss)
+    assert metrics.roc_aucs == approx(full_metrics.roc_aucs)
+    assert metrics.metrics_matrix == {
+        key: value for key, value in full_metrics.metrics_matrix.items() if key in top_labels or key not in labels
+    }
+    # detailed data is of the top classes by support
+    assert metrics.confusion_matrix.labels == top_labels
+    assert metrics.confusion_matrix.values == [row[7:] for row in full_metrics.confusion_matrix.values[7:]]
+    assert metrics.confusion_by_classes == {label: full_metrics.confusion_by_classes[label] for label in top_labels}
+    assert metrics.roc_curve == {label: full_metrics.roc_curve[label] for label in top_labels}
+    assert metrics.pr_curve == {label: full_metrics.pr_curve[label] for label in top_labels}
+    assert metrics.pr_table == {label: full_metrics.pr_table[label] for label in top_labels}
+    assert sum(metrics.sparse_confusion_matrix.counts) == 2000
+    assert full_metrics.sparse_confusion_matrix is None
+
+
 # TODO: there a lot of different tests one may think of and should be implemented here. However, it will be
 #  more efficient to first refactor the current code given the tests now, because we are right now testing
 #  waaaaay to many things at once. This makes testing also way more difficult that it should be.
@@ -8,6 +8,7 @@ import pytest
 from evidently.analyzers.data_quality_analyzer import DataQualityAnalyzer
 from evidently.model.widget import BaseWidgetInfo
 from evidently.options import OptionsProvider
+from evidently.options import QualityMetricsOptions
 from evidently.pipeline.column_mapping import ColumnMapping
 from evidently.dashboard.widgets.data_quality_correlations import DataQualityCorrelationsWidget
 
@@ -75,3 +76,14 @@ def test_data_quality_features_widget(
     assert result.title == expected_result.title
     assert result.size == expected_result.size
     assert result.params is not None
+
+
+def test_data_quality_correlations_widget_with_selected_kinds(widget: DataQualityCorrelationsWidget) -> None:
+    widget.options_provider.add(QualityMetricsOptions(correlation_kinds=["pearson"]))
+    reference_data = pd.DataFrame({"num_1": [1, 2, 3, 4], "num_2": [4, 1, 3, 2], "cat": ["a", "b", "a", "b"]})
+    data_mapping = ColumnMapping(numerical_features=["num_1", "num_2"], categorical_features=["cat"])
+    analyzer = DataQualityAnalyzer()
+    analyzer.options_provider = widget.options_provider
+    analyzer_results = analyzer.calculate(reference_data, reference_data, data_mapping)
+    result = widget.calculate(reference_data, reference_data, data_mapping, {DataQualityAnalyzer: analyzer_results})
+    assert [part["id"] for part in result.params["details"]["parts"]] == ["pearson"]
@@ -0,0 +1,40 @@
+import pandas as pd
+
+from evidently.metrics.data_drift_metrics import DataDriftMetrics
+from evidently.metrics.data_integrity_metrics import DataIntegrityMetrics
+from evidently.metrics.data_integrity_metrics import DataIntegrityValueByRegexpMetrics
+from evidently.metrics.data_quality_metrics import DataQualityValueListMetrics
+from evidently.options import DataDriftOptions
+
+
+def test_metric_fingerprint() -> None:
+    assert DataIntegrityMetrics().get_fingerprint() == DataIntegrityMetrics().get_fingerprint()
+    assert (
+        DataDriftMetrics(options=DataDriftOptions(threshold=0.1)).get_fingerprint()
+        == DataDriftMetrics(options=DataDriftOptions(threshold=0.1)).get_fingerprint()
+    )
+    assert (
+        DataDriftMetrics(options=DataDriftOptions(threshold=0.1)).get_fingerprint()
+        != DataDriftMetrics(options=DataDriftOptions(threshold=0.2)).get_fingerprint()
+    )
+    assert DataDriftMetrics().get_fingerprint() != DataIntegrityMetrics().get_fingerprint()
+    assert (
+        DataIntegrityValueByRegexpMetrics(column_name="a", reg_exp="^a").get_fingerprint()
+        == DataIntegrityValueByRegexpMetrics(column_name="a", reg_exp="^a").get_fingerprint()
+    )
+    assert (
+        DataQualityValueListMetrics(column="a", values=[1, 2]).get_fingerprint()
+        != DataQualityValueListMetrics(column="a", values=[1, 3]).get_fingerprint()
+    )
+
+
+def test_metric_fingerprint_with_uncomparable_parameters() -> None:
+    values = pd.Series([1, 2])
+    assert (
+        DataQualityValueListMetrics(column="a", values=values).get_fingerprint()
+        == DataQualityValueListMetrics(column="a", values=values).get_fingerprint()
+    )
+    assert (
+        DataQualityValueListMetrics(column="a", values=values).get_fingerprint()
+        != DataQualityValueListMetrics(column="a", values=pd.Series([1, 2])).get_fingerprint()
+    )
@@ -12,9 +12,11 @@ from evidently.analyzers.classification_performance_analyzer import ConfusionMat
 from evidently.pipeline.column_mapping import ColumnMapping
 from evidently.metrics.base_metric import InputData
 from evidently.metrics import ClassificationPerformanceMetrics
+from evidently.metrics.classification_performance_metrics import classification_performance_metrics
 from evidently.metrics.classification_performance_metrics import get_prediction_data
 from evidently.metrics.classification_performance_metrics import k_probability_threshold
 from evidently.metrics.classification_performance_metrics import threshold_probability_labels
+from evidently.options import QualityMetricsOptions
 
 
 def test_classification_performance_metrics_binary_labels() -> None:
@@ -229,6 +231,107 @@ def test_classification_performance_metrics() -> None:
     assert result.current_metrics.recall == 0.75
 
 
+def test_classification_performance_metrics_max_curve_points() -> None:
+    rng = np.random.default_rng(0)
+    test_dataset = pd.DataFrame({"target": rng.choice(["a", "b"], 1000), "b": rng.random(1000)})
+    test_dataset["a"] = 1 - test_dataset["b"]
+    column_mapping = ColumnMapping(target="target", prediction=["a", "b"], pos_label="b")
+    metric = ClassificationPerformanceMetrics(QualityMetricsOptions(max_curve_points=10)).with_threshold(0.3)
+    result = metric.calculate(
+        data=InputData(current_data=test_dataset, reference_data=test_dataset, column_mapping=column_mapping),
+        metrics={},
+    )
+
+    for metrics in (result.current_metrics, result.reference_metrics, result.current_by_threshold_metrics[0.3]):
+        assert len(metrics.roc_curve["b"]["fpr"]) == 10
+        assert len(metrics.pr_curve["b"]["pr"]) == 10
+
+
+def test_classification_performance_metrics_top_classes() -> None:
+    rng = np.random.default_rng(0)
+    labels = ["a", "b", "c", "d", "e"]
+    probas = rng.random((500, 5))
+    test_dataset = pd.DataFrame(probas / probas.sum(axis=1, keepdims=True), columns=labels)
+    test_dataset["target"] = rng.choice(labels, 500, p=[0.1, 0.1, 0.1, 0.3, 0.4])
+    column_mapping = ColumnMapping(target="target", prediction=labels)
+    data = InputData(current_data=test_dataset, reference_data=None, column_mapping=column_mapping)
+    full_result = ClassificationPerformanceMetrics().calculate(data=data, metrics={})
+    result = ClassificationPerformanceMetrics(QualityMetricsOptions(top_classes=2)).calculate(data=data, metrics={})
+
+    for metrics, full_metrics in (
+        (result.current_metrics, full_result.current_metrics),
+        (result.dummy_metrics, full_result.dummy_metrics),
+    ):
+        assert metrics.accuracy == full_metrics.accuracy
+        assert metrics.f1 == full_metrics.f1
+        assert metrics.log_loss == approx(full_metrics.log_loss)
+        assert metrics.confusion_matrix.labels == ["d", "e"]
+        assert set(metrics.metrics_matrix) == {"d", "e", "accuracy", "macro avg", "weighted avg"}
+        assert metrics.metrics_matrix["macro avg"] == full_metrics.metrics_matrix["macro avg"]
+
+    assert result.current_metrics.roc_auc == approx(full_result.current_metrics.roc_auc)
+    assert list(result.current_metrics.roc_curve) == ["d", "e"]
+
+
+def test_classification_performance_metrics_dummy_zero_scores() -> None:
+    # the dummy model predicts "b" for every row: precision and recall of "a" are 0
+    test_dataset = pd.DataFrame({"target": ["b", "b", "a", "b"], "a": [0.2, 0.7, 0.3, 0.2]})
+    test_dataset["b"] = 1 - test_dataset["a"]
+    column_mapping = ColumnMapping(target="target", prediction=["a", "b"], pos_label="a")
+    metric = ClassificationPerformanceMetrics().with_threshold(0.0).with_threshold(1.0).with_k(2)
+    result = metric.calculate(
+        data=InputData(current_data=test_dataset, reference_data=None, column_mapping=column_mapping), metrics={}
+    )
+
+    for dummy_metrics in list(result.dummy_by_threshold_metrics.values()) + list(result.dummy_by_k_metrics.values()):
+        assert dummy_metrics.precision == 0
+        assert dummy_metrics.recall == 0
+        assert np.isnan(dummy_metrics.f1)
+
+
+def test_classification_performance_metrics_by_thresholds() -> None:
+    rng = np.random.default_rng(0)
+    probas = np.round(rng.random(500), 2)
+    test_dataset = pd.DataFrame({"target": np.where(rng.random(500) < probas, "b", "a"), "b": probas})
+    column_mapping = ColumnMapping(target="target", prediction="b", pos_label="b")
+    thresholds = [0.0, 0.3, 0.5, 0.73, 1.0, 1.5]
+    k_variants = [1, 10, 0.2, 0.5]
+    metric = ClassificationPerformanceMetrics()
+
+    for threshold in thresholds:
+        metric.with_threshold(threshold)
+
+    for k in k_variants:
+        metric.with_k(k)
+
+    result = metric.calculate(
+        data=InputData(current_data=test_dataset, reference_data=None, column_mapping=column_mapping), metrics={}
+    )
+    prediction_probas = get_prediction_data(test_dataset, column_mapping).prediction_probas
+    expected_thresholds = [
+        (result.current_by_threshold_metrics[threshold], threshold) for threshold in thresholds
+    ] + [(result.current_by_k_metrics[k], k_probability_threshold(prediction_probas, k)) for k in k_variants]
+
+    for metrics, threshold in expected_thresholds:
+        expected = classification_performance_metrics(
+            test_dataset["target"],
+            threshold_probability_labels(prediction_probas, "b", "a", threshold),
+            prediction_probas,
+            "b",
+        )
+        assert metrics.accuracy == expected.accuracy
+        assert metrics.precision == expected.precision
+        assert metrics.recall == expected.recall
+        assert metrics.f1 == expected.f1
+        assert metrics.metrics_matrix == expected.metrics_matrix
+        assert metrics.confusion_matrix == expected.confusion_matrix
+        assert metrics.confusion_by_classes == expected.confusion_by_classes
+        assert metrics.roc_auc == expected.roc_auc
+        assert metrics.roc_curve == expected.roc_curve
+        assert metrics.pr_curve == expected.pr_curve
+        assert metrics.pr_table == expected.pr_table
+
+
 @pytest.mark.parametrize(
     "data, mapping, threshold, expected",
     (
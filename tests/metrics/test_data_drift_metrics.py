@@ -4,6 +4,7 @@ import pandas as pd
 from evidently.pipeline.column_mapping import ColumnMapping
 from evidently.metrics.base_metric import InputData
 from evidently.metrics.data_drift_metrics import DataDriftMetrics
+from evidently.utils.reference_cache import ReferenceCache
 
 
 def test_data_drift_metrics() -> None:
@@ -22,3 +23,28 @@ def test_data_drift_metrics() -> None:
     )
     assert result is not None
     assert result.analyzer_result.metrics.n_drifted_features == 0
+
+
+def test_data_drift_metrics_with_reference_cache() -> None:
+    random_state = np.random.RandomState(0)
+    reference_data = pd.DataFrame(
+        {"num_1": random_state.normal(size=1000), "num_2": random_state.randint(0, 50, size=1000).astype(float)}
+    )
+    reference_data.loc[::7, "num_2"] = np.nan
+    current_data = pd.DataFrame(
+        {"num_1": random_state.normal(0.5, size=300), "num_2": random_state.randint(10, 80, size=300)}
+    )
+    data = InputData(current_data=current_data, reference_data=reference_data, column_mapping=ColumnMapping())
+    expected = DataDriftMetrics().calculate(data=data, metrics={})
+    cache = ReferenceCache()
+    metric = DataDriftMetrics(reference_cache=cache)
+
+    for _ in range(2):
+        result = metric.calculate(data=data, metrics={})
+        assert result.analyzer_result.metrics == expected.analyzer_result.metrics
+
+        for feature, distr in expected.distr_for_plots.items():
+            for dataset in ("current", "reference"):
+                pd.testing.assert_frame_equal(result.distr_for_plots[feature][dataset], distr[dataset])
+
+    assert cache.hits > 0
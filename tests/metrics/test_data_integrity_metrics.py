@@ -23,3 +23,36 @@ def test_data_integrity_metrics() -> None:
     assert result is not None
     assert result.current_stats.number_of_columns == 4
     assert result.current_stats.number_of_rows == 3
+
+
+def test_data_integrity_metrics_duplicates() -> None:
+    test_dataset = pd.DataFrame(
+        {
+            "a": [1, 2, 1, 3, 1],
+            "b": [1, 2, 1, 3, 1],
+            "c": ["x", "y", "x", "z", "y"],
+            "d": [1.0, 2.0, 1.0, 3.0, 1.0],
+        }
+    )
+    # the same bytes as "a" but a different dtype: the hashes are equal, the columns are not
+    test_dataset["e"] = test_dataset["a"].astype("uint64")
+    test_dataset["f"] = test_dataset["c"]
+    data_mapping = ColumnMapping()
+    metric = DataIntegrityMetrics()
+    result = metric.calculate(
+        data=InputData(current_data=test_dataset, reference_data=None, column_mapping=data_mapping), metrics={}
+    )
+    assert result.current_stats.number_of_duplicated_rows == 1
+    # pairs a-b and c-f
+    assert result.current_stats.number_of_duplicated_columns == 2
+
+
+def test_data_integrity_metrics_negative_zeros() -> None:
+    test_dataset = pd.DataFrame({"a": [0.0, -0.0, np.nan, np.nan], "b": [0.0, 0.0, np.nan, np.nan], "c": [1, 1, 2, 2]})
+    metric = DataIntegrityMetrics()
+    result = metric.calculate(
+        data=InputData(current_data=test_dataset, reference_data=None, column_mapping=ColumnMapping()), metrics={}
+    )
+    # pandas treats negative and positive zeros as equal values
+    assert result.current_stats.number_of_duplicated_rows == test_dataset.duplicated().sum() == 2
+    assert result.current_stats.number_of_duplicated_columns == 1
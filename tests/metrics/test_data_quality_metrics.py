@@ -167,3 +167,14 @@ def test_data_quality_correlation_metrics() -> None:
     assert result.current_correlation.abs_max_num_features_correlation == 1.0
 
     assert result.reference_correlation is None
+
+
+def test_data_quality_metrics_without_plot_data() -> None:
+    test_dataset = pd.DataFrame({"category_feature": ["n", "d", "p", "n"], "numerical_feature": [0, 2, 2, 432]})
+    data = InputData(current_data=test_dataset, reference_data=None, column_mapping=ColumnMapping())
+    expected = DataQualityMetrics().calculate(data=data, metrics={})
+    data.calculate_plot_data = False
+    result = DataQualityMetrics().calculate(data=data, metrics={})
+    assert result.distr_for_plots is None
+    assert result.counts_of_values is None
+    assert result.features_stats == expected.features_stats
@@ -0,0 +1,214 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from evidently.analyzers.data_quality_analyzer import DataQualityAnalyzer
+from evidently.metrics.data_integrity_metrics import DataIntegrityMetrics
+from evidently.metrics.partial_stats import DataIntegrityState
+from evidently.metrics.partial_stats import FeatureStatsState
+from evidently.metrics.partial_stats import SketchOptions
+from evidently.metrics.partial_stats import ValueCountsState
+from evidently.utils.dataset_view import DatasetView
+
+
+def _make_dataset(size: int, seed: int) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    dataset = pd.DataFrame(
+        {
+            "num": np.round(rng.normal(size=size), 1),
+            "int": rng.geometric(0.3, size),
+            "cat": pd.Series(rng.choice(["a", "b", "c", "d"], size, p=[0.4, 0.3, 0.2, 0.1]), dtype=object),
+            "datetime": pd.Series(pd.to_datetime("2022-01-01") + pd.to_timedelta(rng.integers(0, 5, size), unit="D")),
+        }
+    )
+    dataset["num"] = dataset["num"].mask(rng.random(size) < 0.1)
+    dataset.loc[rng.random(size) < 0.02, "num"] = np.inf
+    dataset["cat"] = dataset["cat"].mask(rng.random(size) < 0.1)
+    dataset["datetime"] = dataset["datetime"].mask(rng.random(size) < 0.1)
+    dataset["num_copy"] = dataset["num"]
+    dataset = pd.concat([dataset, dataset.iloc[: size // 10]], ignore_index=True)
+    dataset.loc[dataset.index[-3:], :] = np.nan
+    return dataset
+
+
+def _merge_chunks(dataset: pd.DataFrame, chunk_size: int, from_data):
+    state = None
+
+    for start in range(0, dataset.shape[0], chunk_size):
+        chunk_state = from_data(dataset.iloc[start: start + chunk_size])
+
+        if state is None:
+            state = chunk_state
+
+        else:
+            state.merge(chunk_state)
+
+    return state
+
+
+@pytest.mark.parametrize("chunk_size", (1, 7, 100, 1000))
+def test_value_counts_state(chunk_size: int) -> None:
+    column = pd.Series(["b", None, "a", "b", "c", None, "a", "c", "d"] * 5 + ["c"])
+    state = _merge_chunks(column, chunk_size, ValueCountsState.from_data)
+    expected = column.value_counts(dropna=False)
+    value_counts = state.get_value_counts()
+    # values with the same count are in order of their first appearance
+    assert value_counts["x"].tolist()[:4] == ["c", "b", None, "a"]
+    assert dict(zip(value_counts["x"], value_counts["count"])) == expected.to_dict()
+    assert state.get_most_common() == ("c", 11, 4)
+    assert state.first_null_position == 1
+    assert state.null_value is None
+
+
+@pytest.mark.parametrize("chunk_size", (13, 100, 1000))
+@pytest.mark.parametrize(
+    "feature_name, feature_type", (("num", "num"), ("int", "num"), ("cat", "cat"), ("datetime", "datetime"))
+)
+def test_feature_stats_state(chunk_size: int, feature_name: str, feature_type: str) -> None:
+    feature = _make_dataset(500, 0)[feature_name]
+    state = _merge_chunks(feature, chunk_size, lambda chunk: FeatureStatsState.from_data(chunk, feature_type))
+    expected = DataQualityAnalyzer._get_features_stats(feature, feature_type)
+    result = state.finalize()
+
+    for field, value in expected.__dict__.items():
+        if isinstance(value, float):
+            assert getattr(result, field) == pytest.approx(value, nan_ok=True), field
+
+        else:
+            assert getattr(result, field) == value, field
+
+
+def test_feature_stats_state_empty() -> None:
+    state = FeatureStatsState.from_data(pd.Series([np.nan, np.nan]), "num")
+    state.merge(FeatureStatsState.from_data(pd.Series([], dtype=float), "num"))
+    result = state.finalize()
+    assert result.count == 0
+    assert result.missing_count == 2
+    assert np.isnan(result.mean)
+    assert np.isnan(result.percentile_50)
+
+    with pytest.raises(ValueError):
+        state.merge(FeatureStatsState.from_data(pd.Series(["a"]), "cat"))
+
+
+@pytest.mark.parametrize("chunk_size", (17, 100, 1000))
+def test_data_integrity_state(chunk_size: int) -> None:
+    dataset = _make_dataset(300, 1)
+    state = _merge_chunks(dataset, chunk_size, DataIntegrityState.from_data)
+    expected = DataIntegrityMetrics._get_integrity_metrics_values(DatasetView(dataset), dataset.columns)
+    result = state.finalize()
+
+    for field, value in expected.__dict__.items():
+        if field != "counts_of_values":
+            assert getattr(result, field) == value, field
+
+    assert result.number_of_duplicated_rows > 0
+    assert result.number_of_duplicated_columns == 1
+
+    for column, counts in expected.counts_of_values.items():
+        # order of values with the same count is not defined in `value_counts`
+        result_counts = result.counts_of_values[column]
+        assert result_counts["count"].tolist() == counts["count"].tolist()
+        assert set(zip(result_counts["x"].astype(str), result_counts["count"])) == set(
+            zip(counts["x"].astype(str), counts["count"])
+        )
+
+
+@pytest.mark.parametrize("chunk_size", (1, 2, 4))
+def test_data_integrity_state_equal_hashes(chunk_size: int) -> None:
+    # pandas hashes mixed values as strings: 1 and "1" have equal hashes, but are not equal
+    dataset = pd.DataFrame(
+        {
+            "a": pd.Series([1, "1", 1.0, True], dtype=object),
+            "b": [0] * 4,
+            "c": pd.Series(["1", 1, "1", "1"], dtype=object),
+            "d": pd.Series([1, "1", 1.0, True], dtype=object),
+        }
+    )
+    result = _merge_chunks(dataset, chunk_size, DataIntegrityState.from_data).finalize()
+
+    assert result.number_of_duplicated_rows == dataset.duplicated().sum() == 2
+    # only columns "a" and "d" are equal
+    assert result.number_of_duplicated_columns == 1
+
+
+@pytest.mark.parametrize(
+    "feature_name, feature_type", (("num", "num"), ("int", "num"), ("cat", "cat"), ("datetime", "datetime"))
+)
+def test_feature_stats_state_sketches(feature_name: str, feature_type: str) -> None:
+    feature = _make_dataset(5000, 2)[feature_name]
+    sketches = SketchOptions(hll_precision=10, heavy_hitters_capacity=10, kll_k=50)
+    state = _merge_chunks(feature, 300, lambda chunk: FeatureStatsState.from_data(chunk, feature_type, sketches))
+    expected = DataQualityAnalyzer._get_features_stats(feature, feature_type)
+    result = state.finalize()
+
+    for field in ("count", "missing_count", "infinite_count", "min", "max", "mean", "std"):
+        assert getattr(result, field) == pytest.approx(getattr(expected, field), nan_ok=True), field
+
+    assert "unique_count" in result.approximate_fields
+    assert result.unique_count == pytest.approx(expected.unique_count, rel=0.1)
+    assert expected.approximate_fields is None
+
+    if feature_type == "num":
+        # the sketch of 50 values is compacted
+        assert "percentile_50" in result.approximate_fields
+        assert state.quantiles.cdf_error > 0
+
+        for field in ("percentile_25", "percentile_50", "percentile_75"):
+            expected_rank = np.mean(feature.dropna() <= getattr(expected, field))
+            assert np.mean(feature.dropna() <= getattr(result, field)) == pytest.approx(expected_rank, abs=0.05)
+
+    if feature_name == "num":
+        # there are more unique values than the capacity of the sketch
+        assert "most_common_value" in result.approximate_fields
+        assert state.value_counts.most_common_values.values.shape[0] == 10
+
+    else:
+        assert result.most_common_value == expected.most_common_value
+        assert result.most_common_value_percentage == expected.most_common_value_percentage
+
+
+def test_feature_stats_state_sketches_exact_percentiles() -> None:
+    feature = pd.Series([1.0, np.inf, 3.0, np.nan, 2.0, -np.inf, 5.0, 4.0])
+    sketches = SketchOptions()
+    state = _merge_chunks(feature, 3, lambda chunk: FeatureStatsState.from_data(chunk, "num", sketches))
+    expected = DataQualityAnalyzer._get_features_stats(feature, "num")
+    result = state.finalize()
+
+    # the sketch keeps all values while they are fewer than k
+    assert state.quantiles.cdf_error == 0
+    assert "percentile_50" not in result.approximate_fields
+    assert [result.percentile_25, result.percentile_50, result.percentile_75] == [
+        expected.percentile_25,
+        expected.percentile_50,
+        expected.percentile_75,
+    ]
+
+    with pytest.raises(ValueError):
+        state.merge(FeatureStatsState.from_data(feature, "num"))
+
+
+def test_data_integrity_state_sketches() -> None:
+    dataset = _make_dataset(3000, 3)
+    sketches = SketchOptions(heavy_hitters_capacity=3)
+    state = _merge_chunks(dataset, 170, lambda chunk: DataIntegrityState.from_data(chunk, sketches))
+    expected = DataIntegrityMetrics._get_integrity_metrics_values(DatasetView(dataset), dataset.columns)
+    result = state.finalize()
+
+    for field, value in expected.__dict__.items():
+        if field not in result.approximate_fields + ["counts_of_values", "approximate_fields"]:
+            assert getattr(result, field) == value, field
+
+    assert result.number_of_duplicated_rows == pytest.approx(expected.number_of_duplicated_rows, rel=0.05)
+    assert "counts_of_values" in result.approximate_fields
+    assert state.distinct_rows is None
+
+    for column, unique_count in expected.number_uniques_by_columns.items():
+        assert result.number_uniques_by_columns[column] == pytest.approx(unique_count, rel=0.05), column
+
+    # the three most common values and missing values
+    assert result.counts_of_values["cat"]["x"].tolist()[:3] == expected.counts_of_values["cat"]["x"].tolist()[:3]
+    assert result.counts_of_values["num"].shape[0] == 4
+
+    with pytest.raises(ValueError):
+        state.merge(DataIntegrityState.from_data(dataset))
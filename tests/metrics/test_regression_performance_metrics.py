@@ -21,3 +21,18 @@ def test_regression_performance_metrics() -> None:
         data=InputData(current_data=test_dataset, reference_data=None, column_mapping=data_mapping), metrics={}
     )
     assert result is not None
+
+
+def test_regression_performance_metrics_without_plot_data() -> None:
+    test_dataset = pd.DataFrame({"target": [1, 2, 3, 4], "prediction": [1, 3, 2, 4]})
+    metric = RegressionPerformanceMetrics()
+    result = metric.calculate(
+        data=InputData(
+            current_data=test_dataset, reference_data=None, column_mapping=ColumnMapping(), calculate_plot_data=False
+        ),
+        metrics={},
+    )
+    assert result.hist_for_plot is None
+    assert result.vals_for_plots is None
+    assert result.me_hist_for_plot is None
+    assert result.mean_abs_error == 0.5
@@ -1,5 +1,6 @@
 from typing import ClassVar
 
+import numpy as np
 import pandas as pd
 import pytest
 
@@ -73,3 +74,65 @@ def test_model_profile_without_current_data_prob_classification() -> None:
     my_profile.calculate(test_data, test_data, data_mapping)
     result = my_profile.json()
     assert result is not None
+
+
+@pytest.mark.parametrize("backend", ("thread", "process"))
+def test_model_profile_concurrent_analyzers(backend: str) -> None:
+    reference_data = pd.DataFrame(
+        {"target": [1, 0, 1, 0], "prediction": [1, 0, 0, 0], "num_feature": [1.0, np.inf, 3.0, 4.0], "cat_feature": [3, 2, 1, 1]}
+    )
+    current_data = reference_data.iloc[::-1].reset_index(drop=True)
+    data_mapping = ColumnMapping(numerical_features=["num_feature"], categorical_features=["cat_feature"])
+    sections = [DataQualityProfileSection, ClassificationPerformanceProfileSection, CatTargetDriftProfileSection]
+
+    sequential_profile = Profile([section() for section in sections])
+    sequential_profile.calculate(reference_data, current_data, column_mapping=data_mapping)
+    concurrent_profile = Profile([section() for section in sections], n_jobs=3, backend=backend)
+    concurrent_profile.calculate(reference_data, current_data, column_mapping=data_mapping)
+
+    sequential_result = sequential_profile.object()
+    concurrent_result = concurrent_profile.object()
+    del sequential_result["timestamp"], concurrent_result["timestamp"]
+    assert set(concurrent_profile.analyzers_results) == set(sequential_profile.analyzers_results)
+    assert concurrent_profile.json() is not None
+    assert sequential_result.keys() == concurrent_result.keys()
+
+
+def test_model_profile_run_stats() -> None:
+    test_data = pd.DataFrame({"target": [1, 0, 1], "prediction": [1, 0, 0], "num_feature": [1, 2, 3]})
+    profile = Profile([DataQualityProfileSection()])
+    profile.calculate(test_data, None, column_mapping=ColumnMapping())
+
+    assert [(call.kind, call.name) for call in profile.run_stats.calls] == [
+        ("analyzer", "DataQualityAnalyzer"),
+        ("stage", "DataQualityProfileSection"),
+    ]
+    assert "run_stats" not in profile.object()
+    assert len(profile.object(include_run_stats=True)["run_stats"]["calls"]) == 2
+
+
+@pytest.mark.parametrize("n_jobs,backend", ((1, "thread"), (2, "process")))
+def test_model_profile_calculate_segmented(n_jobs: int, backend: str) -> None:
+    reference_data = pd.DataFrame({"num_feature": [1.0, 2.0, 3.0, 4.0], "cat_feature": ["a", "b", "a", "b"]})
+    current_data = pd.DataFrame(
+        {
+            "tier": [1, 2, 1, 2, 1],
+            "num_feature": [1.0, 20.0, 3.0, 40.0, 2.0],
+            "cat_feature": ["a", "c", "b", "c", "a"],
+        }
+    )
+    profile = Profile([DataDriftProfileSection()], n_jobs=n_jobs, backend=backend)
+    segmented = profile.calculate_segmented(reference_data, current_data, segment_by="tier")
+
+    assert list(segmented.segments) == [1, 2]
+    assert segmented.summary["rows"].to_dict() == {1: 3, 2: 2}
+
+    for tier, segment_profile in segmented.segments.items():
+        expected_profile = Profile([DataDriftProfileSection()])
+        expected_profile.calculate(reference_data, current_data[current_data["tier"] == tier].drop(columns="tier"))
+        expected_metrics = expected_profile.object()["data_drift"]["data"]["metrics"]
+        metrics = segment_profile.object()["data_drift"]["data"]["metrics"]
+        # the segment column is not a feature
+        assert metrics["n_features"] == expected_metrics["n_features"] == 2
+        assert metrics["num_feature"]["drift_score"] == expected_metrics["num_feature"]["drift_score"]
+        assert segmented.summary.loc[tier, "data_drift.n_drifted_features"] == expected_metrics["n_drifted_features"]
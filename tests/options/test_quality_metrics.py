@@ -0,0 +1,50 @@
+import pytest
+
+from evidently.options import QualityMetricsOptions
+
+
+def test_correlation_sample_size() -> None:
+    options = QualityMetricsOptions(correlation_sample_size=100, sampled_correlation_kinds=["kendall", "cramer_v"])
+    assert options.get_correlation_sample_size("kendall", 1000) == 100
+    assert options.get_correlation_sample_size("cramer_v", 1000) == 100
+    assert options.get_correlation_sample_size("kendall", 100) is None
+    assert options.get_correlation_sample_size("pearson", 1000) is None
+    assert QualityMetricsOptions().get_correlation_sample_size("kendall", 1000) is None
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    (
+        {"correlation_kinds": ["pearson", "unknown"]},
+        {"sampled_correlation_kinds": ["unknown"]},
+        {"correlation_sample_size": 0},
+        {"cramer_v_n_jobs": 0},
+        {"cramer_v_backend": "unknown"},
+    ),
+)
+def test_correlation_options_errors(kwargs) -> None:
+    with pytest.raises(ValueError):
+        QualityMetricsOptions(**kwargs)
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    (
+        {"hll_precision": 3},
+        {"hll_precision": 19},
+        {"heavy_hitters_capacity": 0},
+        {"max_curve_points": 1},
+        {"top_classes": 0},
+        {"top_classes_by": "unknown"},
+    ),
+)
+def test_approximate_stats_options_errors(kwargs) -> None:
+    with pytest.raises(ValueError):
+        QualityMetricsOptions(**kwargs)
+
+
+def test_use_top_classes() -> None:
+    assert not QualityMetricsOptions().use_top_classes(1000)
+    assert QualityMetricsOptions(top_classes=10).use_top_classes(11)
+    assert not QualityMetricsOptions(top_classes=10).use_top_classes(10)
+    assert not QualityMetricsOptions(top_classes=1).use_top_classes(2)
@@ -0,0 +1,43 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from evidently import ColumnMapping
+from evidently.analyzers.classification_performance_analyzer import ClassificationPerformanceAnalyzer
+from evidently.analyzers.data_drift_analyzer import DataDriftAnalyzer
+from evidently.pipeline.pipeline import Pipeline
+from evidently.pipeline.stage import PipelineStage
+
+
+class _DataStage(PipelineStage):
+    def __init__(self, analyzer):
+        super().__init__()
+        self.add_analyzer(analyzer)
+        self.data = None
+
+    def calculate(self, reference_data, current_data, column_mapping, analyzers_results):
+        self.data = (reference_data, current_data)
+
+
+@pytest.mark.parametrize(
+    "analyzer, expected_rows",
+    (
+        (ClassificationPerformanceAnalyzer, [0, 3]),
+        (DataDriftAnalyzer, [0, 1, 2, 3]),
+    ),
+)
+def test_stages_get_rows_used_by_analyzers(analyzer, expected_rows) -> None:
+    data = pd.DataFrame(
+        {
+            "target": [1, 0, 1, 0],
+            "prediction": [1, 0, 0, 0],
+            "feature": [1.0, np.nan, np.inf, 4.0],
+        }
+    )
+    stage = _DataStage(analyzer)
+    Pipeline([stage], []).execute(data, data, ColumnMapping(numerical_features=["feature"]))
+    reference_data, current_data = stage.data
+    assert reference_data.index.tolist() == expected_rows
+    assert current_data.index.tolist() == expected_rows
+    # the input data is not changed
+    assert len(data) == 4
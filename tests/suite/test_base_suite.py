@@ -0,0 +1,112 @@
+import threading
+
+import pandas as pd
+import pytest
+
+from evidently import ColumnMapping
+from evidently.metrics.base_metric import InputData
+from evidently.metrics.base_metric import Metric
+from evidently.suite.base_suite import Suite
+from evidently.suite.execution_graph import DependencyExecutionGraph
+
+
+class RowsCountMetric(Metric[int]):
+    def calculate(self, data: InputData, metrics: dict) -> int:
+        return data.current_data.shape[0]
+
+
+class DoubledRowsCountMetric(Metric[int]):
+    def __init__(self, rows_count: RowsCountMetric):
+        self.rows_count = rows_count
+
+    def calculate(self, data: InputData, metrics: dict) -> int:
+        return metrics[self.rows_count] * 2
+
+
+class WaitingMetric(Metric[str]):
+    """Blocks until all metrics with the same barrier are calculated at the same time"""
+
+    def __init__(self, name: str, barrier: threading.Barrier):
+        self.name = name
+        self.barrier = barrier
+
+    def calculate(self, data: InputData, metrics: dict) -> str:
+        self.barrier.wait(timeout=5)
+        return self.name
+
+
+def _input_data() -> InputData:
+    return InputData(
+        reference_data=None, current_data=pd.DataFrame({"feature": [1, 2, 3]}), column_mapping=ColumnMapping()
+    )
+
+
+def test_dependency_execution_graph_order() -> None:
+    rows_count = RowsCountMetric()
+    doubled = DoubledRowsCountMetric(rows_count)
+    graph = DependencyExecutionGraph([doubled], [])
+    assert graph.get_metric_execution_iterator() == [rows_count, doubled]
+    assert graph.get_metric_dependencies(doubled) == [rows_count]
+    assert graph.get_metric_dependencies(rows_count) == []
+
+
+def test_dependency_execution_graph_cycle() -> None:
+    rows_count = RowsCountMetric()
+    doubled = DoubledRowsCountMetric(rows_count)
+    rows_count.cycle = doubled
+
+    with pytest.raises(ValueError):
+        DependencyExecutionGraph([doubled], [])
+
+
+@pytest.mark.parametrize("n_jobs,backend", ((1, "thread"), (4, "thread"), (2, "process")))
+def test_suite_calculates_dependencies(n_jobs, backend) -> None:
+    suite = Suite(n_jobs=n_jobs, backend=backend)
+    doubled = DoubledRowsCountMetric(RowsCountMetric())
+    suite.add_metrics(doubled, RowsCountMetric())
+    suite.run_calculate(_input_data())
+
+    assert len(suite.context.metrics) == 2
+    assert doubled.get_result() == 6
+    assert doubled.rows_count.get_result() == 3
+
+
+def test_suite_calculates_independent_metrics_concurrently() -> None:
+    barrier = threading.Barrier(3)
+    suite = Suite(n_jobs=3)
+    metrics = [WaitingMetric(name, barrier) for name in ("a", "b", "c")]
+    suite.add_metrics(*metrics)
+    suite.run_calculate(_input_data())
+
+    assert [metric.get_result() for metric in metrics] == ["a", "b", "c"]
+
+
+def test_suite_wrong_execution_parameters() -> None:
+    with pytest.raises(ValueError):
+        Suite(n_jobs=0)
+
+    with pytest.raises(ValueError):
+        Suite(backend="unknown")
+
+
+class NaNCountMetric(Metric[dict]):
+    def calculate(self, data: InputData, metrics: dict) -> dict:
+        return {
+            "current": int(data.current_data["feature"].isna().sum()),
+            "reference": int(data.reference_data["feature"].isna().sum()),
+        }
+
+
+def test_suite_process_backend_with_shared_data() -> None:
+    suite = Suite(n_jobs=2, backend="process")
+    nan_count = NaNCountMetric()
+    suite.add_metrics(nan_count, RowsCountMetric())
+    suite.run_calculate(
+        InputData(
+            reference_data=pd.DataFrame({"feature": [1.0, None, None]}),
+            current_data=pd.DataFrame({"feature": ["a", None, "b", "c"]}),
+            column_mapping=ColumnMapping(),
+        )
+    )
+
+    assert nan_count.get_result() == {"current": 1, "reference": 2}
@@ -2,8 +2,10 @@ import json
 
 import numpy as np
 import pandas as pd
+import pytest
 
 from evidently import ColumnMapping
+from evidently.test_preset import DataStability
 from evidently.test_suite import TestSuite
 from evidently.tests import TestNumberOfDriftedFeatures
 from evidently.tests import TestShareOfDriftedFeatures
@@ -41,6 +43,7 @@ from evidently.tests import TestValueList
 from evidently.tests import TestNumberOfOutListValues
 from evidently.tests import TestShareOfOutListValues
 from evidently.tests import TestValueQuantile
+from evidently.tests import TestValueMAE
 from evidently.tests.base_test import Test
 
 
@@ -170,3 +173,117 @@ def test_export_to_json():
 
     assert "by_status" in summary_result
     assert summary_result["by_status"] == {"FAIL": 8, "SUCCESS": 28, "ERROR": 1}
+
+
+def test_equivalent_metrics_are_calculated_once():
+    current_data = pd.DataFrame({"feature": [1, 2, np.nan, 4], "target": [1, 0, 1, 0]})
+    suite = TestSuite(
+        tests=[
+            TestColumnNANShare(column_name="feature", lt=0.5),
+            TestColumnNANShare(column_name="target", lt=0.5),
+            TestNumberOfRows(),
+            TestValueList(column_name="target", values=[0, 1]),
+            TestNumberOfOutListValues(column_name="target", values=[0, 1]),
+            TestShareOfOutListValues(column_name="target", values=[0]),
+        ]
+    )
+    suite.run(current_data=current_data, reference_data=None)
+
+    metrics = suite._inner_suite.context.metrics
+    assert len(metrics) == 3
+    # all tests that depend on equivalent metrics share one instance
+    tests = suite._inner_suite.context.tests
+    assert tests[0].data_integrity_metric is tests[1].data_integrity_metric is tests[2].data_integrity_metric
+    assert tests[3].metric is tests[4].metric
+    assert tests[3].metric is not tests[5].metric
+    assert suite.as_dict()["summary"]["by_status"] == {"SUCCESS": 4, "FAIL": 2}
+
+
+def test_run_stats():
+    current_data = pd.DataFrame({"feature": [1, 2, np.nan, 4], "target": [1, 0, 1, 0]})
+    suite = TestSuite(tests=[TestColumnNANShare(column_name="feature"), TestNumberOfRows()])
+    suite.run(current_data=current_data, reference_data=None)
+
+    assert [(call.kind, call.name) for call in suite.run_stats.calls] == [
+        ("metric", "DataIntegrityMetrics"),
+        ("test", "TestColumnNANShare"),
+        ("test", "TestNumberOfRows"),
+    ]
+    assert "run_stats" not in suite.as_dict()
+
+    run_stats = json.loads(suite.json(include_run_stats=True))["run_stats"]
+    assert run_stats["totals"]["renderer"]["count"] == 4
+
+
+@pytest.mark.parametrize("n_jobs,backend", ((1, "thread"), (2, "process")))
+def test_run_without_plot_data(n_jobs, backend):
+    reference_data = pd.DataFrame(
+        {
+            "feature": [1.0, 2.0, 3.0, 4.0, 5.0, 6.0],
+            "score": [0.3, 0.1, 0.2, 0.6, 0.5, 0.4],
+            "target": [1.0, 2.0, 3.0, 4.0, 5.0, 6.0],
+            "prediction": 3.5,
+        }
+    )
+    current_data = pd.DataFrame(
+        {
+            "feature": [1.0, 1.0, np.nan, 40.0, 5.0],
+            # all values are the most common ones
+            "score": [0.0819127172474044, 0.7, -1.867612345, 0.2, 0.9],
+            "target": [1.0, 3.0, 3.0, 4.0, 8.0],
+            "prediction": 3.0,
+        }
+    )
+    tests = [
+        TestNumberOfDriftedFeatures(),
+        TestNumberOfNANs(),
+        TestMostCommonValueShare(column_name="feature"),
+        TestMostCommonValueShare(column_name="score"),
+        TestFeatureValueMean(column_name="feature"),
+        TestValueMAE(),
+    ]
+    expected_suite = TestSuite(tests=tests)
+    expected_suite.run(reference_data=reference_data, current_data=current_data)
+    suite = TestSuite(tests=tests, n_jobs=n_jobs, backend=backend)
+    suite.run(reference_data=reference_data, current_data=current_data, calculate_plot_data=False)
+
+    assert suite.as_dict()["tests"] == expected_suite.as_dict()["tests"]
+    assert suite.as_dict()["summary"] == expected_suite.as_dict()["summary"]
+
+    with pytest.raises(ValueError):
+        suite.show()
+
+
+@pytest.mark.parametrize("n_jobs,backend", ((1, "thread"), (2, "thread"), (2, "process")))
+def test_run_segmented(n_jobs, backend):
+    reference_data = pd.DataFrame({"feature": [1.0, 2.0, 3.0, 4.0, 5.0, 6.0], "category": ["a", "b"] * 3})
+    current_data = pd.DataFrame(
+        {
+            "country": ["us", "de", "us", "de", "us"],
+            "feature": [1.0, 2.0, np.nan, 40.0, 5.0],
+            "category": ["a", "b", "a", "c", "a"],
+        }
+    )
+    suite = TestSuite(tests=[TestNumberOfRows(gt=2), DataStability()], n_jobs=n_jobs, backend=backend)
+    segmented = suite.run_segmented(reference_data=reference_data, current_data=current_data, segment_by="country")
+
+    assert segmented.segment_by == ["country"]
+    assert list(segmented.segments) == ["de", "us"]
+    assert segmented.summary["rows"].to_dict() == {"de": 2, "us": 3}
+    assert not segmented
+
+    for country, segment_suite in segmented.segments.items():
+        expected_suite = TestSuite(tests=[TestNumberOfRows(gt=2), DataStability()])
+        expected_suite.run(
+            reference_data=reference_data,
+            current_data=current_data[current_data["country"] == country].drop(columns="country"),
+        )
+        result = segment_suite.as_dict()
+        expected_result = expected_suite.as_dict()
+        assert result["summary"] == expected_result["summary"]
+        assert [test["status"] for test in result["tests"]] == [test["status"] for test in expected_result["tests"]]
+        assert segmented.summary.loc[country, "total_tests"] == expected_result["summary"]["total_tests"]
+        assert segmented.summary.loc[country, "fail"] == expected_result["summary"]["failed_tests"]
+
+    # the test suite itself is not run
+    assert suite.run_stats.calls == []
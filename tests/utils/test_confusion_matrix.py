@@ -0,0 +1,95 @@
+import warnings
+
+import numpy as np
+import pandas as pd
+import pytest
+import sklearn.metrics
+
+from evidently.utils.confusion_matrix import BinaryThresholdSweep
+from evidently.utils.confusion_matrix import get_confusion_matrix
+from evidently.utils.confusion_matrix import get_confusion_matrix_metrics
+from evidently.utils.confusion_matrix import get_sparse_confusion_matrix
+
+
+@pytest.mark.parametrize(
+    "target, prediction, average, pos_label",
+    (
+        ([0, 1, 1, 0, 1, 0], [0, 1, 0, 0, 1, 1], "binary", 1),
+        ([0, 1, 1, 0, 1, 0], [0, 0, 0, 0, 0, 0], "binary", 1),
+        ([0, 0, 0], [0, 0, 0], "binary", 1),
+        (["n", "y", "y", "n"], [1.0, 0.0, 1.0, 1.0], "macro", 1),
+        ([1, 0, 1, 1], [1.0, 0.0, 1.0, 1.0], "binary", 0),
+        (["a", "b", "c", "a", "c", "c"], ["a", "c", "c", "b", "b", "d"], "macro", 1),
+        (["a", "b", "c", "a"], ["a", "a", "a", "a"], "macro", 1),
+    ),
+)
+def test_confusion_matrix_metrics(target: list, prediction: list, average: str, pos_label) -> None:
+    if isinstance(target[0], str) != isinstance(prediction[0], str):
+        with pytest.raises(ValueError):
+            get_confusion_matrix(target, prediction)
+
+        return
+
+    matrix, labels = get_confusion_matrix(target, prediction)
+    assert labels == sklearn.metrics._classification.unique_labels(target, prediction).tolist()
+    assert matrix.tolist() == sklearn.metrics.confusion_matrix(target, prediction).tolist()
+    result = get_confusion_matrix_metrics(matrix, labels, average, pos_label)
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        assert result.metrics_matrix == sklearn.metrics.classification_report(target, prediction, output_dict=True)
+        assert result.precision == sklearn.metrics.precision_score(
+            target, prediction, average=average, pos_label=pos_label
+        )
+        assert result.recall == sklearn.metrics.recall_score(target, prediction, average=average, pos_label=pos_label)
+        assert result.f1 == sklearn.metrics.f1_score(target, prediction, average=average, pos_label=pos_label)
+
+    assert result.accuracy == sklearn.metrics.accuracy_score(target, prediction)
+    sparse_matrix, sparse_labels = get_sparse_confusion_matrix(target, prediction)
+    assert sparse_labels == labels
+    assert sparse_matrix.toarray().tolist() == matrix.tolist()
+    assert get_confusion_matrix_metrics(sparse_matrix, labels, average, pos_label) == result
+    report_labels = labels[:1]
+    reported = get_confusion_matrix_metrics(sparse_matrix, labels, average, pos_label, report_labels)
+    assert reported.metrics_matrix == {
+        key: value for key, value in result.metrics_matrix.items() if key not in map(str, labels[1:])
+    }
+
+
+def test_binary_threshold_sweep() -> None:
+    rng = np.random.default_rng(0)
+    scores = np.round(rng.random(1000), 2)
+    is_positive = rng.random(1000) < scores
+    sweep = BinaryThresholdSweep(is_positive, scores)
+    thresholds = np.array([-1.0, 0.0, 0.25, 0.5, 0.505, 0.99, 1.0, 2.0, np.nan])
+    true_positives, false_positives, false_negatives, true_negatives = sweep.get_confusion_counts(thresholds)
+
+    for i, threshold in enumerate(thresholds):
+        predicted = scores >= threshold
+        assert true_positives[i] == np.sum(predicted & is_positive)
+        assert false_positives[i] == np.sum(predicted & ~is_positive)
+        assert false_negatives[i] == np.sum(~predicted & is_positive)
+        assert true_negatives[i] == np.sum(~predicted & ~is_positive)
+
+    sorted_scores = pd.Series(scores).sort_values(ascending=False)
+    assert sweep.get_k_threshold(10) == sorted_scores.iloc[10]
+    assert sweep.get_k_threshold(0.3) == sorted_scores.iloc[299]
+    assert sweep.get_k_threshold(5000) == sorted_scores.iloc[-1]
+
+    with pytest.raises(ValueError):
+        sweep.get_k_threshold(1.5)
+
+
+def test_confusion_matrix_errors() -> None:
+    with pytest.raises(ValueError):
+        get_confusion_matrix([0.5, 1.0], [1, 0])
+
+    matrix, labels = get_confusion_matrix([0, 1, 2], [0, 1, 1])
+
+    with pytest.raises(ValueError):
+        get_confusion_matrix_metrics(matrix, labels, "binary", 1)
+
+    matrix, labels = get_confusion_matrix(["a", "b"], ["a", "a"])
+
+    with pytest.raises(ValueError):
+        get_confusion_matrix_metrics(matrix, labels, "binary", 1)
@@ -0,0 +1,67 @@
+import numpy as np
+import pandas as pd
+import pytest
+from scipy.stats import chi2_contingency
+
+from evidently.utils import correlations
+from evidently.utils.correlations import get_cramer_v_matrix
+
+
+def _cramer_v(x: pd.Series, y: pd.Series) -> float:
+    table = pd.crosstab(x, y).values
+    chi2_stat = chi2_contingency(table, correction=False)[0]
+    return np.sqrt(chi2_stat / table.sum() / (min(table.shape) - 1)) if min(table.shape) > 1 else np.nan
+
+
+def _make_data(size: int) -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    return pd.DataFrame(
+        {
+            "str": rng.choice(["a", "b", "c"], size),
+            "int": rng.integers(0, 4, size),
+            "with_missing": rng.choice([1.5, 2.5, np.nan], size),
+            "category": pd.Categorical(rng.choice(["x", "y"], size)),
+            "mixed": pd.Series(rng.choice([1, "1", "z"], size), dtype=object),
+            "constant": ["c"] * size,
+        }
+    )
+
+
+def _expected_matrix(data: pd.DataFrame) -> np.ndarray:
+    return np.array(
+        [[1.0 if x == y else _cramer_v(data[x], data[y]) for y in data.columns] for x in data.columns]
+    )
+
+
+@pytest.mark.parametrize("size", (10, 500))
+def test_cramer_v_matrix(size: int) -> None:
+    data = _make_data(size)
+    result = get_cramer_v_matrix(data)
+    assert list(result.columns) == list(result.index) == list(data.columns)
+    np.testing.assert_allclose(result.values, _expected_matrix(data), rtol=1e-12)
+
+
+def test_cramer_v_matrix_sparse_tables(monkeypatch) -> None:
+    data = _make_data(500)
+    monkeypatch.setattr(correlations, "MAX_DENSE_TABLE_SIZE", 0)
+    np.testing.assert_allclose(get_cramer_v_matrix(data).values, _expected_matrix(data), rtol=1e-9)
+
+
+@pytest.mark.parametrize("backend", ("thread", "process"))
+def test_cramer_v_matrix_concurrent(backend: str) -> None:
+    data = _make_data(200)
+    pd.testing.assert_frame_equal(get_cramer_v_matrix(data, n_jobs=2, backend=backend), get_cramer_v_matrix(data))
+
+
+def test_cramer_v_matrix_max_categories() -> None:
+    data = pd.DataFrame({"id": [str(i) for i in range(8)], "x": ["a", "b"] * 4, "y": ["a", "a", "b", "b"] * 2})
+    result = get_cramer_v_matrix(data, max_categories=4)
+    assert np.isnan(result.loc["id", "x"]) and np.isnan(result.loc["y", "id"])
+    assert result.loc["id", "id"] == 1.0
+    assert result.loc["x", "y"] == pytest.approx(0.0)
+
+
+def test_cramer_v_matrix_small_data() -> None:
+    assert get_cramer_v_matrix(pd.DataFrame({"x": ["a", "b"]})).empty
+    result = get_cramer_v_matrix(pd.DataFrame({"x": ["a", "b", None], "y": [None, None, "c"]}))
+    assert np.isnan(result.loc["x", "y"])
@@ -0,0 +1,126 @@
+import numpy as np
+import pytest
+import sklearn.metrics
+from scipy.spatial import ConvexHull
+
+from evidently.utils.confusion_matrix import BinaryThresholdSweep
+from evidently.utils.curves import get_curve_points
+from evidently.utils.curves import get_pr_curve
+from evidently.utils.curves import get_pr_table
+from evidently.utils.curves import get_roc_curve
+
+
+def _get_pr_table(is_positive: np.ndarray, scores: np.ndarray, step_size: float) -> list:
+    # straightforward calculation with a sum over top rows for every step
+    binded = sorted(zip(is_positive.tolist(), scores.tolist()), key=lambda x: x[1], reverse=True)
+    data_size = len(binded)
+    offset = max(round(data_size * step_size), 1)
+    positives = sum(is_positive)
+    pr_table = []
+
+    for step in range(offset, data_size + offset, offset):
+        count = min(step, data_size)
+        prob = round(binded[min(step, data_size - 1)][1], 2)
+        tp = sum(x[0] for x in binded[:step])
+        pr_table.append(
+            [
+                round(100.0 * count / data_size, 1),
+                count,
+                prob,
+                tp,
+                count - tp,
+                round(100.0 * tp / count, 1),
+                round(100.0 * tp / positives, 1),
+            ]
+        )
+
+    return pr_table
+
+
+@pytest.mark.parametrize("size, seed", ((1, 0), (2, 1), (15, 2), (1000, 3)))
+def test_curves(size: int, seed: int) -> None:
+    rng = np.random.default_rng(seed)
+    scores = np.round(rng.random(size), 2)
+    is_positive = rng.random(size) < scores
+    # both labels are present
+    is_positive[0] = True
+    is_positive[-1] = size == 1 or not is_positive[-1]
+    sweep = BinaryThresholdSweep(is_positive, scores)
+
+    fpr, tpr, thrs = sklearn.metrics.roc_curve(is_positive, scores)
+    roc_curve = get_roc_curve(sweep)
+    assert roc_curve["fpr"] == pytest.approx(fpr.tolist(), nan_ok=True)
+    assert roc_curve["tpr"] == pytest.approx(tpr.tolist(), nan_ok=True)
+    assert roc_curve["thrs"][0] == thrs[1] + 1
+    assert roc_curve["thrs"][1:] == thrs[1:].tolist()
+
+    precision, recall, thresholds = sklearn.metrics.precision_recall_curve(is_positive, scores)
+    pr_curve = get_pr_curve(sweep)
+    # the curve stops at the first threshold with full recall
+    full_recall = len(precision) - len(pr_curve["pr"])
+    assert recall[full_recall] == 1.0
+    assert full_recall == 0 or recall[full_recall - 1] == 1.0
+    assert pr_curve["pr"] == precision[full_recall:].tolist()
+    assert pr_curve["rcl"] == recall[full_recall:].tolist()
+    assert pr_curve["thrs"] == thresholds[full_recall:].tolist()
+
+    for step_size in (0.05, 0.3):
+        assert get_pr_table(sweep, step_size) == _get_pr_table(is_positive, scores, step_size)
+
+
+def test_curves_without_positives() -> None:
+    sweep = BinaryThresholdSweep(np.array([False, False, False]), np.array([0.2, 0.7, 0.2]))
+    roc_curve = get_roc_curve(sweep)
+    assert roc_curve["fpr"] == [0.0, 1 / 3, 1.0]
+    assert np.isnan(roc_curve["tpr"]).all()
+    assert roc_curve["thrs"] == [1.7, 0.7, 0.2]
+    assert get_pr_curve(sweep) == {"pr": [0.0, 1.0], "rcl": [1.0, 0.0], "thrs": [0.7]}
+    assert get_pr_table(sweep, 0.5) == [[66.7, 2, 0.2, 0, 2, 0.0, 0.0], [100.0, 3, 0.2, 0, 3, 0.0, 0.0]]
+
+
+def _get_hull(x: list, y: list) -> set:
+    points = np.c_[x, y]
+    return {tuple(point) for point in points[ConvexHull(points).vertices].tolist()}
+
+
+@pytest.mark.parametrize("max_points", (2, 50, 200, 10000))
+def test_reduced_curves(max_points: int) -> None:
+    rng = np.random.default_rng(0)
+    scores = rng.random(5000)
+    is_positive = rng.random(5000) < scores
+    sweep = BinaryThresholdSweep(is_positive, scores)
+    roc_curve = get_roc_curve(sweep)
+    reduced_roc_curve = get_roc_curve(sweep, max_points)
+    pr_curve = get_pr_curve(sweep)
+    reduced_pr_curve = get_pr_curve(sweep, max_points)
+    assert len(reduced_roc_curve["fpr"]) == min(max_points, len(roc_curve["fpr"]))
+    assert len(reduced_pr_curve["pr"]) == min(max_points, len(pr_curve["pr"]))
+    assert len(reduced_pr_curve["thrs"]) == len(reduced_pr_curve["pr"]) - 1
+
+    for curve, reduced_curve in ((roc_curve, reduced_roc_curve), (pr_curve, reduced_pr_curve)):
+        # reduced curves are subsets of points of the curves with the same ends
+        points = list(zip(*curve.values()))
+        reduced_points = list(zip(*reduced_curve.values()))
+        assert set(reduced_points) <= set(points)
+        assert reduced_points[0] == points[0]
+
+    assert reduced_roc_curve["fpr"][-1] == 1.0
+    assert reduced_pr_curve["rcl"][-1] == 0.0
+    auc = np.trapz(roc_curve["tpr"], roc_curve["fpr"])
+
+    if max_points >= len(_get_hull(roc_curve["fpr"], roc_curve["tpr"])):
+        assert _get_hull(reduced_roc_curve["fpr"], reduced_roc_curve["tpr"]) == _get_hull(
+            roc_curve["fpr"], roc_curve["tpr"]
+        )
+        assert np.trapz(reduced_roc_curve["tpr"], reduced_roc_curve["fpr"]) == pytest.approx(auc, abs=0.01)
+
+
+def test_curve_points() -> None:
+    x = np.linspace(0, 1, 101)
+    # collinear points are dropped
+    assert get_curve_points(x, x, 10).tolist() == [0, 100]
+    assert get_curve_points(x, x, None).tolist() == list(range(101))
+    assert get_curve_points(x, x * np.nan, 3).tolist() == [0, 100]
+    # the farthest point is added first
+    y = np.minimum(x, 0.3) + np.where(x > 0.5, 0.0, 0.01 * x)
+    assert get_curve_points(x, y, 3).tolist() == [0, 30, 100]
@@ -0,0 +1,120 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from evidently import ColumnMapping
+from evidently.metrics.base_metric import InputData
+from evidently.utils.dataset_view import DatasetView
+from evidently.utils.dataset_view import get_column_view
+from evidently.utils.dataset_view import get_dataset_view
+from evidently.utils.dataset_view import register_dataset_views
+
+
+def test_column_view_primitives() -> None:
+    column = pd.Series([1.0, np.nan, np.inf, 2.0, 1.0, -np.inf, None], name="feature")
+    view = DatasetView(column.to_frame()).column("feature")
+
+    np.testing.assert_array_equal(view.null_mask(), column.isnull().to_numpy())
+    assert view.null_count() == 2
+    pd.testing.assert_series_equal(view.not_null(), column.dropna())
+    pd.testing.assert_series_equal(view.finite(), column.replace([np.inf, -np.inf], np.nan).dropna())
+    np.testing.assert_array_equal(view.sorted_finite_values(), [1.0, 1.0, 2.0])
+    pd.testing.assert_series_equal(view.value_counts(), column.value_counts())
+    pd.testing.assert_series_equal(view.value_counts(dropna=False), column.value_counts(dropna=False))
+    assert view.nunique() == column.nunique()
+    np.testing.assert_array_equal(view.unique(), column.unique())
+    # primitives are calculated once
+    assert view.finite() is view.finite()
+
+
+def test_dataset_view_null_mask() -> None:
+    data = pd.DataFrame({"a": [1, None, 3], "b": ["x", "y", None], "c": [None, None, None]})
+    view = DatasetView(data)
+
+    np.testing.assert_array_equal(view.null_mask(), data.isnull().to_numpy())
+    np.testing.assert_array_equal(view.null_mask(["c", "a"]), data[["c", "a"]].isnull().to_numpy())
+    assert view.null_mask([]).shape == (3, 0)
+
+
+def test_dataset_view_replaced_column() -> None:
+    data = pd.DataFrame({"a": [1, 2, 2]})
+    view = DatasetView(data)
+    assert view.column("a").nunique() == 2
+
+    data["a"] = [1, 2, 3]
+    assert view.column("a").nunique() == 3
+
+
+def test_registered_dataset_views() -> None:
+    reference_data = pd.DataFrame({"a": [1.0, np.inf, 2.0]})
+    current_data = pd.DataFrame({"a": [3.0, 4.0]})
+
+    assert get_dataset_view(reference_data) is not get_dataset_view(reference_data)
+
+    with register_dataset_views(reference_data, None, current_data) as (reference_view, none_view, current_view):
+        assert none_view is None
+        assert get_dataset_view(reference_data) is reference_view
+        assert InputData(reference_data, current_data, ColumnMapping()).current_view is current_view
+
+        column_view = get_column_view(reference_data["a"])
+        assert column_view is reference_view.column("a")
+        # views of derived columns are shared too
+        finite_view = column_view.finite_view()
+        assert get_column_view(column_view.finite()) is finite_view
+
+        with register_dataset_views(reference_data) as (nested_view,):
+            assert nested_view is reference_view
+
+        assert get_dataset_view(reference_data) is reference_view
+
+    assert get_dataset_view(reference_data) is not reference_view
+    assert get_column_view(reference_data["a"]) is not column_view
+
+
+def test_dataset_view_row_hashes() -> None:
+    data = pd.DataFrame(
+        {
+            "num": [1.0, 2.0, 1.0, np.nan, np.nan, 1.0],
+            "cat": ["a", "b", "a", None, None, "c"],
+            "category": pd.Categorical(["x", "y", "x", "x", "x", "x"]),
+        }
+    )
+    view = DatasetView(data)
+    hashes = view.row_hashes(["num", "cat", "category"])
+    np.testing.assert_array_equal(hashes, pd.util.hash_pandas_object(data, index=False).to_numpy())
+    assert view.row_hashes(["num", "cat", "category"]) is hashes
+    np.testing.assert_array_equal(
+        view.row_hashes(["cat"]), pd.util.hash_pandas_object(data[["cat"]], index=False).to_numpy()
+    )
+
+
+def test_dataset_view_negative_zeros() -> None:
+    data = pd.DataFrame({"a": [0.0, -0.0, np.nan, np.nan], "b": [1, 1, 2, 2], "c": [0.0, 0.0, np.nan, np.nan]})
+    view = DatasetView(data)
+
+    # pandas treats negative and positive zeros as equal values
+    np.testing.assert_array_equal(view.duplicated(["a", "b"]), data.duplicated().to_numpy())
+    assert view.column("a").content_hash() == view.column("c").content_hash()
+    np.testing.assert_array_equal(view.column("a").negative_zeros(), [1])
+    assert view.column("b").negative_zeros().shape == (0,)
+
+
+@pytest.mark.parametrize("keep", ("first", "last", False))
+def test_dataset_view_duplicated(keep) -> None:
+    rng = np.random.default_rng(0)
+    data = pd.DataFrame(
+        {
+            "num": rng.integers(0, 3, 200).astype(float),
+            "cat": rng.choice(["a", "b"], 200),
+            "lists": [[value] for value in rng.integers(0, 2, 200)],
+        }
+    )
+    data.loc[::7, "num"] = np.nan
+    view = DatasetView(data)
+
+    for columns in (["num"], ["num", "cat"], ["cat", "num"]):
+        np.testing.assert_array_equal(
+            view.duplicated(columns, keep=keep), data.duplicated(subset=columns, keep=keep).to_numpy()
+        )
+
+    assert not view.duplicated([], keep=keep).any()
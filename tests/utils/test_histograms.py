@@ -0,0 +1,78 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from evidently.utils.dataset_view import ColumnView
+from evidently.utils.dataset_view import get_column_view
+from evidently.utils.dataset_view import register_dataset_views
+from evidently.utils.histograms import calculate_bin_edges
+from evidently.utils.histograms import get_bin_edges
+from evidently.utils.histograms import get_histogram
+from evidently.utils.histograms import get_sorted_values
+from evidently.utils.reference_cache import ReferenceCache
+
+
+def _finite(column: pd.Series) -> pd.Series:
+    return column.replace([np.inf, -np.inf], np.nan).dropna()
+
+
+@pytest.mark.parametrize(
+    "column",
+    (
+        pd.Series([1.0, np.nan, 2.5, np.inf, 2.5, -3.0, 7.0]),
+        pd.Series([4, 1, 1, 9, 3, 3, 3]),
+        pd.Series([2.0, 2.0, 2.0]),
+        pd.Series([], dtype=float),
+        pd.Series(np.random.default_rng(0).lognormal(size=1000)),
+    ),
+)
+@pytest.mark.parametrize("bins", (1, 10, "sturges", "sqrt", "doane"))
+def test_get_histogram(column: pd.Series, bins) -> None:
+    if isinstance(bins, str) and column.shape[0] == 0:
+        return
+
+    counts, bin_edges = get_histogram(ColumnView(column), bins)
+    expected_counts, expected_bin_edges = np.histogram(_finite(column), bins=bins)
+    assert bin_edges.tolist() == expected_bin_edges.tolist()
+    assert counts.tolist() == expected_counts.tolist()
+
+
+def test_get_histogram_density() -> None:
+    column = pd.Series(np.random.default_rng(1).normal(size=100))
+    densities, bin_edges = get_histogram(ColumnView(column), 7, density=True)
+    expected_densities, expected_bin_edges = np.histogram(column, bins=7, density=True)
+    assert bin_edges.tolist() == expected_bin_edges.tolist()
+    assert densities.tolist() == expected_densities.tolist()
+
+
+def test_get_bin_edges_of_columns() -> None:
+    rng = np.random.default_rng(2)
+    reference = pd.Series(rng.normal(size=300))
+    current = pd.Series(rng.normal(1.0, size=200))
+    values = np.concatenate([reference, current])
+
+    for bins in (10, "sturges", "doane"):
+        bin_edges = get_bin_edges([ColumnView(current), ColumnView(reference)], bins)
+        assert bin_edges.tolist() == np.histogram_bin_edges(values, bins=bins).tolist()
+
+    assert calculate_bin_edges(-1.0, 3.0, 50, "sturges").tolist() == np.histogram_bin_edges(
+        np.linspace(-1.0, 3.0, 50), bins="sturges"
+    ).tolist()
+
+
+def test_histograms_are_shared() -> None:
+    data = pd.DataFrame({"feature": [3.0, 1.0, 2.0, 5.0]})
+
+    with register_dataset_views(data):
+        view = get_column_view(data["feature"])
+        bin_edges = get_bin_edges([view], 2)
+        assert get_bin_edges([get_column_view(data["feature"])], 2) is bin_edges
+        assert get_histogram(get_column_view(data["feature"]), 2)[0] is get_histogram(view, bin_edges)[0]
+
+
+def test_sorted_values_in_reference_cache() -> None:
+    column = pd.Series([3, 1, 2])
+    cache = ReferenceCache()
+    assert get_sorted_values(ColumnView(column), cache).tolist() == [1.0, 2.0, 3.0]
+    assert get_sorted_values(ColumnView(column), cache).tolist() == [1.0, 2.0, 3.0]
+    assert cache.hits == cache.misses == 1
@@ -0,0 +1,94 @@
+import warnings
+
+import numpy as np
+import pandas as pd
+import pytest
+import sklearn.metrics
+from scipy import sparse
+
+from evidently.utils.multiclass import get_log_loss
+from evidently.utils.multiclass import get_multiclass_metrics
+from evidently.utils.multiclass import get_roc_aucs
+from evidently.utils.multiclass import get_top_positions
+
+
+def _make_dataset(size: int, classes: int, seed: int):
+    rng = np.random.default_rng(seed)
+    probas = np.round(rng.random((size, classes)), 2) + 0.01
+    probas = probas / probas.sum(axis=1, keepdims=True)
+    columns = [f"class_{i}" for i in range(classes)]
+    # the last class is never in the target
+    target = pd.Series(np.array(columns)[rng.integers(0, classes - 1, size)])
+    prediction = np.array(columns)[np.argmax(probas, axis=1)]
+    return target, prediction, pd.DataFrame(probas, columns=columns)
+
+
+def test_roc_aucs() -> None:
+    target, _, probas = _make_dataset(1000, 6, 0)
+    target_positions = probas.columns.get_indexer(target)
+    roc_aucs = get_roc_aucs(target_positions, probas.to_numpy())
+
+    for position, column in enumerate(probas.columns[:-1]):
+        assert roc_aucs[position] == pytest.approx(sklearn.metrics.roc_auc_score(target == column, probas[column]))
+
+    assert np.isnan(roc_aucs[-1])
+
+
+def test_log_loss() -> None:
+    target, _, probas = _make_dataset(1000, 6, 1)
+    target = target.where(target != "class_0", "unknown")
+    binaraized_target = (target.values.reshape(-1, 1) == list(probas.columns)).astype(int)
+    assert get_log_loss(target, probas) == pytest.approx(sklearn.metrics.log_loss(binaraized_target, probas))
+
+
+@pytest.mark.parametrize("top_classes_by", ("support", "error"))
+def test_multiclass_metrics(top_classes_by: str) -> None:
+    target, prediction, probas = _make_dataset(2000, 12, 2)
+    result = get_multiclass_metrics(target, prediction, probas, 4, top_classes_by)
+    matrix = sklearn.metrics.confusion_matrix(target, prediction)
+    labels = sorted(set(target) | set(prediction))
+    support = matrix.sum(axis=1)
+    errors = support + matrix.sum(axis=0) - 2 * np.diag(matrix)
+    scores = support if top_classes_by == "support" else errors
+    assert len(result.top_labels) == 4
+    assert min(scores[labels.index(label)] for label in result.top_labels) >= max(
+        scores[i] for i, label in enumerate(labels) if label not in result.top_labels
+    )
+
+    sparse_matrix = result.sparse_confusion_matrix
+    assert sparse_matrix.labels == labels
+    dense_matrix = np.zeros_like(matrix)
+    dense_matrix[sparse_matrix.true_positions, sparse_matrix.predicted_positions] = sparse_matrix.counts
+    assert dense_matrix.tolist() == matrix.tolist()
+    top_positions = [labels.index(label) for label in result.top_labels]
+    assert result.confusion_matrix == matrix[np.ix_(top_positions, top_positions)].tolist()
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        report = sklearn.metrics.classification_report(target, prediction, output_dict=True)
+
+    assert result.quality_metrics.metrics_matrix == {
+        key: value for key, value in report.items() if key in result.top_labels or key not in labels
+    }
+    assert result.quality_metrics.accuracy == sklearn.metrics.accuracy_score(target, prediction)
+    assert list(result.confusion_by_classes) == result.top_labels
+    assert list(result.roc_curve) == list(result.pr_curve) == list(result.pr_table) == result.top_labels
+    assert result.roc_aucs[:-1] == pytest.approx(
+        [sklearn.metrics.roc_auc_score(target == column, probas[column]) for column in probas.columns[:-1]]
+    )
+    assert result.roc_auc == pytest.approx(np.mean(result.roc_aucs[:-1]))
+
+    labels_result = get_multiclass_metrics(target, prediction, None, 4, top_classes_by)
+    assert labels_result.quality_metrics == result.quality_metrics
+    assert labels_result.roc_aucs is None
+    assert labels_result.roc_curve is None
+
+
+def test_top_positions() -> None:
+    matrix = sparse.csr_matrix(np.array([[5, 0, 0, 1], [0, 3, 4, 0], [0, 0, 6, 0], [0, 2, 0, 6]]))
+    assert get_top_positions(matrix, 2, "support").tolist() == [1, 3]
+    assert get_top_positions(matrix, 2, "error").tolist() == [1, 2]
+    assert get_top_positions(matrix, 10, "error").tolist() == [0, 1, 2, 3]
+
+    with pytest.raises(ValueError):
+        get_top_positions(matrix, 2, "unknown")
@@ -0,0 +1,129 @@
+import copy
+import pickle
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from evidently.utils.reference_cache import ReferenceCache
+from evidently.utils.reference_cache import activate_reference_cache
+from evidently.utils.reference_cache import get_active_reference_cache
+from evidently.utils.reference_cache import make_key
+from evidently.utils.reference_cache import resolve_reference_cache
+
+
+def test_make_key() -> None:
+    feature = pd.Series([1.0, 2.0, np.nan], name="feature")
+
+    assert make_key("name", feature) == make_key("name", feature.copy())
+    # the index is a part of the key
+    assert make_key("name", feature) != make_key("name", feature.set_axis([10, 20, 30]))
+    assert make_key("name", feature) != make_key("name", feature.rename_axis("row"))
+    assert make_key("name", feature) != make_key("other", feature)
+    assert make_key("name", feature, 10) != make_key("name", feature, 20)
+    assert make_key("name", feature) != make_key("name", pd.Series([1.0, 2.0, 3.0], name="feature"))
+    assert make_key("name", feature) != make_key("name", feature.rename("other"))
+    assert make_key("name", feature) != make_key("name", feature.astype("float32"))
+    zeros = pd.Series([0.0, 1.0], name="feature")
+    assert make_key("name", zeros) != make_key("name", pd.Series([-0.0, 1.0], name="feature"))
+
+
+def test_reference_cache_in_memory() -> None:
+    cache = ReferenceCache(max_size=2)
+    calls = []
+
+    def calculate(feature: pd.Series):
+        calls.append(feature.name)
+        return np.sort(feature.to_numpy())
+
+    features = [pd.Series([3, 1, 2], name=name) for name in ("a", "b", "c")]
+
+    result = cache.get_or_calculate("sorted", features[0], lambda: calculate(features[0]))
+    np.testing.assert_array_equal(result, [1, 2, 3])
+    assert not result.flags.writeable
+    assert cache.get_or_calculate("sorted", features[0], lambda: calculate(features[0])) is result
+    assert calls == ["a"]
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    # the least recently used entry is evicted
+    cache.get_or_calculate("sorted", features[1], lambda: calculate(features[1]))
+    cache.get_or_calculate("sorted", features[0], lambda: calculate(features[0]))
+    cache.get_or_calculate("sorted", features[2], lambda: calculate(features[2]))
+    cache.get_or_calculate("sorted", features[1], lambda: calculate(features[1]))
+    assert calls == ["a", "b", "c", "b"]
+    assert len(cache) == 2
+
+
+def test_reference_cache_on_disk(tmp_path) -> None:
+    feature = pd.Series(["a", "b", "a"], name="feature")
+    cache = ReferenceCache(directory=str(tmp_path))
+    cache.get_or_calculate("sorted", feature, lambda: np.array([1.5, 2.5]))
+    cache.get_or_calculate("counts", feature, lambda: feature.value_counts())
+    assert len(list(tmp_path.glob("*.npz"))) == 2
+
+    other_cache = ReferenceCache(directory=str(tmp_path))
+    np.testing.assert_array_equal(other_cache.get_or_calculate("sorted", feature, pytest.fail), [1.5, 2.5])
+    pd.testing.assert_series_equal(other_cache.get_or_calculate("counts", feature, pytest.fail), feature.value_counts())
+    assert other_cache.hits == 2
+
+
+def test_reference_cache_broken_file(tmp_path) -> None:
+    feature = pd.Series([1, 2, 3])
+    cache = ReferenceCache(directory=str(tmp_path))
+    cache.get_or_calculate("sum", feature, lambda: 6)
+    (path,) = tmp_path.glob("*.npz")
+    path.write_bytes(b"broken")
+
+    assert ReferenceCache(directory=str(tmp_path)).get_or_calculate("sum", feature, lambda: 7) == 7
+
+
+def test_reference_cache_pickle(tmp_path) -> None:
+    feature = pd.Series([1, 2, 3])
+    cache = ReferenceCache(directory=str(tmp_path))
+    cache.get_or_calculate("sum", feature, lambda: 6)
+    copied_cache = pickle.loads(pickle.dumps(cache))
+
+    assert len(copied_cache) == 0
+    assert copied_cache.get_or_calculate("sum", feature, pytest.fail) == 6
+
+
+def test_reference_cache_unhashable_data() -> None:
+    cache = ReferenceCache()
+    feature = pd.Series([[1], [2]])
+
+    assert cache.get_or_calculate("len", feature, lambda: 2) == 2
+    assert len(cache) == 0
+
+
+def test_reference_cache_index() -> None:
+    cache = ReferenceCache()
+    feature = pd.Series([1.0, np.nan, 3.0], name="feature")
+    reindexed = feature.set_axis([10, 20, 30])
+
+    assert cache.get_or_calculate("not_null", feature, feature.dropna).index.tolist() == [0, 2]
+    # cached values keep the index of the data, data with other index gets its own value
+    assert cache.get_or_calculate("not_null", reindexed, reindexed.dropna).index.tolist() == [10, 30]
+    assert cache.get_or_calculate("not_null", feature.copy(), feature.dropna).index.tolist() == [0, 2]
+    assert cache.hits == 1
+
+
+def test_reference_cache_wrong_size() -> None:
+    with pytest.raises(ValueError):
+        ReferenceCache(max_size=0)
+
+
+def test_active_reference_cache() -> None:
+    cache = ReferenceCache()
+    options_cache = ReferenceCache()
+
+    assert get_active_reference_cache() is None
+    assert resolve_reference_cache(None) is None
+
+    with activate_reference_cache(cache):
+        assert get_active_reference_cache() is cache
+        assert resolve_reference_cache(None) is cache
+        assert resolve_reference_cache(options_cache) is options_cache
+        # copies of metrics and options keep using the same cache
+        assert copy.deepcopy({"cache": cache})["cache"] is cache
+
+    assert get_active_reference_cache() is None
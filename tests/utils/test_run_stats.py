@@ -0,0 +1,43 @@
+from evidently.utils.run_stats import CallKind
+from evidently.utils.run_stats import RunStats
+from evidently.utils.run_stats import collect_run_stats
+from evidently.utils.run_stats import measure
+
+
+def _allocate(size: int) -> int:
+    with measure(CallKind.METRIC, "inner"):
+        data = bytearray(size)
+    return len(data)
+
+
+def test_measure_without_active_run_stats() -> None:
+    with measure(CallKind.METRIC, "not recorded"):
+        pass
+
+
+def test_run_stats_records_calls_and_calls_callbacks() -> None:
+    forwarded = []
+    run_stats = RunStats(trace_memory=True, callbacks=[forwarded.append])
+
+    with run_stats.activate():
+        with measure(CallKind.METRIC, "outer"):
+            _allocate(10_000_000)
+
+    assert [(call.kind, call.name) for call in run_stats.calls] == [("metric", "inner"), ("metric", "outer")]
+    assert forwarded == run_stats.calls
+    inner, outer = run_stats.calls
+    assert inner.wall_time >= 0
+    assert inner.peak_memory >= 10_000_000
+    assert outer.peak_memory >= inner.peak_memory
+    assert outer.wall_time >= inner.wall_time
+
+    result = run_stats.as_dict()
+    assert len(result["calls"]) == 2
+    assert result["totals"]["metric"]["count"] == 2
+
+
+def test_collect_run_stats() -> None:
+    result, calls = collect_run_stats(False, _allocate, 100)
+    assert result == 100
+    assert len(calls) == 1
+    assert calls[0].peak_memory is None
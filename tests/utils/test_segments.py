@@ -0,0 +1,56 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from evidently import ColumnMapping
+from evidently.utils.segments import get_segment_column_mapping
+from evidently.utils.segments import get_segment_columns
+from evidently.utils.segments import make_segments_summary
+from evidently.utils.segments import split_segments
+
+
+def test_get_segment_columns() -> None:
+    data = pd.DataFrame({"country": ["de"], "tier": [1]})
+
+    assert get_segment_columns("country", data) == ["country"]
+    assert get_segment_columns(("country", "tier"), data) == ["country", "tier"]
+
+    with pytest.raises(ValueError):
+        get_segment_columns([], data)
+
+    with pytest.raises(ValueError):
+        get_segment_columns(["country", "unknown"], data)
+
+
+def test_get_segment_column_mapping() -> None:
+    data = pd.DataFrame({"country": ["de", "us"], "tier": [1, 2], "feature": [1.0, 2.0], "category": ["a", "b"]})
+    column_mapping = get_segment_column_mapping(data, ColumnMapping(), ["country", "tier"])
+
+    assert column_mapping.numerical_features == ["feature"]
+    assert column_mapping.categorical_features == ["category"]
+    assert column_mapping.datetime_features == []
+
+
+def test_split_segments() -> None:
+    data = pd.DataFrame({"country": ["us", "de", None, "us"], "tier": [1, 1, 2, 2], "feature": [1, 2, 3, 4]})
+
+    segments = split_segments(data, ["country"])
+    assert [key for key, _ in segments[:2]] == ["de", "us"]
+    # rows with missing segment values are not lost
+    assert pd.isnull(segments[2][0])
+    assert [segment["feature"].tolist() for _, segment in segments] == [[2], [1, 4], [3]]
+
+    segments = split_segments(data, ["country", "tier"])
+    assert [key for key, _ in segments[:3]] == [("de", 1), ("us", 1), ("us", 2)]
+
+
+def test_make_segments_summary() -> None:
+    summary = make_segments_summary(["country"], [("de", {"rows": 1}), ("us", {"rows": 2})])
+    assert summary.index.name == "country"
+    assert summary.loc["us", "rows"] == 2
+
+    summary = make_segments_summary(["country", "tier"], [(("de", 1), {"rows": 1}), (("de", 2), {"rows": np.nan})])
+    assert list(summary.index.names) == ["country", "tier"]
+    assert summary.loc[("de", 1), "rows"] == 1
+
+    assert make_segments_summary(["country", "tier"], []).empty
@@ -0,0 +1,36 @@
+import numpy as np
+import pandas as pd
+
+from evidently.utils.shared_data import share_dataframes
+
+
+def test_share_dataframes() -> None:
+    frame = pd.DataFrame(
+        {
+            "num": [1.5, np.nan, 3.0],
+            "int": [1, 2, 3],
+            "bool": [True, False, True],
+            "str": ["a", None, "c"],
+            "cat": pd.Categorical(["x", "y", "x"]),
+            "dt": pd.to_datetime(["2020-01-01", "2020-01-02", None]),
+        },
+        index=[10, 20, 30],
+    )
+
+    with share_dataframes(frame, None) as (shared_frame, shared_none):
+        assert shared_none is None
+        attached = shared_frame.attach()
+        pd.testing.assert_frame_equal(attached, frame)
+        assert not attached["num"].to_numpy().flags.writeable
+        # repeated attaching in the same process reuses the shared columns, but not the frame
+        attached["new"] = 1
+        attached_again = shared_frame.attach()
+        assert "new" not in attached_again
+        assert np.shares_memory(attached_again["num"].to_numpy(), attached["num"].to_numpy())
+
+
+def test_share_empty_dataframe() -> None:
+    frame = pd.DataFrame({"num": pd.Series([], dtype=float)})
+
+    with share_dataframes(frame) as (shared_frame,):
+        pd.testing.assert_frame_equal(shared_frame.attach(), frame)
@@ -0,0 +1,105 @@
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from evidently.utils.sketches import HyperLogLogSketch
+from evidently.utils.sketches import KLLSketch
+from evidently.utils.sketches import SpaceSavingSketch
+
+
+def _get_cdf(values: np.ndarray, points: np.ndarray) -> np.ndarray:
+    return np.searchsorted(np.sort(values), points, side="right") / values.shape[0]
+
+
+def test_kll_sketch_small_data_is_exact() -> None:
+    values = np.array([3.0, 1.0, np.nan, 2.0, np.inf, 2.0])
+    sketch = KLLSketch.from_values(values)
+    assert sketch.count == 4
+    assert (sketch.min, sketch.max) == (1.0, 3.0)
+    assert sketch.std == pytest.approx(np.std([3.0, 1.0, 2.0, 2.0]))
+    assert [item.tolist() for item in sketch.get_weighted_values()] == [[1.0, 2.0, 3.0], [1, 2, 1]]
+    assert sketch.cdf([0.0, 2.0, 5.0]).tolist() == [0.0, 0.75, 1.0]
+
+
+@pytest.mark.parametrize("k", (50, 200))
+def test_kll_sketch_rank_error(k: int) -> None:
+    values = np.random.default_rng(0).lognormal(size=300000)
+    sketch = KLLSketch.from_values(values, k=k, chunk_size=10000)
+    points = np.quantile(values, np.linspace(0, 1, 101))
+    assert np.max(np.abs(sketch.cdf(points) - _get_cdf(values, points))) <= sketch.rank_error
+    assert sketch.get_weighted_values()[1].sum() == values.shape[0]
+    assert sketch.get_quantiles([0, 1]).tolist() == [values.min(), values.max()]
+    assert sum(level.shape[0] for level in sketch.levels) < 4 * k
+
+
+def test_kll_sketch_merge() -> None:
+    rng = np.random.default_rng(1)
+    first = rng.normal(size=100000)
+    second = rng.normal(1.0, size=50000)
+    sketch = KLLSketch.from_values(first)
+    sketch.merge(KLLSketch.from_values(second))
+    values = np.concatenate([first, second])
+    points = np.linspace(-3, 4, 50)
+    assert sketch.count == values.shape[0]
+    assert sketch.mean == pytest.approx(values.mean())
+    assert sketch.std == pytest.approx(values.std())
+    assert np.max(np.abs(sketch.cdf(points) - _get_cdf(values, points))) <= sketch.rank_error
+
+    with pytest.raises(ValueError):
+        sketch.merge(KLLSketch(k=100))
+
+
+def test_kll_sketch_to_dict() -> None:
+    sketch = KLLSketch.from_values(np.random.default_rng(2).normal(size=10000))
+    restored = KLLSketch.from_dict(json.loads(json.dumps(sketch.to_dict())))
+    assert restored.to_dict() == sketch.to_dict()
+    restored.update([1.0, 2.0])
+    sketch.update([1.0, 2.0])
+    assert restored.to_dict() == sketch.to_dict()
+
+
+@pytest.mark.parametrize("count", (0, 10, 1000, 100000))
+def test_hyper_log_log_sketch_count(count: int) -> None:
+    values = np.arange(count).astype(str)
+    sketch = HyperLogLogSketch.from_values(np.concatenate([values, values[: count // 2]]), chunk_size=1000)
+    assert sketch.count() == pytest.approx(count, rel=3 * sketch.relative_error)
+
+
+def test_hyper_log_log_sketch_merge() -> None:
+    first = HyperLogLogSketch.from_values(np.arange(0, 60000))
+    second = HyperLogLogSketch.from_values(np.arange(40000, 100000).astype(float))
+    first.merge(second)
+    assert first.count() == pytest.approx(100000, rel=3 * first.relative_error)
+    restored = HyperLogLogSketch.from_dict(json.loads(json.dumps(first.to_dict())))
+    assert restored.count() == first.count()
+
+    with pytest.raises(ValueError):
+        first.merge(HyperLogLogSketch(precision=10))
+
+
+def test_space_saving_sketch_small_data_is_exact() -> None:
+    sketch = SpaceSavingSketch.from_values(pd.Series(["b", "a", None, "a", "c", "b", "a"]), capacity=10)
+    assert sketch.is_exact
+    assert sketch.count == 6
+    assert sketch.values.tolist() == ["a", "b", "c"]
+    assert sketch.counts.tolist() == [3, 2, 1]
+    assert sketch.get_most_common() == ("a", 3)
+
+
+def test_space_saving_sketch_heavy_hitters() -> None:
+    rng = np.random.default_rng(0)
+    values = rng.zipf(1.3, 200000)
+    expected = pd.Series(values).value_counts()
+    first = SpaceSavingSketch.from_values(values[:120000], capacity=50, chunk_size=10000)
+    first.merge(SpaceSavingSketch.from_values(values[120000:], capacity=50, chunk_size=10000))
+    assert not first.is_exact
+    assert first.count == values.shape[0]
+    assert first.values[:5].tolist() == expected.index[:5].tolist()
+    exact_counts = expected.reindex(first.values).fillna(0).to_numpy()
+    # counts are upper bounds, the exact counts are within the errors
+    assert np.all(first.counts >= exact_counts)
+    assert np.all(first.counts - first.errors <= exact_counts)
+    restored = SpaceSavingSketch.from_dict(json.loads(json.dumps(first.to_dict())))
+    assert restored.get_most_common() == first.get_most_common()